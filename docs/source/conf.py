@@ -9,7 +9,7 @@
 project = 'PyGPT'
 copyright = '2024, pygpt.net'
 author = 'szczyglis-dev, Marcin Szczygliński'
-release = '2.1.37'
+release = '2.1.38'
 
 # -- General configuration ---------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
@@ -3,5 +3,7 @@
 source ./venv/bin/activate
 python3 scripts/resources.py "$@"
 cd "$(dirname "$0")"/src/pygpt_net
-pyside6-rcc icons.qrc -o icons_rc.py
-echo "Resources compiled to: src/pygpt_net/icons_rc.py"
\ No newline at end of file
+# pyside6-rcc wrapper always generates Python code, so use bundled rcc to compile binary resources
+RCC=$(python3 -c "import os, PySide6; print(os.path.join(os.path.dirname(PySide6.__file__), 'Qt', 'libexec', 'rcc'))")
+"$RCC" --binary icons.qrc -o data/icons.rcc
+echo "Resources compiled to: src/pygpt_net/data/icons.rcc"
\ No newline at end of file
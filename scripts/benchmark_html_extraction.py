@@ -0,0 +1,170 @@
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+# HTML-to-text extraction benchmark: extracts text from a set of saved HTML pages (files or directories)
+# with the previous BeautifulSoup (html.parser) method and with the lxml extractor used by the web search
+# plugin (whole page and main content only), and reports extraction speed and output size.
+# Without paths, synthetic pages with navigation, sidebars, scripts and footers are generated.
+
+root_dir = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, os.path.join(root_dir, 'src'))
+
+from pygpt_net.plugin.cmd_web.extractor import Extractor
+
+VARIANTS = ["bs4", "lxml", "lxml+main"]
+WORDS = ["data", "model", "search", "page", "result", "query", "system", "python", "network", "value",
+         "content", "context", "summary", "token", "language", "index", "vector", "document", "server", "user"]
+
+
+def get_pages(paths: list) -> list:
+    """
+    Get saved HTML pages
+
+    :param paths: HTML files or directories
+    :return: list of (name, HTML data)
+    """
+    pages = []
+    for path in paths:
+        if os.path.isdir(path):
+            files = sorted(os.path.join(path, f) for f in os.listdir(path) if f.endswith((".html", ".htm")))
+        else:
+            files = [path]
+        for file in files:
+            with open(file, "rb") as f:
+                pages.append((os.path.basename(file), f.read()))
+    return pages
+
+
+def get_synthetic_pages(count: int, paragraphs: int, seed: int) -> list:
+    """
+    Get synthetic HTML pages with boilerplate
+
+    :param count: number of pages
+    :param paragraphs: paragraphs of content per page
+    :param seed: random seed
+    :return: list of (name, HTML data)
+    """
+    rnd = random.Random(seed)
+
+    def sentence() -> str:
+        return " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(8, 20))).capitalize() + "."
+
+    links = "".join('<li><a href="/link/{0}">Link {0}</a></li>'.format(i) for i in range(60))
+    pages = []
+    for i in range(count):
+        content = "".join("<p>{}</p>".format(" ".join(sentence() for _ in range(5))) for _ in range(paragraphs))
+        html = (
+            "<!DOCTYPE html><html><head><title>Page {i}</title>"
+            "<style>{style}</style><script>{script}</script></head><body>"
+            "<header><nav><ul class=\"menu\">{links}</ul></nav></header>"
+            "<div class=\"layout\"><aside class=\"sidebar\"><ul>{links}</ul></aside>"
+            "<div id=\"content\"><h1>Title {i}</h1>{content}"
+            "<div class=\"share social\">Share: Facebook Twitter LinkedIn</div></div>"
+            "<div class=\"comments\">{comments}</div></div>"
+            "<footer><ul>{links}</ul><p>Copyright notice and cookie policy.</p></footer>"
+            "<script>{script}</script></body></html>"
+        ).format(
+            i=i,
+            style="body { margin: 0; } .menu li { display: inline; } " * 50,
+            script="window.dataLayer = window.dataLayer || []; function gtag(){dataLayer.push(arguments);} " * 50,
+            links=links,
+            content=content,
+            comments="".join("<p>Comment {}: {}</p>".format(j, sentence()) for j in range(10)),
+        )
+        pages.append(("synthetic_{}.html".format(i), html.encode("utf-8")))
+    return pages
+
+
+def extract_bs4(data: bytes) -> str:
+    """
+    Extract text with the previous method (BeautifulSoup html.parser, whole <html> text)
+
+    :param data: HTML data
+    :return: text
+    """
+    from bs4 import BeautifulSoup
+    try:
+        html = data.decode("utf-8")
+    except Exception:
+        return ""
+    text = ""
+    soup = BeautifulSoup(html, "html.parser")
+    for element in soup.find_all('html'):
+        text += element.text
+    text = text.replace("\n", " ").replace("\t", " ")
+    return re.sub(r'\s+', ' ', text)
+
+
+def run(variant: str, pages: list, max_size: int, repeat: int) -> dict:
+    """
+    Run extraction variant
+
+    :param variant: variant name
+    :param pages: list of (name, HTML data)
+    :param max_size: max HTML bytes (lxml variants)
+    :param repeat: number of repeats (best time is reported)
+    :return: results
+    """
+    extractor = Extractor()
+    if variant == "bs4":
+        func = extract_bs4
+    else:
+        main = variant == "lxml+main"
+        func = lambda data: extractor.extract(data, max_size=max_size, main=main)
+    best = None
+    texts = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        texts = [func(data) for name, data in pages]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return {
+        "time": best,
+        "chars": sum(len(text) for text in texts),
+        "words": sum(len(text.split()) for text in texts),
+        "texts": texts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PyGPT HTML-to-text extraction benchmark (offline)")
+    parser.add_argument("paths", nargs="*", help="saved HTML files or directories (synthetic pages if empty)")
+    parser.add_argument("--pages", type=int, default=50, help="number of synthetic pages")
+    parser.add_argument("--paragraphs", type=int, default=30, help="content paragraphs per synthetic page")
+    parser.add_argument("--max-size", type=int, default=1000000, help="max HTML bytes parsed (0 = unlimited)")
+    parser.add_argument("--repeat", type=int, default=3, help="number of repeats (best time is reported)")
+    parser.add_argument("--variants", default=",".join(VARIANTS), help="comma-separated extraction variants")
+    parser.add_argument("--show", action="store_true", help="print first 300 characters of every extracted page")
+    parser.add_argument("--seed", type=int, default=42, help="random seed")
+    args = parser.parse_args()
+
+    if args.paths:
+        pages = get_pages(args.paths)
+    else:
+        pages = get_synthetic_pages(args.pages, args.paragraphs, args.seed)
+    size = sum(len(data) for name, data in pages)
+    print("Pages: {}, HTML: {:.2f} MB, max size: {}".format(len(pages), size / 1024 / 1024, args.max_size))
+    print("{:<12} {:>10} {:>10} {:>10} {:>12} {:>12}".format(
+        "variant", "total ms", "ms/page", "MB/s", "chars", "words"))
+
+    for variant in args.variants.split(","):
+        result = run(variant, pages, args.max_size, args.repeat)
+        print("{:<12} {:>10.1f} {:>10.2f} {:>10.1f} {:>12} {:>12}".format(
+            variant,
+            result["time"] * 1000,
+            result["time"] * 1000 / max(len(pages), 1),
+            size / 1024 / 1024 / result["time"] if result["time"] else 0,
+            result["chars"],
+            result["words"],
+        ))
+        if args.show:
+            for (name, data), text in zip(pages, result["texts"]):
+                print("  {}: {}".format(name, text[:300]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,390 @@
+import argparse
+import csv
+import hashlib
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# Offline indexing throughput benchmark: generates synthetic txt, md, csv, json and pdf corpora,
+# indexes every corpus with Indexing.index_files() into each vector store provider and reports
+# docs/s, chunks/s, peak RSS and on-disk index size. Every run is executed in a separate process
+# (clean peak RSS), embeddings come from the built-in local hashing model (no API calls).
+
+root_dir = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, os.path.join(root_dir, 'src'))
+
+FORMATS = ["txt", "md", "csv", "json", "pdf"]
+STORES = ["SimpleVectorStore", "NumpyVectorStore", "ChromaVectorStore"]
+WORDS = [
+    "cache", "network", "socket", "timeout", "database", "migration", "token", "session", "parser", "schema",
+    "thread", "queue", "worker", "plugin", "config", "profile", "render", "stream", "upload", "archive",
+    "locale", "theme", "memory", "index", "vector", "embedding", "prompt", "command", "context", "audio",
+    "the", "is", "and", "of", "to", "in", "for", "with", "when", "after",
+]
+
+
+def get_sentence(rnd: random.Random) -> str:
+    """
+    Get random sentence
+
+    :param rnd: random generator
+    :return: sentence
+    """
+    words = [rnd.choice(WORDS) for _ in range(rnd.randint(8, 16))]
+    return " ".join(words).capitalize() + "."
+
+
+def get_paragraph(rnd: random.Random, size: int) -> str:
+    """
+    Get random text of given size
+
+    :param rnd: random generator
+    :param size: size in bytes
+    :return: text
+    """
+    sentences = []
+    length = 0
+    while length < size:
+        sentence = get_sentence(rnd)
+        sentences.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(sentences)
+
+
+def write_pdf(path: str, text: str):
+    """
+    Write text to minimal PDF file (Helvetica, one page per 50 lines)
+
+    :param path: output path
+    :param text: text
+    """
+    words = text.split()
+    lines = []
+    line = []
+    for word in words:
+        line.append(word)
+        if len(" ".join(line)) > 90:
+            lines.append(" ".join(line))
+            line = []
+    if line:
+        lines.append(" ".join(line))
+    pages = [lines[i:i + 50] for i in range(0, len(lines), 50)] or [[""]]
+
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page in pages:
+        stream = "BT /F1 10 Tf 40 800 Td 14 TL " + " ".join(
+            "({}) '".format(re.sub(r"([()\\])", r"\\\1", line)) for line in page) + " ET"
+        objects.append("<< /Length {} >>\nstream\n{}\nendstream".format(len(stream), stream))
+        objects.append("<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       "/Resources << /Font << /F1 3 0 R >> >> /Contents {} 0 R >>".format(len(objects)))
+        kids.append("{} 0 R".format(len(objects)))
+    objects[1] = "<< /Type /Pages /Kids [{}] /Count {} >>".format(" ".join(kids), len(kids))
+
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for i, obj in enumerate(objects):
+        offsets.append(len(data))
+        data += "{} 0 obj\n{}\nendobj\n".format(i + 1, obj).encode("latin-1")
+    xref = len(data)
+    data += "xref\n0 {}\n0000000000 65535 f \n".format(len(objects) + 1).encode("latin-1")
+    for offset in offsets:
+        data += "{:010d} 00000 n \n".format(offset).encode("latin-1")
+    data += "trailer\n<< /Size {} /Root 1 0 R >>\nstartxref\n{}\n%%EOF\n".format(len(objects) + 1, xref).encode("latin-1")
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def build_corpus(path: str, fmt: str, files: int, size: int, seed: int) -> int:
+    """
+    Generate synthetic corpus
+
+    :param path: output directory
+    :param fmt: file format
+    :param files: number of files
+    :param size: approx. size of file in KB
+    :param seed: random seed
+    :return: size of corpus in bytes
+    """
+    rnd = random.Random(seed)
+    os.makedirs(path, exist_ok=True)
+    for i in range(files):
+        file_path = os.path.join(path, "doc_{}.{}".format(i, fmt))
+        if fmt == "txt":
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(get_paragraph(rnd, size * 1024))
+        elif fmt == "md":
+            with open(file_path, "w", encoding="utf-8") as f:
+                for j in range(max(1, size // 2)):
+                    f.write("## Section {}\n\n{}\n\n".format(j, get_paragraph(rnd, 2048)))
+        elif fmt == "csv":
+            with open(file_path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["id", "name", "description"])
+                for j in range(max(1, size * 1024 // 120)):
+                    writer.writerow([j, rnd.choice(WORDS), get_paragraph(rnd, 100)])
+        elif fmt == "json":
+            items = [{"id": j, "name": rnd.choice(WORDS), "description": get_paragraph(rnd, 200)}
+                     for j in range(max(1, size * 1024 // 240))]
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump({"items": items}, f, indent=2)
+        elif fmt == "pdf":
+            write_pdf(file_path, get_paragraph(rnd, size * 1024))
+    return get_dir_size(path)
+
+
+def get_dir_size(path: str) -> int:
+    """
+    Get size of directory
+
+    :param path: path to directory
+    :return: size in bytes
+    """
+    size = 0
+    for root, dirs, files in os.walk(path):
+        for file in files:
+            size += os.path.getsize(os.path.join(root, file))
+    return size
+
+
+def get_peak_rss() -> int:
+    """
+    Get peak resident memory of current process
+
+    :return: peak RSS in bytes
+    """
+    try:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024  # bytes on macOS, KB on Linux
+    except ImportError:
+        import psutil
+        return psutil.Process().memory_info().peak_wset  # Windows
+
+
+def run(store_id: str, corpus: str, user_dir: str, args) -> dict:
+    """
+    Index corpus into vector store (executed in child process)
+
+    :param store_id: vector store provider ID
+    :param corpus: path to corpus directory
+    :param user_dir: temporary user directory
+    :param args: benchmark arguments
+    :return: dict with results
+    """
+    from types import SimpleNamespace
+    from llama_index.core import ServiceContext, Settings
+    from llama_index.core.node_parser import SentenceSplitter
+
+    from pygpt_net.core.idx.embeddings import HashingEmbedding
+    from pygpt_net.core.idx.indexing import Indexing
+    from pygpt_net.core.idx.lexical import Lexical
+    from pygpt_net.core.idx.metadata import Metadata
+    from pygpt_net.provider.loaders.file_csv import Loader as CsvLoader
+    from pygpt_net.provider.loaders.file_json import Loader as JsonLoader
+    from pygpt_net.provider.loaders.file_markdown import Loader as MarkdownLoader
+    from pygpt_net.provider.loaders.file_pdf import Loader as PdfLoader
+    from pygpt_net.provider.vector_stores import Storage
+
+    class Config:
+        def __init__(self, data: dict):
+            self.data = data
+
+        def get(self, key: str, default=None):
+            return self.data.get(key, default)
+
+        def has(self, key: str) -> bool:
+            return key in self.data
+
+        def get_user_dir(self, dir: str) -> str:
+            path = os.path.join(user_dir, dir)
+            os.makedirs(path, exist_ok=True)
+            return path
+
+        def is_compiled(self) -> bool:
+            return False
+
+    class Files:
+        def get_id(self, path: str) -> str:
+            return hashlib.md5(path.encode()).hexdigest()
+
+    noop = lambda *a, **kw: None
+    window = SimpleNamespace()
+    window.core = SimpleNamespace(
+        config=Config({
+            "llama.idx.storage": store_id,
+            "llama.idx.embeddings.batch": args.batch,
+            "llama.idx.embeddings.limit.rpm": 0,
+            "llama.idx.embeddings.limit.tpm": 0,
+            "llama.idx.pipeline.workers": args.workers,
+            "llama.idx.incremental": False,
+            "llama.idx.replace_old": False,
+            "llama.idx.recursive": False,
+            "llama.idx.hybrid": False,
+        }),
+        debug=SimpleNamespace(log=noop, info=noop),
+        platforms=SimpleNamespace(is_snap=lambda: False),
+    )
+    window.core.idx = SimpleNamespace(
+        log=noop,
+        files=Files(),
+        metadata=Metadata(window),
+        get_current_store=lambda: store_id,
+        llm=SimpleNamespace(is_local_embeddings=lambda: True),
+    )
+    window.core.idx.lexical = Lexical(window)
+    window.core.idx.storage = Storage(window)
+    window.core.idx.indexing = Indexing(window)
+
+    if store_id == "SimpleVectorStore":
+        from pygpt_net.provider.vector_stores.simple import SimpleProvider as Provider
+    elif store_id == "NumpyVectorStore":
+        from pygpt_net.provider.vector_stores.numpy_mmap import NumpyProvider as Provider
+    elif store_id == "ChromaVectorStore":
+        from pygpt_net.provider.vector_stores.chroma import ChromaProvider as Provider
+    elif store_id == "ElasticsearchStore":
+        from pygpt_net.provider.vector_stores.elasticsearch import ElasticsearchProvider as Provider
+    elif store_id == "PineconeVectorStore":
+        from pygpt_net.provider.vector_stores.pinecode import PinecodeProvider as Provider
+    elif store_id == "RedisVectorStore":
+        from pygpt_net.provider.vector_stores.redis import RedisProvider as Provider
+    else:
+        raise ValueError("Unknown vector store: {}".format(store_id))
+    storage = window.core.idx.storage
+    storage.register(store_id, Provider())
+    indexing = window.core.idx.indexing
+    for loader in [CsvLoader(), JsonLoader(), MarkdownLoader(), PdfLoader()]:
+        indexing.register_loader(loader)
+
+    embed_model = HashingEmbedding()
+    # empty index is created with global settings and some providers (e.g. Chroma) ignore service context,
+    # so the same embedding model and node parser are set globally to get comparable chunks in every store
+    Settings.embed_model = embed_model
+    Settings.chunk_size = args.chunk_size
+    Settings.node_parser = SentenceSplitter(chunk_size=args.chunk_size)
+    context = ServiceContext.from_defaults(llm=None, embed_model=embed_model, chunk_size=args.chunk_size)
+    index = storage.get("bench", service_context=context)
+
+    start = time.perf_counter()
+    files, errors = indexing.index_files("bench", index, corpus)
+    storage.store("bench", index)
+    elapsed = time.perf_counter() - start
+
+    stats = indexing.batch.stats
+    return {
+        "files": len(files),
+        "docs": stats["docs"],
+        "chunks": stats["nodes"],
+        "time": elapsed,
+        "rss": get_peak_rss(),
+        "disk": get_dir_size(storage.get_storage().get_path("bench")),
+        "errors": len(errors),
+    }
+
+
+def report(store_id: str, fmt: str, corpus_size: int, result: dict):
+    """
+    Print results
+
+    :param store_id: vector store provider ID
+    :param fmt: corpus format
+    :param corpus_size: corpus size in bytes
+    :param result: benchmark results
+    """
+    if "error" in result:
+        print("{:<20} {:<5} {}".format(store_id, fmt, result["error"]))
+        return
+    print("{:<20} {:<5} {:>8.1f} {:>6} {:>6} {:>8.1f} {:>10.1f} {:>10.1f} {:>10.1f} {:>10.1f} {:>6}".format(
+        store_id,
+        fmt,
+        corpus_size / 1024 / 1024,
+        result["docs"],
+        result["chunks"],
+        result["time"],
+        result["docs"] / result["time"],
+        result["chunks"] / result["time"],
+        result["rss"] / 1024 / 1024,
+        result["disk"] / 1024 / 1024,
+        result["errors"],
+    ))
+
+
+def check_chunks(results: list) -> dict:
+    """
+    Check if every store split the same corpus into the same number of chunks
+
+    :param results: list of (store ID, format, corpus size, results)
+    :return: formats with different chunk counts (format -> store ID -> chunks)
+    """
+    chunks = {}
+    for store_id, fmt, size, result in results:
+        if "error" not in result:
+            chunks.setdefault(fmt, {})[store_id] = result["chunks"]
+    return {fmt: counts for fmt, counts in chunks.items() if len(set(counts.values())) > 1}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PyGPT indexing throughput benchmark (offline)")
+    parser.add_argument("--files", type=int, default=100, help="number of files per format")
+    parser.add_argument("--size", type=int, default=8, help="approx. size of file in KB")
+    parser.add_argument("--formats", default=",".join(FORMATS), help="comma-separated corpus formats")
+    parser.add_argument("--stores", default=",".join(STORES), help="comma-separated vector store providers")
+    parser.add_argument("--batch", type=int, default=100, help="embedding batch size")
+    parser.add_argument("--workers", type=int, default=0, help="parser processes (indexing pipeline)")
+    parser.add_argument("--chunk-size", type=int, default=512, help="chunk size in tokens")
+    parser.add_argument("--seed", type=int, default=42, help="random seed")
+    parser.add_argument("--keep", action="store_true", help="keep temporary directory")
+    parser.add_argument("--run", nargs=3, metavar=("STORE", "CORPUS", "USER_DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        print(json.dumps(run(args.run[0], args.run[1], args.run[2], args)))  # child process
+        return
+
+    tmp_dir = tempfile.mkdtemp(prefix='pygpt_bench_idx_')
+    try:
+        corpora = {}
+        for fmt in args.formats.split(","):
+            path = os.path.join(tmp_dir, "corpus", fmt)
+            corpora[fmt] = (path, build_corpus(path, fmt, args.files, args.size, args.seed))
+        print("Corpora: {} files per format, in: {}".format(args.files, tmp_dir))
+        results = []
+        for store_id in args.stores.split(","):
+            for fmt, (path, size) in corpora.items():
+                user_dir = os.path.join(tmp_dir, "user", store_id, fmt)
+                cmd = [sys.executable, os.path.abspath(__file__), "--run", store_id, path, user_dir] + [
+                    "--batch", str(args.batch),
+                    "--workers", str(args.workers),
+                    "--chunk-size", str(args.chunk_size),
+                ]
+                proc = subprocess.run(cmd, capture_output=True, text=True)
+                try:
+                    result = json.loads(proc.stdout.strip().splitlines()[-1])
+                except (IndexError, ValueError):
+                    lines = proc.stderr.strip().splitlines()
+                    result = {"error": lines[-1] if lines else "failed"}
+                results.append((store_id, fmt, size, result))
+
+        mismatched = check_chunks(results)
+        print("{:<20} {:<5} {:>8} {:>6} {:>6} {:>8} {:>10} {:>10} {:>10} {:>10} {:>6}".format(
+            "store", "fmt", "MB", "docs", "chunks", "time s", "docs/s", "chunks/s", "RSS MB", "disk MB", "errors"))
+        for store_id, fmt, size, result in results:
+            report(store_id, fmt, size, result)
+        for fmt, counts in mismatched.items():
+            print("WARNING: different number of chunks in {} corpus, results are not comparable: {}".format(
+                fmt, ", ".join("{}={}".format(store_id, n) for store_id, n in counts.items())))
+        if mismatched:
+            sys.exit(1)
+    finally:
+        if not args.keep:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
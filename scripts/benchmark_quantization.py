@@ -0,0 +1,190 @@
+import argparse
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+# Vector quantization benchmark: indexes synthetic clustered embeddings into SimpleVectorStore (JSON)
+# and NumpyVectorStore (float32, float16, int8, with and without exact float32 re-ranking) and reports
+# recall@k against exact brute-force search, memory of loaded vectors, on-disk size and query latency.
+
+root_dir = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, os.path.join(root_dir, 'src'))
+
+from llama_index.core.schema import TextNode
+from llama_index.core.vector_stores import SimpleVectorStore
+from llama_index.core.vector_stores.types import VectorStoreQuery
+
+from pygpt_net.provider.vector_stores.numpy_mmap import NumpyVectorStore
+
+VARIANTS = ["simple", "float32", "float16", "float16+rerank", "int8", "int8+rerank"]
+
+
+def get_data(count: int, dim: int, queries: int, seed: int) -> (np.ndarray, np.ndarray):
+    """
+    Get synthetic clustered embeddings and queries
+
+    :param count: number of vectors
+    :param dim: dimensions
+    :param queries: number of queries
+    :param seed: random seed
+    :return: vectors, queries
+    """
+    rnd = np.random.default_rng(seed)
+    centers = rnd.normal(size=(max(1, count // 50), dim)).astype(np.float32)
+    vectors = centers[rnd.integers(0, len(centers), count)] + 0.6 * rnd.normal(size=(count, dim)).astype(np.float32)
+    picked = vectors[rnd.integers(0, count, queries)]
+    return vectors, picked + 0.3 * rnd.normal(size=picked.shape).astype(np.float32)
+
+
+def get_expected(vectors: np.ndarray, queries: np.ndarray, k: int) -> list:
+    """
+    Get exact top-k ids (brute force, float32 cosine similarity)
+
+    :param vectors: vectors
+    :param queries: queries
+    :param k: top k
+    :return: list of sets of ids
+    """
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    expected = []
+    for q in queries:
+        scores = np.dot(normalized, q / np.linalg.norm(q))
+        expected.append({str(i) for i in np.argpartition(-scores, k - 1)[:k]})
+    return expected
+
+
+def get_nodes(vectors: np.ndarray) -> list:
+    """
+    Get nodes with embeddings
+
+    :param vectors: vectors
+    :return: list of nodes
+    """
+    return [TextNode(text="", id_=str(i), embedding=v.tolist()) for i, v in enumerate(vectors)]
+
+
+def get_size(path: str, files: list = None) -> int:
+    """
+    Get size of files in directory
+
+    :param path: directory or file
+    :param files: file names (all if None)
+    :return: size in bytes
+    """
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path)
+               if files is None or f in files)
+
+
+def open_store(variant: str, path: str, nodes: list) -> (object, int, int):
+    """
+    Build store, persist and open again
+
+    :param variant: store variant
+    :param path: store path
+    :param nodes: nodes
+    :return: store, memory of loaded vectors, disk size
+    """
+    if variant == "simple":
+        store = SimpleVectorStore()
+        store.add(nodes)
+        store.persist(persist_path=path)
+        del store
+        gc.collect()
+        tracemalloc.start()
+        store = SimpleVectorStore.from_persist_path(path)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return store, memory, get_size(path)
+
+    dtype, _, rerank = variant.partition("+")
+    store = NumpyVectorStore(path=path, dtype=dtype, rerank=4 if rerank else 0)
+    store.add(nodes)
+    store.persist()
+    store.close()
+    store = NumpyVectorStore(path=path, rerank=4 if rerank else 0)
+    # scanned arrays only, exact vectors are read from disk for re-ranked candidates
+    memory = store._count * store._dim * np.dtype(store.dtype).itemsize
+    if store._scales is not None:
+        memory += store._count * 4
+    return store, memory, get_size(path)
+
+
+def run(variant: str, path: str, nodes: list, queries: np.ndarray, expected: list, k: int) -> dict:
+    """
+    Run benchmark of store variant
+
+    :param variant: store variant
+    :param path: store path
+    :param nodes: nodes
+    :param queries: queries
+    :param expected: exact top-k ids
+    :param k: top k
+    :return: result
+    """
+    store, memory, disk = open_store(variant, path, nodes)
+    hits = 0
+    times = []
+    for q, ids in zip(queries, expected):
+        start = time.perf_counter()
+        result = store.query(VectorStoreQuery(query_embedding=q.tolist(), similarity_top_k=k))
+        times.append(time.perf_counter() - start)
+        hits += len(ids & set(result.ids))
+    if hasattr(store, "close"):
+        store.close()
+    return {
+        "recall": hits / (k * len(queries)),
+        "memory": memory,
+        "disk": disk,
+        "latency": float(np.median(times)) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PyGPT vector quantization benchmark (offline)")
+    parser.add_argument("--count", type=int, default=10000, help="number of vectors")
+    parser.add_argument("--dim", type=int, default=768, help="embedding dimensions")
+    parser.add_argument("--queries", type=int, default=50, help="number of queries")
+    parser.add_argument("--k", type=int, default=10, help="top k (recall@k)")
+    parser.add_argument("--variants", default=",".join(VARIANTS), help="comma-separated store variants")
+    parser.add_argument("--seed", type=int, default=42, help="random seed")
+    args = parser.parse_args()
+
+    vectors, queries = get_data(args.count, args.dim, args.queries, args.seed)
+    expected = get_expected(vectors, queries, args.k)
+    nodes = get_nodes(vectors)
+    raw = vectors.astype(np.float32).nbytes
+    print("Vectors: {} x {}, raw float32: {:.1f} MB, queries: {}, k: {}".format(
+        args.count, args.dim, raw / 1024 / 1024, args.queries, args.k))
+    print("{:<16} {:>10} {:>10} {:>8} {:>10} {:>8} {:>12}".format(
+        "variant", "recall@k", "memory MB", "x raw", "disk MB", "x raw", "query ms"))
+
+    tmp_dir = tempfile.mkdtemp(prefix='pygpt_bench_quant_')
+    try:
+        for variant in args.variants.split(","):
+            path = os.path.join(tmp_dir, variant)
+            if variant == "simple":
+                path += ".json"
+            result = run(variant, path, nodes, queries, expected, args.k)
+            print("{:<16} {:>10.3f} {:>10.1f} {:>8.2f} {:>10.1f} {:>8.2f} {:>12.2f}".format(
+                variant,
+                result["recall"],
+                result["memory"] / 1024 / 1024,
+                result["memory"] / raw,
+                result["disk"] / 1024 / 1024,
+                result["disk"] / raw,
+                result["latency"],
+            ))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+import argparse
+import hashlib
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+# Offline retrieval benchmark: builds a synthetic code/docs corpus with unique identifiers and error codes,
+# indexes it in memory and compares vector, BM25 and hybrid (fused) retrieval by recall@k, MRR and latency.
+# Vectors come from a local hashed bag-of-words embedding (no API calls), so absolute quality numbers only
+# approximate real embedding models - use them to compare retrieval modes and fusion weights.
+
+root_dir = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, os.path.join(root_dir, 'src'))
+
+from llama_index.core import VectorStoreIndex  # noqa: E402
+from llama_index.core.embeddings import BaseEmbedding  # noqa: E402
+from llama_index.core.schema import QueryBundle, TextNode  # noqa: E402
+
+from pygpt_net.core.idx.lexical import Lexical  # noqa: E402
+from pygpt_net.core.idx.retriever import HybridRetriever, LexicalRetriever  # noqa: E402
+
+TOPICS = [
+    "cache", "network", "socket", "timeout", "database", "migration", "token", "session", "parser", "schema",
+    "thread", "queue", "worker", "plugin", "config", "profile", "render", "stream", "upload", "archive",
+    "locale", "theme", "memory", "index", "vector", "embedding", "prompt", "command", "context", "audio",
+]
+FILLER = [
+    "The module is loaded on startup and keeps its state between calls.",
+    "Errors are logged to the debug console and shown in the status bar.",
+    "Values are read from the user configuration and validated before use.",
+    "The function returns None if the requested item does not exist.",
+    "This behaviour can be changed in the settings dialog.",
+    "Long running operations are executed in a background worker.",
+]
+
+
+class HashEmbedding(BaseEmbedding):
+    """Hashed bag-of-words embedding (offline, deterministic)"""
+    dim: int = 256
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "HashEmbedding"
+
+    def embed(self, text: str) -> list:
+        vector = [0.0] * self.dim
+        for word in re.findall(r"[a-z]+|\d+", text.lower()):
+            digest = hashlib.md5(word.encode()).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dim
+            vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+        norm = sum(v * v for v in vector) ** 0.5 or 1.0
+        return [v / norm for v in vector]
+
+    def _get_query_embedding(self, query: str) -> list:
+        return self.embed(query)
+
+    async def _aget_query_embedding(self, query: str) -> list:
+        return self.embed(query)
+
+    def _get_text_embedding(self, text: str) -> list:
+        return self.embed(text)
+
+
+def build_corpus(docs: int, seed: int) -> (list, list):
+    """
+    Build synthetic corpus and labelled queries
+
+    :param docs: number of documents
+    :param seed: random seed
+    :return: list of nodes, list of queries (type, text, relevant node id)
+    """
+    rnd = random.Random(seed)
+    nodes = []
+    queries = []
+    for i in range(docs):
+        topic = rnd.sample(TOPICS, 3)
+        func = "{}_{}_{}".format(rnd.choice(["get", "load", "parse", "update"]), topic[0], i)
+        code = "E{}".format(10000 + i)
+        text = " ".join([
+            "Function {}() handles {} {} for the {} subsystem.".format(func, topic[0], topic[1], topic[2]),
+            "If it fails, error {} is raised.".format(code),
+        ] + rnd.sample(FILLER, 3))
+        id = "node_{}".format(i)
+        nodes.append(TextNode(text=text, id_=id))
+        queries.append(("identifier", func, id))
+        queries.append(("error code", "What does error {} mean?".format(code), id))
+        queries.append(("natural", "how {} {} works in {} subsystem".format(topic[0], topic[1], topic[2]), id))
+    return nodes, queries
+
+
+def evaluate(retriever, queries: list, k: int) -> dict:
+    """
+    Run queries and compute metrics
+
+    :param retriever: retriever
+    :param queries: labelled queries
+    :param k: cut-off for recall
+    :return: dict with recall, MRR and latencies per query type
+    """
+    results = {}
+    for type, text, relevant in queries:
+        start = time.perf_counter()
+        nodes = retriever.retrieve(QueryBundle(text))
+        elapsed = (time.perf_counter() - start) * 1000
+        ids = [n.node.node_id for n in nodes]
+        item = results.setdefault(type, {"hits": 0, "rr": 0.0, "ms": [], "n": 0})
+        item["n"] += 1
+        item["ms"].append(elapsed)
+        if relevant in ids[:k]:
+            item["hits"] += 1
+            item["rr"] += 1.0 / (ids.index(relevant) + 1)
+    return results
+
+
+def report(name: str, results: dict, k: int):
+    """
+    Print metrics
+
+    :param name: retrieval mode
+    :param results: metrics per query type
+    :param k: cut-off for recall
+    """
+    for type, item in results.items():
+        ms = sorted(item["ms"])
+        print("{:<10} {:<12} {:>10.3f} {:>8.3f} {:>10.2f} {:>10.2f}".format(
+            name,
+            type,
+            item["hits"] / item["n"],
+            item["rr"] / item["n"],
+            statistics.median(ms),
+            ms[int(len(ms) * 0.95) - 1],
+        ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PyGPT hybrid retrieval benchmark (offline)")
+    parser.add_argument("--docs", type=int, default=2000, help="number of synthetic documents")
+    parser.add_argument("--queries", type=int, default=300, help="number of queries per query type")
+    parser.add_argument("--top-k", type=int, default=4, help="number of retrieved nodes")
+    parser.add_argument("--weight-vector", type=float, default=0.4, help="vector weight in fused ranking")
+    parser.add_argument("--weight-bm25", type=float, default=0.6, help="BM25 weight in fused ranking")
+    parser.add_argument("--seed", type=int, default=42, help="random seed")
+    args = parser.parse_args()
+
+    nodes, queries = build_corpus(args.docs, args.seed)
+    rnd = random.Random(args.seed)
+    selected = []
+    for type in ["identifier", "error code", "natural"]:
+        items = [q for q in queries if q[0] == type]
+        selected.extend(rnd.sample(items, min(args.queries, len(items))))
+
+    start = time.perf_counter()
+    index = VectorStoreIndex(nodes, embed_model=HashEmbedding())
+    print("Vector index: {} nodes in {:.2f} s".format(len(nodes), time.perf_counter() - start))
+
+    lexical = Lexical()
+    start = time.perf_counter()
+    db = lexical.connect("")
+    lexical.insert(db, nodes)
+    print("Lexical index: {} nodes in {:.2f} s".format(lexical.count(db), time.perf_counter() - start))
+
+    k = args.top_k
+    vector = index.as_retriever(similarity_top_k=k)
+    bm25 = LexicalRetriever(lexical, db, k)
+    hybrid = HybridRetriever([
+        (index.as_retriever(similarity_top_k=k * 2), args.weight_vector),
+        (LexicalRetriever(lexical, db, k * 2), args.weight_bm25),
+    ], k)
+
+    print("{:<10} {:<12} {:>10} {:>8} {:>10} {:>10}".format(
+        "mode", "query", "recall@{}".format(k), "MRR", "p50 ms", "p95 ms"))
+    for name, retriever in [("vector", vector), ("bm25", bm25), ("hybrid", hybrid)]:
+        report(name, evaluate(retriever, selected, k), k)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+import argparse
+import json
+import os
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+# Cold-start benchmark: launches the app offscreen with --profile-startup against
+# a synthetic large user profile (temporary HOME) and prints median span times.
+
+root_dir = os.path.join(os.path.dirname(__file__), '..')
+src_dir = os.path.join(root_dir, 'src')
+base_presets_dir = os.path.join(src_dir, 'pygpt_net', 'data', 'config', 'presets')
+
+
+def get_env(home: str) -> dict:
+    """
+    Prepare environment for app process
+
+    :param home: home directory
+    :return: environment dict
+    """
+    env = dict(os.environ)
+    env['HOME'] = home
+    env['QT_QPA_PLATFORM'] = 'offscreen'
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [src_dir, env.get('PYTHONPATH')]))
+    return env
+
+
+def launch(home: str, trace_path: str) -> dict:
+    """
+    Launch app with startup profiler and return trace data
+
+    :param home: home directory
+    :param trace_path: trace output path
+    :return: trace dict
+    """
+    code = 'from pygpt_net.app import run; run()'
+    cmd = [sys.executable, '-c', code, '--profile-startup', trace_path, '--profile-exit']
+    start = time.perf_counter()
+    result = subprocess.run(cmd, env=get_env(home), capture_output=True, text=True, timeout=300)
+    wall = (time.perf_counter() - start) * 1000
+    if not os.path.exists(trace_path):
+        print(result.stdout)
+        print(result.stderr)
+        raise RuntimeError("Trace file not created, app failed to start")
+    with open(trace_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    os.remove(trace_path)
+    data['wall_ms'] = wall
+    return data
+
+
+def populate(user_dir: str, contexts: int, items: int, presets: int, notes: int):
+    """
+    Populate user profile with synthetic data
+
+    :param user_dir: user config directory
+    :param contexts: number of contexts
+    :param items: number of items per context
+    :param presets: number of presets
+    :param notes: number of notepad tabs
+    """
+    now = int(time.time())
+    text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20
+    conn = sqlite3.connect(os.path.join(user_dir, 'db.sqlite'))
+    with conn:
+        for i in range(contexts):
+            cur = conn.execute(
+                "INSERT INTO ctx_meta (uuid, created_ts, updated_ts, name, mode, model, last_mode, last_model, "
+                "extra, is_initialized, is_deleted, is_important, is_archived) "
+                "VALUES (?, ?, ?, ?, 'chat', 'gpt-4', 'chat', 'gpt-4', '', 1, 0, 0, 0)",
+                (str(uuid.uuid4()), now - i, now - i, "Context {}".format(i)),
+            )
+            meta_id = cur.lastrowid
+            conn.executemany(
+                "INSERT INTO ctx_item (meta_id, input, output, input_name, output_name, input_ts, output_ts, "
+                "mode, model, input_tokens, output_tokens, total_tokens) "
+                "VALUES (?, ?, ?, 'User', 'AI', ?, ?, 'chat', 'gpt-4', 100, 100, 200)",
+                [(meta_id, text, text, now - i, now - i) for _ in range(items)],
+            )
+        conn.executemany(
+            "INSERT INTO notepad (idx, uuid, created_ts, updated_ts, title, content, is_deleted) "
+            "VALUES (?, ?, ?, ?, ?, ?, 0)",
+            [(i + 1, str(uuid.uuid4()), now, now, "Note {}".format(i), text) for i in range(notes)],
+        )
+    conn.close()
+
+    src = os.path.join(base_presets_dir, 'current.chat.json')
+    dst_dir = os.path.join(user_dir, 'presets')
+    for i in range(presets):
+        shutil.copyfile(src, os.path.join(dst_dir, 'bench_{}.json'.format(i)))
+
+
+def report(runs: list):
+    """
+    Print median span times
+
+    :param runs: list of trace dicts
+    """
+    spans = {}
+    order = []
+    for data in runs:
+        for event in data['traceEvents']:
+            name = event['name']
+            if name not in spans:
+                spans[name] = []
+                order.append((event['ts'], name))
+            spans[name].append(event['dur'] / 1000)
+    print("{:<40} {:>10} {:>10} {:>10}".format("span", "median ms", "min ms", "max ms"))
+    for _, name in sorted(order):
+        values = spans[name]
+        print("{:<40} {:>10.1f} {:>10.1f} {:>10.1f}".format(
+            name, statistics.median(values), min(values), max(values)))
+    wall = [data['wall_ms'] for data in runs]
+    print("{:<40} {:>10.1f} {:>10.1f} {:>10.1f}".format(
+        "process wall time", statistics.median(wall), min(wall), max(wall)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PyGPT cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="number of measured runs")
+    parser.add_argument("--contexts", type=int, default=2000, help="number of synthetic contexts")
+    parser.add_argument("--items", type=int, default=10, help="number of items per context")
+    parser.add_argument("--presets", type=int, default=200, help="number of synthetic presets")
+    parser.add_argument("--notes", type=int, default=10, help="number of notepad tabs")
+    parser.add_argument("--keep", action="store_true", help="keep temporary profile directory")
+    args = parser.parse_args()
+
+    home = tempfile.mkdtemp(prefix='pygpt_bench_')
+    trace_path = os.path.join(home, 'trace.json')
+    user_dir = os.path.join(home, '.config', 'pygpt-net')
+    try:
+        print("Installing profile in: {}".format(home))
+        launch(home, trace_path)  # first run installs default user files and DB
+        populate(user_dir, args.contexts, args.items, args.presets, args.notes)
+        launch(home, trace_path)  # warm-up (migrations, patches)
+
+        runs = []
+        for i in range(args.runs):
+            runs.append(launch(home, trace_path))
+            print("Run {}/{}: {:.1f} ms".format(i + 1, args.runs, runs[-1]['wall_ms']))
+        report(runs)
+    finally:
+        if not args.keep:
+            shutil.rmtree(home, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+import json
+import os
+import subprocess
+import sys
+
+# modules already loaded by the core container (llama-index, langchain, Qt) are not measured
+BASE_MODULES = [
+    'pygpt_net.core.idx',
+    'pygpt_net.core.chain',
+    'pygpt_net.plugin.base',
+    'pygpt_net.provider.audio_input.base',
+]
+
+# modules registered at startup in launcher
+MODULES = [
+    'pygpt_net.provider.llms.anthropic',
+    'pygpt_net.provider.llms.azure_openai',
+    'pygpt_net.provider.llms.hugging_face',
+    'pygpt_net.provider.llms.llama',
+    'pygpt_net.provider.llms.ollama',
+    'pygpt_net.provider.llms.openai',
+    'pygpt_net.provider.vector_stores.chroma',
+    'pygpt_net.provider.vector_stores.elasticsearch',
+    'pygpt_net.provider.vector_stores.pinecode',
+    'pygpt_net.provider.vector_stores.redis',
+    'pygpt_net.provider.audio_input.google_speech_recognition',
+    'pygpt_net.provider.audio_input.google_cloud_speech_recognition',
+    'pygpt_net.provider.audio_input.bing_speech_recognition',
+    'pygpt_net.plugin.cmd_web',
+    'pygpt_net.plugin.cmd_code_interpreter',
+    'pygpt_net.plugin.audio_input',
+]
+
+# heavy third-party libraries that should be imported only on first use
+HEAVY = [
+    'anthropic',
+    'bs4',
+    'chromadb',
+    'docker',
+    'elasticsearch',
+    'langchain_community',
+    'langchain_openai',
+    'llama_index.llms.anthropic',
+    'llama_index.llms.openai',
+    'llama_index.embeddings.openai',
+    'llama_index.vector_stores.chroma',
+    'llama_index.vector_stores.elasticsearch',
+    'llama_index.vector_stores.pinecone',
+    'llama_index.vector_stores.redis',
+    'pinecone',
+    'pyaudio',
+    'speech_recognition',
+]
+
+CODE = '''
+import json, sys, time
+for name in {base!r}:
+    __import__(name)
+before = set(sys.modules)
+start = time.perf_counter()
+error = None
+try:
+    __import__({module!r})
+except Exception as e:
+    error = str(e)
+elapsed = (time.perf_counter() - start) * 1000
+heavy = [m for m in {heavy!r} if m in sys.modules and m not in before]
+print(json.dumps({{"ms": elapsed, "heavy": heavy, "error": error}}))
+'''
+
+
+def measure(module: str) -> dict:
+    """
+    Measure cold import time of module in a fresh interpreter
+
+    :param module: module name
+    :return: dict with time in ms, heavy modules loaded and error (if any)
+    """
+    code = CODE.format(base=BASE_MODULES, module=module, heavy=HEAVY)
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [src_dir, env.get('PYTHONPATH')]))
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env)
+    try:
+        return json.loads(result.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        return {"ms": 0.0, "heavy": [], "error": result.stderr.strip().splitlines()[-1:]}
+
+
+def report(modules: list):
+    """
+    Print import time report
+
+    :param modules: list of module names
+    """
+    total = 0.0
+    print(f"{'module':<64} {'ms':>9}  heavy imports")
+    for module in modules:
+        data = measure(module)
+        total += data['ms']
+        heavy = ', '.join(data['heavy']) or '-'
+        if data['error']:
+            heavy = f"error: {data['error']}"
+        print(f"{module:<64} {data['ms']:>9.1f}  {heavy}")
+    print(f"{'total':<64} {total:>9.1f}")
+
+
+src_dir = os.path.join(os.path.dirname(__file__), '..', 'src')
+
+if __name__ == '__main__':
+    report(sys.argv[1:] or MODULES)
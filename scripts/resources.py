@@ -7,7 +7,8 @@ def generate_qrc_file(source_dir, output_file):
 
     qrc_content = '<RCC>\n'
     for svg_file in svg_files:
-        file_path = os.path.join(source_dir, svg_file)
+        file_path = os.path.relpath(os.path.join(source_dir, svg_file), os.path.dirname(output_file))
+        file_path = file_path.replace(os.sep, '/')
         qrc_content += '    <qresource prefix="/icons">\n'
         qrc_content += f'        <file alias="{svg_file}">{file_path}</file>\n'
         qrc_content += '    </qresource>\n'
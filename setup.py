@@ -1,6 +1,6 @@
 from setuptools import setup, find_packages
 
-VERSION = '2.1.37'
+VERSION = '2.1.38'
 DESCRIPTION = 'Desktop AI Assistant powered by GPT-4, GPT-4V, GPT-3.5, DALL-E 3, Langchain LLMs, Llama-index, ' \
               'Whisper and more with chatbot, assistant, text completion, vision and image generation, ' \
               'internet access, chat with files, commands and code execution, file upload and download and more'
@@ -64,6 +64,7 @@ setup(
         'llama-index-readers-microsoft-onedrive>=0.1.3, <0.2.0',
         'llama-index-readers-twitter>=0.1.3, <0.2.0',
         'llama-index-readers-web>=0.1.6, <0.2.0',
+        'lxml>=5.1.0, <6.0.0',
         'Markdown>=3.5.1, <4.0.0',
         'nbconvert>=7.16.1, <8.0.0',
         'openai>=1.12.0, <2.0.0',
@@ -6,9 +6,16 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.13 15:00:00                  #
+# Updated Date: 2024.03.22 12:00:00                  #
 # ================================================== #
 
+import multiprocessing
+
+from pygpt_net.core.profiler import Profiler
+
+with Profiler.span("import.icons_rc"):
+    import pygpt_net.icons_rc
+
 from pygpt_net.launcher import Launcher
 
 # plugins
@@ -34,12 +41,14 @@ from pygpt_net.provider.llms.anthropic import AnthropicLLM
 from pygpt_net.provider.llms.azure_openai import AzureOpenAILLM
 from pygpt_net.provider.llms.hugging_face import HuggingFaceLLM
 from pygpt_net.provider.llms.llama import Llama2LLM
+from pygpt_net.provider.llms.local import LocalLLM
 from pygpt_net.provider.llms.ollama import OllamaLLM
 from pygpt_net.provider.llms.openai import OpenAILLM
 
 # vector store providers (llama-index)
 from pygpt_net.provider.vector_stores.chroma import ChromaProvider
 from pygpt_net.provider.vector_stores.elasticsearch import ElasticsearchProvider
+from pygpt_net.provider.vector_stores.numpy_mmap import NumpyProvider
 from pygpt_net.provider.vector_stores.pinecode import PinecodeProvider
 from pygpt_net.provider.vector_stores.redis import RedisProvider
 from pygpt_net.provider.vector_stores.simple import SimpleProvider
@@ -292,6 +301,7 @@ def run(**kwargs):
     launcher.add_llm(AnthropicLLM())
     launcher.add_llm(HuggingFaceLLM())
     launcher.add_llm(Llama2LLM())
+    launcher.add_llm(LocalLLM())
     launcher.add_llm(OllamaLLM())
 
     # register custom langchain and llama-index LLMs
@@ -303,6 +313,7 @@ def run(**kwargs):
     # register base vector store providers (llama-index)
     launcher.add_vector_store(ChromaProvider())
     launcher.add_vector_store(ElasticsearchProvider())
+    launcher.add_vector_store(NumpyProvider())
     launcher.add_vector_store(PinecodeProvider())
     launcher.add_vector_store(RedisProvider())
     launcher.add_vector_store(SimpleProvider())
@@ -318,4 +329,5 @@ def run(**kwargs):
     
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()  # required by indexing pipeline processes in compiled version
     run()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.17 13:00:00                  #
+# Updated Date: 2024.03.22 20:00:00                  #
 # ================================================== #
 
 import copy
@@ -16,6 +16,7 @@ import re
 from pathlib import Path
 from packaging.version import Version
 
+from pygpt_net.core.profiler import Profiler
 from pygpt_net.provider.core.config.json_file import JsonFileProvider
 
 
@@ -43,6 +44,7 @@ class Config:
         self.data_session = {}  # temporary config (session only)
         self.version = self.get_version()
         self.dirs = {
+            "cache": "cache",
             "capture": "capture",
             "css": "css",
             "data": "data",
@@ -333,13 +335,18 @@ class Config:
 
         :param all: load all configs
         """
-        self.load_config(all)
+        with Profiler.span("config.load"):
+            self.load_config(all)
 
         if all:
-            self.window.core.modes.load()
-            self.window.core.models.load()
-            self.window.core.presets.load()
-            self.window.core.plugins.load_presets()
+            with Profiler.span("modes.load"):
+                self.window.core.modes.load()
+            with Profiler.span("models.load"):
+                self.window.core.models.load()
+            with Profiler.span("presets.load"):
+                self.window.core.presets.load()
+            with Profiler.span("plugins.load_presets"):
+                self.window.core.plugins.load_presets()
 
     def load_config(self, all: bool = True):
         """
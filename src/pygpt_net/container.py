@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.02.24 00:00:00                  #
+# Updated Date: 2024.03.22 20:00:00                  #
 # ================================================== #
 
 from pygpt_net.config import Config
@@ -22,6 +22,7 @@ from pygpt_net.core.ctx import Ctx
 from pygpt_net.core.db import Database
 from pygpt_net.core.debug import Debug
 from pygpt_net.core.dispatcher import Dispatcher
+from pygpt_net.core.fetch import Fetch
 from pygpt_net.core.idx import Idx
 from pygpt_net.core.installer import Installer
 from pygpt_net.core.filesystem import Filesystem
@@ -36,6 +37,7 @@ from pygpt_net.core.plugins import Plugins
 from pygpt_net.core.presets import Presets
 from pygpt_net.core.prompt import Prompt
 from pygpt_net.core.settings import Settings
+from pygpt_net.core.summarizer import Summarizer
 from pygpt_net.core.tokens import Tokens
 from pygpt_net.core.updater import Updater
 from pygpt_net.core.web import Web
@@ -65,6 +67,7 @@ class Container:
         self.db = Database(window)
         self.debug = Debug(window)
         self.dispatcher = Dispatcher(window)
+        self.fetch = Fetch(window)
         self.filesystem = Filesystem(window)
         self.gpt = Gpt(window)
         self.history = History(window)
@@ -80,6 +83,7 @@ class Container:
         self.presets = Presets(window)
         self.prompt = Prompt(window)
         self.settings = Settings(window)
+        self.summarizer = Summarizer(window)
         self.tokens = Tokens(window)
         self.updater = Updater(window)
         self.web = Web(window)
@@ -6,16 +6,19 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.18 03:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
+import copy
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import QApplication
 
 from pygpt_net.core.dispatcher import Event
 from pygpt_net.core.worker import Worker, WorkerSignals
+from pygpt_net.item.ctx import CtxItem
 
 
 class Command:
@@ -92,6 +95,147 @@ class Command:
                 window.core.dispatcher.apply(id, event, is_async=True)
         finished_signal.emit(event)
 
+    def dispatch_parallel(self, event: Event):
+        """
+        Dispatch cmd execute event with independent commands executed concurrently
+
+        Commands accessing the same path or URL are kept serialized, results are merged
+        into ctx.results in the original order of commands before reply.
+
+        :param event: event object
+        """
+        self.window.core.debug.info("Dispatch CMD event begin (parallel): " + event.name)
+        if self.window.core.debug.enabled():
+            self.window.core.debug.debug("EVENT BEFORE: " + str(event))
+
+        self.window.stateChanged.emit(self.window.STATE_BUSY)
+        worker = Worker(self.worker_parallel)
+        worker.signals = WorkerSignals()
+        worker.signals.finished.connect(self.handle_finished_parallel)
+        worker.kwargs['event'] = event
+        worker.kwargs['window'] = self.window
+        worker.kwargs['finished_signal'] = worker.signals.finished
+        self.window.threadpool.start(worker)
+
+    def worker_parallel(self, event: Event, window, finished_signal: Signal):
+        """
+        Parallel command worker callback
+
+        :param event: event object
+        :param window: Window instance
+        :param finished_signal: WorkerSignals: finished signal
+        """
+        sub_ctxs = []
+        try:
+            commands = event.data['commands']
+            groups = window.core.command.group_independent(commands)
+            max_workers = window.core.config.get("cmd.parallel.workers")
+            if not max_workers or max_workers < 1:
+                max_workers = 1
+            max_workers = min(len(groups), int(max_workers))
+            window.core.debug.info(
+                "Executing {} commands in {} independent groups ({} workers)...".format(
+                    len(commands),
+                    len(groups),
+                    max_workers,
+                )
+            )
+
+            sub_ctxs = [None] * len(commands)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self.run_group, group, event.ctx, window) for group in groups]
+                for future in futures:
+                    for idx, sub_ctx in future.result():
+                        sub_ctxs[idx] = sub_ctx
+        except Exception as e:
+            window.core.debug.log(e)
+            event.stop = True  # finish without reply, UI must be unlocked
+        finally:
+            if self.is_stop():
+                self.stop = False  # unlock needed here
+                event.stop = True
+            event.data['sub_ctx'] = [sub_ctx for sub_ctx in sub_ctxs if sub_ctx is not None]
+            finished_signal.emit(event)
+
+    def run_group(self, group: list, ctx: CtxItem, window) -> list:
+        """
+        Execute group of dependent commands one by one (in executor thread)
+
+        :param group: list of (index, command) tuples
+        :param ctx: parent context item
+        :param window: Window instance
+        :return: list of (index, sub context) tuples
+        """
+        executed = []
+        for idx, cmd in group:
+            if self.is_stop():
+                break
+            sub_ctx = self.prepare_sub_ctx(ctx, cmd)
+            sub_event = Event(Event.CMD_EXECUTE, {
+                'commands': [cmd],
+            })
+            sub_event.ctx = sub_ctx
+            try:
+                for id in window.core.plugins.get_ids():
+                    if window.controller.plugins.is_enabled(id):
+                        if sub_event.stop:
+                            break
+                        window.core.dispatcher.apply(id, sub_event)
+            except Exception as e:
+                window.core.debug.log(e)
+                sub_ctx.results.append({
+                    "request": {
+                        "cmd": cmd.get("cmd"),
+                    },
+                    "result": "Error {}".format(e),
+                })
+                sub_ctx.reply = True
+            executed.append((idx, sub_ctx))
+        return executed
+
+    def prepare_sub_ctx(self, ctx: CtxItem, cmd: dict) -> CtxItem:
+        """
+        Prepare context item for single command executed in parallel
+
+        :param ctx: parent context item
+        :param cmd: command
+        :return: sub context item
+        """
+        sub_ctx = copy.copy(ctx)
+        sub_ctx.cmds = [cmd]
+        sub_ctx.results = []
+        sub_ctx.urls = []
+        sub_ctx.doc_ids = []
+        sub_ctx.reply = False
+        sub_ctx.extra_ctx = None
+        sub_ctx.sub_reply = True
+        sub_ctx.sub_extra = []
+        return sub_ctx
+
+    def merge_results(self, ctx: CtxItem, sub_ctxs: list):
+        """
+        Merge results from sub contexts into parent context (in commands order)
+
+        :param ctx: parent context item
+        :param sub_ctxs: list of sub context items
+        """
+        extra_ctx = []
+        for sub_ctx in sub_ctxs:
+            ctx.results.extend(sub_ctx.results)
+            for url in sub_ctx.urls:
+                if url not in ctx.urls:
+                    ctx.urls.append(url)
+            if len(sub_ctx.doc_ids) > 0:
+                ctx.doc_ids.extend(sub_ctx.doc_ids)
+                ctx.index_meta = sub_ctx.index_meta
+            if sub_ctx.extra_ctx:
+                extra_ctx.append(sub_ctx.extra_ctx)
+            if sub_ctx.reply:
+                ctx.reply = True
+            ctx.sub_extra.extend(sub_ctx.sub_extra)
+        if len(extra_ctx) > 0:
+            ctx.extra_ctx = "\n\n".join(extra_ctx)
+
     def is_stop(self) -> bool:
         """
         Check if stop is requested
@@ -132,3 +276,29 @@ class Command:
                     internal=ctx.internal,
                     prev_ctx=prev_ctx,
                 )
+
+    def handle_finished_parallel(self, event: Event):
+        """
+        Handle parallel command execution finish (merge results and reply)
+
+        :param event: event object
+        """
+        ctx = event.ctx
+        if ctx is None or event.stop:
+            # nothing to reply, restore idle state
+            self.window.ui.status("")
+            self.window.controller.chat.common.unlock_input()
+            self.window.stateChanged.emit(self.window.STATE_IDLE)
+            return
+        self.merge_results(ctx, event.data.get('sub_ctx', []))
+
+        # handle post-finishing operations (once per batch)
+        post_update = []
+        for extra_data in ctx.sub_extra:
+            if isinstance(extra_data, dict) and isinstance(extra_data.get("post_update"), list):
+                post_update.extend(extra_data["post_update"])
+        ctx.sub_extra = []
+        if "file_explorer" in post_update:
+            self.window.controller.files.update_explorer()
+
+        self.window.core.dispatcher.reply(ctx)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.09 21:00:00                  #
+# Updated Date: 2024.03.22 10:00:00                  #
 # ================================================== #
 
 import datetime
@@ -16,6 +16,7 @@ from pygpt_net.utils import trans
 from .common import Common
 from .indexer import Indexer
 from .settings import Settings
+from .watcher import Watcher
 
 
 class Idx:
@@ -29,6 +30,7 @@ class Idx:
         self.settings = Settings(window)
         self.common = Common(window)
         self.indexer = Indexer(window)
+        self.watcher = Watcher(window)
         self.current_idx = "base"
 
     def setup(self):
@@ -39,6 +41,8 @@ class Idx:
         self.indexer.update_explorer()
         self.common.setup()
         self.update()
+        self.watcher.setup()
+        self.indexer.resume_jobs()
 
     def select(self, idx: int):
         """
@@ -96,6 +100,42 @@ class Idx:
             return
         self.indexer.index_all_files(idx)
 
+    def pause_jobs_by_idx(self, idx: int):
+        """
+        Pause indexing jobs of index
+
+        :param idx: idx of the list (row idx)
+        """
+        idx = self.window.core.idx.get_by_idx(idx)
+        if idx is None:
+            return
+        for job in self.window.core.idx.jobs.get_by_idx(idx):
+            self.indexer.pause_job(job["id"])
+
+    def resume_jobs_by_idx(self, idx: int):
+        """
+        Resume paused indexing jobs of index
+
+        :param idx: idx of the list (row idx)
+        """
+        idx = self.window.core.idx.get_by_idx(idx)
+        if idx is None:
+            return
+        for job in self.window.core.idx.jobs.get_by_idx(idx):
+            self.indexer.resume_job(job["id"])
+
+    def cancel_jobs_by_idx(self, idx: int):
+        """
+        Cancel indexing jobs of index
+
+        :param idx: idx of the list (row idx)
+        """
+        idx = self.window.core.idx.get_by_idx(idx)
+        if idx is None:
+            return
+        for job in self.window.core.idx.jobs.get_by_idx(idx):
+            self.indexer.cancel_job(job["id"])
+
     def set_by_idx(self, idx: int):
         """
         Set idx by list idx
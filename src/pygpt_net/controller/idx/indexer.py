@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.15 10:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
 import datetime
@@ -201,15 +201,8 @@ class Indexer:
             )
             return
 
-        worker = IndexWorker()
-        worker.window = self.window
-        worker.content = ts
-        worker.idx = idx
-        worker.type = "db_current"
-        worker.silent = silent
-        worker.signals.finished.connect(self.handle_finished_db_current)
-        worker.signals.error.connect(self.handle_error)
-        self.window.threadpool.start(worker)
+        job = self.window.core.idx.jobs.create("db_current", idx, ts)
+        self.start_job(job["id"], idx, silent)
 
     def index_path(
             self,
@@ -223,15 +216,92 @@ class Indexer:
         :param idx: index name
         """
         self.window.update_status(trans('idx.status.indexing'))
+        job = self.window.core.idx.jobs.create("file", idx, path)
+        self.start_job(job["id"], idx)
+
+    def start_job(
+            self,
+            id: str,
+            idx: str,
+            silent: bool = False
+    ):
+        """
+        Run or resume indexing job (threaded)
+
+        :param id: job id
+        :param idx: index name
+        :param silent: silent mode
+        """
         worker = IndexWorker()
         worker.window = self.window
-        worker.content = path
+        worker.content = id
         worker.idx = idx
-        worker.type = "file"
-        worker.signals.finished.connect(self.handle_finished_file)
+        worker.type = "job"
+        worker.silent = silent
+        worker.signals.finished.connect(self.handle_finished_job)
+        worker.signals.progress.connect(self.handle_progress)
         worker.signals.error.connect(self.handle_error)
         self.window.threadpool.start(worker)
 
+    def resume_jobs(self):
+        """Resume indexing jobs interrupted by closing the app or error"""
+        if not self.window.core.config.get('llama.idx.jobs.resume'):
+            return
+        for job in self.window.core.idx.jobs.get_unfinished():
+            self.window.core.idx.log("Resuming indexing job: {}".format(job["id"]))
+            self.start_job(job["id"], job["idx"], True)
+
+    def resume_job(self, id: str):
+        """
+        Resume paused indexing job
+
+        :param id: job id
+        """
+        job = self.window.core.idx.jobs.get(id)
+        if job is None or job["status"] != self.window.core.idx.jobs.STATUS_PAUSED:
+            return
+        self.window.update_status(trans('idx.status.indexing'))
+        self.start_job(id, job["idx"])
+
+    def pause_job(self, id: str):
+        """
+        Pause indexing job (stops after current chunk is stored)
+
+        :param id: job id
+        """
+        self.window.core.idx.jobs.pause(id)
+
+    def cancel_job(self, id: str):
+        """
+        Cancel indexing job (stops after current chunk is stored, indexed items are kept)
+
+        :param id: job id
+        """
+        self.window.core.idx.jobs.cancel(id)
+
+    def index_paths(
+            self,
+            paths: list,
+            idx: str = "base",
+            silent: bool = False
+    ):
+        """
+        Index changed files and directories (threaded)
+
+        :param paths: list of changed paths
+        :param idx: index name
+        :param silent: silent mode
+        """
+        worker = IndexWorker()
+        worker.window = self.window
+        worker.content = paths
+        worker.idx = idx
+        worker.type = "paths"
+        worker.silent = silent
+        worker.signals.finished.connect(self.handle_finished_paths)
+        worker.signals.error.connect(self.handle_error_paths)
+        self.window.threadpool.start(worker)
+
     def index_all_files(
             self,
             idx: str,
@@ -248,6 +318,9 @@ class Indexer:
         if not force:
             content = trans('idx.confirm.files.content').replace('{dir}', path) \
                       + "\n" + trans('idx.token.warn')
+            if self.window.core.idx.indexing.is_incremental():
+                # changes are scanned and logged by worker, scan of large tree would freeze UI here
+                content += "\n\n" + trans('idx.confirm.files.incremental')
             self.window.ui.dialogs.confirm(
                 type='idx.index.files.all',
                 id=idx,
@@ -474,6 +547,18 @@ class Indexer:
         self.window.core.debug.log(err)
         print(err)
 
+    @Slot(object)
+    def handle_error_paths(self, err: any):
+        """
+        Handle thread error signal (changed paths indexing)
+
+        :param err: error message
+        """
+        self.window.update_status(str(err))
+        self.window.core.debug.log(err)
+        print(err)
+        self.window.controller.idx.watcher.on_finished()
+
     @Slot(str, object, object)
     def handle_finished_db_current(
             self,
@@ -540,6 +625,67 @@ class Indexer:
         if len(errors) > 0:
             self.window.ui.dialogs.alert("\n".join(errors))
 
+    @Slot(object)
+    def handle_progress(self, progress: dict):
+        """
+        Handle indexing job progress signal
+
+        :param progress: job progress
+        """
+        jobs = self.window.core.idx.jobs
+        metrics = progress["metrics"]
+        if progress["status"] == jobs.STATUS_PAUSED:
+            msg = trans('idx.status.paused').format(**metrics)
+        else:
+            msg = trans('idx.status.progress').format(
+                done=metrics["done"],
+                total=metrics["total"],
+                rate=round(metrics["rate"], 2),
+                eta=jobs.format_eta(metrics["eta"]),
+                size=jobs.format_size(metrics["bytes"]),
+                calls=metrics["embed_calls"],
+            )
+        self.window.update_status(msg)
+
+    @Slot(str, object, object, bool)
+    def handle_finished_job(
+            self,
+            idx: str,
+            job: dict,
+            errors: list,
+            silent: bool = False
+    ):
+        """
+        Handle indexing job finished signal
+
+        :param idx: index name
+        :param job: job data
+        :param errors: errors
+        :param silent: silent mode (no msg and status update)
+        """
+        if job["type"] == "file":
+            num = job["result"]  # files are appended to index at checkpoints
+            if num > 0:
+                msg = trans('idx.status.success') + f" {num}"
+                self.update_idx_status(idx)
+                self.window.controller.idx.after_index(idx)  # post-actions (update UI, etc.)
+                if not silent:
+                    self.window.update_status(msg)
+                    self.window.ui.dialogs.alert(msg)
+            elif not silent:
+                self.window.update_status(trans('idx.status.empty'))
+            if len(errors) > 0:
+                if silent:
+                    self.window.update_status("\n".join(errors))
+                else:
+                    self.window.ui.dialogs.alert("\n".join(errors))
+        else:
+            self.handle_finished_db_current(idx, job["result"], errors, silent)
+        if job["status"] == self.window.core.idx.jobs.STATUS_CANCELLED:
+            self.window.update_status(
+                trans('idx.status.cancelled').format(**self.window.core.idx.jobs.get_metrics(job))
+            )
+
     @Slot(str, object, object, bool)
     def handle_finished_file(
             self,
@@ -565,8 +711,32 @@ class Indexer:
             if not silent:
                 self.window.update_status(msg)
                 self.window.ui.dialogs.alert(msg)
-        else:
+        elif not silent:
             self.window.update_status(trans('idx.status.empty'))
 
         if len(errors) > 0:
-            self.window.ui.dialogs.alert("\n".join(errors))
+            if silent:
+                self.window.update_status("\n".join(errors))
+            else:
+                self.window.ui.dialogs.alert("\n".join(errors))
+
+    @Slot(str, object, object, bool)
+    def handle_finished_paths(
+            self,
+            idx: str,
+            files: dict,
+            errors: list,
+            silent: bool = False
+    ):
+        """
+        Handle changed paths indexing finished signal
+
+        :param idx: index name
+        :param files: indexed files
+        :param errors: errors
+        :param silent: silent mode (no msg and status update)
+        """
+        self.handle_finished_file(idx, files, errors, silent)
+        if len(files) == 0:
+            self.update_explorer()  # removed files
+        self.window.controller.idx.watcher.on_finished()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.21 18:00:00                  #
+# ================================================== #
+
+
+class Watcher:
+    def __init__(self, window=None):
+        """
+        Directory watcher controller
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.busy = False  # indexing of previous batch in progress
+
+    def is_enabled(self) -> bool:
+        """
+        Check if watching directories is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.window.core.config.get('llama.idx.watch'))
+
+    def get_idx(self) -> str:
+        """
+        Get index used for re-indexing of watched directories
+
+        :return: index name
+        """
+        idx = self.window.core.config.get('llama.idx.watch.index')
+        if not idx:
+            idx = "base"
+        return idx
+
+    def setup(self):
+        """Start watcher if enabled"""
+        if self.is_enabled():
+            self.window.core.idx.watcher.start()
+
+    def stop(self):
+        """Stop watcher"""
+        self.window.core.idx.watcher.stop()
+
+    def restart(self):
+        """Restart watcher (after settings change)"""
+        self.stop()
+        self.setup()
+
+    def on_update(self):
+        """On app post-update: send changed paths to indexer"""
+        if self.busy or not self.window.core.idx.watcher.is_running():
+            return
+        paths = self.window.core.idx.watcher.get_batch()
+        if not paths:
+            return
+        self.busy = True
+        self.window.controller.idx.indexer.index_paths(
+            paths,
+            self.get_idx(),
+            silent=True,
+        )
+
+    def on_finished(self):
+        """On batch indexing finished"""
+        self.busy = False
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.15 12:00:00                  #
+# Updated Date: 2024.03.20 18:00:00                  #
 # ================================================== #
 
 from pygpt_net.utils import trans
@@ -27,14 +27,9 @@ class Plugins:
         # plugins: info
         self.window.controller.plugins.update_info()
 
-        # reload all domains (plugin locale files)
+        # plugin domains (plugin locale files) are cleared on language change
+        # and loaded again on first use, so no need to reload them here
         ids = self.window.core.plugins.plugins.keys()
-        for id in ids:
-            plugin = self.window.core.plugins.plugins[id]
-            if not plugin.use_locale:
-                continue
-            domain = 'plugin.{}'.format(id)
-            trans('', True, domain)
 
         # apply to plugin settings
         for id in ids:
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.18 03:00:00                  #
+# Updated Date: 2024.03.20 10:00:00                  #
 # ================================================== #
 
 from PySide6.QtGui import QAction
@@ -414,6 +414,12 @@ class Plugins:
         })
         ctx.results = []
         event.ctx = ctx
+
+        # run independent commands concurrently if allowed
+        if len(commands) > 1 and self.window.core.dispatcher.parallel_allowed(ctx):
+            self.window.controller.command.dispatch_parallel(event)
+            return
+
         self.window.controller.command.dispatch(event)
 
     def apply_cmds_inline(self, ctx: CtxItem, cmds: list):
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.09 07:00:00                  #
+# Updated Date: 2024.03.21 18:00:00                  #
 # ================================================== #
 
 import copy
@@ -150,6 +150,13 @@ class Editor:
         if self.config_changed('llama.hub.loaders.args') or self.config_changed('llama.hub.loaders.use_local'):
             self.window.core.idx.indexing.reload_loaders()
 
+        # restart directory watcher
+        for key in ['llama.idx.watch', 'llama.idx.watch.paths', 'llama.idx.watch.debounce',
+                    'llama.idx.watch.interval', 'llama.idx.recursive']:
+            if self.config_changed(key):
+                self.window.controller.idx.watcher.restart()
+                break
+
         # update idx list
         if self.config_changed('llama.idx.list'):
             self.window.controller.idx.settings.update_idx_choices()
@@ -6,9 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.15 12:00:00                  #
+# Updated Date: 2024.03.22 18:00:00                  #
 # ================================================== #
 
+import threading
 import time
 from datetime import datetime, timedelta
 
@@ -22,6 +23,7 @@ class Bridge:
         """
         self.window = window
         self.last_call = None
+        self.rate_lock = threading.Lock()
 
     def call(self, **kwargs) -> bool:
         """
@@ -104,18 +106,20 @@ class Bridge:
         return self.window.core.gpt.quick_call(**kwargs)
 
     def apply_rate_limit(self):
-        """Apply API calls RPM limit"""
+        """Apply API calls RPM limit (thread-safe, concurrent calls get consecutive slots)"""
         max_per_minute = 60
         if self.window.core.config.has("max_requests_limit"):
             max_per_minute = int(self.window.core.config.get("max_requests_limit")) # per minute
         if max_per_minute <= 0:
             return
         interval = timedelta(minutes=1) / max_per_minute
-        now = datetime.now()
-        if self.last_call is not None:
-            time_since_last_call = now - self.last_call
-            if time_since_last_call < interval:
-                sleep_time = (interval - time_since_last_call).total_seconds()
-                self.window.core.debug.debug("RPM limit: sleep for {} seconds".format(sleep_time))
-                time.sleep(sleep_time)
-        self.last_call = now
+        sleep_time = 0
+        with self.rate_lock:
+            now = datetime.now()
+            if self.last_call is not None and now - self.last_call < interval:
+                sleep_time = (self.last_call + interval - now).total_seconds()
+                now = self.last_call + interval  # reserve next slot
+            self.last_call = now
+        if sleep_time > 0:
+            self.window.core.debug.debug("RPM limit: sleep for {} seconds".format(sleep_time))
+            time.sleep(sleep_time)
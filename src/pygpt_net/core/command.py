@@ -6,11 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.17 13:00:00                  #
+# Updated Date: 2024.03.20 10:00:00                  #
 # ================================================== #
 
 import copy
 import json
+import os
 
 from pygpt_net.item.ctx import CtxItem
 
@@ -23,6 +24,7 @@ class Command:
         :param window: Window instance
         """
         self.window = window
+        self.resource_params = ["path", "src", "dst", "url"]  # params that identify accessed resource
 
     def append_syntax(self, data: dict) -> str:
         """
@@ -281,3 +283,104 @@ class Command:
             ctx.extra = {}
         ctx.extra["tool_calls_outputs"] = outputs
         return outputs
+
+    def get_owner(self, cmd: dict) -> str or None:
+        """
+        Get ID of enabled plugin that handles command
+
+        :param cmd: command dict
+        :return: plugin ID or None if not found
+        """
+        for id in self.window.core.plugins.get_ids():
+            if not self.window.controller.plugins.is_enabled(id):
+                continue
+            plugin = self.window.core.plugins.get(id)
+            if plugin is not None and cmd.get("cmd") in plugin.allowed_cmds:
+                return id
+
+    def get_resources(self, cmd: dict) -> list:
+        """
+        Get resources (paths, URLs) accessed by command
+
+        :param cmd: command dict
+        :return: list of normalized resource keys
+        """
+        resources = []
+        params = cmd.get("params")
+        if not isinstance(params, dict):
+            return resources
+        for key in self.resource_params:
+            if key not in params:
+                continue
+            values = params[key]
+            if not isinstance(values, list):
+                values = [values]
+            for value in values:
+                if isinstance(value, str) and value.strip() != "":
+                    resources.append(self.normalize_resource(value.strip()))
+        return resources
+
+    def normalize_resource(self, resource: str) -> str:
+        """
+        Normalize resource key (absolute path or URL)
+
+        :param resource: path or URL
+        :return: normalized resource key
+        """
+        if "://" in resource:
+            return resource.rstrip("/")
+        if not os.path.isabs(resource):
+            resource = os.path.join(self.window.core.config.get_user_dir('data'), resource)
+        return os.path.normcase(os.path.normpath(resource))
+
+    def is_conflict(self, a: str, b: str) -> bool:
+        """
+        Check if two resources overlap (the same resource or directory containing the other one)
+
+        :param a: resource key
+        :param b: resource key
+        :return: True if resources overlap
+        """
+        if a == b:
+            return True
+        if "://" in a or "://" in b:
+            return False
+        return a.startswith(b.rstrip(os.sep) + os.sep) or b.startswith(a.rstrip(os.sep) + os.sep)
+
+    def group_independent(self, cmds: list) -> list:
+        """
+        Split commands into independent groups that can be executed concurrently
+
+        Commands that access the same path or URL (or commands without any resource
+        handled by the same plugin) are placed in the same group and keep their original order.
+
+        :param cmds: commands list
+        :return: list of groups, each group is a list of (index, command) tuples
+        """
+        keys = []
+        for cmd in cmds:
+            resources = self.get_resources(cmd)
+            if len(resources) == 0:
+                resources = ["plugin:" + str(self.get_owner(cmd))]  # serialize per plugin
+            keys.append(resources)
+
+        # union-find over conflicting commands
+        parents = list(range(len(cmds)))
+
+        def find(i: int) -> int:
+            while parents[i] != i:
+                parents[i] = parents[parents[i]]
+                i = parents[i]
+            return i
+
+        for i in range(len(cmds)):
+            for j in range(i + 1, len(cmds)):
+                if find(i) == find(j):
+                    continue
+                if any(self.is_conflict(a, b) for a in keys[i] for b in keys[j]):
+                    parents[find(j)] = find(i)
+
+        groups = {}
+        for i, cmd in enumerate(cmds):
+            groups.setdefault(find(i), []).append((i, cmd))
+        return list(groups.values())
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.02.27 04:00:00                  #
+# Updated Date: 2024.03.22 08:00:00                  #
 # ================================================== #
 
 import time
@@ -79,6 +79,31 @@ class Idx:
         """
         return self.get_provider().clear_meta_indexed_all()
 
+    def set_meta_as_indexed_bulk(self, idx: str, items: dict) -> int:
+        """
+        Set ctx metas as indexed (batch of documents, all updates in one transaction)
+
+        :param idx: index name
+        :param items: dict: ctx meta ID -> list of inserted document IDs
+        :return: number of updated ctx metas
+        """
+        if not items:
+            return 0
+        ts = int(time.time())
+        store = self.window.core.idx.get_current_store()
+        metas = self.get_provider().get_meta_by_ids(list(items.keys()))
+        updated = []
+        for id, doc_ids in items.items():
+            meta = self.window.core.ctx.meta.get(id, metas.get(id))  # prefer already loaded meta
+            if meta is None or not doc_ids:
+                continue
+            for doc_id in doc_ids:
+                self.store_idx_data_in_meta(meta, store, idx, doc_id)
+            meta.indexed = ts
+            updated.append((meta, doc_ids[-1]))
+        self.get_provider().set_meta_indexed_bulk(store, idx, updated, ts)
+        return len(updated)
+
     def remove_meta_from_indexed(self, store: str, id: int, idx: str, doc_id: str = None) -> bool:
         """
         Remove ctx meta from indexed
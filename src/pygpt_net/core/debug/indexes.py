@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.12 06:00:00                  #
+# Updated Date: 2024.03.21 14:00:00                  #
 # ================================================== #
 
 import datetime
@@ -70,6 +70,18 @@ class IndexesDebug:
                                    str(self.window.core.config.get("llama.idx.excluded.force")))
         self.window.core.debug.add(self.id, 'Custom metadata:',
                                    str(self.window.core.config.get("llama.idx.custom_meta")))
+        self.window.core.debug.add(self.id, 'Embeddings batch [size]:',
+                                   str(self.window.core.idx.indexing.batch.get_size()))
+        self.window.core.debug.add(self.id, 'Embeddings batch [stats]:',
+                                   str(self.window.core.idx.indexing.batch.stats))
+        self.window.core.debug.add(self.id, 'Embeddings cache [max size]:',
+                                   str(self.window.core.idx.llm.cache.get_max_size()))
+        self.window.core.debug.add(self.id, 'Embeddings cache [stats]:',
+                                   str(self.window.core.idx.llm.cache.get_stats()))
+        self.window.core.debug.add(self.id, 'Pipeline [workers]:',
+                                   str(self.window.core.idx.indexing.pipeline.get_workers()))
+        self.window.core.debug.add(self.id, 'Pipeline [last run]:',
+                                   str(self.window.core.idx.indexing.pipeline.get_summary()))
 
         # ctx
         self.window.core.debug.add(self.id, 'CTX [auto]:',
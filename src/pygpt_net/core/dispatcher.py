@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.19 06:00:00                  #
+# Updated Date: 2024.03.20 10:00:00                  #
 # ================================================== #
 
 import json
@@ -151,12 +151,30 @@ class Dispatcher:
         disallowed_modes = ["assistant", "agent"]
         if ctx.internal:
             return False
+        if ctx.sub_reply:  # already running in parallel executor thread
+            return False
         if self.window.core.config.get("mode") in disallowed_modes:
             return False
         if len(ctx.cmds) > 1:  # if multiple commands then run synchronously
             return False
         return True
 
+    def parallel_allowed(self, ctx: CtxItem) -> bool:
+        """
+        Check if multiple commands can be executed concurrently
+
+        :param ctx: context item
+        :return: True if parallel execution is allowed
+        """
+        disallowed_modes = ["assistant", "agent"]
+        if ctx.internal:
+            return False
+        if not self.window.core.config.get("cmd.parallel"):
+            return False
+        if self.window.core.config.get("mode") in disallowed_modes:
+            return False
+        return True
+
     def dispatch(
             self,
             event: Event,
@@ -215,6 +233,8 @@ class Dispatcher:
         :param ctx: context object
         """
         if ctx is not None:
+            if ctx.sub_reply:
+                return  # results are collected and sent by parallel executor
             self.window.core.debug.info("Reply...")
             if self.window.core.debug.enabled() and self.is_log_display():
                 self.window.core.debug.debug("CTX REPLY: " + str(ctx))
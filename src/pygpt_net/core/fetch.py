@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.22 20:00:00                  #
+# ================================================== #
+
+import hashlib
+import json
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+
+class Fetch:
+    HEADERS = ["cache-control", "content-type", "etag", "expires", "last-modified"]  # stored headers
+
+    def __init__(self, window=None):
+        """
+        HTTP fetch with on-disk cache (Cache-Control, conditional revalidation)
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.session = None  # pooled HTTP session
+        self.size = None  # cache size in bytes, computed on first store
+        self.lock = threading.RLock()
+
+    def get_session(self) -> requests.Session:
+        """
+        Get pooled HTTP session (thread-safe, shared by all fetches)
+
+        :return: session
+        """
+        with self.lock:
+            if self.session is None:
+                adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+                self.session = requests.Session()
+                self.session.mount("http://", adapter)
+                self.session.mount("https://", adapter)
+            return self.session
+
+    def is_cache_enabled(self) -> bool:
+        """
+        Check if cache is enabled
+
+        :return: True if enabled
+        """
+        enabled = self.window.core.config.get("web.cache")
+        return enabled is None or bool(enabled)
+
+    def get_max_size(self) -> int:
+        """
+        Get max cache size
+
+        :return: max size in bytes
+        """
+        size = self.window.core.config.get("web.cache.max_size")  # MB
+        if size is None or int(size) <= 0:
+            size = 100
+        return int(size) * 1024 * 1024
+
+    def get_cache_dir(self) -> str:
+        """
+        Get cache directory
+
+        :return: path to cache directory
+        """
+        path = os.path.join(self.window.core.config.get_user_dir("cache"), "http")
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def get_key(self, url: str, headers: dict) -> str:
+        """
+        Get cache key (request headers included, e.g. API keys)
+
+        :param url: URL
+        :param headers: request headers
+        :return: cache key
+        """
+        data = url + "\n" + json.dumps(headers, sort_keys=True)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def get_expires(self, headers: dict, now: float) -> float or None:
+        """
+        Get expiration time from response headers
+
+        :param headers: response headers (lowercase)
+        :param now: response time
+        :return: expiration timestamp or None if response must not be stored
+        """
+        directives = {}
+        for item in headers.get("cache-control", "").split(","):
+            name, _, value = item.strip().lower().partition("=")
+            if name:
+                directives[name] = value.strip('"')
+        if "no-store" in directives:
+            return None
+        if "no-cache" in directives:
+            return now  # revalidate every time
+        if "max-age" in directives:
+            try:
+                return now + int(directives["max-age"])
+            except ValueError:
+                return now
+        if "expires" in headers:
+            try:
+                return parsedate_to_datetime(headers["expires"]).timestamp()
+            except Exception:
+                return now  # invalid date means already expired
+        return now
+
+    def load_entry(self, key: str) -> dict or None:
+        """
+        Load cache entry metadata
+
+        :param key: cache key
+        :return: metadata or None if not cached
+        """
+        path = os.path.join(self.get_cache_dir(), key)
+        try:
+            os.stat(path + ".bin")  # body must exist
+            with open(path + ".json", "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            return None
+
+    def save_entry(self, key: str, entry: dict, data: bytes = None):
+        """
+        Save cache entry (atomic replace)
+
+        :param key: cache key
+        :param entry: metadata
+        :param data: response body (None to update metadata only)
+        """
+        path = os.path.join(self.get_cache_dir(), key)
+        tmp_path = "{}.{}.tmp".format(path, threading.get_ident())
+        with self.lock:
+            if data is not None:
+                size = self.get_size()
+                try:
+                    size -= os.stat(path + ".bin").st_size  # replaced entry
+                except FileNotFoundError:
+                    pass
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path + ".bin")
+                self.size = size + len(data)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path + ".json")
+            if data is not None:
+                self.evict()
+
+    def read_entry(self, key: str) -> bytes:
+        """
+        Read cached response body (marked as recently used)
+
+        :param key: cache key
+        :return: response body
+        """
+        path = os.path.join(self.get_cache_dir(), key + ".bin")
+        with open(path, "rb") as f:
+            data = f.read()
+        os.utime(path)  # LRU
+        return data
+
+    def get_size(self) -> int:
+        """
+        Get cache size
+
+        :return: size in bytes
+        """
+        with self.lock:
+            if self.size is None:
+                with os.scandir(self.get_cache_dir()) as entries:
+                    self.size = sum(entry.stat().st_size for entry in entries if entry.name.endswith(".bin"))
+            return self.size
+
+    def evict(self):
+        """Remove least recently used entries if cache size exceeds the limit"""
+        max_size = self.get_max_size()
+        with self.lock:
+            if self.get_size() <= max_size:
+                return
+            path = self.get_cache_dir()
+            files = []
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".bin"):
+                        stat = entry.stat()
+                        files.append((stat.st_mtime, stat.st_size, entry.name[:-4]))
+            files.sort()
+            for mtime, size, key in files:
+                if self.size <= max_size * 0.9:
+                    break
+                for ext in [".bin", ".json"]:
+                    try:
+                        os.remove(os.path.join(path, key + ext))
+                    except FileNotFoundError:
+                        pass
+                self.size -= size
+
+    def clear(self):
+        """Clear cache"""
+        with self.lock:
+            with os.scandir(self.get_cache_dir()) as entries:
+                for entry in entries:
+                    os.remove(entry.path)
+            self.size = 0
+
+    def download(
+            self,
+            url: str,
+            headers: dict,
+            timeout: float = None,
+            verify: bool = True,
+            stop: threading.Event = None
+    ) -> (int, dict, bytes or None):
+        """
+        Download URL content
+
+        :param url: URL
+        :param headers: request headers
+        :param timeout: connect and read timeout (seconds)
+        :param verify: verify SSL certificate
+        :param stop: event set to abort download
+        :return: status code, response headers (lowercase), body or None if aborted
+        """
+        if not verify:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        chunks = []
+        with self.get_session().get(
+                url,
+                headers=headers,
+                timeout=timeout,
+                verify=verify,
+                stream=True,
+        ) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=65536):
+                if stop is not None and stop.is_set():
+                    return response.status_code, {}, None
+                chunks.append(chunk)
+            return response.status_code, {k.lower(): v for k, v in response.headers.items()}, b"".join(chunks)
+
+    def get(
+            self,
+            url: str,
+            headers: dict = None,
+            timeout: float = None,
+            verify: bool = True,
+            ttl: int = None,
+            stop: threading.Event = None
+    ) -> bytes:
+        """
+        Get URL content, from cache if fresh, revalidated with conditional GET if stale
+
+        :param url: URL
+        :param headers: request headers
+        :param timeout: connect and read timeout (seconds)
+        :param verify: verify SSL certificate
+        :param ttl: cache lifetime (seconds) overriding response headers, None or 0 = use headers, -1 = no cache
+        :param stop: event set to abort download (empty content is returned)
+        :return: response data (bytes)
+        """
+        headers = dict(headers or {})
+        if (ttl is not None and int(ttl) < 0) or not self.is_cache_enabled():
+            status, _, data = self.download(url, headers, timeout, verify, stop)
+            return data or b""
+
+        ttl = int(ttl or 0)
+        key = self.get_key(url, headers)
+        entry = self.load_entry(key)
+        now = time.time()
+        if entry is not None:
+            expires = entry["stored_ts"] + ttl if ttl > 0 else entry["expires"]
+            if expires > now:
+                try:
+                    return self.read_entry(key)  # fresh
+                except OSError:
+                    entry = None
+        if entry is not None:
+            if entry["headers"].get("etag"):
+                headers["If-None-Match"] = entry["headers"]["etag"]
+            if entry["headers"].get("last-modified"):
+                headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+
+        try:
+            status, response_headers, data = self.download(url, headers, timeout, verify, stop)
+        except Exception:
+            if entry is None:
+                raise
+            return self.read_entry(key)  # stale content if network failed
+        if data is None:
+            return b""  # aborted
+
+        if status == 304 and entry is not None:
+            entry["headers"].update({k: v for k, v in response_headers.items() if k in self.HEADERS})
+            entry["stored_ts"] = now
+            entry["expires"] = self.get_expires(entry["headers"], now) or now
+            self.save_entry(key, entry)
+            return self.read_entry(key)
+
+        expires = self.get_expires(response_headers, now)
+        validators = "etag" in response_headers or "last-modified" in response_headers
+        if expires is not None and (expires > now or validators or ttl > 0) \
+                and len(data) <= self.get_max_size():
+            entry = {
+                "url": url,
+                "headers": {k: v for k, v in response_headers.items() if k in self.HEADERS},
+                "stored_ts": now,
+                "expires": expires,
+            }
+            try:
+                self.save_entry(key, entry, data)
+            except Exception as e:
+                self.window.core.debug.log(e)
+        return data
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.06 02:00:00                  #
+# Updated Date: 2024.03.22 10:00:00                  #
 # ================================================== #
 
 import datetime
@@ -19,9 +19,12 @@ from pygpt_net.provider.core.index.db_sqlite import DbSqliteProvider
 from pygpt_net.provider.vector_stores import Storage
 
 from .indexing import Indexing
+from .jobs import Jobs
+from .lexical import Lexical
 from .llm import Llm
 from .chat import Chat
 from .metadata import Metadata
+from .watcher import Watcher
 
 from .types.ctx import Ctx
 from .types.external import External
@@ -37,10 +40,13 @@ class Idx:
         """
         self.window = window
         self.indexing = Indexing(window)
+        self.jobs = Jobs(window)
         self.llm = Llm(window)
         self.storage = Storage(window)
+        self.lexical = Lexical(window)
         self.chat = Chat(window, self.storage)
         self.metadata = Metadata(window)
+        self.watcher = Watcher(window)
 
         self.providers = {
             "json_file": JsonFileProvider(window),  # only for patching
@@ -151,6 +157,35 @@ class Idx:
             )  # store index
         return files, errors
 
+    def index_paths(
+            self,
+            idx: str = "base",
+            paths: list = None
+    ) -> (dict, list):
+        """
+        Index changed files and directories (index new and modified files, remove deleted)
+
+        :param idx: index name
+        :param paths: list of changed paths
+        :return: dict with indexed files (path -> id), list with errors
+        """
+        context = self.llm.get_service_context()
+        index = self.storage.get(
+            id=idx,
+            service_context=context,
+        )  # get or create index
+        files, errors = self.indexing.index_paths(
+            idx=idx,
+            index=index,
+            paths=paths,
+        )  # index files
+        if len(files) > 0:
+            self.storage.store(
+                id=idx,
+                index=index,
+            )  # store index
+        return files, errors
+
     def index_db_by_meta_id(
             self,
             idx: str = "base",
@@ -357,6 +392,7 @@ class Idx:
             doc_id = files[path]
             file_id = self.files.get_id(path)
             ts = int(datetime.datetime.now().timestamp())
+            stat = self.get_file_stat(path)  # manifest for incremental indexing
             if file_id not in self.items[store_id][idx].items:
                 id = self.files.append(
                     store_id=store_id,
@@ -364,6 +400,7 @@ class Idx:
                     file_id=file_id,
                     path=path,
                     doc_id=doc_id,
+                    stat=stat,
                 )
                 if id is not None:
                     self.items[store_id][idx].items[file_id] = {
@@ -372,15 +409,31 @@ class Idx:
                         "path": path,
                         "indexed_ts": ts,
                     }
+                    self.items[store_id][idx].items[file_id].update(stat)
             else:
-                # update indexed timestamp only
+                # update indexed timestamp and manifest only
                 self.files.update(
                     id=self.items[store_id][idx].items[file_id]["db_id"],  # DB id
                     doc_id=doc_id,
                     ts=ts,
+                    stat=stat,
                 )
                 self.items[store_id][idx].items[file_id]["id"] = doc_id
                 self.items[store_id][idx].items[file_id]["indexed_ts"] = ts
+                self.items[store_id][idx].items[file_id].update(stat)
+
+    def get_file_stat(self, path: str) -> dict:
+        """
+        Get indexed file manifest
+
+        :param path: file path
+        :return: dict with size, mtime and hash (empty if file not exists)
+        """
+        try:
+            return self.files.get_stat(path)
+        except Exception as e:
+            self.window.core.debug.log(e)
+            return {}
 
     def remove_doc(self, idx: str, doc_id: str):
         """
@@ -391,6 +444,7 @@ class Idx:
         """
         self.llm.get_service_context()  # init environment only (ENV API keys, etc.)
         if self.storage.remove_document(idx, doc_id):
+            self.storage.flush(idx)
             self.log("Removed document from index: " + idx + " - " + doc_id)
 
     def remove_file(self, idx: str, file: str):
@@ -410,6 +464,7 @@ class Idx:
                     id=idx,
                     doc_id=doc_id,
                 )
+                self.storage.flush(idx)
                 # remove from index data and db
                 del self.items[store_id][idx].items[file]
                 self.files.remove(store_id, idx, doc_id)
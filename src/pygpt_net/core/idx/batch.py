@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.22 00:00:00                  #
+# ================================================== #
+
+from llama_index.core import VectorStoreIndex
+from llama_index.core.indices.base import BaseIndex
+from llama_index.core.ingestion import run_transformations
+from llama_index.core.schema import Document, MetadataMode
+
+from .embeddings import CachedEmbedding
+
+
+class Batch:
+    def __init__(self, window=None, indexing=None):
+        """
+        Batched embedding and nodes insertion
+
+        :param window: Window instance
+        :param indexing: Indexing instance
+        """
+        self.window = window
+        self.indexing = indexing
+        self.index = None  # index of pending nodes
+        self.idx = None  # name of index of pending nodes (None if temporary index)
+        self.nodes = []  # pending nodes
+        self.docs = []  # pending documents
+        self.errors = []  # errors from last flushes
+        self.failed = []  # ids of documents not inserted
+        self.stats = {
+            "docs": 0,
+            "nodes": 0,
+            "requests": 0,
+            "inserts": 0,
+        }
+
+    def get_size(self) -> int:
+        """
+        Get batch size (max nodes embedded in one request)
+
+        :return: batch size, 0 if batching is disabled
+        """
+        size = self.window.core.config.get("llama.idx.embeddings.batch")
+        if size is None:
+            return 0
+        return max(0, int(size))
+
+    def is_enabled(self, index: BaseIndex) -> bool:
+        """
+        Check if batching is enabled for index
+
+        :param index: index instance
+        :return: True if enabled
+        """
+        return self.get_size() > 0 and isinstance(index, VectorStoreIndex)
+
+    def add(self, index: BaseIndex, doc: Document, idx: str = None):
+        """
+        Split document into nodes and add them to batch, flush if batch is full
+
+        :param index: index instance
+        :param doc: document
+        :param idx: index name (to update lexical index), None if temporary index
+        """
+        if self.index is not None and (self.index is not index or self.idx != idx):
+            self.flush()  # insert pending nodes to previous index
+        self.index = index
+        self.idx = idx
+        nodes = run_transformations([doc], index._transformations)
+        self.nodes.extend(nodes)
+        self.docs.append(doc)
+        if len(self.nodes) >= self.get_size():
+            self.flush()
+
+    def flush(self) -> list:
+        """
+        Embed pending nodes and insert them into index
+
+        :return: list with ids of inserted documents
+        """
+        index = self.index
+        idx = self.idx
+        nodes = self.nodes
+        docs = self.docs
+        self.index = None
+        self.idx = None
+        self.nodes = []
+        self.docs = []
+        if index is None or not docs:
+            return []
+
+        ids = [doc.id_ for doc in docs]
+        try:
+            self.embed(index, nodes)
+            index.insert_nodes(nodes)
+            for doc in docs:
+                index.docstore.set_document_hash(doc.get_doc_id(), doc.hash)
+            if idx is not None:
+                self.window.core.idx.lexical.add(idx, nodes)
+        except Exception as e:
+            self.errors.append(str(e))
+            self.failed.extend(ids)
+            self.window.core.debug.log(e)
+            return []
+
+        self.stats["docs"] += len(docs)
+        self.stats["nodes"] += len(nodes)
+        self.stats["inserts"] += 1
+        self.window.core.idx.log("Inserted batch: {} documents, {} nodes".format(len(docs), len(nodes)))
+        return ids
+
+    def embed(self, index: VectorStoreIndex, nodes: list):
+        """
+        Embed nodes in batches, one provider request per batch
+
+        :param index: index instance
+        :param nodes: nodes to embed
+        """
+        size = self.get_size()
+        embed_model = index._embed_model
+        model = embed_model
+        if isinstance(embed_model, CachedEmbedding):
+            model = embed_model.get_model()  # only not cached texts are requested
+
+        def request(texts: list) -> list:
+            self.indexing.apply_rate_limit(texts)  # apply RPM and TPM limits per batch
+            self.stats["requests"] += 1
+            return model.get_text_embedding_batch(texts)
+
+        batch_size = model.embed_batch_size
+        model.embed_batch_size = size
+        try:
+            nodes = [node for node in nodes if node.embedding is None]
+            for i in range(0, len(nodes), size):
+                batch = nodes[i:i + size]
+                texts = [node.get_content(metadata_mode=MetadataMode.EMBED) for node in batch]
+                if model is not embed_model:
+                    embeddings = embed_model.embed(texts, "text", request)
+                else:
+                    embeddings = request(texts)
+                for node, embedding in zip(batch, embeddings):
+                    node.embedding = embedding
+        finally:
+            model.embed_batch_size = batch_size
+
+    def get_errors(self) -> (list, list):
+        """
+        Get and clear errors from last flushes
+
+        :return: errors, ids of not inserted documents
+        """
+        errors = self.errors
+        failed = self.failed
+        self.errors = []
+        self.failed = []
+        return errors, failed
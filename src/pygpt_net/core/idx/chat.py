@@ -6,14 +6,18 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.13 01:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
 import json
+import os
 
+from llama_index.core.chat_engine import ContextChatEngine
+from llama_index.core.indices.base import BaseIndex
 from llama_index.core.llms import ChatMessage, MessageRole
 from llama_index.core.prompts import ChatPromptTemplate
 from llama_index.core.memory import ChatMemoryBuffer
+from llama_index.core.query_engine import RetrieverQueryEngine
 
 from pygpt_net.item.ctx import CtxItem
 from .context import Context
@@ -73,6 +77,7 @@ class Chat:
         model = kwargs.get("model", None)
         system_prompt = kwargs.get("system_prompt_raw", None)  # raw system prompt, without plugin ads
         stream = kwargs.get("stream", False)
+        context = kwargs.get("service_context", None)  # shared service context, optional
         query = ctx.input
 
         if model is None or not isinstance(model, ModelItem):
@@ -89,7 +94,8 @@ class Chat:
         if not self.storage.exists(idx):
             raise Exception("Index not prepared")
 
-        context = self.window.core.idx.llm.get_service_context(model=model)
+        if context is None:
+            context = self.window.core.idx.llm.get_service_context(model=model)
         index = self.storage.get(idx, service_context=context)  # get index
         input_tokens = self.window.core.tokens.from_llama_messages(
             query,
@@ -100,12 +106,16 @@ class Chat:
         tpl = self.get_custom_prompt(system_prompt)
         if tpl is not None:
             self.log("Query index with custom prompt: {}...".format(system_prompt))
-            response = index.as_query_engine(
+            response = self.get_query_engine(
+                index,
+                idx,
                 streaming=stream,
                 text_qa_template=tpl,
             ).query(query)  # query with custom sys prompt
         else:
-            response = index.as_query_engine(
+            response = self.get_query_engine(
+                index,
+                idx,
                 streaming=stream,
             ).query(query)  # query with default prompt
 
@@ -167,8 +177,9 @@ class Chat:
             history,
             model.id,
         )
-        chat_engine = index.as_chat_engine(
-            chat_mode="context",
+        chat_engine = self.get_chat_engine(
+            index,
+            idx,
             memory=memory,
             system_prompt=system_prompt,
         )
@@ -198,7 +209,7 @@ class Chat:
 
     def query_file(self, ctx: CtxItem, path: str, query: str, model: ModelItem = None) -> str:
         """
-        Query file using temp index (created on the fly)
+        Query file using temp index (created on the fly, reused while file is not modified)
 
         :param ctx: context
         :param path: path to file to index (in memory)
@@ -209,39 +220,38 @@ class Chat:
         if model is None:
             model = self.window.core.models.from_defaults()
         context = self.window.core.idx.llm.get_service_context(model=model)
-        tmp_id, index = self.storage.get_tmp(path, service_context=context)  # get or create tmp index
+        scope = json.dumps({"path": path, "model": model.id})
+        identifier = json.dumps({"path": path, "model": model.id, "version": self.get_file_version(path)})
+        is_cached = self.storage.has_tmp(identifier)
+        tmp_id, index = self.storage.get_tmp(identifier, service_context=context)  # get or create tmp index
 
         idx = "tmp:{}".format(path)  # tmp index id
-        self.log("Indexing to temporary in-memory index: {}...".format(idx))
-
-        # index file to tmp index
-        files, errors = self.window.core.idx.indexing.index_files(
-            idx=idx,
-            index=index,
-            path=path,
-            is_tmp=True,  # do not try to remove old doc id
-        )
-
-        # query tmp index
-        output = None
-        if len(files) > 0:
-            self.log("Querying temporary in-memory index: {}...".format(idx))
-            response = index.as_query_engine(
-                streaming=False,
-            ).query(query)  # query with default prompt
-            if response:
-                ctx.add_doc_meta(response.metadata)  # store metadata
-                output = response.response
-
-        # clean tmp index
-        self.log("Removing temporary in-memory index: {} ({})...".format(idx, tmp_id))
-        self.storage.clean_tmp(tmp_id)  # clean memory
+        if is_cached:
+            self.log("Reusing temporary in-memory index: {}...".format(idx))
+            num = 1
+        else:
+            self.log("Indexing to temporary in-memory index: {}...".format(idx))
+
+            # index file to tmp index
+            files, errors = self.window.core.idx.indexing.index_files(
+                idx=idx,
+                index=index,
+                path=path,
+                is_tmp=True,  # do not try to remove old doc id
+            )
+            num = len(files)
+
+        output = self.query_tmp(ctx, idx, index, query) if num > 0 else None
+        self.release_tmp(idx, tmp_id, scope, num > 0)
         self.log("Returning response: {}".format(output))
         return output
 
     def query_web(self, ctx: CtxItem, type: str, url: str, args: dict, query: str, model: ModelItem = None) -> str:
         """
-        Query web using temp index (created on the fly)
+        Query web using temp index (created on the fly, reused without any request until TTL from build)
+
+        When expired, index is rebuilt and web pages are fetched through the HTTP cache (core.fetch)
+        and revalidated with stored ETag / Last-Modified validators.
 
         :param ctx: context
         :param type: type of content
@@ -260,37 +270,138 @@ class Chat:
         if model is None:
             model = self.window.core.models.from_defaults()
         context = self.window.core.idx.llm.get_service_context(model=model)
-        tmp_id, index = self.storage.get_tmp(id, service_context=context)  # get or create tmp index
+        parts["model"] = model.id
+        scope = json.dumps(parts)
+        is_cached = self.storage.has_tmp(scope)
+        tmp_id, index = self.storage.get_tmp(scope, service_context=context)  # get or create tmp index
 
         idx = "tmp:{}".format(id)  # tmp index id
-        self.log("Indexing to temporary in-memory index: {}...".format(idx))
-
-        # index file to tmp index
-        num, errors = self.window.core.idx.indexing.index_urls(
-            idx=id,
-            index=index,
-            urls=[url],
-            type=type,
-            extra_args=args,
-            is_tmp=True,  # do not try to remove old doc id
+        if is_cached:
+            self.log("Reusing temporary in-memory index: {}...".format(idx))
+            num = 1
+        else:
+            self.log("Indexing to temporary in-memory index: {}...".format(idx))
+
+            # index file to tmp index
+            num, errors = self.window.core.idx.indexing.index_urls(
+                idx=id,
+                index=index,
+                urls=[url],
+                type=type,
+                extra_args=args,
+                is_tmp=True,  # do not try to remove old doc id
+            )
+
+        output = self.query_tmp(ctx, idx, index, query) if num > 0 else None
+        self.release_tmp(idx, tmp_id, scope, num > 0)
+        self.log("Returning response: {}...".format(output))
+        return output
+
+    def query_tmp(self, ctx: CtxItem, idx: str, index: BaseIndex, query: str) -> str or None:
+        """
+        Query temp index
+
+        :param ctx: context
+        :param idx: tmp index id
+        :param index: index instance
+        :param query: query
+        :return: response
+        """
+        self.log("Querying temporary in-memory index: {}...".format(idx))
+        response = self.get_query_engine(
+            index,
+            streaming=False,
+        ).query(query)  # query with default prompt
+        if response:
+            ctx.add_doc_meta(response.metadata)  # store metadata
+            return response.response
+
+    def release_tmp(self, idx: str, tmp_id: str, scope: str, reuse: bool = True):
+        """
+        Keep temp index for next queries or clean it
+
+        :param idx: tmp index id
+        :param tmp_id: tmp index storage id
+        :param scope: index scope (source and model)
+        :param reuse: False to clean index (nothing indexed)
+        """
+        if reuse:
+            self.log("Releasing temporary in-memory index: {} ({})...".format(idx, tmp_id))
+            self.storage.keep_tmp(tmp_id, scope)  # kept until TTL or memory limit, or cleaned if disabled
+        else:
+            self.log("Removing temporary in-memory index: {} ({})...".format(idx, tmp_id))
+            self.storage.clean_tmp(tmp_id)  # clean memory
+
+    def get_file_version(self, path: str) -> list:
+        """
+        Get file version (modification time and size, for directories: of all files)
+
+        :param path: file or directory path
+        :return: version
+        """
+        if os.path.isdir(path):
+            mtime = 0
+            size = 0
+            count = 0
+            for root, dirs, files in os.walk(path):
+                for file in files:
+                    stat = os.stat(os.path.join(root, file))
+                    mtime = max(mtime, stat.st_mtime)
+                    size += stat.st_size
+                    count += 1
+            return [mtime, size, count]
+        try:
+            stat = os.stat(path)
+            return [stat.st_mtime, stat.st_size]
+        except OSError:
+            return []
+
+    def is_hybrid(self) -> bool:
+        """
+        Check if hybrid retrieval (vector + BM25) is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.window.core.config.get("llama.idx.hybrid"))
+
+    def get_query_engine(self, index: BaseIndex, idx: str = None, **kwargs) -> RetrieverQueryEngine:
+        """
+        Get query engine, with hybrid retriever (vector + BM25) if enabled
+
+        :param index: index instance
+        :param idx: index name, None for temporary index
+        :param kwargs: query engine keyword arguments
+        :return: query engine
+        """
+        if not self.is_hybrid():
+            return index.as_query_engine(**kwargs)
+        self.log("Using hybrid retrieval (vector + BM25)...")
+        return RetrieverQueryEngine.from_args(
+            self.window.core.idx.lexical.get_retriever(index, idx),
+            service_context=index.service_context,
+            **kwargs
         )
 
-        # query tmp index
-        output = None
-        if num > 0:
-            self.log("Querying temporary in-memory index: {}...".format(idx))
-            response = index.as_query_engine(
-                streaming=False,
-            ).query(query)  # query with default prompt
-            if response:
-                ctx.add_doc_meta(response.metadata)  # store metadata
-                output = response.response
+    def get_chat_engine(self, index: BaseIndex, idx: str = None, **kwargs) -> ContextChatEngine:
+        """
+        Get context chat engine, with hybrid retriever (vector + BM25) if enabled
 
-        # clean tmp index# clean tmp index
-        self.log("Removing temporary in-memory index: {} ({})...".format(idx, tmp_id))
-        self.storage.clean_tmp(tmp_id)  # clean memory
-        self.log("Returning response: {}...".format(output))
-        return output
+        :param index: index instance
+        :param idx: index name, None for temporary index
+        :param kwargs: chat engine keyword arguments
+        :return: chat engine
+        """
+        if not self.is_hybrid():
+            return index.as_chat_engine(
+                chat_mode="context",
+                **kwargs
+            )
+        self.log("Using hybrid retrieval (vector + BM25)...")
+        return ContextChatEngine.from_defaults(
+            retriever=self.window.core.idx.lexical.get_retriever(index, idx),
+            service_context=index.service_context,
+            **kwargs
+        )
 
     def get_memory_buffer(self, history: list, llm = None) -> ChatMemoryBuffer:
         """
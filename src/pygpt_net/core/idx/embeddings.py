@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.22 12:00:00                  #
+# ================================================== #
+
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+import time
+
+from array import array
+from collections import Counter
+from typing import Any, ClassVar, List
+
+import numpy as np
+
+from llama_index.core.base.embeddings.base import BaseEmbedding, Embedding
+from llama_index.core.bridge.pydantic import Field, PrivateAttr
+
+from .lexical import tokenize
+
+
+class EmbeddingsCache:
+    def __init__(self, window=None):
+        """
+        Content-addressed embeddings cache (SQLite)
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.db = None
+        self.path = None
+        self.size = 0  # current size of stored vectors (bytes)
+        self.lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evicted": 0,
+        }
+
+    def get_max_size(self) -> int:
+        """
+        Get max cache size
+
+        :return: max size in bytes, 0 if cache is disabled
+        """
+        size = self.window.core.config.get("llama.idx.embeddings.cache.size")
+        if size is None:
+            return 0
+        return max(0, int(size)) * 1024 * 1024
+
+    def is_enabled(self) -> bool:
+        """
+        Check if cache is enabled
+
+        :return: True if enabled
+        """
+        return self.get_max_size() > 0
+
+    def get_path(self) -> str:
+        """
+        Get path to cache database file
+
+        :return: path to file
+        """
+        return os.path.join(self.window.core.config.get_user_path(), 'cache', 'embeddings.db')
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Open cache database (on first use)
+
+        :return: connection
+        """
+        path = self.get_path()
+        if self.db is not None and self.path == path:
+            return self.db
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.path = path
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                vector BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                used_ts REAL NOT NULL
+            )""")
+        self.db.execute("CREATE INDEX IF NOT EXISTS embeddings_used_ts ON embeddings (used_ts)")
+        self.db.commit()
+        self.size = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()[0]
+        return self.db
+
+    def get_key(self, provider: str, model: str, text: str) -> str:
+        """
+        Build cache key
+
+        :param provider: embeddings provider id
+        :param model: model name
+        :param text: embedded text
+        :return: key
+        """
+        text_hash = hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+        return "{}:{}:{}".format(provider, model, text_hash)
+
+    def get_many(self, keys: list) -> dict:
+        """
+        Get cached embeddings
+
+        :param keys: cache keys
+        :return: dict with found embeddings (key => embedding)
+        """
+        found = {}
+        with self.lock:
+            db = self.connect()
+            for i in range(0, len(keys), 500):  # SQLite variables limit
+                chunk = keys[i:i + 500]
+                rows = db.execute(
+                    "SELECT key, vector FROM embeddings WHERE key IN ({})".format(",".join("?" * len(chunk))),
+                    chunk,
+                ).fetchall()
+                for key, vector in rows:
+                    found[key] = array("f", vector).tolist()
+            if found:
+                now = time.time()
+                db.executemany("UPDATE embeddings SET used_ts = ? WHERE key = ?", [(now, key) for key in found])
+                db.commit()
+            self.stats["hits"] += len(found)
+            self.stats["misses"] += len(keys) - len(found)
+        return found
+
+    def set_many(self, items: dict):
+        """
+        Store embeddings and evict least recently used if max size exceeded
+
+        :param items: dict with embeddings (key => embedding)
+        """
+        if not items:
+            return
+        now = time.time()
+        rows = []
+        for key, embedding in items.items():
+            vector = array("f", embedding).tobytes()
+            rows.append((key, vector, len(vector), now))
+        with self.lock:
+            db = self.connect()
+            db.executemany("INSERT OR REPLACE INTO embeddings (key, vector, size, used_ts) VALUES (?, ?, ?, ?)", rows)
+            db.commit()
+            self.size = db.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()[0]
+            self.evict(db)
+
+    def evict(self, db: sqlite3.Connection):
+        """
+        Remove least recently used embeddings if cache is larger than max size
+
+        :param db: connection
+        """
+        max_size = self.get_max_size()
+        if self.size <= max_size:
+            return
+        target = int(max_size * 0.9)  # make room for next inserts
+        removed = []
+        size = self.size
+        for key, item_size in db.execute("SELECT key, size FROM embeddings ORDER BY used_ts ASC"):
+            if size <= target:
+                break
+            removed.append((key,))
+            size -= item_size
+        db.executemany("DELETE FROM embeddings WHERE key = ?", removed)
+        db.commit()
+        self.size = size
+        self.stats["evicted"] += len(removed)
+
+    def clear(self):
+        """Remove all cached embeddings"""
+        with self.lock:
+            db = self.connect()
+            db.execute("DELETE FROM embeddings")
+            db.commit()
+            self.size = 0
+
+    def get_stats(self) -> dict:
+        """
+        Get cache stats
+
+        :return: dict with hits, misses, evicted and size
+        """
+        stats = dict(self.stats)
+        stats["size"] = self.size
+        return stats
+
+    def wrap(self, embed_model: BaseEmbedding, provider: str) -> BaseEmbedding:
+        """
+        Wrap embeddings model with cache
+
+        :param embed_model: embeddings model
+        :param provider: embeddings provider id
+        :return: cached embeddings model or original model if cache is disabled
+        """
+        if embed_model is None or not self.is_enabled() or isinstance(embed_model, HashingEmbedding):
+            return embed_model  # local vectors are computed faster than read from cache
+        return CachedEmbedding(embed_model, self, provider)
+
+
+class CachedEmbedding(BaseEmbedding):
+    _embed_model: BaseEmbedding = PrivateAttr()
+    _cache: EmbeddingsCache = PrivateAttr()
+    _provider: str = PrivateAttr()
+
+    def __init__(self, embed_model: BaseEmbedding, cache: EmbeddingsCache, provider: str, **kwargs: Any):
+        """
+        Embeddings model with cache, only not cached texts are sent to wrapped model
+
+        :param embed_model: embeddings model
+        :param cache: embeddings cache
+        :param provider: embeddings provider id
+        """
+        super().__init__(
+            model_name=embed_model.model_name,
+            embed_batch_size=embed_model.embed_batch_size,
+            callback_manager=embed_model.callback_manager,
+            **kwargs,
+        )
+        self._embed_model = embed_model
+        self._cache = cache
+        self._provider = provider
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "CachedEmbedding"
+
+    def get_model(self) -> BaseEmbedding:
+        """
+        Get wrapped embeddings model
+
+        :return: embeddings model
+        """
+        return self._embed_model
+
+    def get_keys(self, texts: List[str], type: str) -> list:
+        """
+        Get cache keys for texts
+
+        :param texts: texts
+        :param type: embedding type (query or text)
+        :return: list of keys
+        """
+        model = "{}:{}".format(self._embed_model.class_name(), self.model_name)
+        return [self._cache.get_key(self._provider, model, type + ":" + text) for text in texts]
+
+    def embed(self, texts: List[str], type: str, func) -> List[Embedding]:
+        """
+        Get embeddings from cache or from wrapped model
+
+        :param texts: texts
+        :param type: embedding type (query or text)
+        :param func: function embedding list of not cached texts
+        :return: embeddings
+        """
+        keys = self.get_keys(texts, type)
+        found = self._cache.get_many(list(set(keys)))
+        missing = list(dict.fromkeys(key for key in keys if key not in found))
+        if missing:
+            texts_map = dict(zip(keys, texts))
+            embeddings = func([texts_map[key] for key in missing])
+            items = dict(zip(missing, embeddings))
+            self._cache.set_many(items)
+            found.update(items)
+        return [found[key] for key in keys]
+
+    def _get_query_embedding(self, query: str) -> Embedding:
+        return self.embed(
+            [query],
+            "query",
+            lambda texts: [self._embed_model._get_query_embedding(texts[0])],
+        )[0]
+
+    async def _aget_query_embedding(self, query: str) -> Embedding:
+        keys = self.get_keys([query], "query")
+        found = self._cache.get_many(keys)
+        if keys[0] not in found:
+            found[keys[0]] = await self._embed_model._aget_query_embedding(query)
+            self._cache.set_many(found)
+        return found[keys[0]]
+
+    def _get_text_embedding(self, text: str) -> Embedding:
+        return self._get_text_embeddings([text])[0]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[Embedding]:
+        return self.embed(texts, "text", self._embed_model._get_text_embeddings)
+
+    async def _aget_text_embedding(self, text: str) -> Embedding:
+        return (await self._aget_text_embeddings([text]))[0]
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[Embedding]:
+        keys = self.get_keys(texts, "text")
+        found = self._cache.get_many(list(set(keys)))
+        missing = list(dict.fromkeys(key for key in keys if key not in found))
+        if missing:
+            texts_map = dict(zip(keys, texts))
+            embeddings = await self._embed_model._aget_text_embeddings([texts_map[key] for key in missing])
+            items = dict(zip(missing, embeddings))
+            self._cache.set_many(items)
+            found.update(items)
+        return [found[key] for key in keys]
+
+
+class HashingEmbedding(BaseEmbedding):
+    dim: int = Field(default=512, description="Number of vector dimensions.")
+    ngrams: int = Field(default=2, description="Max number of words in hashed n-grams.")
+    _buckets: dict = PrivateAttr()
+
+    MAX_BUCKETS: ClassVar[int] = 100000  # max number of cached term hashes
+
+    def __init__(self, dim: int = 512, ngrams: int = 2, **kwargs: Any):
+        """
+        Local embeddings model (hashing vectorizer), works offline without any model
+
+        Terms and n-grams are hashed into signed buckets weighted by log term frequency,
+        vectors are L2-normalized, so cosine similarity measures shared terms.
+
+        :param dim: number of vector dimensions
+        :param ngrams: max number of words in n-grams
+        """
+        kwargs.setdefault("model_name", "hashing-{}-{}".format(dim, ngrams))
+        kwargs.setdefault("embed_batch_size", 1000)
+        super().__init__(dim=int(dim), ngrams=max(1, int(ngrams)), **kwargs)
+        self._buckets = {}
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "HashingEmbedding"
+
+    def get_terms(self, text: str) -> list:
+        """
+        Get terms and word n-grams of text
+
+        :param text: text
+        :return: list of terms
+        """
+        words = tokenize(text)
+        terms = list(words)
+        for n in range(2, self.ngrams + 1):
+            terms.extend(" ".join(words[i:i + n]) for i in range(len(words) - n + 1))
+        return terms
+
+    def get_bucket(self, term: str) -> (int, float):
+        """
+        Get vector dimension and sign of term (stable across processes)
+
+        :param term: term
+        :return: dimension, sign
+        """
+        bucket = self._buckets.get(term)
+        if bucket is None:
+            value = int.from_bytes(hashlib.blake2b(term.encode("utf-8"), digest_size=8).digest(), "little")
+            bucket = (value % self.dim, 1.0 if value >> 63 else -1.0)
+            if len(self._buckets) >= self.MAX_BUCKETS:
+                self._buckets.clear()
+            self._buckets[term] = bucket
+        return bucket
+
+    def embed(self, texts: List[str]) -> List[Embedding]:
+        """
+        Get embeddings of texts
+
+        :param texts: texts
+        :return: embeddings
+        """
+        rows = []
+        cols = []
+        values = []
+        for i, text in enumerate(texts):
+            for term, count in Counter(self.get_terms(text)).items():
+                bucket, sign = self.get_bucket(term)
+                rows.append(i)
+                cols.append(bucket)
+                values.append(sign * (1.0 + math.log(count)))
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        np.add.at(matrix, (rows, cols), values)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (matrix / norms).tolist()
+
+    def _get_query_embedding(self, query: str) -> Embedding:
+        return self.embed([query])[0]
+
+    async def _aget_query_embedding(self, query: str) -> Embedding:
+        return self.embed([query])[0]
+
+    def _get_text_embedding(self, text: str) -> Embedding:
+        return self.embed([text])[0]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[Embedding]:
+        return self.embed(texts)
@@ -6,23 +6,29 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.19 01:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
 import datetime
 import os.path
 import time
 
+from collections import deque
+
 from pathlib import Path
 from sqlalchemy import text
 
 from llama_index.core.indices.base import BaseIndex
+from llama_index.core.ingestion import run_transformations
 from llama_index.core.schema import Document
 from llama_index.core import SimpleDirectoryReader
 
-from pygpt_net.provider.loaders.base import BaseLoader
+from pygpt_net.provider.loaders.base import BaseLoader, LazyReader
 from pygpt_net.utils import parse_args
 
+from .batch import Batch
+from .pipeline import Pipeline
+
 
 class Indexing:
     def __init__(self, window=None):
@@ -39,6 +45,10 @@ class Indexing:
         self.data_providers = {}  # data providers (loaders)
         self.external_instructions = {}
         self.last_call = None
+        self.embed_calls = 0  # number of embedding API calls (progress stats)
+        self.tokens_calls = deque()  # (time, tokens) of calls in last minute
+        self.batch = Batch(window, self)
+        self.pipeline = Pipeline(window, self)
 
     def register_loader(self, loader: BaseLoader):
         """
@@ -56,29 +66,23 @@ class Indexing:
         self.data_providers[loader.id] = loader  # cache loader
         extensions = loader.extensions  # available extensions
         types = loader.type  # available types
+        # readers are created on first use, to not import all reader libraries at startup
         if "file" in types:
-            loader.set_args(self.get_loader_arguments(loader.id, "file"))  # set reader arguments
-            try:
-                reader = loader.get()  # get data reader instance
-                for ext in extensions:
-                    self.loaders["file"][ext] = reader  # set reader instance, by file extension
-            except ImportError as e:
-                msg = "Error while registering data loader: " + loader.id + " - " + str(e)
-                self.window.core.debug.log(msg)
-                self.window.core.debug.log(e)
+            reader = LazyReader(loader, self.get_loader_arguments(loader.id, "file"))
+            for ext in extensions:
+                self.loaders["file"][ext] = reader  # set reader instance, by file extension
         if "web" in types:
-            loader.set_args(self.get_loader_arguments(loader.id, "web"))  # set reader arguments
-            try:
-                reader = loader.get()  # get data reader instance
-                self.loaders["web"][loader.id] = reader # set reader instance, by id
-                if loader.instructions:
-                    for item in loader.instructions:
-                        cmd = list(item.keys())[0]
-                        self.external_instructions[cmd] = item[cmd]
-            except ImportError as e:
-                msg = "Error while registering data loader: " + loader.id + " - " + str(e)
-                self.window.core.debug.log(msg)
-                self.window.core.debug.log(e)
+            # not advertised to model if reader dependencies are missing
+            if not loader.is_available():
+                self.window.core.idx.log("Missing dependencies for data loader: " + loader.id)
+                self.unregister_web_reader(loader.id)
+                return
+            reader = LazyReader(loader, self.get_loader_arguments(loader.id, "web"))
+            self.loaders["web"][loader.id] = reader  # set reader instance, by id
+            if loader.instructions:
+                for item in loader.instructions:
+                    cmd = list(item.keys())[0]
+                    self.external_instructions[cmd] = item[cmd]
 
     def reload_loaders(self):
         """Reload loaders (update arguments)"""
@@ -177,6 +181,63 @@ class Indexing:
             return False
         return True
 
+    def get_file_reader(self, ext: str):
+        """
+        Get file reader by extension (reader is created on first use)
+
+        :param ext: file extension
+        :return: reader instance or None if not available
+        """
+        if ext not in self.loaders["file"]:
+            return None
+        reader = self.loaders["file"][ext]
+        if isinstance(reader, LazyReader):
+            try:
+                reader.get()
+            except ImportError as e:
+                msg = "Error while loading data loader: " + reader.loader.id + " - " + str(e)
+                self.window.core.debug.log(msg)
+                self.window.core.debug.log(e)
+                for key in [k for k, v in self.loaders["file"].items() if v is reader]:
+                    del self.loaders["file"][key]  # unregister unavailable reader
+                return None
+        return reader
+
+    def get_web_reader(self, type: str):
+        """
+        Get web reader by type (reader is created on first use)
+
+        :param type: web loader type
+        :return: reader instance or None if not available
+        """
+        if type not in self.loaders["web"]:
+            return None
+        reader = self.loaders["web"][type]
+        if isinstance(reader, LazyReader):
+            try:
+                reader.get()
+            except ImportError as e:
+                msg = "Error while loading data loader: " + type + " - " + str(e)
+                self.window.core.debug.log(msg)
+                self.window.core.debug.log(e)
+                self.unregister_web_reader(type)
+                return None
+        return reader
+
+    def unregister_web_reader(self, type: str):
+        """
+        Unregister web reader and its commands
+
+        :param type: web loader type
+        """
+        if type in self.loaders["web"]:
+            del self.loaders["web"][type]
+        if type in self.data_providers:
+            for item in self.data_providers[type].instructions:
+                cmd = list(item.keys())[0]
+                if cmd in self.external_instructions:
+                    del self.external_instructions[cmd]
+
     def get_documents(self, path: str) -> list[Document]:
         """
         Get documents from path
@@ -201,9 +262,9 @@ class Indexing:
                 self.window.core.idx.log("Ignoring excluded extension: {}".format(ext))
                 return []
 
-            if ext in self.loaders["file"]:
+            reader = self.get_file_reader(ext)
+            if reader is not None:
                 self.window.core.idx.log("Using loader for: {}".format(ext))
-                reader = self.loaders["file"][ext]
                 documents = reader.load_data(file=Path(path))
             else:
                 self.window.core.idx.log("Using default SimpleDirectoryReader for: {}".format(ext))
@@ -248,18 +309,49 @@ class Indexing:
         :param is_tmp: True if temporary index
         :return: dict with indexed files, errors
         """
+        # index only new and modified files, remove deleted files
+        changed = None
+        if os.path.isdir(path) and not is_tmp and self.is_incremental():
+            changes = self.get_changes(idx, path)
+            self.apply_changes(idx, index, changes)
+            changed = set(changes["new"] + changes["modified"])
+
+        # parse files in process pool if enabled
+        if os.path.isdir(path) and self.pipeline.is_enabled():
+            return self.pipeline.run(
+                idx=idx,
+                index=index,
+                path=path,
+                is_tmp=is_tmp,
+                recursive=bool(self.window.core.config.get("llama.idx.recursive")),
+                files=sorted(changed) if changed is not None else None,
+            )
+
         if self.window.core.config.get("llama.idx.recursive"):
-            return self.index_files_recursive(idx, index, path, is_tmp)
+            return self.index_files_recursive(idx, index, path, is_tmp, changed)
 
-        indexed = {}
-        errors = []
         files = []
         if os.path.isdir(path):
             files = [os.path.join(path, f)
                      for f in os.listdir(path) if os.path.isfile(os.path.join(path, f))]
+            if changed is not None:
+                files = [f for f in files if f in changed]
         elif os.path.isfile(path):
             files = [path]
+        return self.index_files_list(idx, index, files, is_tmp)
+
+    def index_files_list(self, idx: str, index: BaseIndex, files: list, is_tmp: bool = False) -> tuple:
+        """
+        Index list of files
 
+        :param idx: index name
+        :param index: index instance
+        :param files: list of paths to files
+        :param is_tmp: True if temporary index
+        :return: dict with indexed files, errors
+        """
+        indexed = {}
+        errors = []
         for file in files:   # per file to allow use of multiple loaders
             try:
                 # remove old file from index if exists
@@ -272,7 +364,7 @@ class Indexing:
                 documents = self.get_documents(file)
                 for d in documents:
                     self.prepare_document(d)
-                    self.index_document(index, d)
+                    self.index_document(index, d, None if is_tmp else idx)
                     indexed[file] = d.id_  # add to index
                     self.window.core.idx.log("Inserted document: {}, metadata: {}".format(d.id_, d.metadata))
             except Exception as e:
@@ -281,9 +373,17 @@ class Indexing:
                 self.window.core.debug.log(e)
                 continue
 
+        errors.extend(self.flush_documents(indexed))  # insert pending batch
         return indexed, errors
 
-    def index_files_recursive(self, idx: str, index: BaseIndex, path: str = None, is_tmp: bool = False) -> tuple:
+    def index_files_recursive(
+            self,
+            idx: str,
+            index: BaseIndex,
+            path: str = None,
+            is_tmp: bool = False,
+            changed: set = None
+    ) -> tuple:
         """
         Index all files in directory and subdirectories recursively.
 
@@ -291,6 +391,7 @@ class Indexing:
         :param index: index instance
         :param path: path to file or directory
         :param is_tmp: True if temporary index
+        :param changed: paths of new and modified files to index (None to index all files)
         :return: dict with indexed files, errors
         """
         indexed = {}
@@ -301,9 +402,11 @@ class Indexing:
             for root, dirs, files in os.walk(path):
                 for file in files:
                     file_path = os.path.join(root, file)
+                    if changed is not None and file_path not in changed:
+                        continue  # unchanged
                     try:
                         # remove old file from index if exists
-                        file_id = self.window.core.idx.files.get_id(path)
+                        file_id = self.window.core.idx.files.get_id(file_path)
 
                         if not is_tmp:
                             self.remove_old_file(idx, file_id)
@@ -312,7 +415,7 @@ class Indexing:
                         documents = self.get_documents(file_path)
                         for d in documents:
                             self.prepare_document(d)
-                            self.index_document(index, d)
+                            self.index_document(index, d, None if is_tmp else idx)
                             indexed[file_path] = d.id_  # add to index
                             self.window.core.idx.log("Inserted document: {}, metadata: {}".format(d.id_, d.metadata))
                     except Exception as e:
@@ -334,7 +437,7 @@ class Indexing:
                 documents = self.get_documents(path)
                 for d in documents:
                     self.prepare_document(d)
-                    self.index_document(index, d)
+                    self.index_document(index, d, None if is_tmp else idx)
                     indexed[path] = d.id_  # add to index
                     self.window.core.idx.log("Inserted document: {}, metadata: {}".format(d.id_, d.metadata))
             except Exception as e:
@@ -342,13 +445,189 @@ class Indexing:
                 print("Error while indexing file: " + path)
                 self.window.core.debug.log(e)
 
+        errors.extend(self.flush_documents(indexed))  # insert pending batch
         return indexed, errors
 
+    def is_incremental(self) -> bool:
+        """
+        Check if only changed files should be indexed when indexing directory
+
+        :return: True if incremental
+        """
+        return bool(self.window.core.config.get("llama.idx.incremental"))
+
+    def get_changes(self, idx: str, path: str) -> dict:
+        """
+        Compare files in directory with indexed files manifest (dry-run, nothing is changed)
+
+        :param idx: index name
+        :param path: path to directory
+        :return: dict with lists of paths: new, modified, touched, unchanged and dict of removed (file_id -> data)
+        """
+        changes = {
+            "new": [],
+            "modified": [],
+            "touched": [],  # content not changed, only modified time
+            "unchanged": [],
+            "removed": {},
+        }
+        recursive = bool(self.window.core.config.get("llama.idx.recursive"))
+        items = self.window.core.idx.get_idx_data(idx).get(idx, {})
+        if recursive:
+            files = [os.path.join(root, f) for root, dirs, names in os.walk(path) for f in names]
+        else:
+            files = [os.path.join(path, f)
+                     for f in os.listdir(path) if os.path.isfile(os.path.join(path, f))]
+
+        for file in files:
+            if not self.is_allowed(file):
+                continue
+            file_id = self.window.core.idx.files.get_id(file)
+            if file_id not in items:
+                changes["new"].append(file)
+                continue
+            try:
+                changes[self.window.core.idx.files.compare(file, items[file_id])].append(file)
+            except Exception as e:
+                self.window.core.debug.log(e)
+                changes["modified"].append(file)
+
+        # indexed files from this directory that no longer exist
+        root_path = os.path.normpath(path)
+        for file_id in items:
+            file_path = items[file_id].get("path")
+            if file_path is None:
+                continue
+            file_path = os.path.normpath(file_path)
+            if recursive:
+                in_dir = file_path.startswith(root_path + os.sep)
+            else:
+                in_dir = os.path.dirname(file_path) == root_path
+            if in_dir and not os.path.exists(file_path):
+                changes["removed"][file_id] = items[file_id]
+        return changes
+
+    def get_paths_changes(self, idx: str, paths: list) -> dict:
+        """
+        Compare changed paths (files or directories) with indexed files manifest (dry-run)
+
+        :param idx: index name
+        :param paths: list of changed paths
+        :return: dict with lists of paths: new, modified, touched, unchanged and dict of removed (file_id -> data)
+        """
+        changes = {
+            "new": [],
+            "modified": [],
+            "touched": [],
+            "unchanged": [],
+            "removed": {},
+        }
+        items = self.window.core.idx.get_idx_data(idx).get(idx, {})
+        for path in paths:
+            if os.path.isdir(path):
+                dir_changes = self.get_changes(idx, path)
+                for key in ["new", "modified", "touched", "unchanged"]:
+                    changes[key].extend(f for f in dir_changes[key] if f not in changes[key])
+                changes["removed"].update(dir_changes["removed"])
+            elif os.path.isfile(path):
+                if not self.is_allowed(path) or path in changes["new"] or path in changes["modified"]:
+                    continue
+                file_id = self.window.core.idx.files.get_id(path)
+                if file_id not in items:
+                    changes["new"].append(path)
+                    continue
+                try:
+                    changes[self.window.core.idx.files.compare(path, items[file_id])].append(path)
+                except Exception as e:
+                    self.window.core.debug.log(e)
+                    changes["modified"].append(path)
+            else:
+                # removed file or directory
+                root_path = os.path.normpath(path)
+                for file_id in items:
+                    file_path = items[file_id].get("path")
+                    if file_path is None:
+                        continue
+                    file_path = os.path.normpath(file_path)
+                    if file_path == root_path or file_path.startswith(root_path + os.sep):
+                        changes["removed"][file_id] = items[file_id]
+        return changes
+
+    def index_paths(self, idx: str, index: BaseIndex, paths: list) -> tuple:
+        """
+        Index changed paths: index new and modified files, remove deleted files
+
+        :param idx: index name
+        :param index: index instance
+        :param paths: list of changed paths (files or directories)
+        :return: dict with indexed files, errors
+        """
+        changes = self.get_paths_changes(idx, paths)
+        self.apply_changes(idx, index, changes)
+        return self.index_files_list(idx, index, changes["new"] + changes["modified"])
+
+    def get_changes_summary(self, changes: dict) -> dict:
+        """
+        Count changes
+
+        :param changes: changes
+        :return: dict with number of new, modified, removed and unchanged files
+        """
+        return {
+            "new": len(changes["new"]),
+            "modified": len(changes["modified"]),
+            "removed": len(changes["removed"]),
+            "unchanged": len(changes["unchanged"]) + len(changes["touched"]),
+        }
+
+    def apply_changes(self, idx: str, index: BaseIndex, changes: dict):
+        """
+        Remove deleted files from index and update manifest of touched files
+
+        :param idx: index name
+        :param index: index instance
+        :param changes: changes
+        """
+        self.window.core.idx.log("Changes in files: {}".format(self.get_changes_summary(changes)))
+        store_id = self.window.core.idx.get_current_store()
+        items = self.window.core.idx.get_idx_data(idx).get(idx, {})
+
+        # update modified time only, content is not changed
+        for file in changes["touched"]:
+            file_id = self.window.core.idx.files.get_id(file)
+            item = items[file_id]
+            stat = self.window.core.idx.files.get_stat(file)
+            self.window.core.idx.files.update(
+                id=item["db_id"],
+                doc_id=item["id"],
+                ts=item["indexed_ts"],
+                stat=stat,
+            )
+            item.update(stat)
+
+        # remove deleted files, from current index instance (it is stored after indexing)
+        if not changes["removed"]:
+            return
+        for file_id, item in changes["removed"].items():
+            self.window.core.idx.log("Removing deleted file: {}, document id: {}".format(item["path"], item["id"]))
+            try:
+                index.delete_ref_doc(item["id"], delete_from_docstore=True)
+                self.window.core.idx.lexical.delete(idx, item["id"])
+            except Exception as e:
+                self.window.core.debug.log(e)
+            self.window.core.idx.files.remove(store_id, idx, item["id"])
+            if file_id in items:
+                del items[file_id]
+        self.window.core.idx.storage.store(
+            id=idx,
+            index=index,
+        )
+
     def get_db_data_from_ts(self, updated_ts: int = 0) -> list:
         """
-        Get data from database from timestamp
+        Get data of all ctx metas updated from timestamp (in one query)
 
-        :param updated_ts: timestamp
+        :param updated_ts: timestamp from which to get data
         :return: list of documents
         """
         db = self.window.core.db.get_db()
@@ -359,31 +638,37 @@ class Indexing:
             ctx_item.input_ts AS input_ts,
             ctx_item.meta_id AS meta_id,
             ctx_item.id AS item_id
-        FROM 
-            ctx_item
-        LEFT JOIN
-            ctx_meta
-        ON
-            ctx_item.meta_id = ctx_meta.id
-        WHERE
-            ctx_meta.updated_ts > {updated_ts}
+        FROM ctx_item
+        JOIN ctx_meta ON ctx_meta.id = ctx_item.meta_id
+        WHERE ctx_meta.updated_ts > {updated_ts}
         """
+        # restrict to updated data if from timestamp is given
+        if updated_ts > 0:
+            query += f" AND (ctx_item.input_ts > {updated_ts} OR ctx_item.output_ts > {updated_ts})"
+        query += " ORDER BY ctx_item.meta_id, ctx_item.id"
         with db.connect() as connection:
             result = connection.execute(text(query))
             for item in result.fetchall():
-                data = item._asdict()
-                doc = Document(
-                    text=data["text"],
-                    metadata={
-                        "ctx_date": str(datetime.datetime.fromtimestamp(int(data["input_ts"]))),
-                        "ctx_id": data["meta_id"],
-                        "item_id": data["item_id"],
-                        "indexed_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    }
-                )
-                documents.append(doc)
+                documents.append(self.get_db_document(item._asdict()))
         return documents
 
+    def get_db_document(self, data: dict) -> Document:
+        """
+        Prepare document from ctx item row
+
+        :param data: row data
+        :return: document
+        """
+        return Document(
+            text=data["text"],
+            metadata={
+                "ctx_date": str(datetime.datetime.fromtimestamp(int(data["input_ts"]))),
+                "ctx_id": data["meta_id"],
+                "item_id": data["item_id"],
+                "indexed_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+        )
+
     def get_db_meta_ids_from_ts(self, updated_ts: int = 0) -> list:
         """
         Get IDs of meta from database from timestamp
@@ -468,17 +753,44 @@ class Indexing:
 
             # get items from database
             documents = self.get_db_data_by_id(id, from_ts)
-            for d in documents:
-                self.index_document(index, d)
-                doc_id = d.id_
-                self.window.core.idx.log("Inserted ctx DB document: {} / {}, id: {}, metadata: {}".format(n+1, len(documents), d.id_, d.metadata))
-                self.window.core.ctx.idx.set_meta_as_indexed(id, idx, doc_id)  # update ctx
-                n += 1
+            n, errs = self.index_db_documents(idx, index, documents, id)
+            errors.extend(errs)
         except Exception as e:
             errors.append(str(e))
             self.window.core.debug.log(e)
         return n, errors
 
+    def index_db_documents(self, idx: str, index: BaseIndex, documents: list, id: int = None) -> (int, list):
+        """
+        Index ctx documents in batches, ctx metas are updated once per batch
+
+        :param idx: index name
+        :param index: index instance
+        :param documents: list of documents
+        :param id: ctx meta id (if all documents are from the same meta, default: from document metadata)
+        :return: number of indexed documents, errors
+        """
+        errors = []
+        n = 0
+        size = self.batch.get_size() or 100
+        for i in range(0, len(documents), size):
+            batch = documents[i:i + size]
+            indexed = {}
+            for d in batch:
+                self.index_document(index, d, idx)
+                indexed[d.id_] = d.id_
+            errors.extend(self.flush_documents(indexed))  # insert pending batch
+
+            items = {}  # meta id -> inserted doc ids
+            for d in batch:
+                if d.id_ not in indexed:
+                    continue
+                self.window.core.idx.log("Inserted ctx DB document: {} / {}, id: {}, metadata: {}".format(n+1, len(documents), d.id_, d.metadata))
+                items.setdefault(d.metadata.get("ctx_id", id), []).append(d.id_)
+                n += 1
+            self.window.core.ctx.idx.set_meta_as_indexed_bulk(idx, items)  # update ctx
+        return n, errors
+
     def index_db_from_updated_ts(self, idx: str, index: BaseIndex, from_ts: int = 0) -> (int, list):
         """
         Index data from database from timestamp
@@ -491,11 +803,15 @@ class Indexing:
         self.window.core.idx.log("Indexing documents from database from timestamp: {}".format(from_ts))
         errors = []
         n = 0
-        ids = self.get_db_meta_ids_from_ts(from_ts)
-        for id in ids:
-            indexed, errs = self.index_db_by_meta_id(idx, index, id, from_ts)
-            n += indexed
+        try:
+            documents = self.get_db_data_from_ts(from_ts)  # all updated metas at once
+            if from_ts == 0:
+                self.remove_old_meta_ids(idx, [d.metadata["ctx_id"] for d in documents])
+            n, errs = self.index_db_documents(idx, index, documents)
             errors.extend(errs)
+        except Exception as e:
+            errors.append(str(e))
+            self.window.core.debug.log(e)
         return n, errors
 
     def index_url(
@@ -522,12 +838,11 @@ class Indexing:
         n = 0
 
         # check if web loader for defined type exists
-        if type not in self.loaders["web"]:
+        loader = self.get_web_reader(type)
+        if loader is None:
             raise ValueError("No web loader for type: {}".format(type))
 
         try:
-            # remove old content from index if already indexed
-            loader = self.loaders["web"][type]
 
             # additional keyword arguments for data loader
             if extra_args is None:
@@ -557,8 +872,15 @@ class Indexing:
             # append custom metadata
             self.window.core.idx.metadata.append_web_metadata(documents, type, args)
 
+            indexed = {}
+            for d in documents:
+                self.index_document(index, d, None if is_tmp else idx)
+                indexed[d.id_] = d.id_
+            errors.extend(self.flush_documents(indexed))  # insert pending batch
+
             for d in documents:
-                self.index_document(index, d)
+                if d.id_ not in indexed:
+                    continue
                 doc_id = d.id_  # URL is used as document ID
                 if not is_tmp:
                     self.window.core.idx.external.set_indexed(
@@ -644,6 +966,31 @@ class Indexing:
                 return True
         return False
 
+    def remove_old_meta_ids(self, idx: str, ids: list):
+        """
+        Remove old documents of ctx metas from index
+
+        :param idx: index name
+        :param ids: ctx meta ids
+        """
+        # abort if not configured to replace old documents
+        if not self.window.core.config.get("llama.idx.replace_old"):
+            return
+
+        store = self.window.core.idx.get_current_store()
+        doc_ids = self.window.core.idx.ctx.get_doc_ids(store, idx)  # meta id -> doc id
+        for id in dict.fromkeys(ids):
+            doc_id = doc_ids.get(id)
+            if doc_id:
+                self.window.core.idx.log("Removing old document id: {}".format(doc_id))
+                try:
+                    self.window.core.idx.storage.remove_document(
+                        id=idx,
+                        doc_id=doc_id,
+                    )
+                except Exception as e:
+                    pass
+
     def remove_old_file(self, idx: str, file_id: str):
         """
         Remove old file from index
@@ -699,18 +1046,53 @@ class Indexing:
                 return True
         return False
 
-    def index_document(self, index: BaseIndex, doc: Document):
+    def index_document(self, index: BaseIndex, doc: Document, idx: str = None):
         """
         Index document
 
         :param index: index instance
         :param doc: document
+        :param idx: index name (to update lexical index), None if temporary index
         """
+        if self.batch.is_enabled(index):
+            self.batch.add(index, doc, idx)  # embed and insert in batches
+            return
         self.apply_rate_limit()  # apply RPM limit
-        index.insert(document=doc)
+        if idx is None or not self.window.core.idx.lexical.is_enabled():
+            index.insert(document=doc)
+            return
+        # insert nodes directly, the same nodes are added to lexical index
+        nodes = run_transformations([doc], index._transformations)
+        index.insert_nodes(nodes)
+        index.docstore.set_document_hash(doc.get_doc_id(), doc.hash)
+        self.window.core.idx.lexical.add(idx, nodes)
 
-    def apply_rate_limit(self):
-        """Apply API calls RPM limit"""
+    def flush_documents(self, indexed: dict = None) -> list:
+        """
+        Insert pending batch of documents
+
+        :param indexed: dict with indexed items (values are document ids), not inserted documents will be removed
+        :return: errors
+        """
+        self.batch.flush()
+        errors, failed = self.batch.get_errors()
+        if indexed is not None and failed:
+            for key in list(indexed.keys()):
+                if indexed[key] in failed:
+                    del indexed[key]
+        return errors
+
+    def apply_rate_limit(self, texts: list = None):
+        """
+        Apply API calls RPM and TPM limits
+
+        :param texts: texts sent in request (for TPM limit)
+        """
+        self.embed_calls += 1
+        if self.window.core.idx.llm.is_local_embeddings():
+            return  # no API calls
+        if texts:
+            self.apply_tokens_limit(texts)
         max_per_minute = 60
         if self.window.core.config.has("llama.idx.embeddings.limit.rpm"):
             max_per_minute = int(self.window.core.config.get("llama.idx.embeddings.limit.rpm")) # per minute
@@ -725,3 +1107,31 @@ class Indexing:
                 self.window.core.idx.log("RPM limit: sleep for {} seconds".format(sleep_time))
                 time.sleep(sleep_time)
         self.last_call = now
+
+    def apply_tokens_limit(self, texts: list):
+        """
+        Apply API calls TPM limit
+
+        :param texts: texts sent in request
+        """
+        max_tokens = self.window.core.config.get("llama.idx.embeddings.limit.tpm")
+        if max_tokens is None or int(max_tokens) <= 0:
+            return
+        max_tokens = int(max_tokens)
+        tokens = sum(self.window.core.tokens.from_str(text, "") for text in texts)
+        now = time.time()
+        while self.tokens_calls and now - self.tokens_calls[0][0] >= 60:
+            self.tokens_calls.popleft()
+
+        # wait until enough tokens from previous calls expire
+        used = sum(n for _, n in self.tokens_calls)
+        sleep_time = 0
+        for ts, n in self.tokens_calls:
+            if used + tokens <= max_tokens:
+                break
+            used -= n
+            sleep_time = ts + 60 - now
+        if sleep_time > 0:
+            self.window.core.idx.log("TPM limit: sleep for {} seconds".format(sleep_time))
+            time.sleep(sleep_time)
+        self.tokens_calls.append((time.time(), tokens))
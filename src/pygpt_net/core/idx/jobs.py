@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.23 10:00:00                  #
+# ================================================== #
+
+import datetime
+import json
+import os
+import threading
+import time
+import uuid
+
+from llama_index.core.indices.base import BaseIndex
+
+
+class Jobs:
+    STATUS_RUNNING = "running"
+    STATUS_PAUSED = "paused"
+    STATUS_CANCELLED = "cancelled"
+    STATUS_FINISHED = "finished"
+
+    def __init__(self, window=None):
+        """
+        Persistent indexing jobs with checkpoints
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.items = {}  # job id -> job data
+        self.loaded = False
+        self.lock = threading.RLock()
+        self.store_interval = 60  # max seconds between index stores
+        self.store_items = 1000  # max items processed between index stores
+
+    def get_path(self) -> str:
+        """
+        Get path to jobs file
+
+        :return: path to jobs file
+        """
+        return os.path.join(self.window.core.config.get_user_dir('idx'), '_jobs.json')
+
+    def load(self):
+        """Load unfinished jobs"""
+        self.items = {}
+        path = self.get_path()
+        try:
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.items = json.load(f)
+        except Exception as e:
+            self.window.core.debug.log(e)
+        self.loaded = True
+
+    def save(self):
+        """Save jobs (atomic write, file is never left half-written)"""
+        path = self.get_path()
+        with self.lock:
+            data = json.dumps(self.items, indent=4)
+        try:
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.window.core.debug.log(e)
+
+    def get_all(self) -> dict:
+        """
+        Get all jobs
+
+        :return: dict with jobs
+        """
+        if not self.loaded:
+            self.load()
+        return self.items
+
+    def get(self, id: str) -> dict or None:
+        """
+        Get job by id
+
+        :param id: job id
+        :return: job data or None if not exists
+        """
+        return self.get_all().get(id)
+
+    def get_unfinished(self) -> list:
+        """
+        Get jobs interrupted while running (app closed, error)
+
+        :return: list of jobs
+        """
+        return [job for job in self.get_all().values() if job["status"] == self.STATUS_RUNNING]
+
+    def get_by_idx(self, idx: str) -> list:
+        """
+        Get running and paused jobs of index
+
+        :param idx: index name
+        :return: list of jobs
+        """
+        return [job for job in self.get_all().values()
+                if job["idx"] == idx and job["status"] in [self.STATUS_RUNNING, self.STATUS_PAUSED]]
+
+    def create(self, type: str, idx: str, content) -> dict:
+        """
+        Create job
+
+        :param type: job type: file (path to index), db_current (ctx history from timestamp)
+        :param idx: index name
+        :param content: path to file or directory, or timestamp from
+        :return: job data
+        """
+        ts = int(datetime.datetime.now().timestamp())
+        job = {
+            "id": uuid.uuid4().hex,
+            "type": type,
+            "idx": idx,
+            "content": content,
+            "status": self.STATUS_RUNNING,
+            "checkpoint": None,  # last stored [meta id, item id], file jobs resume from idx_file manifest
+            "result": 0,  # number of indexed files or documents
+            "errors": [],
+            "stats": {
+                "total": 0,
+                "done": 0,
+                "bytes": 0,
+                "embed_calls": 0,
+                "time": 0.0,
+            },
+            "created_ts": ts,
+            "updated_ts": ts,
+        }
+        with self.lock:
+            self.get_all()[job["id"]] = job
+        self.save()
+        return job
+
+    def set_status(self, id: str, status: str) -> bool:
+        """
+        Set job status (running job stops at the next checkpoint)
+
+        :param id: job id
+        :param status: new status
+        :return: True if changed
+        """
+        job = self.get(id)
+        if job is None or job["status"] in [self.STATUS_CANCELLED, self.STATUS_FINISHED]:
+            return False
+        with self.lock:
+            job["status"] = status
+        self.save()
+        return True
+
+    def pause(self, id: str) -> bool:
+        """
+        Pause job
+
+        :param id: job id
+        :return: True if paused
+        """
+        return self.set_status(id, self.STATUS_PAUSED)
+
+    def resume(self, id: str) -> bool:
+        """
+        Mark job as running again
+
+        :param id: job id
+        :return: True if resumed
+        """
+        return self.set_status(id, self.STATUS_RUNNING)
+
+    def cancel(self, id: str) -> bool:
+        """
+        Cancel job (already indexed items are kept)
+
+        :param id: job id
+        :return: True if cancelled
+        """
+        job = self.get(id)
+        if job is not None and job["status"] == self.STATUS_PAUSED:
+            self.set_status(id, self.STATUS_CANCELLED)
+            self.remove(id)  # not running, nothing to finish
+            return True
+        return self.set_status(id, self.STATUS_CANCELLED)
+
+    def remove(self, id: str):
+        """
+        Remove job
+
+        :param id: job id
+        """
+        with self.lock:
+            if id in self.get_all():
+                del self.items[id]
+        self.save()
+
+    def is_stopped(self, job: dict) -> bool:
+        """
+        Check if job was paused or cancelled
+
+        :param job: job data
+        :return: True if stopped
+        """
+        return job["status"] != self.STATUS_RUNNING
+
+    def get_chunk_size(self) -> int:
+        """
+        Get number of items processed between checkpoints
+
+        :return: number of items
+        """
+        size = self.window.core.config.get("llama.idx.jobs.checkpoint")
+        if size is None or int(size) <= 0:
+            return 20
+        return int(size)
+
+    def get_progress(self, job: dict) -> dict:
+        """
+        Get job progress (sent to UI instead of whole job data)
+
+        :param job: job data
+        :return: dict with job id, type, index name, status and metrics
+        """
+        return {
+            "id": job["id"],
+            "type": job["type"],
+            "idx": job["idx"],
+            "status": job["status"],
+            "result": job["result"],
+            "metrics": self.get_metrics(job),
+        }
+
+    def get_metrics(self, job: dict) -> dict:
+        """
+        Get job progress metrics
+
+        :param job: job data
+        :return: dict with done, total, items per second, ETA (seconds), bytes and embedding calls
+        """
+        stats = job["stats"]
+        rate = 0.0
+        if stats["time"] > 0:
+            rate = stats["done"] / stats["time"]
+        eta = None
+        if rate > 0:
+            eta = max(stats["total"] - stats["done"], 0) / rate
+        return {
+            "done": stats["done"],
+            "total": stats["total"],
+            "rate": rate,
+            "eta": eta,
+            "bytes": stats["bytes"],
+            "embed_calls": stats["embed_calls"],
+            "errors": len(job["errors"]),
+        }
+
+    def format_size(self, size: int) -> str:
+        """
+        Format size in bytes
+
+        :param size: size in bytes
+        :return: formatted size
+        """
+        for unit in ['B', 'KB', 'MB', 'GB']:
+            if size < 1024:
+                return "{:.1f} {}".format(size, unit) if unit != 'B' else "{} B".format(size)
+            size /= 1024
+        return "{:.1f} TB".format(size)
+
+    def format_eta(self, seconds: float or None) -> str:
+        """
+        Format ETA
+
+        :param seconds: remaining seconds
+        :return: formatted ETA (H:MM:SS)
+        """
+        if seconds is None:
+            return "-"
+        return str(datetime.timedelta(seconds=int(seconds)))
+
+    def get_files(self, job: dict, index: BaseIndex) -> list:
+        """
+        Get files left to index, files already indexed by job are skipped
+
+        :param job: job data
+        :param index: index instance
+        :return: list of paths
+        """
+        indexing = self.window.core.idx.indexing
+        idx = job["idx"]
+        path = job["content"]
+        files = []
+        if os.path.isdir(path):
+            if indexing.is_incremental():
+                changes = indexing.get_changes(idx, path)
+                indexing.apply_changes(idx, index, changes)
+                files = changes["new"] + changes["modified"]
+            elif self.window.core.config.get("llama.idx.recursive"):
+                files = [os.path.join(root, f) for root, dirs, names in os.walk(path) for f in names]
+            else:
+                files = [os.path.join(path, f)
+                         for f in os.listdir(path) if os.path.isfile(os.path.join(path, f))]
+        elif os.path.isfile(path):
+            files = [path]
+        processed = self.get_processed(job)
+        return sorted(f for f in files if f not in processed)
+
+    def get_processed(self, job: dict) -> set:
+        """
+        Get files indexed and stored since job was created (from idx_file manifest)
+
+        :param job: job data
+        :return: set of paths
+        """
+        items = self.window.core.idx.get_idx_data(job["idx"]).get(job["idx"], {})
+        return set(item["path"] for item in items.values()
+                   if item.get("indexed_ts", 0) >= job["created_ts"])
+
+    def get_documents(self, job: dict) -> list:
+        """
+        Get ctx documents left to index, sorted to resume from checkpoint
+
+        :param job: job data
+        :return: list of documents
+        """
+        indexing = self.window.core.idx.indexing
+        documents = indexing.get_db_data_from_ts(job["content"])
+        if job["checkpoint"] is None:
+            if job["content"] == 0:
+                indexing.remove_old_meta_ids(job["idx"], [d.metadata["ctx_id"] for d in documents])
+            return documents
+        checkpoint = tuple(job["checkpoint"])
+        return [d for d in documents
+                if (d.metadata["ctx_id"], d.metadata["item_id"]) > checkpoint]
+
+    def get_size(self, files: list) -> int:
+        """
+        Get size of files
+
+        :param files: list of paths
+        :return: size in bytes
+        """
+        size = 0
+        for file in files:
+            try:
+                size += os.path.getsize(file)
+            except Exception:
+                pass
+        return size
+
+    def index_files(self, job: dict, index: BaseIndex, files: list, state: dict, callback: callable = None):
+        """
+        Index files, pipeline (if enabled) is run once for all files
+
+        :param job: job data
+        :param index: index instance
+        :param files: list of paths
+        :param state: run state
+        :param callback: progress callback
+        """
+        indexing = self.window.core.idx.indexing
+        chunk_size = self.get_chunk_size()
+        if os.path.isdir(job["content"]) and indexing.pipeline.is_enabled():
+            chunk = []
+
+            def on_file(file: str, doc_id: str or None) -> bool:
+                if doc_id is not None:
+                    state["pending"][file] = doc_id
+                chunk.append(file)
+                if len(chunk) < chunk_size and not self.is_stopped(job):
+                    return True
+                items = list(chunk)
+                chunk.clear()
+                return self.update(job, index, state, len(items), self.get_size(items), callback)
+
+            indexed, errors = indexing.pipeline.run(
+                idx=job["idx"],
+                index=index,
+                path=job["content"],
+                files=files,
+                callback=on_file,
+            )
+            self.add_errors(job, errors)
+            for file in list(state["pending"].keys()):
+                if file not in indexed:
+                    del state["pending"][file]  # not inserted in last batch
+            if chunk:
+                self.update(job, index, state, len(chunk), self.get_size(chunk), callback)
+            return
+
+        for i in range(0, len(files), chunk_size):
+            if self.is_stopped(job):
+                break
+            chunk = files[i:i + chunk_size]
+            indexed, errors = indexing.index_files_list(job["idx"], index, chunk)
+            state["pending"].update(indexed)
+            self.add_errors(job, errors)
+            if not self.update(job, index, state, len(chunk), self.get_size(chunk), callback):
+                break
+
+    def index_documents(self, job: dict, index: BaseIndex, documents: list, state: dict, callback: callable = None):
+        """
+        Index ctx documents in chunks
+
+        :param job: job data
+        :param index: index instance
+        :param documents: list of documents
+        :param state: run state
+        :param callback: progress callback
+        """
+        chunk_size = self.get_chunk_size()
+        for i in range(0, len(documents), chunk_size):
+            if self.is_stopped(job):
+                break
+            chunk = documents[i:i + chunk_size]
+            n, errors = self.window.core.idx.indexing.index_db_documents(job["idx"], index, chunk)
+            last = chunk[-1].metadata
+            state["pending"] += n
+            state["checkpoint"] = [last["ctx_id"], last["item_id"]]
+            self.add_errors(job, errors)
+            size = sum(len(d.text.encode("utf-8")) for d in chunk)
+            if not self.update(job, index, state, len(chunk), size, callback):
+                break
+
+    def add_errors(self, job: dict, errors: list):
+        """
+        Add errors to job
+
+        :param job: job data
+        :param errors: errors
+        """
+        if errors:
+            with self.lock:
+                job["errors"].extend(errors)
+
+    def update(self, job: dict, index: BaseIndex, state: dict, items: int, size: int, callback: callable = None) -> bool:
+        """
+        Update job progress, store index if store interval elapsed or job is stopped
+
+        :param job: job data
+        :param index: index instance
+        :param state: run state
+        :param items: number of processed items
+        :param size: processed bytes
+        :param callback: progress callback
+        :return: False if job is stopped
+        """
+        indexing = self.window.core.idx.indexing
+        now = time.time()
+        with self.lock:
+            stats = job["stats"]
+            stats["done"] += items
+            stats["bytes"] += size
+            stats["embed_calls"] += indexing.embed_calls - state["calls"]
+            stats["time"] += now - state["ts"]
+        state["calls"] = indexing.embed_calls
+        state["ts"] = now
+        state["items"] += items
+        if self.is_stopped(job) \
+                or state["items"] >= self.store_items \
+                or now - state["stored_ts"] >= self.store_interval:
+            self.store(job, index, state)
+        self.window.core.idx.log("Indexing job {}: {}".format(job["id"], self.get_metrics(job)))
+        if callback is not None:
+            callback(self.get_progress(job))
+        return not self.is_stopped(job)
+
+    def store(self, job: dict, index: BaseIndex, state: dict):
+        """
+        Store index and save job checkpoint
+
+        :param job: job data
+        :param index: index instance
+        :param state: run state
+        """
+        if job["type"] == "file":
+            pending = state["pending"]
+            self.add_errors(job, self.window.core.idx.indexing.flush_documents(pending))
+            if pending:
+                self.window.core.idx.storage.store(
+                    id=job["idx"],
+                    index=index,
+                )
+                self.window.core.idx.append(job["idx"], pending)  # manifest must match stored index
+            n = len(pending)
+            state["pending"] = {}
+        else:
+            n = state["pending"]
+            if n > 0:
+                self.window.core.idx.storage.store(
+                    id=job["idx"],
+                    index=index,
+                )
+            state["pending"] = 0
+        with self.lock:
+            job["result"] += n
+            if job["type"] != "file":
+                job["checkpoint"] = state["checkpoint"]
+            job["updated_ts"] = int(datetime.datetime.now().timestamp())
+        state["items"] = 0
+        state["stored_ts"] = time.time()
+        self.save()  # checkpoint
+
+    def run(self, id: str, callback: callable = None) -> dict or None:
+        """
+        Run or resume job
+
+        Index is stored and progress is saved when store interval elapsed (time or number of items)
+        and when job is paused or cancelled, so only items processed after the last store are
+        indexed again when job is resumed after app was closed.
+
+        :param id: job id
+        :param callback: called with job progress (see get_progress) after every chunk of items
+        :return: job data or None if not exists
+        """
+        job = self.get(id)
+        if job is None:
+            return None
+        if job["status"] == self.STATUS_PAUSED:
+            self.resume(id)
+
+        index = self.window.core.idx.storage.get(
+            id=job["idx"],
+            service_context=self.window.core.idx.llm.get_service_context(),
+        )  # get or create index
+        now = time.time()
+        state = {
+            "pending": {} if job["type"] == "file" else 0,  # indexed, not stored yet
+            "checkpoint": job["checkpoint"],  # last processed ctx item
+            "items": 0,  # processed since last store
+            "calls": self.window.core.idx.indexing.embed_calls,
+            "ts": now,
+            "stored_ts": now,
+        }
+        if job["type"] == "file":
+            items = self.get_files(job, index)
+            job["stats"]["total"] = job["stats"]["done"] + len(items)
+            self.index_files(job, index, items, state, callback)
+        else:
+            items = self.get_documents(job)
+            job["stats"]["total"] = job["stats"]["done"] + len(items)
+            self.index_documents(job, index, items, state, callback)
+        if state["items"] > 0 or state["pending"]:
+            self.store(job, index, state)
+
+        if job["status"] == self.STATUS_RUNNING:
+            job["status"] = self.STATUS_FINISHED
+        if job["status"] != self.STATUS_PAUSED:
+            self.remove(id)
+        return job
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.23 10:00:00                  #
+# ================================================== #
+
+import json
+import os
+import re
+import sqlite3
+import threading
+
+from llama_index.core.indices.base import BaseIndex
+from llama_index.core.schema import BaseNode, NodeWithScore
+from llama_index.core.vector_stores.utils import metadata_dict_to_node, node_to_metadata_dict
+
+from .retriever import HybridRetriever, LexicalRetriever
+
+WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+CAMEL_PATTERN = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+
+
+def tokenize(text: str) -> list:
+    """
+    Split text into lowercase terms, identifiers are kept whole and split into parts
+
+    :param text: text
+    :return: list of terms
+    """
+    terms = []
+    for word in WORD_PATTERN.findall(text):
+        terms.append(word.lower())
+        parts = [p for chunk in word.split("_") for p in CAMEL_PATTERN.findall(chunk)]
+        if len(parts) > 1:
+            terms.extend(p.lower() for p in parts)  # get_file_reader -> get, file, reader
+    return terms
+
+
+class Lexical:
+    def __init__(self, window=None):
+        """
+        Lexical (BM25) index of nodes, kept next to vector index
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.dbs = {}  # opened databases: path -> connection
+        self.lock = threading.RLock()
+
+    def is_enabled(self) -> bool:
+        """
+        Check if hybrid (BM25 + vector) retrieval is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.window.core.config.get("llama.idx.hybrid"))
+
+    def get_weights(self) -> (float, float):
+        """
+        Get weights of retrievers in fused ranking
+
+        :return: vector weight, BM25 weight
+        """
+        weights = []
+        for key, default in [("llama.idx.hybrid.weight.vector", 0.4), ("llama.idx.hybrid.weight.bm25", 0.6)]:
+            value = self.window.core.config.get(key)
+            weights.append(default if value is None else max(0.0, float(value)))
+        return weights[0], weights[1]
+
+    def get_top_k(self) -> int:
+        """
+        Get number of nodes returned by hybrid retriever
+
+        :return: top k
+        """
+        top_k = self.window.core.config.get("llama.idx.hybrid.top_k")
+        if top_k is None or int(top_k) <= 0:
+            return 4
+        return int(top_k)
+
+    def get_path(self, idx: str) -> str:
+        """
+        Get lexical index database path (per vector store and index)
+
+        :param idx: index name
+        :return: database path
+        """
+        return os.path.join(
+            self.window.core.config.get_user_dir('idx'),
+            "_lexical",
+            self.window.core.idx.get_current_store(),
+            idx + ".db",
+        )
+
+    def connect(self, path: str) -> sqlite3.Connection:
+        """
+        Open lexical index database
+
+        :param path: database path, empty for in-memory database
+        :return: database connection
+        """
+        if path:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        db = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        db.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS nodes USING fts5("
+            "terms, node_id UNINDEXED, ref_doc_id UNINDEXED, node UNINDEXED, "
+            "tokenize = \"unicode61 tokenchars '_'\")"
+        )
+        db.execute("CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT)")
+        db.execute(
+            "INSERT OR IGNORE INTO info (key, value) SELECT 'count', COUNT(*) FROM nodes "
+            "WHERE NOT EXISTS (SELECT 1 FROM info WHERE key = 'count')"
+        )  # database created before nodes count was stored
+        db.commit()
+        return db
+
+    def get_db(self, idx: str) -> sqlite3.Connection:
+        """
+        Get opened lexical index database
+
+        :param idx: index name
+        :return: database connection
+        """
+        path = self.get_path(idx)
+        with self.lock:
+            if path not in self.dbs:
+                self.dbs[path] = self.connect(path)
+            return self.dbs[path]
+
+    def insert(self, db: sqlite3.Connection, nodes: list):
+        """
+        Insert nodes into database (replace existing nodes with the same ID)
+
+        :param db: database connection
+        :param nodes: nodes
+        """
+        rows = []
+        for node in nodes:
+            text = node.get_content()
+            metadata = node_to_metadata_dict(node, remove_text=False, flat_metadata=False)
+            rows.append((" ".join(tokenize(text)), node.node_id, node.ref_doc_id, json.dumps(metadata)))
+        with self.lock:
+            deleted = db.executemany("DELETE FROM nodes WHERE node_id = ?", [(row[1],) for row in rows]).rowcount
+            db.executemany("INSERT INTO nodes (terms, node_id, ref_doc_id, node) VALUES (?, ?, ?, ?)", rows)
+            self.update_count(db, len(rows) - deleted)
+            db.commit()
+
+    def add(self, idx: str, nodes: list):
+        """
+        Add inserted nodes to lexical index
+
+        :param idx: index name
+        :param nodes: nodes inserted into vector index
+        """
+        if not self.is_enabled() or not nodes:
+            return
+        try:
+            self.insert(self.get_db(idx), nodes)
+        except Exception as e:
+            self.window.core.debug.log(e)
+
+    def delete(self, idx: str, doc_id: str):
+        """
+        Remove document nodes from lexical index
+
+        :param idx: index name
+        :param doc_id: document ID
+        """
+        if not os.path.exists(self.get_path(idx)):
+            return
+        try:
+            db = self.get_db(idx)
+            with self.lock:
+                deleted = db.execute("DELETE FROM nodes WHERE ref_doc_id = ?", (doc_id,)).rowcount
+                self.update_count(db, -deleted)
+                db.commit()
+        except Exception as e:
+            self.window.core.debug.log(e)
+
+    def remove(self, idx: str):
+        """
+        Remove lexical index
+
+        :param idx: index name
+        """
+        path = self.get_path(idx)
+        with self.lock:
+            if path in self.dbs:
+                self.dbs.pop(path).close()
+            if os.path.exists(path):
+                os.remove(path)
+
+    def count(self, db: sqlite3.Connection) -> int:
+        """
+        Count indexed nodes (stored count, FTS table is not scanned)
+
+        :param db: database connection
+        :return: number of nodes
+        """
+        with self.lock:
+            row = db.execute("SELECT value FROM info WHERE key = 'count'").fetchone()
+        return int(row[0]) if row else 0
+
+    def update_count(self, db: sqlite3.Connection, diff: int):
+        """
+        Update stored nodes count (commit is done by caller)
+
+        :param db: database connection
+        :param diff: number of added (or removed if negative) nodes
+        """
+        db.execute("UPDATE info SET value = value + ? WHERE key = 'count'", (diff,))
+
+    def get_docstore_count(self, index: BaseIndex) -> int:
+        """
+        Count nodes stored in index docstore
+
+        :param index: index instance
+        :return: number of nodes
+        """
+        nodes = getattr(index.index_struct, "nodes_dict", None)
+        if nodes is not None:
+            return len(nodes)  # updated together with docstore, no need to load all nodes
+        return len(index.docstore.docs)
+
+    def sync(self, idx: str, index: BaseIndex):
+        """
+        Rebuild lexical index from index docstore if nodes count differs
+        (index created or updated while hybrid retrieval was disabled)
+
+        :param idx: index name
+        :param index: index instance
+        """
+        total = self.get_docstore_count(index)
+        if total == 0:
+            return  # nodes are stored in vector store only, lexical index is updated on insert
+        db = self.get_db(idx)
+        if self.count(db) == total:
+            return
+        nodes = [node for node in index.docstore.docs.values() if isinstance(node, BaseNode)]
+        with self.lock:
+            db.execute("DELETE FROM nodes")
+            db.execute("UPDATE info SET value = 0 WHERE key = 'count'")
+            self.insert(db, nodes)
+        self.window.core.idx.log("Lexical index rebuilt from docstore: {}, nodes: {}".format(idx, len(nodes)))
+
+    def search(self, db: sqlite3.Connection, query: str, top_k: int) -> list:
+        """
+        Search nodes by BM25 rank
+
+        :param db: database connection
+        :param query: query
+        :param top_k: max number of nodes
+        :return: list of nodes with scores (higher is better)
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        match = " OR ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+        with self.lock:
+            rows = db.execute(
+                "SELECT node, bm25(nodes) AS rank FROM nodes WHERE nodes MATCH ? ORDER BY rank LIMIT ?",
+                (match, top_k),
+            ).fetchall()
+        return [NodeWithScore(node=metadata_dict_to_node(json.loads(node)), score=-rank) for node, rank in rows]
+
+    def get_retriever(self, index: BaseIndex, idx: str = None) -> HybridRetriever:
+        """
+        Get hybrid retriever (vector + BM25, fused ranking)
+
+        :param index: index instance
+        :param idx: index name, None for temporary index (lexical index built in memory)
+        :return: retriever
+        """
+        top_k = self.get_top_k()
+        vector_weight, bm25_weight = self.get_weights()
+        if idx is not None:
+            self.sync(idx, index)
+            db = self.get_db(idx)
+        else:
+            db = self.connect("")
+            self.insert(db, [node for node in index.docstore.docs.values() if isinstance(node, BaseNode)])
+        retrievers = [
+            (index.as_retriever(similarity_top_k=top_k * 2), vector_weight),
+            (LexicalRetriever(self, db, top_k * 2), bm25_weight),
+        ]
+        return HybridRetriever(retrievers, top_k)
+
+    def close(self):
+        """Close all opened databases"""
+        with self.lock:
+            for db in self.dbs.values():
+                db.close()
+            self.dbs = {}
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.13 15:00:00                  #
+# Updated Date: 2024.03.22 12:00:00                  #
 # ================================================== #
 
 import os.path
@@ -18,6 +18,8 @@ from llama_index.llms.openai import OpenAI
 
 from pygpt_net.item.model import ModelItem
 
+from .embeddings import EmbeddingsCache
+
 
 class Llm:
     def __init__(self, window=None):
@@ -29,6 +31,8 @@ class Llm:
         self.window = window
         self.default_model = "gpt-3.5-turbo"
         self.default_embed = "openai"
+        self.local_embed = ["local"]  # providers without API calls
+        self.cache = EmbeddingsCache(window)
 
     def init(self):
         """Init base ENV vars"""
@@ -91,10 +95,19 @@ class Llm:
             window=self.window,
             env=env,
         )
-        return self.window.core.llm.llms[provider].get_embeddings_model(
+        embed_model = self.window.core.llm.llms[provider].get_embeddings_model(
             window=self.window,
             config=args,
         )
+        return self.cache.wrap(embed_model, provider)  # use cached embeddings if enabled
+
+    def is_local_embeddings(self) -> bool:
+        """
+        Check if current embeddings provider works locally (no API calls and limits)
+
+        :return: True if local
+        """
+        return self.window.core.config.get("llama.idx.embeddings.provider") in self.local_embed
 
     def get_service_context(self, model: ModelItem = None) -> ServiceContext:
         """
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.23 10:00:00                  #
+# ================================================== #
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from llama_index.core import SimpleDirectoryReader
+from llama_index.core.indices.base import BaseIndex
+
+from pygpt_net.provider.loaders.base import LazyReader
+
+readers = {}  # reader instances cache (in parser process)
+
+
+def parse_file(path: str, loader_cls: type = None, args: dict = None) -> list or None:
+    """
+    Parse file to documents (executed in parser process)
+
+    :param path: path to file
+    :param loader_cls: data loader class or None to use default reader
+    :param args: data loader arguments
+    :return: list of documents or None if loader is not available in parser process (parsed in indexing thread)
+    """
+    if loader_cls is None:
+        return SimpleDirectoryReader(input_files=[path]).load_data()
+
+    key = loader_cls.__module__ + '.' + loader_cls.__name__
+    if key not in readers:
+        try:
+            loader = loader_cls()
+            loader.set_args(args)
+            readers[key] = loader.get()
+        except Exception:
+            readers[key] = None  # parse in indexing thread
+    if readers[key] is None:
+        return None
+    return readers[key].load_data(file=Path(path))
+
+
+class Pipeline:
+    def __init__(self, window=None, indexing=None):
+        """
+        Staged file indexing pipeline: directory scan -> parsing in process pool -> embed and insert
+
+        :param window: Window instance
+        :param indexing: Indexing instance
+        """
+        self.window = window
+        self.indexing = indexing
+        self.queue_size = 64  # default bounded queue size
+        self.stats = {}
+
+    def get_workers(self) -> int:
+        """
+        Get number of parser processes
+
+        :return: number of processes, 0 if pipeline is disabled
+        """
+        workers = self.window.core.config.get("llama.idx.pipeline.workers")
+        if workers is None:
+            return 0
+        return max(0, int(workers))
+
+    def get_queue_size(self) -> int:
+        """
+        Get bounded queue size
+
+        :return: max items in queue between stages
+        """
+        size = self.window.core.config.get("llama.idx.pipeline.queue")
+        if size is None or int(size) <= 0:
+            return self.queue_size
+        return int(size)
+
+    def is_enabled(self) -> bool:
+        """
+        Check if pipeline is enabled
+
+        :return: True if enabled
+        """
+        return self.get_workers() > 0
+
+    def run(
+            self,
+            idx: str,
+            index: BaseIndex,
+            path: str,
+            is_tmp: bool = False,
+            recursive: bool = False,
+            files: list = None,
+            callback: callable = None
+    ) -> tuple:
+        """
+        Index all files in directory using pipeline
+
+        :param idx: index name
+        :param index: index instance
+        :param path: path to directory
+        :param is_tmp: True if temporary index
+        :param recursive: True to index subdirectories
+        :param files: list of files to index (None to scan directory)
+        :param callback: called in consumer thread after every file with (path, document id or None if failed),
+                         pipeline is stopped if returns False
+        :return: dict with indexed files, errors
+        """
+        indexed = {}
+        errors = []
+        workers = self.get_workers()
+        size = self.get_queue_size()
+        files_queue = queue.Queue(maxsize=size)
+        docs_queue = queue.Queue(maxsize=size)
+        stop = threading.Event()
+        self.stats = {
+            "scan": self.init_stats(),
+            "parse": self.init_stats(),
+            "insert": self.init_stats(),
+            "workers": workers,
+        }
+
+        scanner = threading.Thread(
+            target=self.scan,
+            args=(path, recursive, files_queue, stop, files),
+            daemon=True,
+        )
+        parser = threading.Thread(
+            target=self.parse,
+            args=(files_queue, docs_queue, workers, stop),
+            daemon=True,
+        )
+        scanner.start()
+        parser.start()
+
+        # embed and insert (consumer), in current thread - index is not thread-safe
+        stats = self.stats["insert"]
+        try:
+            while True:
+                item = docs_queue.get()
+                if item is None:
+                    break
+                file, documents, error = item
+                if documents is None and error is None:
+                    # reader not allowed in subprocess (e.g. uses window instance or API client),
+                    # parsed here, in the same thread as without pipeline
+                    file, documents, error = self.parse_local(file)
+                if error is not None:
+                    errors.append(str(error))
+                    print("Error while indexing file: " + file)
+                    self.window.core.debug.log(error)
+                else:
+                    self.insert(idx, index, file, documents, is_tmp, indexed, errors)
+                if callback is not None and not callback(file, indexed.get(file)):
+                    break  # stopped by caller
+
+            start = time.perf_counter()
+            errors.extend(self.indexing.flush_documents(indexed))  # insert pending batch
+            stats["time"] += time.perf_counter() - start
+        finally:
+            stop.set()  # unblock producers if consumer failed or was stopped
+            scanner.join()
+            parser.join()
+
+        self.window.core.idx.log("Pipeline finished: {}".format(self.get_summary()))
+        return indexed, errors
+
+    def insert(
+            self,
+            idx: str,
+            index: BaseIndex,
+            file: str,
+            documents: list,
+            is_tmp: bool,
+            indexed: dict,
+            errors: list
+    ):
+        """
+        Embed and insert parsed documents (stage 3)
+
+        :param idx: index name
+        :param index: index instance
+        :param file: path to file
+        :param documents: parsed documents
+        :param is_tmp: True if temporary index
+        :param indexed: dict with indexed files
+        :param errors: errors
+        """
+        stats = self.stats["insert"]
+        start = time.perf_counter()
+        try:
+            # remove old file from index if exists
+            file_id = self.window.core.idx.files.get_id(file)
+            if not is_tmp:
+                self.indexing.remove_old_file(idx, file_id)
+
+            # index new version of file
+            for d in documents:
+                self.indexing.prepare_document(d)
+                self.indexing.index_document(index, d, None if is_tmp else idx)
+                indexed[file] = d.id_  # add to index
+                self.window.core.idx.log("Inserted document: {}, metadata: {}".format(d.id_, d.metadata))
+                stats["docs"] += 1
+            stats["files"] += 1
+        except Exception as e:
+            errors.append(str(e))
+            print("Error while indexing file: " + file)
+            self.window.core.debug.log(e)
+        finally:
+            stats["time"] += time.perf_counter() - start
+
+    def scan(
+            self,
+            path: str,
+            recursive: bool,
+            out_queue: queue.Queue,
+            stop: threading.Event,
+            files: list = None
+    ):
+        """
+        Scan directory for files (stage 1)
+
+        :param path: path to directory
+        :param recursive: True to scan subdirectories
+        :param out_queue: files queue
+        :param stop: stop event
+        :param files: list of files to use instead of scanning directory
+        """
+        stats = self.stats["scan"]
+        start = time.perf_counter()
+        try:
+            if files is not None:
+                for file_path in files:
+                    if not self.put(out_queue, file_path, stop):
+                        return
+                    stats["files"] += 1
+            elif recursive:
+                for root, dirs, files in os.walk(path):
+                    for file in files:
+                        if not self.put(out_queue, os.path.join(root, file), stop):
+                            return
+                        stats["files"] += 1
+            else:
+                for file in os.listdir(path):
+                    file_path = os.path.join(path, file)
+                    if os.path.isfile(file_path):
+                        if not self.put(out_queue, file_path, stop):
+                            return
+                        stats["files"] += 1
+        except Exception as e:
+            self.window.core.debug.log(e)
+        finally:
+            stats["time"] = time.perf_counter() - start
+            self.put(out_queue, None, stop)
+
+    def parse(self, in_queue: queue.Queue, out_queue: queue.Queue, workers: int, stop: threading.Event):
+        """
+        Parse files to documents using process pool (stage 2)
+
+        :param in_queue: files queue
+        :param out_queue: documents queue
+        :param workers: number of processes
+        :param stop: stop event
+        """
+        stats = self.stats["parse"]
+        start = time.perf_counter()
+        pool = None
+        pending = deque()
+        max_pending = workers * 2
+        try:
+            while not stop.is_set():
+                try:
+                    file = in_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if file is None:
+                    break
+                reader = self.get_reader(file)
+                if reader is False:
+                    continue  # excluded
+                if reader is None or (isinstance(reader, LazyReader) and reader.loader.allow_subprocess):
+                    if pool is None:
+                        pool = ProcessPoolExecutor(
+                            max_workers=workers,
+                            mp_context=multiprocessing.get_context("spawn"),
+                        )
+                    loader_cls = None
+                    args = None
+                    if reader is not None:
+                        loader_cls = reader.loader.__class__
+                        args = reader.args
+                    pending.append((file, pool.submit(parse_file, file, loader_cls, args)))
+                    while len(pending) >= max_pending:
+                        if not self.collect(pending.popleft(), out_queue, stop):
+                            return
+                else:
+                    # reader requires indexing thread (e.g. uses window instance), parsed by consumer
+                    if not self.put(out_queue, (file, None, None), stop):
+                        return
+                stats["files"] += 1
+
+            while pending:
+                if not self.collect(pending.popleft(), out_queue, stop):
+                    return
+        except Exception as e:
+            self.window.core.debug.log(e)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+            stats["time"] = time.perf_counter() - start
+            self.put(out_queue, None, stop)
+
+    def get_reader(self, file: str) -> LazyReader or bool or None:
+        """
+        Get reader for file
+
+        :param file: path to file
+        :return: reader, None if default reader, False if file is excluded
+        """
+        ext = os.path.splitext(file)[1][1:].lower()
+        if self.indexing.is_excluded(ext):
+            self.window.core.idx.log("Ignoring excluded extension: {}".format(ext))
+            return False
+        return self.indexing.get_file_reader(ext)
+
+    def parse_local(self, file: str) -> tuple:
+        """
+        Parse file in indexing (consumer) thread
+
+        :param file: path to file
+        :return: tuple (file, documents, error)
+        """
+        try:
+            documents = self.indexing.get_documents(file)
+            self.stats["parse"]["docs"] += len(documents)
+            return file, documents, None
+        except Exception as e:
+            return file, None, e
+
+    def collect(self, item: tuple, out_queue: queue.Queue, stop: threading.Event) -> bool:
+        """
+        Wait for parsed file and put documents to queue
+
+        :param item: tuple (file, future)
+        :param out_queue: documents queue
+        :param stop: stop event
+        :return: False if stopped
+        """
+        file, future = item
+        try:
+            documents = future.result()
+            if documents is None:
+                return self.put(out_queue, (file, None, None), stop)  # loader not available in process
+            self.window.core.idx.metadata.append_file_metadata(documents, file)
+            self.stats["parse"]["docs"] += len(documents)
+            result = (file, documents, None)
+        except Exception as e:
+            result = (file, None, e)
+        return self.put(out_queue, result, stop)
+
+    def put(self, out_queue: queue.Queue, item, stop: threading.Event) -> bool:
+        """
+        Put item to bounded queue, wait if queue is full
+
+        :param out_queue: queue
+        :param item: item
+        :param stop: stop event
+        :return: False if stopped
+        """
+        while not stop.is_set():
+            try:
+                out_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def init_stats(self) -> dict:
+        """
+        Get empty stage stats
+
+        :return: stats dict
+        """
+        return {
+            "files": 0,
+            "docs": 0,
+            "time": 0.0,
+        }
+
+    def get_summary(self) -> dict:
+        """
+        Get per-stage throughput of last run
+
+        :return: dict with stats per stage
+        """
+        summary = {}
+        for stage in ["scan", "parse", "insert"]:
+            if stage not in self.stats:
+                continue
+            stats = self.stats[stage]
+            elapsed = stats["time"]
+            summary[stage] = {
+                "files": stats["files"],
+                "docs": stats["docs"],
+                "time": round(elapsed, 3),
+                "files_per_sec": round(stats["files"] / elapsed, 2) if elapsed > 0 else 0,
+                "docs_per_sec": round(stats["docs"] / elapsed, 2) if elapsed > 0 else 0,
+            }
+        return summary
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.22 00:00:00                  #
+# ================================================== #
+
+from llama_index.core.retrievers import BaseRetriever
+from llama_index.core.schema import NodeWithScore, QueryBundle
+
+
+class LexicalRetriever(BaseRetriever):
+    def __init__(self, lexical, db, top_k: int = 4):
+        """
+        BM25 retriever over lexical index
+
+        :param lexical: Lexical instance
+        :param db: lexical index database connection
+        :param top_k: max number of nodes
+        """
+        super(LexicalRetriever, self).__init__()
+        self.lexical = lexical
+        self.db = db
+        self.top_k = top_k
+
+    def _retrieve(self, query_bundle: QueryBundle) -> list:
+        """
+        Retrieve nodes
+
+        :param query_bundle: query
+        :return: list of nodes with scores
+        """
+        return self.lexical.search(self.db, query_bundle.query_str, self.top_k)
+
+
+class HybridRetriever(BaseRetriever):
+    def __init__(self, retrievers: list, top_k: int = 4):
+        """
+        Fused retriever, results are merged by weighted sum of normalized scores (relative score fusion)
+
+        :param retrievers: list of tuples (retriever, weight)
+        :param top_k: max number of nodes
+        """
+        super(HybridRetriever, self).__init__()
+        self.retrievers = retrievers
+        self.top_k = top_k
+
+    def _retrieve(self, query_bundle: QueryBundle) -> list:
+        """
+        Retrieve nodes from all retrievers and fuse rankings
+
+        :param query_bundle: query
+        :return: list of nodes with fused scores
+        """
+        results = []
+        for retriever, weight in self.retrievers:
+            if weight > 0:
+                results.append((retriever.retrieve(query_bundle), weight))
+        return self.fuse(results)
+
+    def fuse(self, results: list) -> list:
+        """
+        Fuse results, scores of each retriever are min-max normalized to 0-1 and summed with weights
+
+        :param results: list of tuples (list of nodes with scores, weight)
+        :return: top k nodes with fused scores
+        """
+        scores = {}
+        nodes = {}
+        for items, weight in results:
+            if not items:
+                continue
+            values = [item.score or 0.0 for item in items]
+            low = min(values)
+            high = max(values)
+            for item, value in zip(items, values):
+                id = item.node.node_id
+                norm = (value - low) / (high - low) if high > low else 1.0
+                scores[id] = scores.get(id, 0.0) + weight * norm
+                if id not in nodes:
+                    nodes[id] = item.node
+        ids = sorted(scores, key=lambda id: scores[id], reverse=True)[:self.top_k]
+        return [NodeWithScore(node=nodes[id], score=scores[id]) for id in ids]
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.02.27 04:00:00                  #
+# Updated Date: 2024.03.22 08:00:00                  #
 # ================================================== #
 
 class Ctx:
@@ -73,6 +73,19 @@ class Ctx:
             meta_id=meta_id,
         )
 
+    def get_doc_ids(self, store_id: str, idx: str) -> dict:
+        """
+        Get indexed document ids of all ctx metas
+
+        :param store_id: store id
+        :param idx: index name
+        :return: dict: meta id -> document id
+        """
+        return self.provider.get_meta_doc_ids(
+            store_id=store_id,
+            idx=idx,
+        )
+
     def update(self, meta_id: int, doc_id: str) -> bool:
         """
         Update timestamp of indexed ctx meta
@@ -6,10 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.02.27 04:00:00                  #
+# Updated Date: 2024.03.21 16:00:00                  #
 # ================================================== #
 
 import datetime
+import hashlib
 import os.path
 
 
@@ -30,7 +31,8 @@ class Files:
             idx: str,
             file_id: str,
             path: str,
-            doc_id: str
+            doc_id: str,
+            stat: dict = None
     ) -> int:
         """
         Append file to index
@@ -40,6 +42,7 @@ class Files:
         :param file_id: file id
         :param path: file path
         :param doc_id: document id
+        :param stat: file manifest (size, mtime, hash)
         :return: ID of appended file
         """
         data = {
@@ -48,6 +51,8 @@ class Files:
             "indexed_ts": datetime.datetime.now().timestamp(),
             "id": doc_id,
         }
+        if stat is not None:
+            data.update(stat)
         return self.provider.append_file(
             store_id=store_id,
             idx=idx,
@@ -67,6 +72,52 @@ class Files:
         path = path.replace("\\", "/").strip(r'\/')
         return path
 
+    def get_stat(self, path: str) -> dict:
+        """
+        Get file manifest
+
+        :param path: file path
+        :return: dict with size, mtime (ns) and content hash
+        """
+        stat = os.stat(path)
+        return {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "hash": self.get_hash(path),
+        }
+
+    def get_hash(self, path: str) -> str:
+        """
+        Get file content hash
+
+        :param path: file path
+        :return: sha256 hash
+        """
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha.update(chunk)
+        return sha.hexdigest()
+
+    def compare(self, path: str, item: dict) -> str:
+        """
+        Compare file with stored manifest
+
+        :param path: file path
+        :param item: indexed file data
+        :return: unchanged, touched (modified time only) or modified
+        """
+        if item.get("size") is None or item.get("mtime") is None:
+            return "modified"  # indexed without manifest
+        stat = os.stat(path)
+        if stat.st_size != item["size"]:
+            return "modified"
+        if stat.st_mtime_ns == item["mtime"]:
+            return "unchanged"
+        if item.get("hash") is not None and self.get_hash(path) == item["hash"]:
+            return "touched"
+        return "modified"
+
     def get_doc_id(self, store_id: str, idx: str, file_id: str) -> str:
         """
         Get indexed document id by file
@@ -97,19 +148,21 @@ class Files:
             file_id=file_id,
         )
 
-    def update(self, id: int, doc_id: str, ts: int) -> bool:
+    def update(self, id: int, doc_id: str, ts: int, stat: dict = None) -> bool:
         """
         Update timestamp of indexed file
 
         :param id: database record ID
         :param doc_id: document ID
         :param ts: timestamp
+        :param stat: file manifest (size, mtime, hash)
         :return: True if file was updated
         """
         return self.provider.update_file(
             id=id,
             doc_id=doc_id,
             ts=ts,
+            stat=stat,
         )
 
     def remove(self, store_id: str, idx: str, doc_id: str):
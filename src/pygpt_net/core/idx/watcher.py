@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.21 18:00:00                  #
+# ================================================== #
+
+import ctypes
+import ctypes.util
+import os
+import queue
+import select
+import struct
+import sys
+import threading
+import time
+
+# inotify flags (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE \
+             | IN_DELETE_SELF | IN_MOVE_SELF
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class InotifyBackend:
+    def __init__(self, paths: list, recursive: bool = True):
+        """
+        Filesystem events from inotify (Linux)
+
+        :param paths: directories to watch
+        :param recursive: True to watch subdirectories
+        """
+        self.paths = paths
+        self.recursive = recursive
+        self.watches = {}  # wd -> directory
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.add_watch = libc.inotify_add_watch
+        self.add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        for path in paths:
+            self.add(path)
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """
+        Check if inotify is available on current platform
+
+        :return: True if available
+        """
+        if not sys.platform.startswith("linux"):
+            return False
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"))
+            return hasattr(libc, "inotify_init1")
+        except Exception:
+            return False
+
+    def add(self, path: str):
+        """
+        Add watch for directory (and subdirectories if recursive)
+
+        :param path: path to directory
+        """
+        dirs = [path]
+        if self.recursive:
+            dirs.extend(os.path.join(root, d) for root, subdirs, files in os.walk(path) for d in subdirs)
+        for dir in dirs:
+            wd = self.add_watch(self.fd, os.fsencode(dir), WATCH_MASK)
+            if wd >= 0:
+                self.watches[wd] = dir
+
+    def read(self, timeout: float) -> set:
+        """
+        Read filesystem events
+
+        :param timeout: max time to wait for events (seconds)
+        :return: set of changed paths
+        """
+        changed = set()
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return changed
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                changed.update(self.paths)  # events lost, rescan all directories
+                continue
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            dir = self.watches.get(wd)
+            if dir is None or mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                continue
+            path = os.path.join(dir, name) if name else dir
+            if mask & IN_ISDIR:
+                if not self.recursive:
+                    continue
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self.add(path)  # new subdirectory
+            changed.add(path)
+        return changed
+
+    def close(self):
+        """Close inotify descriptor"""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class PollingBackend:
+    def __init__(self, paths: list, recursive: bool = True, interval: float = 5.0):
+        """
+        Filesystem changes from periodic mtime scan (fallback)
+
+        :param paths: directories to watch
+        :param recursive: True to watch subdirectories
+        :param interval: scan interval (seconds)
+        """
+        self.paths = paths
+        self.recursive = recursive
+        self.interval = interval
+        self.snapshot = None  # first scan in watcher thread
+        self.last_scan = 0
+
+    def scan(self) -> dict:
+        """
+        Scan directories
+
+        :return: dict with files (path -> (mtime, size))
+        """
+        files = {}
+        for path in self.paths:
+            if self.recursive:
+                paths = [os.path.join(root, f) for root, dirs, names in os.walk(path) for f in names]
+            else:
+                try:
+                    paths = [os.path.join(path, f) for f in os.listdir(path)]
+                except OSError:
+                    paths = []
+            for file in paths:
+                try:
+                    stat = os.stat(file)
+                except OSError:
+                    continue
+                if os.path.isfile(file):
+                    files[file] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def read(self, timeout: float) -> set:
+        """
+        Compare directories with previous scan if interval elapsed
+
+        :param timeout: max time to wait (seconds)
+        :return: set of changed paths
+        """
+        wait = self.last_scan + self.interval - time.monotonic()
+        if wait > 0:
+            time.sleep(min(wait, timeout))
+            return set()
+        snapshot = self.scan()
+        self.last_scan = time.monotonic()
+        if self.snapshot is None:
+            self.snapshot = snapshot
+            return set()
+        changed = {path for path in snapshot if self.snapshot.get(path) != snapshot[path]}
+        changed.update(path for path in self.snapshot if path not in snapshot)  # removed
+        self.snapshot = snapshot
+        return changed
+
+    def close(self):
+        """Release snapshot"""
+        self.snapshot = {}
+
+
+class Watcher:
+    def __init__(self, window=None):
+        """
+        Directory watcher, debounced batches of changed paths are put to queue
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.queue = queue.Queue()
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.backend = None
+        self.max_batch = 1000  # max paths in one batch
+
+    def get_paths(self) -> list:
+        """
+        Get watched directories
+
+        :return: list of paths (data directory if not configured)
+        """
+        paths = []
+        value = self.window.core.config.get("llama.idx.watch.paths")
+        if value:
+            paths = [os.path.expanduser(p.strip()) for p in str(value).split(",") if p.strip()]
+        if not paths:
+            paths = [self.window.core.config.get_user_dir('data')]
+        return [os.path.normpath(p) for p in paths if os.path.isdir(p)]
+
+    def get_option(self, key: str, default: float) -> float:
+        """
+        Get numeric watcher option
+
+        :param key: config key
+        :param default: default value
+        :return: value
+        """
+        value = self.window.core.config.get(key)
+        if value is None or float(value) < 0:
+            return default
+        return float(value)
+
+    def create_backend(self, paths: list, recursive: bool):
+        """
+        Create events backend: inotify if available, mtime polling otherwise
+
+        :param paths: directories to watch
+        :param recursive: True to watch subdirectories
+        :return: backend instance
+        """
+        if InotifyBackend.is_available():
+            try:
+                return InotifyBackend(paths, recursive)
+            except Exception as e:
+                self.window.core.debug.log(e)
+        interval = self.get_option("llama.idx.watch.interval", 5.0)
+        return PollingBackend(paths, recursive, interval)
+
+    def is_running(self) -> bool:
+        """
+        Check if watcher is running
+
+        :return: True if running
+        """
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self) -> bool:
+        """
+        Start watching configured directories in background thread
+
+        :return: True if started
+        """
+        if self.is_running():
+            return True
+        paths = self.get_paths()
+        if not paths:
+            return False
+        recursive = bool(self.window.core.config.get("llama.idx.recursive"))
+        self.backend = self.create_backend(paths, recursive)
+        self.stop_event.clear()
+        self.thread = threading.Thread(
+            target=self.run,
+            args=(self.backend, self.get_option("llama.idx.watch.debounce", 2.0)),
+            daemon=True,
+        )
+        self.thread.start()
+        self.window.core.idx.log("Watching directories: {}, backend: {}".format(
+            paths,
+            self.backend.__class__.__name__,
+        ))
+        return True
+
+    def stop(self):
+        """Stop watching"""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=2)
+            self.thread = None
+        if self.backend is not None:
+            self.backend.close()
+            self.backend = None
+
+    def run(self, backend, debounce: float):
+        """
+        Collect events and put debounced batches to queue (watcher thread)
+
+        :param backend: events backend
+        :param debounce: wait time after last event before batch is emitted (seconds)
+        """
+        pending = set()
+        last_event = 0
+        while not self.stop_event.is_set():
+            try:
+                changed = backend.read(timeout=0.2)
+            except Exception as e:
+                self.window.core.debug.log(e)
+                break
+            if changed:
+                pending.update(changed)
+                last_event = time.monotonic()
+            if pending and (time.monotonic() - last_event >= debounce or len(pending) >= self.max_batch):
+                self.queue.put(sorted(pending))
+                pending = set()
+
+    def get_batch(self) -> list:
+        """
+        Get all changed paths collected since last call
+
+        :return: sorted list of changed paths, empty if no changes
+        """
+        paths = set()
+        while True:
+            try:
+                paths.update(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return sorted(paths)
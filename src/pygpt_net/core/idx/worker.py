@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.02.23 01:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
 from PySide6.QtCore import QObject, Signal, QRunnable, Slot
@@ -15,6 +15,7 @@ from PySide6.QtCore import QObject, Signal, QRunnable, Slot
 class IndexWorkerSignals(QObject):
     finished = Signal(str, object, object, bool)  # idx, result, errors, silent mode
     error = Signal(object)
+    progress = Signal(object)  # job progress
 
 
 class IndexWorker(QRunnable):
@@ -45,11 +46,29 @@ class IndexWorker(QRunnable):
             ))
 
             # execute indexing
-            if self.type == "file":
+            if self.type == "job":
+                job = self.window.core.idx.jobs.run(
+                    self.content,
+                    self.signals.progress.emit,
+                )
+                if job is None:
+                    raise Exception("Indexing job not found: {}".format(self.content))
+                if job["status"] == self.window.core.idx.jobs.STATUS_PAUSED:
+                    self.log("Paused indexing.")
+                    self.signals.progress.emit(self.window.core.idx.jobs.get_progress(job))
+                    return
+                result = job
+                errors = job["errors"]
+            elif self.type == "file":
                 result, errors = self.window.core.idx.index_files(
                     self.idx,
                     self.content,
                 )
+            elif self.type == "paths":
+                result, errors = self.window.core.idx.index_paths(
+                    self.idx,
+                    self.content,
+                )
             elif self.type == "db_meta":
                 result, errors = self.window.core.idx.index_db_by_meta_id(
                     self.idx,
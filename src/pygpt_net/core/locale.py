@@ -6,17 +6,21 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.15 10:00:00                  #
+# Updated Date: 2024.03.20 18:00:00                  #
 # ================================================== #
 
 import os
 import configparser
 import io
+import marshal
 
 from pygpt_net.config import Config
+from pygpt_net.core.profiler import Profiler
 
 
 class Locale:
+    CACHE_VERSION = 1
+
     def __init__(self, domain: str = None, config=None):
         """
         Locale loader
@@ -33,6 +37,7 @@ class Locale:
         self.default_domain = 'locale'  # default translation domain
         self.ini_key = 'LOCALE'  # ini key for translations
         self.data = {}
+        self.cache = {}  # compiled translations cache, per language
         self.config.init(False)  # load config
         if self.config.has('lang'):
             self.lang = self.config.get_lang()
@@ -47,6 +52,10 @@ class Locale:
         self.config.load(False)
         if self.config.has('lang'):
             self.lang = self.config.get_lang()
+        if domain is None:
+            self.data = {}  # other domains will be loaded on first use
+        elif domain in self.data:
+            del self.data[domain]
         self.load(self.lang, domain)
 
     def from_file(self, path: str) -> dict:
@@ -74,16 +83,88 @@ class Locale:
         if id not in self.data:
             self.data[id] = {}
         try:
-            path = self.get_base_path(id, lang)
-            if os.path.exists(path):
-                data = self.from_file(path)
-                for key in data:
-                    self.data[id][key] = data[key]
-            path = self.get_user_path(id, lang)
+            self.data[id].update(self.from_cache(id, lang))
+        except Exception as e:
+            print(e)
+
+    def from_cache(self, domain: str, lang: str) -> dict:
+        """
+        Load translations (base + user file) from compiled cache, cache is rebuilt if any of source files changed
+
+        :param domain: translation domain
+        :param lang: language code
+        :return: dict with translations
+        """
+        base_path = self.get_base_path(domain, lang)
+        user_path = self.get_user_path(domain, lang)
+        stamp = [self.get_stamp(base_path), self.get_stamp(user_path)]
+        cache = self.load_cache(lang)
+        if domain in cache and cache[domain]['stamp'] == stamp:
+            return cache[domain]['data']
+
+        data = {}
+        if stamp[0] is not None:
+            data.update(self.from_file(base_path))
+        if stamp[1] is not None:
+            data.update(self.from_file(user_path))  # user file overwrites base translations
+        cache[domain] = {
+            'stamp': stamp,
+            'data': data,
+        }
+        self.save_cache(lang)
+        return data
+
+    def get_stamp(self, path: str) -> list or None:
+        """
+        Get source file stamp (modification time and size)
+
+        :param path: path to file
+        :return: file stamp or None if file not exists
+        """
+        try:
+            stat = os.stat(path)
+            return [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            return None
+
+    def load_cache(self, lang: str) -> dict:
+        """
+        Load compiled translations cache for language (all domains in one read)
+
+        :param lang: language code
+        :return: dict with cached domains
+        """
+        if lang in self.cache:
+            return self.cache[lang]
+        domains = {}
+        path = self.get_cache_path(lang)
+        try:
             if os.path.exists(path):
-                data = self.from_file(path)
-                for key in data:
-                    self.data[id][key] = data[key]
+                with open(path, 'rb') as f:
+                    data = marshal.load(f)
+                if isinstance(data, dict) and data.get('version') == self.CACHE_VERSION:
+                    domains = data['domains']
+        except Exception:
+            domains = {}  # invalid cache, will be rebuilt
+        self.cache[lang] = domains
+        return domains
+
+    def save_cache(self, lang: str):
+        """
+        Save compiled translations cache for language
+
+        :param lang: language code
+        """
+        path = self.get_cache_path(lang)
+        tmp_path = path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                marshal.dump({
+                    'version': self.CACHE_VERSION,
+                    'domains': self.cache[lang],
+                }, f)
+            os.replace(tmp_path, path)
         except Exception as e:
             print(e)
 
@@ -96,9 +177,10 @@ class Locale:
         """
         if type(lang) is not str:
             lang = self.fallback
-        if lang != self.fallback:
-            self.load_by_lang(self.fallback, domain)  # load fallback first
-        self.load_by_lang(lang, domain)
+        with Profiler.span("locale.load: {}".format(domain or self.default_domain)):
+            if lang != self.fallback:
+                self.load_by_lang(self.fallback, domain)  # load fallback first
+            self.load_by_lang(lang, domain)
 
     def get(self, key: str, domain: str = None, params: dict = None) -> str:
         """
@@ -134,6 +216,15 @@ class Locale:
         """
         return os.path.join(self.config.get_app_path(), 'data', 'locale', domain + '.' + lang + '.ini')
 
+    def get_cache_path(self, lang: str) -> str:
+        """
+        Get path for compiled translations cache file
+
+        :param lang: language code
+        :return: path to cache file
+        """
+        return os.path.join(self.config.get_user_path(), 'cache', 'locale.' + lang + '.marshal')
+
     def get_user_path(self, domain: str, lang: str) -> str:
         """
         Get user path for locale file (overwrites base path)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.20 14:00:00                  #
+# ================================================== #
+
+import json
+import os
+import threading
+import time
+
+from contextlib import contextmanager
+
+
+class Profiler:
+    """
+    Startup profiler, records timed spans of startup phases
+
+    Spans are always recorded (until finish) because profiling mode is known only after
+    launcher arguments are parsed, results are dumped only if profiling is enabled.
+    """
+    enabled = False
+    recording = True
+    start_time = time.perf_counter()
+    spans = []
+
+    @classmethod
+    def enable(cls, enabled: bool = True):
+        """
+        Enable profiling mode
+
+        :param enabled: True to enable
+        """
+        cls.enabled = enabled
+
+    @classmethod
+    def reset(cls):
+        """Reset recorded spans and start time"""
+        cls.recording = True
+        cls.start_time = time.perf_counter()
+        cls.spans = []
+
+    @classmethod
+    def add(cls, name: str, start: float, end: float, cat: str = "startup"):
+        """
+        Add timed span
+
+        :param name: span name
+        :param start: start time (perf_counter)
+        :param end: end time (perf_counter)
+        :param cat: span category
+        """
+        if not cls.recording:
+            return
+        cls.spans.append({
+            "name": name,
+            "cat": cat,
+            "start": start,
+            "end": end,
+            "tid": threading.get_ident(),
+        })
+
+    @classmethod
+    @contextmanager
+    def span(cls, name: str, cat: str = "startup"):
+        """
+        Record timed span of wrapped block
+
+        :param name: span name
+        :param cat: span category
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls.add(name, start, time.perf_counter(), cat)
+
+    @classmethod
+    def mark(cls, name: str, cat: str = "startup"):
+        """
+        Record span from profiler start to now (e.g. first paint)
+
+        :param name: span name
+        :param cat: span category
+        """
+        cls.add(name, cls.start_time, time.perf_counter(), cat)
+
+    @classmethod
+    def finish(cls):
+        """Stop recording spans"""
+        cls.recording = False
+
+    @classmethod
+    def to_trace(cls) -> dict:
+        """
+        Return recorded spans in Chrome trace event format (chrome://tracing, Perfetto)
+
+        :return: trace dict
+        """
+        pid = os.getpid()
+        events = []
+        for span in cls.spans:
+            events.append({
+                "name": span["name"],
+                "cat": span["cat"],
+                "ph": "X",
+                "ts": round((span["start"] - cls.start_time) * 1000000, 1),
+                "dur": round((span["end"] - span["start"]) * 1000000, 1),
+                "pid": pid,
+                "tid": span["tid"],
+            })
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+        }
+
+    @classmethod
+    def dump(cls, path: str):
+        """
+        Dump recorded spans to Chrome trace JSON file
+
+        :param path: output file path
+        """
+        with open(path, 'w', encoding="utf-8") as f:
+            json.dump(cls.to_trace(), f, indent=2)
+
+    @classmethod
+    def summary(cls) -> str:
+        """
+        Return recorded spans summary
+
+        :return: summary text
+        """
+        lines = ["{:<40} {:>10} {:>10}".format("span", "start ms", "ms")]
+        for span in sorted(cls.spans, key=lambda s: s["start"]):
+            lines.append("{:<40} {:>10.1f} {:>10.1f}".format(
+                span["name"],
+                (span["start"] - cls.start_time) * 1000,
+                (span["end"] - span["start"]) * 1000,
+            ))
+        return "\n".join(lines)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.22 18:00:00                  #
+# ================================================== #
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from pygpt_net.item.model import ModelItem
+
+
+class Summarizer:
+    def __init__(self, window=None):
+        """
+        Chunked text summarization (map-reduce)
+
+        :param window: Window instance
+        """
+        self.window = window
+
+    def to_chunks(self, text: str, chunk_size: int) -> list:
+        """
+        Split text into chunks
+
+        :param text: text to split
+        :param chunk_size: chunk size (characters)
+        :return: list of chunks
+        """
+        if text is None or text == "":
+            return []
+        return [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+
+    def get_workers(self) -> int:
+        """
+        Get max number of concurrent calls
+
+        :return: number of workers
+        """
+        workers = self.window.core.config.get("max_concurrent_requests")
+        if workers is None or int(workers) <= 0:
+            return 4
+        return int(workers)
+
+    def call(
+            self,
+            prompt: str,
+            system_prompt: str,
+            model: ModelItem,
+            max_tokens: int
+    ) -> str:
+        """
+        Make quick call under the shared RPM limit
+
+        :param prompt: text to summarize
+        :param system_prompt: system prompt
+        :param model: model
+        :param max_tokens: max output tokens
+        :return: response text
+        """
+        self.window.core.bridge.apply_rate_limit()
+        return self.window.core.bridge.quick_call(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            max_tokens=max_tokens,
+            model=model,
+        )
+
+    def summarize(
+            self,
+            chunks: list,
+            system_prompt: str,
+            model: ModelItem,
+            max_tokens: int,
+            reduce: bool = False,
+            callback: callable = None,
+            error_callback: callable = None
+    ) -> str:
+        """
+        Summarize chunks concurrently (map) and optionally summarize partial summaries (reduce)
+
+        :param chunks: chunks of text
+        :param system_prompt: system prompt
+        :param model: model
+        :param max_tokens: max output tokens per call
+        :param reduce: summarize joined partial summaries in final call
+        :param callback: called with (done, total, partial summary) after every chunk
+        :param error_callback: called with exception on chunk error (exception is raised if not set)
+        :return: summary (partial summaries joined in chunks order if not reduced)
+        """
+        chunks = [chunk for chunk in chunks if chunk]
+        if not chunks:
+            return ""
+        results = [None] * len(chunks)
+        executor = ThreadPoolExecutor(max_workers=min(self.get_workers(), len(chunks)))
+        try:
+            futures = {
+                executor.submit(self.call, chunk, system_prompt, model, max_tokens): i
+                for i, chunk in enumerate(chunks)
+            }
+            done = 0
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    if error_callback is None:
+                        raise
+                    error_callback(e)
+                done += 1
+                if callback is not None:
+                    callback(done, len(chunks), results[i])
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        partials = [result for result in results if result]
+        if reduce and len(partials) > 1:
+            try:
+                summary = self.call("\n\n".join(partials), system_prompt, model, max_tokens)
+                if summary:
+                    return summary
+            except Exception as e:
+                if error_callback is None:
+                    raise
+                error_callback(e)  # partial summaries are returned
+        return "".join(partials)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.02.16 16:00:00                  #
+# Updated Date: 2024.03.20 14:00:00                  #
 # ================================================== #
 
 import copy
@@ -21,6 +21,7 @@ from urllib.request import urlopen, Request
 from PySide6.QtCore import QObject, Signal, Slot, QRunnable, QTimer
 from packaging.version import parse as parse_version, Version
 
+from pygpt_net.core.profiler import Profiler
 from pygpt_net.utils import trans
 
 
@@ -39,16 +40,18 @@ class Updater:
             version = self.get_app_version()
 
             # migrate DB
-            self.migrate_db()
-
-            self.patch_config(version)
-            self.patch_models(version)
-            self.patch_presets(version)
-            self.patch_ctx(version)
-            self.patch_indexes(version)
-            self.patch_assistants(version)
-            self.patch_attachments(version)
-            self.patch_notepad(version)
+            with Profiler.span("db.migrate"):
+                self.migrate_db()
+
+            with Profiler.span("config.patch"):
+                self.patch_config(version)
+                self.patch_models(version)
+                self.patch_presets(version)
+                self.patch_ctx(version)
+                self.patch_indexes(version)
+                self.patch_assistants(version)
+                self.patch_attachments(version)
+                self.patch_notepad(version)
         except Exception as e:
             self.window.core.debug.log(e)
             print("Failed to patch config data!")
@@ -1,4478 +1,50 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.4.2
-# WARNING! All changes made in this file will be lost!
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.20 16:00:00                  #
+# ================================================== #
 
-from PySide6 import QtCore
+import os
 
-qt_resource_data = b"\
-\x00\x00\x01\xb8\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-120q-138 0-2\
-40.5-91.5T122-44\
-0h82q14 104 92.5\
- 172T480-200q117\
- 0 198.5-81.5T76\
-0-480q0-117-81.5\
--198.5T480-760q-\
-69 0-129 32t-101\
- 88h110v80H120v-\
-240h80v94q51-64 \
-124.5-99T480-840\
-q75 0 140.5 28.5\
-t114 77q48.5 48.\
-5 77 114T840-480\
-q0 75-28.5 140.5\
-t-77 114q-48.5 4\
-8.5-114 77T480-1\
-20Zm112-192L440-\
-464v-216h80v184l\
-128 128-56 56Z\x22/\
-></svg>\
-\x00\x00\x01\x1a\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-280-200v-80h284q\
-63 0 109.5-40T72\
-0-420q0-60-46.5-\
-100T564-560H312l\
-104 104-56 56-20\
-0-200 200-200 56\
- 56-104 104h252q\
-97 0 166.5 63T80\
-0-420q0 94-69.5 \
-157T564-200H280Z\
-\x22/></svg>\
-\x00\x00\x01\x91\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-760-600v-160H600\
-v-80h240v240h-80\
-ZM120-120v-240h8\
-0v160h160v80H120\
-Zm0-320v-80h80v8\
-0h-80Zm0-160v-80\
-h80v80h-80Zm0-16\
-0v-80h80v80h-80Z\
-m160 0v-80h80v80\
-h-80Zm160 640v-8\
-0h80v80h-80Zm0-6\
-40v-80h80v80h-80\
-Zm160 640v-80h80\
-v80h-80Zm160 0v-\
-80h80v80h-80Zm0-\
-160v-80h80v80h-8\
-0Zm0-160v-80h80v\
-80h-80Z\x22/></svg>\
-\
-\x00\x00\x01C\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-80 310-250l5\
-7-57 73 73v-206H\
-235l73 72-58 58L\
-80-480l169-169 5\
-7 57-72 72h206v-\
-206l-73 73-57-57\
- 170-170 170 170\
--57 57-73-73v206\
-h205l-73-72 58-5\
-8 170 170-170 17\
-0-57-57 73-73H52\
-0v205l72-73 58 5\
-8L480-80Z\x22/></sv\
-g>\
-\x00\x00\x00\xfa\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-520-200v-560h240\
-v560H520Zm-320 0\
-v-560h240v560H20\
-0Zm400-80h80v-40\
-0h-80v400Zm-320 \
-0h80v-400h-80v40\
-0Zm0-400v400-400\
-Zm320 0v400-400Z\
-\x22/></svg>\
-\x00\x00\x01E\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-200-200h57l391-3\
-91-57-57-391 391\
-v57Zm-80 80v-170\
-l528-527q12-11 2\
-6.5-17t30.5-6q16\
- 0 31 6t26 18l55\
- 56q12 11 17.5 2\
-6t5.5 30q0 16-5.\
-5 30.5T817-647L2\
-90-120H120Zm640-\
-584-56-56 56 56Z\
-m-141 85-28-29 5\
-7 57-29-28Z\x22/></\
-svg>\
-\x00\x00\x01\x04\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-280-80 120-240l1\
-60-160 56 58-62 \
-62h406v-160h80v2\
-40H274l62 62-56 \
-58Zm-80-440v-240\
-h486l-62-62 56-5\
-8 160 160-160 16\
-0-56-58 62-62H28\
-0v160h-80Z\x22/></s\
-vg>\
-\x00\x00\x01t\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-438-226 296-368l\
-58-58 84 84 168-\
-168 58 58-226 22\
-6ZM200-80q-33 0-\
-56.5-23.5T120-16\
-0v-560q0-33 23.5\
--56.5T200-800h40\
-v-80h80v80h320v-\
-80h80v80h40q33 0\
- 56.5 23.5T840-7\
-20v560q0 33-23.5\
- 56.5T760-80H200\
-Zm0-80h560v-400H\
-200v400Zm0-480h5\
-60v-80H200v80Zm0\
- 0v-80 80Z\x22/></s\
-vg>\
-\x00\x00\x01\x12\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-80q-139-35-2\
-29.5-159.5T160-5\
-16v-244l320-120 \
-320 120v244q0 15\
-2-90.5 276.5T480\
--80Zm0-84q97-30 \
-162-118.5T718-48\
-0H480v-315l-240 \
-90v207q0 7 2 18h\
-238v316Z\x22/></svg\
->\
-\x00\x00\x01\x8b\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-360-200q-20 0-37\
-.5-9T294-234L120\
--480l174-246q11-\
-16 28.5-25t37.5-\
-9h400q33 0 56.5 \
-23.5T840-680v400\
-q0 33-23.5 56.5T\
-760-200H360Zm400\
--80v-400 400Zm-4\
-00 0h400v-400H36\
-0L218-480l142 20\
-0Zm96-40 104-104\
- 104 104 56-56-1\
-04-104 104-104-5\
-6-56-104 104-104\
--104-56 56 104 1\
-04-104 104 56 56\
-Z\x22/></svg>\
-\x00\x00\x02\x13\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-440-280h80v-240h\
--80v240Zm40-320q\
-17 0 28.5-11.5T5\
-20-640q0-17-11.5\
--28.5T480-680q-1\
-7 0-28.5 11.5T44\
-0-640q0 17 11.5 \
-28.5T480-600Zm0 \
-520q-83 0-156-31\
-.5T197-197q-54-5\
-4-85.5-127T80-48\
-0q0-83 31.5-156T\
-197-763q54-54 12\
-7-85.5T480-880q8\
-3 0 156 31.5T763\
--763q54 54 85.5 \
-127T880-480q0 83\
--31.5 156T763-19\
-7q-54 54-127 85.\
-5T480-80Zm0-80q1\
-34 0 227-93t93-2\
-27q0-134-93-227t\
--227-93q-134 0-2\
-27 93t-93 227q0 \
-134 93 227t227 9\
-3Zm0-320Z\x22/></sv\
-g>\
-\x00\x00\x01\xf1\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-79q-16 0-30.\
-5-6T423-102L102-\
-423q-11-12-17-26\
-.5T79-480q0-16 6\
--31t17-26l321-32\
-1q12-12 26.5-17.\
-5T480-881q16 0 3\
-1 5.5t26 17.5l32\
-1 321q12 11 17.5\
- 26t5.5 31q0 16-\
-5.5 30.5T858-423\
-L537-102q-11 11-\
-26 17t-31 6Zm0-8\
-0 321-321-321-32\
-1-321 321 321 32\
-1Zm-40-281h80v-2\
-40h-80v240Zm40 1\
-20q17 0 28.5-11.\
-5T520-360q0-17-1\
-1.5-28.5T480-400\
-q-17 0-28.5 11.5\
-T440-360q0 17 11\
-.5 28.5T480-320Z\
-m0-160Z\x22/></svg>\
-\
-\x00\x00\x014\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-440-120v-240h80v\
-80h320v80H520v80\
-h-80Zm-320-80v-8\
-0h240v80H120Zm16\
-0-160v-80H120v-8\
-0h160v-80h80v240\
-h-80Zm160-80v-80\
-h400v80H440Zm160\
--160v-240h80v80h\
-160v80H680v80h-8\
-0Zm-480-80v-80h4\
-00v80H120Z\x22/></s\
-vg>\
-\x00\x00\x01\x9b\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-80q-83 0-156\
--31.5T197-197q-5\
-4-54-85.5-127T80\
--480q0-83 31.5-1\
-56T197-763q54-54\
- 127-85.5T480-88\
-0q83 0 156 31.5T\
-763-763q54 54 85\
-.5 127T880-480q0\
- 83-31.5 156T763\
--197q-54 54-127 \
-85.5T480-80Zm0-8\
-0q134 0 227-93t9\
-3-227q0-64-24-12\
-3t-69-104L480-48\
-0v-320q-134 0-22\
-7 93t-93 227q0 1\
-34 93 227t227 93\
-Z\x22/></svg>\
-\x00\x00\x00\xb0\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-160-120v-480l320\
--240 320 240v480\
-H560v-280H400v28\
-0H160Z\x22/></svg>\
-\x00\x00\x01,\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-160-160q-33 0-56\
-.5-23.5T80-240v-\
-480q0-33 23.5-56\
-.5T160-800h480q3\
-3 0 56.5 23.5T72\
-0-720v180l160-16\
-0v440L720-420v18\
-0q0 33-23.5 56.5\
-T640-160H160Zm0-\
-80h480v-480H160v\
-480Zm0 0v-480 48\
-0Z\x22/></svg>\
-\x00\x00\x01P\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-360-240q-33 0-56\
-.5-23.5T280-320v\
--480q0-33 23.5-5\
-6.5T360-880h360q\
-33 0 56.5 23.5T8\
-00-800v480q0 33-\
-23.5 56.5T720-24\
-0H360Zm0-80h360v\
--480H360v480ZM20\
-0-80q-33 0-56.5-\
-23.5T120-160v-56\
-0h80v560h440v80H\
-200Zm160-240v-48\
-0 480Z\x22/></svg>\
-\x00\x00\x00\xe0\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-320-240 80-480l2\
-40-240 57 57-184\
- 184 183 183-56 \
-56Zm320 0-57-57 \
-184-184-183-183 \
-56-56 240 240-24\
-0 240Z\x22/></svg>\
-\x00\x00\x03\xcc\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-80q-82 0-155\
--31.5t-127.5-86Q\
-143-252 111.5-32\
-5T80-480q0-83 31\
-.5-155.5t86-127Q\
-252-817 325-848.\
-5T480-880q83 0 1\
-55.5 31.5t127 86\
-q54.5 54.5 86 12\
-7T880-480q0 82-3\
-1.5 155t-86 127.\
-5q-54.5 54.5-127\
- 86T480-80Zm0-82\
-q26-36 45-75t31-\
-83H404q12 44 31 \
-83t45 75Zm-104-1\
-6q-18-33-31.5-68\
-.5T322-320H204q2\
-9 50 72.5 87t99.\
-5 55Zm208 0q56-1\
-8 99.5-55t72.5-8\
-7H638q-9 38-22.5\
- 73.5T584-178ZM1\
-70-400h136q-3-20\
--4.5-39.5T300-48\
-0q0-21 1.5-40.5T\
-306-560H170q-5 2\
-0-7.5 39.5T160-4\
-80q0 21 2.5 40.5\
-T170-400Zm216 0h\
-188q3-20 4.5-39.\
-5T580-480q0-21-1\
-.5-40.5T574-560H\
-386q-3 20-4.5 39\
-.5T380-480q0 21 \
-1.5 40.5T386-400\
-Zm268 0h136q5-20\
- 7.5-39.5T800-48\
-0q0-21-2.5-40.5T\
-790-560H654q3 20\
- 4.5 39.5T660-48\
-0q0 21-1.5 40.5T\
-654-400Zm-16-240\
-h118q-29-50-72.5\
--87T584-782q18 3\
-3 31.5 68.5T638-\
-640Zm-234 0h152q\
--12-44-31-83t-45\
--75q-26 36-45 75\
-t-31 83Zm-200 0h\
-118q9-38 22.5-73\
-.5T376-782q-56 1\
-8-99.5 55T204-64\
-0Z\x22/></svg>\
-\x00\x00\x01\xdf\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-360-840v-80h240v\
-80H360Zm80 440h8\
-0v-240h-80v240Zm\
-40 320q-74 0-139\
-.5-28.5T226-186q\
--49-49-77.5-114.\
-5T120-440q0-74 2\
-8.5-139.5T226-69\
-4q49-49 114.5-77\
-.5T480-800q62 0 \
-119 20t107 58l56\
--56 56 56-56 56q\
-38 50 58 107t20 \
-119q0 74-28.5 13\
-9.5T734-186q-49 \
-49-114.5 77.5T48\
-0-80Zm0-80q116 0\
- 198-82t82-198q0\
--116-82-198t-198\
--82q-116 0-198 8\
-2t-82 198q0 116 \
-82 198t198 82Zm0\
--280Z\x22/></svg>\
-\x00\x00\x01N\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22m\
-438-240 226-226-\
-58-58-169 169-84\
--84-57 57 142 14\
-2ZM240-80q-33 0-\
-56.5-23.5T160-16\
-0v-640q0-33 23.5\
--56.5T240-880h32\
-0l240 240v480q0 \
-33-23.5 56.5T720\
--80H240Zm280-520\
-v-200H240v640h48\
-0v-440H520ZM240-\
-800v200-200 640-\
-640Z\x22/></svg>\
-\x00\x00\x01\xcb\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22m\
-424-296 282-282-\
-56-56-226 226-11\
-4-114-56 56 170 \
-170Zm56 216q-83 \
-0-156-31.5T197-1\
-97q-54-54-85.5-1\
-27T80-480q0-83 3\
-1.5-156T197-763q\
-54-54 127-85.5T4\
-80-880q83 0 156 \
-31.5T763-763q54 \
-54 85.5 127T880-\
-480q0 83-31.5 15\
-6T763-197q-54 54\
--127 85.5T480-80\
-Zm0-80q134 0 227\
--93t93-227q0-134\
--93-227t-227-93q\
--134 0-227 93t-9\
-3 227q0 134 93 2\
-27t227 93Zm0-320\
-Z\x22/></svg>\
-\x00\x00\x012\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-400 40-640l4\
-40-240 440 240-4\
-40 240Zm0 160L63\
--467l84-46 333 1\
-82 333-182 84 46\
--417 227Zm0 160L\
-63-307l84-46 333\
- 182 333-182 84 \
-46L480-80Zm0-411\
- 273-149-273-149\
--273 149 273 149\
-Zm0-149Z\x22/></svg\
->\
-\x00\x00\x01\xaf\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-360-360v-240h240\
-v240H360Zm80-80h\
-80v-80h-80v80Zm-\
-80 320v-80h-80q-\
-33 0-56.5-23.5T2\
-00-280v-80h-80v-\
-80h80v-80h-80v-8\
-0h80v-80q0-33 23\
-.5-56.5T280-760h\
-80v-80h80v80h80v\
--80h80v80h80q33 \
-0 56.5 23.5T760-\
-680v80h80v80h-80\
-v80h80v80h-80v80\
-q0 33-23.5 56.5T\
-680-200h-80v80h-\
-80v-80h-80v80h-8\
-0Zm320-160v-400H\
-280v400h400ZM480\
--480Z\x22/></svg>\
-\x00\x00\x01\xeb\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-280-600v-80h560v\
-80H280Zm0 160v-8\
-0h560v80H280Zm0 \
-160v-80h560v80H2\
-80ZM160-600q-17 \
-0-28.5-11.5T120-\
-640q0-17 11.5-28\
-.5T160-680q17 0 \
-28.5 11.5T200-64\
-0q0 17-11.5 28.5\
-T160-600Zm0 160q\
--17 0-28.5-11.5T\
-120-480q0-17 11.\
-5-28.5T160-520q1\
-7 0 28.5 11.5T20\
-0-480q0 17-11.5 \
-28.5T160-440Zm0 \
-160q-17 0-28.5-1\
-1.5T120-320q0-17\
- 11.5-28.5T160-3\
-60q17 0 28.5 11.\
-5T200-320q0 17-1\
-1.5 28.5T160-280\
-Z\x22/></svg>\
-\x00\x00\x016\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22m\
-40-120 440-760 4\
-40 760H40Zm138-8\
-0h604L480-720 17\
-8-200Zm302-40q17\
- 0 28.5-11.5T520\
--280q0-17-11.5-2\
-8.5T480-320q-17 \
-0-28.5 11.5T440-\
-280q0 17 11.5 28\
-.5T480-240Zm-40-\
-120h80v-200h-80v\
-200Zm40-100Z\x22/><\
-/svg>\
-\x00\x00\x01\xd8\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-80q-83 0-156\
--31.5T197-197q-5\
-4-54-85.5-127T80\
--480q0-83 31.5-1\
-56T197-763q54-54\
- 127-85.5T480-88\
-0q83 0 156 31.5T\
-763-763q54 54 85\
-.5 127T880-480q0\
- 83-31.5 156T763\
--197q-54 54-127 \
-85.5T480-80Zm0-8\
-0q54 0 104-17.5t\
-92-50.5L228-676q\
--33 42-50.5 92T1\
-60-480q0 134 93 \
-227t227 93Zm252-\
-124q33-42 50.5-9\
-2T800-480q0-134-\
-93-227t-227-93q-\
-54 0-104 17.5T28\
-4-732l448 448Z\x22/\
-></svg>\
-\x00\x00\x00\xbc\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-320-640v320-320Z\
-m-80 400v-480h48\
-0v480H240Zm80-80\
-h320v-320H320v32\
-0Z\x22/></svg>\
-\x00\x00\x01\x08\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-680-40v-160H280q\
--33 0-56.5-23.5T\
-200-280v-400H40v\
--80h160v-160h80v\
-640h640v80H760v1\
-60h-80Zm0-320v-3\
-20H360v-80h320q3\
-3 0 56.5 23.5T76\
-0-680v320h-80Z\x22/\
-></svg>\
-\x00\x00\x01\x82\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-240-400v80h-80q-\
-33 0-56.5-23.5T8\
-0-400v-400q0-33 \
-23.5-56.5T160-88\
-0h400q33 0 56.5 \
-23.5T640-800v80h\
--80v-80H160v400h\
-80ZM400-80q-33 0\
--56.5-23.5T320-1\
-60v-400q0-33 23.\
-5-56.5T400-640h4\
-00q33 0 56.5 23.\
-5T880-560v400q0 \
-33-23.5 56.5T800\
--80H400Zm0-80h40\
-0v-400H400v400Zm\
-200-200Z\x22/></svg\
->\
-\x00\x00\x01P\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-200-120q-33 0-56\
-.5-23.5T120-200v\
--560q0-33 23.5-5\
-6.5T200-840h560q\
-33 0 56.5 23.5T8\
-40-760v560q0 33-\
-23.5 56.5T760-12\
-0H200Zm320-320v2\
-40h240v-240H520Z\
-m0-80h240v-240H5\
-20v240Zm-80 0v-2\
-40H200v240h240Zm\
-0 80H200v240h240\
-v-240Z\x22/></svg>\
-\x00\x00\x00\xc2\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-120-120v-320h80v\
-184l504-504H520v\
--80h320v320h-80v\
--184L256-200h184\
-v80H120Z\x22/></svg\
->\
-\x00\x00\x01S\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22m\
-160-800 80 160h1\
-20l-80-160h80l80\
- 160h120l-80-160\
-h80l80 160h120l-\
-80-160h120q33 0 \
-56.5 23.5T880-72\
-0v480q0 33-23.5 \
-56.5T800-160H160\
-q-33 0-56.5-23.5\
-T80-240v-480q0-3\
-3 23.5-56.5T160-\
-800Zm0 240v320h6\
-40v-320H160Zm0 0\
-v320-320Z\x22/></sv\
-g>\
-\x00\x00\x02\x9a\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-760-120 480-400l\
--94 94q8 15 11 3\
-2t3 34q0 66-47 1\
-13T240-80q-66 0-\
-113-47T80-240q0-\
-66 47-113t113-47\
-q17 0 34 3t32 11\
-l94-94-94-94q-15\
- 8-32 11t-34 3q-\
-66 0-113-47T80-7\
-20q0-66 47-113t1\
-13-47q66 0 113 4\
-7t47 113q0 17-3 \
-34t-11 32l494 49\
-4v40H760ZM600-52\
-0l-80-80 240-240\
-h120v40L600-520Z\
-M240-640q33 0 56\
-.5-23.5T320-720q\
-0-33-23.5-56.5T2\
-40-800q-33 0-56.\
-5 23.5T160-720q0\
- 33 23.5 56.5T24\
-0-640Zm240 180q8\
- 0 14-6t6-14q0-8\
--6-14t-14-6q-8 0\
--14 6t-6 14q0 8 \
-6 14t14 6ZM240-1\
-60q33 0 56.5-23.\
-5T320-240q0-33-2\
-3.5-56.5T240-320\
-q-33 0-56.5 23.5\
-T160-240q0 33 23\
-.5 56.5T240-160Z\
-\x22/></svg>\
-\x00\x00\x00\xc5\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-200-312v-336l240\
- 168-240 168Zm32\
-0-8v-320h80v320h\
--80Zm160 0v-320h\
-80v320h-80Z\x22/></\
-svg>\
-\x00\x00\x01y\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-360-400h400L622-\
-580l-92 120-62-8\
-0-108 140Zm-40 1\
-60q-33 0-56.5-23\
-.5T240-320v-480q\
-0-33 23.5-56.5T3\
-20-880h480q33 0 \
-56.5 23.5T880-80\
-0v480q0 33-23.5 \
-56.5T800-240H320\
-Zm0-80h480v-480H\
-320v480ZM160-80q\
--33 0-56.5-23.5T\
-80-160v-560h80v5\
-60h560v80H160Zm1\
-60-720v480-480Z\x22\
-/></svg>\
-\x00\x00\x01\xdb\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22m\
-370-80-16-128q-1\
-3-5-24.5-12T307-\
-235l-119 50L78-3\
-75l103-78q-1-7-1\
--13.5v-27q0-6.5 \
-1-13.5L78-585l11\
-0-190 119 50q11-\
-8 23-15t24-12l16\
--128h220l16 128q\
-13 5 24.5 12t22.\
-5 15l119-50 110 \
-190-103 78q1 7 1\
- 13.5v27q0 6.5-2\
- 13.5l103 78-110\
- 190-118-50q-11 \
-8-23 15t-24 12L5\
-90-80H370Zm112-2\
-60q58 0 99-41t41\
--99q0-58-41-99t-\
-99-41q-59 0-99.5\
- 41T342-480q0 58\
- 40.5 99t99.5 41\
-Z\x22/></svg>\
-\x00\x00\x01P\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-240-400h320v-80H\
-240v80Zm0-120h48\
-0v-80H240v80Zm0-\
-120h480v-80H240v\
-80ZM80-80v-720q0\
--33 23.5-56.5T16\
-0-880h640q33 0 5\
-6.5 23.5T880-800\
-v480q0 33-23.5 5\
-6.5T800-240H240L\
-80-80Zm126-240h5\
-94v-480H160v525l\
-46-45Zm-46 0v-48\
-0 480Z\x22/></svg>\
-\x00\x00\x01(\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-200-120q-33 0-56\
-.5-23.5T120-200v\
--560q0-33 23.5-5\
-6.5T200-840h280v\
-80H200v560h560v-\
-280h80v280q0 33-\
-23.5 56.5T760-12\
-0H200Zm188-212-5\
-6-56 372-372H560\
-v-80h280v280h-80\
-v-144L388-332Z\x22/\
-></svg>\
-\x00\x00\x02\xff\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22m\
-370-80-16-128q-1\
-3-5-24.5-12T307-\
-235l-119 50L78-3\
-75l103-78q-1-7-1\
--13.5v-27q0-6.5 \
-1-13.5L78-585l11\
-0-190 119 50q11-\
-8 23-15t24-12l16\
--128h220l16 128q\
-13 5 24.5 12t22.\
-5 15l119-50 110 \
-190-103 78q1 7 1\
- 13.5v27q0 6.5-2\
- 13.5l103 78-110\
- 190-118-50q-11 \
-8-23 15t-24 12L5\
-90-80H370Zm70-80\
-h79l14-106q31-8 \
-57.5-23.5T639-32\
-7l99 41 39-68-86\
--65q5-14 7-29.5t\
-2-31.5q0-16-2-31\
-.5t-7-29.5l86-65\
--39-68-99 42q-22\
--23-48.5-38.5T53\
-3-694l-13-106h-7\
-9l-14 106q-31 8-\
-57.5 23.5T321-63\
-3l-99-41-39 68 8\
-6 64q-5 15-7 30t\
--2 32q0 16 2 31t\
-7 30l-86 65 39 6\
-8 99-42q22 23 48\
-.5 38.5T427-266l\
-13 106Zm42-180q5\
-8 0 99-41t41-99q\
-0-58-41-99t-99-4\
-1q-59 0-99.5 41T\
-342-480q0 58 40.\
-5 99t99.5 41Zm-2\
--140Z\x22/></svg>\
-\x00\x00\x00\xc3\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-160-160v-320h160\
-v320H160Zm240 0v\
--640h160v640H400\
-Zm240 0v-440h160\
-v440H640Z\x22/></sv\
-g>\
-\x00\x00\x01E\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-160-160q-33 0-56\
-.5-23.5T80-240v-\
-480q0-33 23.5-56\
-.5T160-800h640q3\
-3 0 56.5 23.5T88\
-0-720v480q0 33-2\
-3.5 56.5T800-160\
-H160Zm0-80h40v-4\
-80h-40v480Zm120 \
-0h400v-480H280v4\
-80Zm480 0h40v-48\
-0h-40v480ZM280-7\
-20v480-480Z\x22/></\
-svg>\
-\x00\x00\x01\x1b\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-240-80q-33 0-56.\
-5-23.5T160-160v-\
-640q0-33 23.5-56\
-.5T240-880h320l2\
-40 240v480q0 33-\
-23.5 56.5T720-80\
-H240Zm280-520v-2\
-00H240v640h480v-\
-440H520ZM240-800\
-v200-200 640-640\
-Z\x22/></svg>\
-\x00\x00\x01\x88\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-280-40q-33 0-56.\
-5-23.5T200-120v-\
-720q0-33 23.5-56\
-.5T280-920h400q3\
-3 0 56.5 23.5T76\
-0-840v720q0 33-2\
-3.5 56.5T680-40H\
-280Zm0-120v40h40\
-0v-40H280Zm0-80h\
-400v-480H280v480\
-Zm200-80L320-480\
-l56-56 64 62v-16\
-6h80v166l64-62 5\
-6 56-160 160ZM28\
-0-800h400v-40H28\
-0v40Zm0 0v-40 40\
-Zm0 640v40-40Z\x22/\
-></svg>\
-\x00\x00\x01A\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-200-80q-33 0-56.\
-5-23.5T120-160v-\
-560q0-33 23.5-56\
-.5T200-800h40v-8\
-0h80v80h320v-80h\
-80v80h40q33 0 56\
-.5 23.5T840-720v\
-560q0 33-23.5 56\
-.5T760-80H200Zm0\
--80h560v-400H200\
-v400Zm0-480h560v\
--80H200v80Zm0 0v\
--80 80Z\x22/></svg>\
-\
-\x00\x00\x00\xda\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22m\
-256-200-56-56 22\
-4-224-224-224 56\
--56 224 224 224-\
-224 56 56-224 22\
-4 224 224-56 56-\
-224-224-224 224Z\
-\x22/></svg>\
-\x00\x00\x01\xb9\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-480q33 0 56.\
-5-23.5T560-560q0\
--33-23.5-56.5T48\
-0-640q-33 0-56.5\
- 23.5T400-560q0 \
-33 23.5 56.5T480\
--480Zm0 294q122-\
-112 181-203.5T72\
-0-552q0-109-69.5\
--178.5T480-800q-\
-101 0-170.5 69.5\
-T240-552q0 71 59\
- 162.5T480-186Zm\
-0 106Q319-217 23\
-9.5-334.5T160-55\
-2q0-150 96.5-239\
-T480-880q127 0 2\
-23.5 89T800-552q\
-0 100-79.5 217.5\
-T480-80Zm0-480Z\x22\
-/></svg>\
-\x00\x00\x01\x5c\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-560-320h80v-80h8\
-0v-80h-80v-80h-8\
-0v80h-80v80h80v8\
-0ZM160-160q-33 0\
--56.5-23.5T80-24\
-0v-480q0-33 23.5\
--56.5T160-800h24\
-0l80 80h320q33 0\
- 56.5 23.5T880-6\
-40v400q0 33-23.5\
- 56.5T800-160H16\
-0Zm0-80h640v-400\
-H447l-80-80H160v\
-480Zm0 0v-480 48\
-0Z\x22/></svg>\
-\x00\x00\x03\x9f\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-200-80q-33 0-56.\
-5-23.5T120-160v-\
-560q0-33 23.5-56\
-.5T200-800h40v-8\
-0h80v80h320v-80h\
-80v80h40q33 0 56\
-.5 23.5T840-720v\
-560q0 33-23.5 56\
-.5T760-80H200Zm0\
--80h560v-400H200\
-v400Zm0-480h560v\
--80H200v80Zm0 0v\
--80 80Zm280 240q\
--17 0-28.5-11.5T\
-440-440q0-17 11.\
-5-28.5T480-480q1\
-7 0 28.5 11.5T52\
-0-440q0 17-11.5 \
-28.5T480-400Zm-1\
-60 0q-17 0-28.5-\
-11.5T280-440q0-1\
-7 11.5-28.5T320-\
-480q17 0 28.5 11\
-.5T360-440q0 17-\
-11.5 28.5T320-40\
-0Zm320 0q-17 0-2\
-8.5-11.5T600-440\
-q0-17 11.5-28.5T\
-640-480q17 0 28.\
-5 11.5T680-440q0\
- 17-11.5 28.5T64\
-0-400ZM480-240q-\
-17 0-28.5-11.5T4\
-40-280q0-17 11.5\
--28.5T480-320q17\
- 0 28.5 11.5T520\
--280q0 17-11.5 2\
-8.5T480-240Zm-16\
-0 0q-17 0-28.5-1\
-1.5T280-280q0-17\
- 11.5-28.5T320-3\
-20q17 0 28.5 11.\
-5T360-280q0 17-1\
-1.5 28.5T320-240\
-Zm320 0q-17 0-28\
-.5-11.5T600-280q\
-0-17 11.5-28.5T6\
-40-320q17 0 28.5\
- 11.5T680-280q0 \
-17-11.5 28.5T640\
--240Z\x22/></svg>\
-\x00\x00\x01I\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-160q-134 0-2\
-27-93t-93-227q0-\
-134 93-227t227-9\
-3q69 0 132 28.5T\
-720-690v-110h80v\
-280H520v-80h168q\
--32-56-87.5-88T4\
-80-720q-100 0-17\
-0 70t-70 170q0 1\
-00 70 170t170 70\
-q77 0 139-44t87-\
-116h84q-28 106-1\
-14 173t-196 67Z\x22\
-/></svg>\
-\x00\x00\x00\xb2\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-440-440H200v-80h\
-240v-240h80v240h\
-240v80H520v240h-\
-80v-240Z\x22/></svg\
->\
-\x00\x00\x02\xe0\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-320 0q-17 0-28.5\
--11.5T280-40q0-1\
-7 11.5-28.5T320-\
-80q17 0 28.5 11.\
-5T360-40q0 17-11\
-.5 28.5T320 0Zm1\
-60 0q-17 0-28.5-\
-11.5T440-40q0-17\
- 11.5-28.5T480-8\
-0q17 0 28.5 11.5\
-T520-40q0 17-11.\
-5 28.5T480 0Zm16\
-0 0q-17 0-28.5-1\
-1.5T600-40q0-17 \
-11.5-28.5T640-80\
-q17 0 28.5 11.5T\
-680-40q0 17-11.5\
- 28.5T640 0ZM480\
--400q-50 0-85-35\
-t-35-85v-240q0-5\
-0 35-85t85-35q50\
- 0 85 35t35 85v2\
-40q0 50-35 85t-8\
-5 35Zm0-240Zm-40\
- 520v-124q-104-1\
-4-172-92.5T200-5\
-20h80q0 83 58.5 \
-141.5T480-320q83\
- 0 141.5-58.5T68\
-0-520h80q0 105-6\
-8 183.5T520-244v\
-124h-80Zm40-360q\
-17 0 28.5-11.5T5\
-20-520v-240q0-17\
--11.5-28.5T480-8\
-00q-17 0-28.5 11\
-.5T440-760v240q0\
- 17 11.5 28.5T48\
-0-480Z\x22/></svg>\
-\x00\x00\x01\xaf\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-200-120q-33 0-56\
-.5-23.5T120-200v\
--560q0-33 23.5-5\
-6.5T200-840h167q\
-11-35 43-57.5t70\
--22.5q40 0 71.5 \
-22.5T594-840h166\
-q33 0 56.5 23.5T\
-840-760v560q0 33\
--23.5 56.5T760-1\
-20H200Zm0-80h560\
-v-560h-80v120H28\
-0v-120h-80v560Zm\
-280-560q17 0 28.\
-5-11.5T520-800q0\
--17-11.5-28.5T48\
-0-840q-17 0-28.5\
- 11.5T440-800q0 \
-17 11.5 28.5T480\
--760Z\x22/></svg>\
-\x00\x00\x01C\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-200-120q-33 0-56\
-.5-23.5T120-200v\
--560q0-33 23.5-5\
-6.5T200-840h560q\
-33 0 56.5 23.5T8\
-40-760v560q0 33-\
-23.5 56.5T760-12\
-0H200Zm0-80h560v\
--560H200v560Zm40\
--80h480L570-480 \
-450-320l-90-120-\
-120 160Zm-40 80v\
--560 560Z\x22/></sv\
-g>\
-\x00\x00\x00\xae\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-382-240 154-468l\
-57-57 171 171 36\
-7-367 57 57-424 \
-424Z\x22/></svg>\
-\x00\x00\x01\xe5\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22m\
-710-362-58-58q14\
--23 21-48t7-52h8\
-0q0 44-13 83.5T7\
-10-362ZM480-594Z\
-m112 112-72-72v-\
-206q0-17-11.5-28\
-.5T480-800q-17 0\
--28.5 11.5T440-7\
-60v126l-80-80v-4\
-6q0-50 35-85t85-\
-35q50 0 85 35t35\
- 85v240q0 11-2.5\
- 20t-5.5 18ZM440\
--120v-123q-104-1\
-4-172-93t-68-184\
-h80q0 83 57.5 14\
-1.5T480-320q34 0\
- 64.5-10.5T600-3\
-60l57 57q-29 23-\
-63.5 39T520-243v\
-123h-80Zm352 64L\
-56-792l56-56 736\
- 736-56 56Z\x22/></\
-svg>\
-\x00\x00\x01\x96\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-80q-83 0-156\
--31.5T197-197q-5\
-4-54-85.5-127T80\
--480q0-83 31.5-1\
-56T197-763q54-54\
- 127-85.5T480-88\
-0q83 0 156 31.5T\
-763-763q54 54 85\
-.5 127T880-480q0\
- 83-31.5 156T763\
--197q-54 54-127 \
-85.5T480-80Zm0-8\
-0q134 0 227-93t9\
-3-227q0-134-93-2\
-27t-227-93q-134 \
-0-227 93t-93 227\
-q0 134 93 227t22\
-7 93Zm0-320Z\x22/><\
-/svg>\
-\x00\x00\x02g\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-200-120q-33 0-56\
-.5-23.5T120-200v\
--400q0-100 70-17\
-0t170-70h240q100\
- 0 170 70t70 170\
-v400q0 33-23.5 5\
-6.5T760-120H200Z\
-m0-80h560v-400q0\
--66-47-113t-113-\
-47H360q-66 0-113\
- 47t-47 113v400Z\
-m160-280q-33 0-5\
-6.5-23.5T280-560\
-q0-33 23.5-56.5T\
-360-640q33 0 56.\
-5 23.5T440-560q0\
- 33-23.5 56.5T36\
-0-480Zm240 0q-33\
- 0-56.5-23.5T520\
--560q0-33 23.5-5\
-6.5T600-640q33 0\
- 56.5 23.5T680-5\
-60q0 33-23.5 56.\
-5T600-480ZM280-2\
-00v-80q0-33 23.5\
--56.5T360-360h24\
-0q33 0 56.5 23.5\
-T680-280v80h-80v\
--80h-80v80h-80v-\
-80h-80v80h-80Zm-\
-80 0h560-560Z\x22/>\
-</svg>\
-\x00\x00\x00\xf6\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-120-320v-80h280v\
-80H120Zm0-160v-8\
-0h440v80H120Zm0-\
-160v-80h440v80H1\
-20Zm520 480v-160\
-H480v-80h160v-16\
-0h80v160h160v80H\
-720v160h-80Z\x22/><\
-/svg>\
-\x00\x00\x01\x12\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-320 280-520l\
-56-58 104 104v-3\
-26h80v326l104-10\
-4 56 58-200 200Z\
-M240-160q-33 0-5\
-6.5-23.5T160-240\
-v-120h80v120h480\
-v-120h80v120q0 3\
-3-23.5 56.5T720-\
-160H240Z\x22/></svg\
->\
-\x00\x00\x01\x09\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-222-200 80-342l5\
-6-56 85 85 170-1\
-70 56 57-225 226\
-Zm0-320L80-662l5\
-6-56 85 85 170-1\
-70 56 57-225 226\
-Zm298 240v-80h36\
-0v80H520Zm0-320v\
--80h360v80H520Z\x22\
-/></svg>\
-\x00\x00\x02Z\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-680-80q-62 0-101\
-.5-31T518-202q-1\
-7-50-32.5-70T414\
--336q-62-50-98-1\
-13t-36-151q0-119\
- 80.5-199.5T560-\
-880q119 0 199.5 \
-80.5T840-600h-80\
-q0-85-57.5-142.5\
-T560-800q-85 0-1\
-42.5 57.5T360-60\
-0q0 68 27 116t77\
- 86q52 38 81 74t\
-43 78q14 44 33.5\
- 65t58.5 21q33 0\
- 56.5-23.5T760-2\
-40h80q0 66-47 11\
-3T680-80ZM248-29\
-0q-59-60-93.5-13\
-9.5T120-600q0-92\
- 34.5-172T248-91\
-2l58 56q-50 50-7\
-8 115.5T200-600q\
-0 74 28 139t78 1\
-15l-58 56Zm312-2\
-10q-42 0-71-29.5\
-T460-600q0-42 29\
--71t71-29q42 0 7\
-1 29t29 71q0 41-\
-29 70.5T560-500Z\
-\x22/></svg>\
-\x00\x00\x03'\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-200-120q-33 0-56\
-.5-23.5T120-200v\
--160q0-33 23.5-5\
-6.5T200-440h400v\
--160h80v160h80q3\
-3 0 56.5 23.5T84\
-0-360v160q0 33-2\
-3.5 56.5T760-120\
-H200Zm0-80h560v-\
-160H200v160Zm80-\
-40q17 0 28.5-11.\
-5T320-280q0-17-1\
-1.5-28.5T280-320\
-q-17 0-28.5 11.5\
-T240-280q0 17 11\
-.5 28.5T280-240Z\
-m140 0q17 0 28.5\
--11.5T460-280q0-\
-17-11.5-28.5T420\
--320q-17 0-28.5 \
-11.5T380-280q0 1\
-7 11.5 28.5T420-\
-240Zm140 0q17 0 \
-28.5-11.5T600-28\
-0q0-17-11.5-28.5\
-T560-320q-17 0-2\
-8.5 11.5T520-280\
-q0 17 11.5 28.5T\
-560-240Zm10-390-\
-58-58q26-24 58-3\
-8t70-14q38 0 70 \
-14t58 38l-58 58q\
--14-14-31.5-22t-\
-38.5-8q-21 0-38.\
-5 8T570-630ZM470\
--730l-56-56q44-4\
-4 102-69t124-25q\
-66 0 124 25t102 \
-69l-56 56q-33-33\
--76.5-51.5T640-8\
-00q-50 0-93.5 18\
-.5T470-730ZM200-\
-200v-160 160Z\x22/>\
-</svg>\
-\x00\x00\x01\xc6\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-360-320h80v-320h\
--80v320Zm160 0h8\
-0v-320h-80v320ZM\
-480-80q-83 0-156\
--31.5T197-197q-5\
-4-54-85.5-127T80\
--480q0-83 31.5-1\
-56T197-763q54-54\
- 127-85.5T480-88\
-0q83 0 156 31.5T\
-763-763q54 54 85\
-.5 127T880-480q0\
- 83-31.5 156T763\
--197q-54 54-127 \
-85.5T480-80Zm0-8\
-0q134 0 227-93t9\
-3-227q0-134-93-2\
-27t-227-93q-134 \
-0-227 93t-93 227\
-q0 134 93 227t22\
-7 93Zm0-320Z\x22/><\
-/svg>\
-\x00\x00\x01\xd5\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22m\
-612-292 56-56-14\
-8-148v-184h-80v2\
-16l172 172ZM480-\
-80q-83 0-156-31.\
-5T197-197q-54-54\
--85.5-127T80-480\
-q0-83 31.5-156T1\
-97-763q54-54 127\
--85.5T480-880q83\
- 0 156 31.5T763-\
-763q54 54 85.5 1\
-27T880-480q0 83-\
-31.5 156T763-197\
-q-54 54-127 85.5\
-T480-80Zm0-400Zm\
-0 320q133 0 226.\
-5-93.5T800-480q0\
--133-93.5-226.5T\
-480-800q-133 0-2\
-26.5 93.5T160-48\
-0q0 133 93.5 226\
-.5T480-160Z\x22/></\
-svg>\
-\x00\x00\x01\x88\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22m\
-600-120-240-84-1\
-86 72q-20 8-37-4\
-.5T120-170v-560q\
-0-13 7.5-23t20.5\
--15l212-72 240 8\
-4 186-72q20-8 37\
- 4.5t17 33.5v560\
-q0 13-7.5 23T812\
--192l-212 72Zm-4\
-0-98v-468l-160-5\
-6v468l160 56Zm80\
- 0 120-40v-474l-\
-120 46v468Zm-440\
--10 120-46v-468l\
--120 40v474Zm440\
--458v468-468Zm-3\
-20-56v468-468Z\x22/\
-></svg>\
-\x00\x00\x01\xeb\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-792-56 671-177q-\
-25 16-53 27.5T56\
-0-131v-82q14-5 2\
-7.5-10t25.5-12L4\
-80-368v208L280-3\
-60H120v-240h128L\
-56-792l56-56 736\
- 736-56 56Zm-8-2\
-32-58-58q17-31 2\
-5.5-65t8.5-70q0-\
-94-55-168T560-74\
-9v-82q124 28 202\
- 125.5T840-481q0\
- 53-14.5 102T784\
--288ZM650-422l-9\
-0-90v-130q47 22 \
-73.5 66t26.5 96q\
-0 15-2.5 29.5T65\
-0-422ZM480-592 3\
-76-696l104-104v2\
-08Zm-80 238v-94l\
--72-72H200v80h11\
-4l86 86Zm-36-130\
-Z\x22/></svg>\
-\x00\x00\x01\xa6\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-784-120 532-372q\
--30 24-69 38t-83\
- 14q-109 0-184.5\
--75.5T120-580q0-\
-109 75.5-184.5T3\
-80-840q109 0 184\
-.5 75.5T640-580q\
-0 44-14 83t-38 6\
-9l252 252-56 56Z\
-M380-400q75 0 12\
-7.5-52.5T560-580\
-q0-75-52.5-127.5\
-T380-760q-75 0-1\
-27.5 52.5T200-58\
-0q0 75 52.5 127.\
-5T380-400Zm-40-6\
-0v-80h-80v-80h80\
-v-80h80v80h80v80\
-h-80v80h-80Z\x22/><\
-/svg>\
-\x00\x00\x01\x80\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-840-680v480q0 33\
--23.5 56.5T760-1\
-20H200q-33 0-56.\
-5-23.5T120-200v-\
-560q0-33 23.5-56\
-.5T200-840h480l1\
-60 160Zm-80 34L6\
-46-760H200v560h5\
-60v-446ZM480-240\
-q50 0 85-35t35-8\
-5q0-50-35-85t-85\
--35q-50 0-85 35t\
--35 85q0 50 35 8\
-5t85 35ZM240-560\
-h360v-160H240v16\
-0Zm-40-86v446-56\
-0 114Z\x22/></svg>\
-\x00\x00\x01\x14\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-440-320v-326L336\
--542l-56-58 200-\
-200 200 200-56 5\
-8-104-104v326h-8\
-0ZM240-160q-33 0\
--56.5-23.5T160-2\
-40v-120h80v120h4\
-80v-120h80v120q0\
- 33-23.5 56.5T72\
-0-160H240Z\x22/></s\
-vg>\
-\x00\x00\x00\xf9\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-160-160q-33 0-56\
-.5-23.5T80-240v-\
-480q0-33 23.5-56\
-.5T160-800h240l8\
-0 80h320q33 0 56\
-.5 23.5T880-640v\
-400q0 33-23.5 56\
-.5T800-160H160Z\x22\
-/></svg>\
-\x00\x00\x01\xd5\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22m\
-612-292 56-56-14\
-8-148v-184h-80v2\
-16l172 172ZM480-\
-80q-83 0-156-31.\
-5T197-197q-54-54\
--85.5-127T80-480\
-q0-83 31.5-156T1\
-97-763q54-54 127\
--85.5T480-880q83\
- 0 156 31.5T763-\
-763q54 54 85.5 1\
-27T880-480q0 83-\
-31.5 156T763-197\
-q-54 54-127 85.5\
-T480-80Zm0-400Zm\
-0 320q133 0 226.\
-5-93.5T800-480q0\
--133-93.5-226.5T\
-480-800q-133 0-2\
-26.5 93.5T160-48\
-0q0 133 93.5 226\
-.5T480-160Z\x22/></\
-svg>\
-\x00\x00\x02\x15\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-280q17 0 28.\
-5-11.5T520-320q0\
--17-11.5-28.5T48\
-0-360q-17 0-28.5\
- 11.5T440-320q0 \
-17 11.5 28.5T480\
--280Zm-40-160h80\
-v-240h-80v240Zm4\
-0 360q-83 0-156-\
-31.5T197-197q-54\
--54-85.5-127T80-\
-480q0-83 31.5-15\
-6T197-763q54-54 \
-127-85.5T480-880\
-q83 0 156 31.5T7\
-63-763q54 54 85.\
-5 127T880-480q0 \
-83-31.5 156T763-\
-197q-54 54-127 8\
-5.5T480-80Zm0-80\
-q134 0 227-93t93\
--227q0-134-93-22\
-7t-227-93q-134 0\
--227 93t-93 227q\
-0 134 93 227t227\
- 93Zm0-320Z\x22/></\
-svg>\
-\x00\x00\x00\xba\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-320-200v-560l440\
- 280-440 280Zm80\
--280Zm0 134 210-\
-134-210-134v268Z\
-\x22/></svg>\
-\x00\x00\x01\xef\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-240-80q-33 0-56.\
-5-23.5T160-160v-\
-400q0-33 23.5-56\
-.5T240-640h40v-8\
-0q0-83 58.5-141.\
-5T480-920q83 0 1\
-41.5 58.5T680-72\
-0v80h40q33 0 56.\
-5 23.5T800-560v4\
-00q0 33-23.5 56.\
-5T720-80H240Zm0-\
-80h480v-400H240v\
-400Zm240-120q33 \
-0 56.5-23.5T560-\
-360q0-33-23.5-56\
-.5T480-440q-33 0\
--56.5 23.5T400-3\
-60q0 33 23.5 56.\
-5T480-280ZM360-6\
-40h240v-80q0-50-\
-35-85t-85-35q-50\
- 0-85 35t-35 85v\
-80ZM240-160v-400\
- 400Z\x22/></svg>\
-\x00\x00\x00\xfa\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-860-240 500-480l\
-360-240v480Zm-40\
-0 0L100-480l360-\
-240v480Zm-80-240\
-Zm400 0Zm-400 90\
-v-180l-136 90 13\
-6 90Zm400 0v-180\
-l-136 90 136 90Z\
-\x22/></svg>\
-\x00\x00\x01I\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-320-240h320v-80H\
-320v80Zm0-160h32\
-0v-80H320v80ZM24\
-0-80q-33 0-56.5-\
-23.5T160-160v-64\
-0q0-33 23.5-56.5\
-T240-880h320l240\
- 240v480q0 33-23\
-.5 56.5T720-80H2\
-40Zm280-520v-200\
-H240v640h480v-44\
-0H520ZM240-800v2\
-00-200 640-640Z\x22\
-/></svg>\
-\x00\x00\x02\xd5\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-120q-151 0-2\
-55.5-46.5T120-28\
-0v-400q0-66 105.\
-5-113T480-840q14\
-9 0 254.5 47T840\
--680v400q0 67-10\
-4.5 113.5T480-12\
-0Zm0-479q89 0 17\
-9-25.5T760-679q-\
-11-29-100.5-55T4\
-80-760q-91 0-178\
-.5 25.5T200-679q\
-14 30 101.5 55T4\
-80-599Zm0 199q42\
- 0 81-4t74.5-11.\
-5q35.5-7.5 67-18\
-.5t57.5-25v-120q\
--26 14-57.5 25t-\
-67 18.5Q600-528 \
-561-524t-81 4q-4\
-2 0-82-4t-75.5-1\
-1.5Q287-543 256-\
-554t-56-25v120q2\
-5 14 56 25t66.5 \
-18.5Q358-408 398\
--404t82 4Zm0 200\
-q46 0 93.5-7t87.\
-5-18.5q40-11.5 6\
-7-26t32-29.5v-98\
-q-26 14-57.5 25t\
--67 18.5Q600-328\
- 561-324t-81 4q-\
-42 0-82-4t-75.5-\
-11.5Q287-343 256\
--354t-56-25v99q5\
- 15 31.5 29t66.5\
- 25.5q40 11.5 88\
- 18.5t94 7Z\x22/></\
-svg>\
-\x00\x00\x03N\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-80q-82 0-155\
--31.5t-127.5-86Q\
-143-252 111.5-32\
-5T80-480q0-83 32\
-.5-156t88-127Q25\
-6-817 330-848.5T\
-488-880q80 0 151\
- 27.5t124.5 76q5\
-3.5 48.5 85 115T\
-880-518q0 115-70\
- 176.5T640-280h-\
-74q-9 0-12.5 5t-\
-3.5 11q0 12 15 3\
-4.5t15 51.5q0 50\
--27.5 74T480-80Z\
-m0-400Zm-220 40q\
-26 0 43-17t17-43\
-q0-26-17-43t-43-\
-17q-26 0-43 17t-\
-17 43q0 26 17 43\
-t43 17Zm120-160q\
-26 0 43-17t17-43\
-q0-26-17-43t-43-\
-17q-26 0-43 17t-\
-17 43q0 26 17 43\
-t43 17Zm200 0q26\
- 0 43-17t17-43q0\
--26-17-43t-43-17\
-q-26 0-43 17t-17\
- 43q0 26 17 43t4\
-3 17Zm120 160q26\
- 0 43-17t17-43q0\
--26-17-43t-43-17\
-q-26 0-43 17t-17\
- 43q0 26 17 43t4\
-3 17ZM480-160q9 \
-0 14.5-5t5.5-13q\
-0-14-15-33t-15-5\
-7q0-42 29-67t71-\
-25h70q66 0 113-3\
-8.5T800-518q0-12\
-1-92.5-201.5T488\
--800q-136 0-232 \
-93t-96 227q0 133\
- 93.5 226.5T480-\
-160Z\x22/></svg>\
-\x00\x00\x01\x90\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-80q-75 0-140\
-.5-28.5t-114-77q\
--48.5-48.5-77-11\
-4T120-440h80q0 1\
-17 81.5 198.5T48\
-0-160q117 0 198.\
-5-81.5T760-440q0\
--117-81.5-198.5T\
-480-720h-6l62 62\
--56 58-160-160 1\
-60-160 56 58-62 \
-62h6q75 0 140.5 \
-28.5t114 77q48.5\
- 48.5 77 114T840\
--440q0 75-28.5 1\
-40.5t-77 114q-48\
-.5 48.5-114 77T4\
-80-80Z\x22/></svg>\
-\x00\x00\x02\x1d\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-120-160v-112q0-3\
-4 17.5-62.5T184-\
-378q62-31 126-46\
-.5T440-440q20 0 \
-40 1.5t40 4.5q-4\
- 58 21 109.5t73 \
-84.5v80H120ZM760\
--40l-60-60v-186q\
--44-13-72-49.5T6\
-00-420q0-58 41-9\
-9t99-41q58 0 99 \
-41t41 99q0 45-25\
-.5 80T790-290l50\
- 50-60 60 60 60-\
-80 80ZM440-480q-\
-66 0-113-47t-47-\
-113q0-66 47-113t\
-113-47q66 0 113 \
-47t47 113q0 66-4\
-7 113t-113 47Zm3\
-00 80q17 0 28.5-\
-11.5T780-440q0-1\
-7-11.5-28.5T740-\
-480q-17 0-28.5 1\
-1.5T700-440q0 17\
- 11.5 28.5T740-4\
-00Z\x22/></svg>\
-\x00\x00\x01w\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-880-260 720-420v\
-67l-80-80v-287H3\
-53l-80-80h367q33\
- 0 56.5 23.5T720\
--720v180l160-160\
-v440ZM822-26 26-\
-822l56-56L878-82\
-l-56 56ZM498-575\
-ZM382-464ZM160-8\
-00l80 80h-80v480\
-h480v-80l80 80q0\
- 33-23.5 56.5T64\
-0-160H160q-33 0-\
-56.5-23.5T80-240\
-v-480q0-33 23.5-\
-56.5T160-800Z\x22/>\
-</svg>\
-\x00\x00\x01\x0f\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-280-120q-33 0-56\
-.5-23.5T200-200v\
--520h-40v-80h200\
-v-40h240v40h200v\
-80h-40v520q0 33-\
-23.5 56.5T680-12\
-0H280Zm80-160h80\
-v-360h-80v360Zm1\
-60 0h80v-360h-80\
-v360Z\x22/></svg>\
-\x00\x00\x00\xbf\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-120-280v-80h560v\
-80H120Zm80-160v-\
-80h560v80H200Zm8\
-0-160v-80h560v80\
-H280Z\x22/></svg>\
-\x00\x00\x01v\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-560-131v-82q90-2\
-6 145-100t55-168\
-q0-94-55-168T560\
--749v-82q124 28 \
-202 125.5T840-48\
-1q0 127-78 224.5\
-T560-131ZM120-36\
-0v-240h160l200-2\
-00v640L280-360H1\
-20Zm440 40v-322q\
-47 22 73.5 66t26\
-.5 96q0 51-26.5 \
-94.5T560-320ZM40\
-0-606l-86 86H200\
-v80h114l86 86v-2\
-52ZM300-480Z\x22/><\
-/svg>\
-\x00\x00\x01\xf7\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22m\
-336-280 144-144 \
-144 144 56-56-14\
-4-144 144-144-56\
--56-144 144-144-\
-144-56 56 144 14\
-4-144 144 56 56Z\
-M480-80q-83 0-15\
-6-31.5T197-197q-\
-54-54-85.5-127T8\
-0-480q0-83 31.5-\
-156T197-763q54-5\
-4 127-85.5T480-8\
-80q83 0 156 31.5\
-T763-763q54 54 8\
-5.5 127T880-480q\
-0 83-31.5 156T76\
-3-197q-54 54-127\
- 85.5T480-80Zm0-\
-80q134 0 227-93t\
-93-227q0-134-93-\
-227t-227-93q-134\
- 0-227 93t-93 22\
-7q0 134 93 227t2\
-27 93Zm0-320Z\x22/>\
-</svg>\
-\x00\x00\x01\xa6\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-330-240q-104 0-1\
-77-73T80-490q0-1\
-04 73-177t177-73\
-h370q75 0 127.5 \
-52.5T880-560q0 7\
-5-52.5 127.5T700\
--380H350q-46 0-7\
-8-32t-32-78q0-46\
- 32-78t78-32h370\
-v80H350q-13 0-21\
-.5 8.5T320-490q0\
- 13 8.5 21.5T350\
--460h350q42-1 71\
--29.5t29-70.5q0-\
-42-29-71t-71-29H\
-330q-71-1-120.5 \
-49T160-490q0 70 \
-49.5 119T330-320\
-h390v80H330Z\x22/><\
-/svg>\
-\x00\x00\x01\x87\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-520-400h80v-120h\
-120v-80H600v-120\
-h-80v120H400v80h\
-120v120ZM320-240\
-q-33 0-56.5-23.5\
-T240-320v-480q0-\
-33 23.5-56.5T320\
--880h480q33 0 56\
-.5 23.5T880-800v\
-480q0 33-23.5 56\
-.5T800-240H320Zm\
-0-80h480v-480H32\
-0v480ZM160-80q-3\
-3 0-56.5-23.5T80\
--160v-560h80v560\
-h560v80H160Zm160\
--720v480-480Z\x22/>\
-</svg>\
-\x00\x00\x01*\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-40-120v-80h880v8\
-0H40Zm120-120q-3\
-3 0-56.5-23.5T80\
--320v-440q0-33 2\
-3.5-56.5T160-840\
-h640q33 0 56.5 2\
-3.5T880-760v440q\
-0 33-23.5 56.5T8\
-00-240H160Zm0-80\
-h640v-440H160v44\
-0Zm0 0v-440 440Z\
-\x22/></svg>\
-\x00\x00\x01)\
-\x00\
-\x00\x04\x03x\xda}\x93\xc1n\x830\x0c\x86_\xc5\xca\
-\xce\x01/!\x19\x9b\x80\xc3\xee\xbbq\xdamR;@\
-\xa2kYQ\xd3\xc7\x9f\x9dM\xbb\xf0\x0b\xa1H\xc8\xfe\
-\xf0\x17\xff\x12\xcd\xf56\xd0\xfd4\x7f][3\xae\xeb\
-\xe5\xa5,SJE\xf2\xc5\xf9{(\x1d3\x97B\x18\
-\x1a\x8f\xd30\xae\xadq\x95\xa1\xdbtL\xaf\xe7{k\
-\x98\xecsd\xfa;\x86\xd2tX\xc7\xcct\xcd\xe5c\
-\x1d\xe9s\x9a\xe7\xd6<\xc4Z\x1fC\x87\xd6\xbc\xb9\x8a\
-\xedc\xe4\xc5zOlC,\x82u\xbe\x08\xbd\xd4\xac\
-\xf4\x16\xd6\x86Vr\xafW\xdc;^\x94&\xad\xe4^\
-/\xa5_\x9a\xbc\xcf\xdf\xd3?-\x83\xdeO\xf2B[\
-G\xc5\xd0Q\xd5\xd0\x11\x22t(\xbd\xe3\x88\x15t<\
-9\xe8\xa8\x19:\x94VGNKn\x0d\xd3\x92\x8b\xa0\
-\xb4\xe4\xda(\xadLo\xd3\x92\xe1{i\x01\x87\xee\x0f\
-\x1c!B\x87\xd2;\x0eM\x0b8t\x7f\xe0\xa8\x19:\
-\x94VGNK&\xc2\xb4\x04Bi\xc9H\x94V\xa6\
-\xb7i\xc9\xf0\xbd\xb4\x80C\xf7\x07\x8e\x10\xa1C\xe9\x1d\
-\x87\xa6\x05\x1c\xba?p\xd4\x0c\x1dJ\xab\xc3\x94]\xa3\
-\xffv\xf7\x03\xd0<\xdfa\
-\x00\x00\x03\x18\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-720-80q-50 0-85-\
-35t-35-85q0-7 1-\
-14.5t3-13.5L322-\
-392q-17 15-38 23\
-.5t-44 8.5q-50 0\
--85-35t-35-85q0-\
-50 35-85t85-35q2\
-3 0 44 8.5t38 23\
-.5l282-164q-2-6-\
-3-13.5t-1-14.5q0\
--50 35-85t85-35q\
-50 0 85 35t35 85\
-q0 50-35 85t-85 \
-35q-23 0-44-8.5T\
-638-672L356-508q\
-2 6 3 13.5t1 14.\
-5q0 7-1 14.5t-3 \
-13.5l282 164q17-\
-15 38-23.5t44-8.\
-5q50 0 85 35t35 \
-85q0 50-35 85t-8\
-5 35Zm0-640q17 0\
- 28.5-11.5T760-7\
-60q0-17-11.5-28.\
-5T720-800q-17 0-\
-28.5 11.5T680-76\
-0q0 17 11.5 28.5\
-T720-720ZM240-44\
-0q17 0 28.5-11.5\
-T280-480q0-17-11\
-.5-28.5T240-520q\
--17 0-28.5 11.5T\
-200-480q0 17 11.\
-5 28.5T240-440Zm\
-480 280q17 0 28.\
-5-11.5T760-200q0\
--17-11.5-28.5T72\
-0-240q-17 0-28.5\
- 11.5T680-200q0 \
-17 11.5 28.5T720\
--160Zm0-600ZM240\
--480Zm480 280Z\x22/\
-></svg>\
-\x00\x00\x02&\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-320q75 0 127\
-.5-52.5T660-500q\
-0-75-52.5-127.5T\
-480-680q-75 0-12\
-7.5 52.5T300-500\
-q0 75 52.5 127.5\
-T480-320Zm0-72q-\
-45 0-76.5-31.5T3\
-72-500q0-45 31.5\
--76.5T480-608q45\
- 0 76.5 31.5T588\
--500q0 45-31.5 7\
-6.5T480-392Zm0 1\
-92q-146 0-266-81\
-.5T40-500q54-137\
- 174-218.5T480-8\
-00q146 0 266 81.\
-5T920-500q-54 13\
-7-174 218.5T480-\
-200Zm0-300Zm0 22\
-0q113 0 207.5-59\
-.5T832-500q-50-1\
-01-144.5-160.5T4\
-80-720q-113 0-20\
-7.5 59.5T128-500\
-q50 101 144.5 16\
-0.5T480-280Z\x22/><\
-/svg>\
-\x00\x00\x00\xba\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-647-440H160v-80h\
-487L423-744l57-5\
-6 320 320-320 32\
-0-57-56 224-224Z\
-\x22/></svg>\
-\x00\x00\x01\xf8\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22m\
-480-120-58-52q-1\
-01-91-167-157T15\
-0-447.5Q111-500 \
-95.5-544T80-634q\
-0-94 63-157t157-\
-63q52 0 99 22t81\
- 62q34-40 81-62t\
-99-22q94 0 157 6\
-3t63 157q0 46-15\
-.5 90T810-447.5Q\
-771-395 705-329T\
-538-172l-58 52Zm\
-0-108q96-86 158-\
-147.5t98-107q36-\
-45.5 50-81t14-70\
-.5q0-60-40-100t-\
-100-40q-47 0-87 \
-26.5T518-680h-76\
-q-15-41-55-67.5T\
-300-774q-60 0-10\
-0 40t-40 100q0 3\
-5 14 70.5t50 81q\
-36 45.5 98 107T4\
-80-228Zm0-273Z\x22/\
-></svg>\
-\x00\x00\x00\xbd\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-120-240v-80h720v\
-80H120Zm0-200v-8\
-0h720v80H120Zm0-\
-200v-80h720v80H1\
-20Z\x22/></svg>\
-\x00\x00\x00\xef\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-240-200h120v-240\
-h240v240h120v-36\
-0L480-740 240-56\
-0v360Zm-80 80v-4\
-80l320-240 320 2\
-40v480H520v-240h\
--80v240H160Zm320\
--350Z\x22/></svg>\
-\x00\x00\x00\xcc\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-280-160v-520H80v\
--120h520v120H400\
-v520H280Zm360 0v\
--320H520v-120h36\
-0v120H760v320H64\
-0Z\x22/></svg>\
-\x00\x00\x00\xae\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-345 240-585l\
-56-56 184 184 18\
-4-184 56 56-240 \
-240Z\x22/></svg>\
-\x00\x00\x01\xad\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-720-330q0 104-73\
- 177T470-80q-104\
- 0-177-73t-73-17\
-7v-370q0-75 52.5\
--127.5T400-880q7\
-5 0 127.5 52.5T5\
-80-700v350q0 46-\
-32 78t-78 32q-46\
- 0-78-32t-32-78v\
--370h80v370q0 13\
- 8.5 21.5T470-32\
-0q13 0 21.5-8.5T\
-500-350v-350q-1-\
-42-29.5-71T400-8\
-00q-42 0-71 29t-\
-29 71v370q-1 71 \
-49 120.5T470-160\
-q70 0 119-49.5T6\
-40-330v-390h80v3\
-90Z\x22/></svg>\
-\x00\x00\x01\xbf\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-400q-50 0-85\
--35t-35-85v-240q\
-0-50 35-85t85-35\
-q50 0 85 35t35 8\
-5v240q0 50-35 85\
-t-85 35Zm0-240Zm\
--40 520v-123q-10\
-4-14-172-93t-68-\
-184h80q0 83 58.5\
- 141.5T480-320q8\
-3 0 141.5-58.5T6\
-80-520h80q0 105-\
-68 184t-172 93v1\
-23h-80Zm40-360q1\
-7 0 28.5-11.5T52\
-0-520v-240q0-17-\
-11.5-28.5T480-80\
-0q-17 0-28.5 11.\
-5T440-760v240q0 \
-17 11.5 28.5T480\
--480Z\x22/></svg>\
-\x00\x00\x01\xde\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-640-640v-120H320\
-v120h-80v-200h48\
-0v200h-80Zm-480 \
-80h640-640Zm560 \
-100q17 0 28.5-11\
-.5T760-500q0-17-\
-11.5-28.5T720-54\
-0q-17 0-28.5 11.\
-5T680-500q0 17 1\
-1.5 28.5T720-460\
-Zm-80 260v-160H3\
-20v160h320Zm80 8\
-0H240v-160H80v-2\
-40q0-51 35-85.5t\
-85-34.5h560q51 0\
- 85.5 34.5T880-5\
-20v240H720v160Zm\
-80-240v-160q0-17\
--11.5-28.5T760-5\
-60H200q-17 0-28.\
-5 11.5T160-520v1\
-60h80v-80h480v80\
-h80Z\x22/></svg>\
-\x00\x00\x00\xff\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-200-120v-640q0-3\
-3 23.5-56.5T280-\
-840h400q33 0 56.\
-5 23.5T760-760v6\
-40L480-240 200-1\
-20Zm80-122 200-8\
-6 200 86v-518H28\
-0v518Zm0-518h400\
--400Z\x22/></svg>\
-\x00\x00\x01\xcb\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-200-120q-33 0-56\
-.5-23.5T120-200v\
--560q0-33 23.5-5\
-6.5T200-840h560q\
-33 0 56.5 23.5T8\
-40-760v560q0 33-\
-23.5 56.5T760-12\
-0H200Zm0-80h133v\
--133H200v133Zm21\
-3 0h134v-133H413\
-v133Zm214 0h133v\
--133H627v133ZM20\
-0-413h133v-134H2\
-00v134Zm213 0h13\
-4v-134H413v134Zm\
-214 0h133v-134H6\
-27v134ZM200-627h\
-133v-133H200v133\
-Zm213 0h134v-133\
-H413v133Zm214 0h\
-133v-133H627v133\
-Z\x22/></svg>\
-\x00\x00\x02\x1a\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-680-360q-17 0-28\
-.5-11.5T640-400v\
--160q0-17 11.5-2\
-8.5T680-600h120q\
-17 0 28.5 11.5T8\
-40-560v40h-60v-2\
-0h-80v120h80v-20\
-h60v40q0 17-11.5\
- 28.5T800-360H68\
-0Zm-300 0v-240h1\
-60q17 0 28.5 11.\
-5T580-560v40q0 1\
-7-11.5 28.5T540-\
-480q17 0 28.5 11\
-.5T580-440v40q0 \
-17-11.5 28.5T540\
--360H380Zm60-150\
-h80v-30h-80v30Zm\
-0 90h80v-30h-80v\
-30Zm-320 60v-200\
-q0-17 11.5-28.5T\
-160-600h120q17 0\
- 28.5 11.5T320-5\
-60v200h-60v-60h-\
-80v60h-60Zm60-12\
-0h80v-60h-80v60Z\
-\x22/></svg>\
-\x00\x00\x01\x1b\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-396-200q-97 0-16\
-6.5-63T160-420q0\
--94 69.5-157T396\
--640h252L544-744\
-l56-56 200 200-2\
-00 200-56-56 104\
--104H396q-63 0-1\
-09.5 40T240-420q\
-0 60 46.5 100T39\
-6-280h284v80H396\
-Z\x22/></svg>\
-\x00\x00\x02\x05\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-160-200q-33 0-56\
-.5-23.5T80-280v-\
-400q0-33 23.5-56\
-.5T160-760h640q3\
-3 0 56.5 23.5T88\
-0-680v400q0 33-2\
-3.5 56.5T800-200\
-H160Zm0-80h640v-\
-400H160v400Zm160\
--40h320v-80H320v\
-80ZM200-440h80v-\
-80h-80v80Zm120 0\
-h80v-80h-80v80Zm\
-120 0h80v-80h-80\
-v80Zm120 0h80v-8\
-0h-80v80Zm120 0h\
-80v-80h-80v80ZM2\
-00-560h80v-80h-8\
-0v80Zm120 0h80v-\
-80h-80v80Zm120 0\
-h80v-80h-80v80Zm\
-120 0h80v-80h-80\
-v80Zm120 0h80v-8\
-0h-80v80ZM160-28\
-0v-400 400Z\x22/></\
-svg>\
-\x00\x00\x01=\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22m\
-240-160 40-160H1\
-20l20-80h160l40-\
-160H180l20-80h16\
-0l40-160h80l-40 \
-160h160l40-160h8\
-0l-40 160h160l-2\
-0 80H660l-40 160\
-h160l-20 80H600l\
--40 160h-80l40-1\
-60H360l-40 160h-\
-80Zm140-240h160l\
-40-160H420l-40 1\
-60Z\x22/></svg>\
-\x00\x00\x01m\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-160-120q-33 0-56\
-.5-23.5T80-200v-\
-440q0-33 23.5-56\
-.5T160-720h160v-\
-80q0-33 23.5-56.\
-5T400-880h160q33\
- 0 56.5 23.5T640\
--800v80h160q33 0\
- 56.5 23.5T880-6\
-40v440q0 33-23.5\
- 56.5T800-120H16\
-0Zm0-80h640v-440\
-H160v440Zm240-52\
-0h160v-80H400v80\
-ZM160-200v-440 4\
-40Z\x22/></svg>\
-\x00\x00\x02\xb3\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-478-240q21 0 35.\
-5-14.5T528-290q0\
--21-14.5-35.5T47\
-8-340q-21 0-35.5\
- 14.5T428-290q0 \
-21 14.5 35.5T478\
--240Zm-36-154h74\
-q0-33 7.5-52t42.\
-5-52q26-26 41-49\
-.5t15-56.5q0-56-\
-41-86t-97-30q-57\
- 0-92.5 30T342-6\
-18l66 26q5-18 22\
-.5-39t53.5-21q32\
- 0 48 17.5t16 38\
-.5q0 20-12 37.5T\
-506-526q-44 39-5\
-4 59t-10 73Zm38 \
-314q-83 0-156-31\
-.5T197-197q-54-5\
-4-85.5-127T80-48\
-0q0-83 31.5-156T\
-197-763q54-54 12\
-7-85.5T480-880q8\
-3 0 156 31.5T763\
--763q54 54 85.5 \
-127T880-480q0 83\
--31.5 156T763-19\
-7q-54 54-127 85.\
-5T480-80Zm0-80q1\
-34 0 227-93t93-2\
-27q0-134-93-227t\
--227-93q-134 0-2\
-27 93t-93 227q0 \
-134 93 227t227 9\
-3Zm0-320Z\x22/></sv\
-g>\
-\x00\x00\x01)\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-160-160q-33 0-56\
-.5-23.5T80-240v-\
-480q0-33 23.5-56\
-.5T160-800h240l8\
-0 80h320q33 0 56\
-.5 23.5T880-640v\
-400q0 33-23.5 56\
-.5T800-160H160Zm\
-0-80h640v-400H44\
-7l-80-80H160v480\
-Zm0 0v-480 480Z\x22\
-/></svg>\
-\x00\x00\x01Q\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-240-400h480v-80H\
-240v80Zm0-120h48\
-0v-80H240v80Zm0-\
-120h480v-80H240v\
-80ZM880-80 720-2\
-40H160q-33 0-56.\
-5-23.5T80-320v-4\
-80q0-33 23.5-56.\
-5T160-880h640q33\
- 0 56.5 23.5T880\
--800v720ZM160-32\
-0h594l46 45v-525\
-H160v480Zm0 0v-4\
-80 480Z\x22/></svg>\
-\
-\x00\x00\x02\x94\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-197-197q-54-55-8\
-5.5-127.5T80-480\
-q0-84 31.5-156.5\
-T197-763l57 57q-\
-44 44-69 102t-25\
- 124q0 67 25 125\
-t69 101l-57 57Zm\
-113-113q-32-33-5\
-1-76.5T240-480q0\
--51 19-94.5t51-7\
-5.5l57 57q-22 22\
--34.5 51T320-480\
-q0 33 12.5 62t34\
-.5 51l-57 57Zm17\
-0-90q-33 0-56.5-\
-23.5T400-480q0-3\
-3 23.5-56.5T480-\
-560q33 0 56.5 23\
-.5T560-480q0 33-\
-23.5 56.5T480-40\
-0Zm170 90-57-57q\
-22-22 34.5-51t12\
-.5-62q0-33-12.5-\
-62T593-593l57-57\
-q32 32 51 75.5t1\
-9 94.5q0 50-19 9\
-3.5T650-310Zm113\
- 113-57-57q44-44\
- 69-102t25-124q0\
--67-25-125t-69-1\
-01l57-57q54 54 8\
-5.5 126.5T880-48\
-0q0 83-31.5 155.\
-5T763-197Z\x22/></s\
-vg>\
-\x00\x00\x01\xbc\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-120q-75 0-14\
-0.5-28.5t-114-77\
-q-48.5-48.5-77-1\
-14T120-480q0-75 \
-28.5-140.5t77-11\
-4q48.5-48.5 114-\
-77T480-840q82 0 \
-155.5 35T760-706\
-v-94h80v240H600v\
--80h110q-41-56-1\
-01-88t-129-32q-1\
-17 0-198.5 81.5T\
-200-480q0 117 81\
-.5 198.5T480-200\
-q105 0 183.5-68T\
-756-440h82q-15 1\
-37-117.5 228.5T4\
-80-120Zm112-192L\
-440-464v-216h80v\
-184l128 128-56 5\
-6Z\x22/></svg>\
-\x00\x00\x00\xf7\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-100-240v-480l360\
- 240-360 240Zm40\
-0 0v-480l360 240\
--360 240ZM180-48\
-0Zm400 0Zm-400 9\
-0 136-90-136-90v\
-180Zm400 0 136-9\
-0-136-90v180Z\x22/>\
-</svg>\
-\x00\x00\x00\xae\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-382-240 154-468l\
-57-57 171 171 36\
-7-367 57 57-424 \
-424Z\x22/></svg>\
-\x00\x00\x00\xb9\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22m\
-313-440 224 224-\
-57 56-320-320 32\
-0-320 57 56-224 \
-224h487v80H313Z\x22\
-/></svg>\
-\x00\x00\x01\xa7\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-240-400q-33 0-56\
-.5-23.5T160-480q\
-0-33 23.5-56.5T2\
-40-560q33 0 56.5\
- 23.5T320-480q0 \
-33-23.5 56.5T240\
--400Zm240 0q-33 \
-0-56.5-23.5T400-\
-480q0-33 23.5-56\
-.5T480-560q33 0 \
-56.5 23.5T560-48\
-0q0 33-23.5 56.5\
-T480-400Zm240 0q\
--33 0-56.5-23.5T\
-640-480q0-33 23.\
-5-56.5T720-560q3\
-3 0 56.5 23.5T80\
-0-480q0 33-23.5 \
-56.5T720-400Z\x22/>\
-</svg>\
-\x00\x00\x02\x0b\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-686-132 444-376q\
--20 8-40.5 12t-4\
-3.5 4q-100 0-170\
--70t-70-170q0-36\
- 10-68.5t28-61.5\
-l146 146 72-72-1\
-46-146q29-18 61.\
-5-28t68.5-10q100\
- 0 170 70t70 170\
-q0 23-4 43.5T584\
--516l244 242q12 \
-12 12 29t-12 29l\
--84 84q-12 12-29\
- 12t-29-12Zm29-8\
-5 27-27-256-256q\
-18-20 26-46.5t8-\
-53.5q0-60-38.5-1\
-04.5T386-758l74 \
-74q12 12 12 28t-\
-12 28L332-500q-1\
-2 12-28 12t-28-1\
-2l-74-74q9 57 53\
-.5 95.5T360-440q\
-26 0 52-8t47-25l\
-256 256ZM472-488\
-Z\x22/></svg>\
-\x00\x00\x01\xcf\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-440-280h80v-160h\
-160v-80H520v-160\
-h-80v160H280v80h\
-160v160Zm40 200q\
--83 0-156-31.5T1\
-97-197q-54-54-85\
-.5-127T80-480q0-\
-83 31.5-156T197-\
-763q54-54 127-85\
-.5T480-880q83 0 \
-156 31.5T763-763\
-q54 54 85.5 127T\
-880-480q0 83-31.\
-5 156T763-197q-5\
-4 54-127 85.5T48\
-0-80Zm0-80q134 0\
- 227-93t93-227q0\
--134-93-227t-227\
--93q-134 0-227 9\
-3t-93 227q0 134 \
-93 227t227 93Zm0\
--320Z\x22/></svg>\
-\x00\x00\x01\xa7\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-240-120q-45 0-89\
--22t-71-58q26 0 \
-53-20.5t27-59.5q\
-0-50 35-85t85-35\
-q50 0 85 35t35 8\
-5q0 66-47 113t-1\
-13 47Zm0-80q33 0\
- 56.5-23.5T320-2\
-80q0-17-11.5-28.\
-5T280-320q-17 0-\
-28.5 11.5T240-28\
-0q0 23-5.5 42T22\
-0-202q5 2 10 2h1\
-0Zm230-160L360-4\
-70l358-358q11-11\
- 27.5-11.5T774-8\
-28l54 54q12 12 1\
-2 28t-12 28L470-\
-360Zm-190 80Z\x22/>\
-</svg>\
-\x00\x00\x00\xf9\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-120-120v-200h80v\
-120h120v80H120Zm\
-520 0v-80h120v-1\
-20h80v200H640ZM1\
-20-640v-200h200v\
-80H200v120h-80Zm\
-640 0v-120H640v-\
-80h200v200h-80Z\x22\
-/></svg>\
-\x00\x00\x00\xbd\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-120-240v-80h240v\
-80H120Zm0-200v-8\
-0h480v80H120Zm0-\
-200v-80h720v80H1\
-20Z\x22/></svg>\
-\x00\x00\x01\xb0\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-320-320h320v-320\
-H320v320ZM480-80\
-q-83 0-156-31.5T\
-197-197q-54-54-8\
-5.5-127T80-480q0\
--83 31.5-156T197\
--763q54-54 127-8\
-5.5T480-880q83 0\
- 156 31.5T763-76\
-3q54 54 85.5 127\
-T880-480q0 83-31\
-.5 156T763-197q-\
-54 54-127 85.5T4\
-80-80Zm0-80q134 \
-0 227-93t93-227q\
-0-134-93-227t-22\
-7-93q-134 0-227 \
-93t-93 227q0 134\
- 93 227t227 93Zm\
-0-320Z\x22/></svg>\
-\x00\x00\x01#\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22m\
-354-247 126-76 1\
-26 77-33-144 111\
--96-146-13-58-13\
-6-58 135-146 13 \
-111 97-33 143ZM2\
-33-80l65-281L80-\
-550l288-25 112-2\
-65 112 265 288 2\
-5-218 189 65 281\
--247-149L233-80Z\
-m247-350Z\x22/></sv\
-g>\
-\x00\x00\x01\xf0\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-260q75 0 127\
-.5-52.5T660-440q\
-0-75-52.5-127.5T\
-480-620q-75 0-12\
-7.5 52.5T300-440\
-q0 75 52.5 127.5\
-T480-260Zm0-80q-\
-42 0-71-29t-29-7\
-1q0-42 29-71t71-\
-29q42 0 71 29t29\
- 71q0 42-29 71t-\
-71 29ZM160-120q-\
-33 0-56.5-23.5T8\
-0-200v-480q0-33 \
-23.5-56.5T160-76\
-0h126l74-80h240l\
-74 80h126q33 0 5\
-6.5 23.5T880-680\
-v480q0 33-23.5 5\
-6.5T800-120H160Z\
-m0-80h640v-480H6\
-38l-73-80H395l-7\
-3 80H160v480Zm32\
-0-240Z\x22/></svg>\
-\x00\x00\x02.\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-80q-75 0-140\
-.5-28.5t-114-77q\
--48.5-48.5-77-11\
-4T120-440q0-75 2\
-8.5-140.5t77-114\
-q48.5-48.5 114-7\
-7T480-800q75 0 1\
-40.5 28.5t114 77\
-q48.5 48.5 77 11\
-4T840-440q0 75-2\
-8.5 140.5t-77 11\
-4q-48.5 48.5-114\
- 77T480-80Zm0-36\
-0Zm112 168 56-56\
--128-128v-184h-8\
-0v216l152 152ZM2\
-24-866l56 56-170\
- 170-56-56 170-1\
-70Zm512 0 170 17\
-0-56 56-170-170 \
-56-56ZM480-160q1\
-17 0 198.5-81.5T\
-760-440q0-117-81\
-.5-198.5T480-720\
-q-117 0-198.5 81\
-.5T200-440q0 117\
- 81.5 198.5T480-\
-160Z\x22/></svg>\
-\x00\x00\x01t\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-784-120 532-372q\
--30 24-69 38t-83\
- 14q-109 0-184.5\
--75.5T120-580q0-\
-109 75.5-184.5T3\
-80-840q109 0 184\
-.5 75.5T640-580q\
-0 44-14 83t-38 6\
-9l252 252-56 56Z\
-M380-400q75 0 12\
-7.5-52.5T560-580\
-q0-75-52.5-127.5\
-T380-760q-75 0-1\
-27.5 52.5T200-58\
-0q0 75 52.5 127.\
-5T380-400Z\x22/></s\
-vg>\
-\x00\x00\x01P\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-160-160q-33 0-56\
-.5-23.5T80-240v-\
-480q0-33 23.5-56\
-.5T160-800h640q3\
-3 0 56.5 23.5T88\
-0-720v480q0 33-2\
-3.5 56.5T800-160\
-H160Zm0-80h640v-\
-400H160v400Zm140\
--40-56-56 103-10\
-4-104-104 57-56 \
-160 160-160 160Z\
-m180 0v-80h240v8\
-0H480Z\x22/></svg>\
-\x00\x00\x02V\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-80q-83 0-156\
--31.5T197-197q-5\
-4-54-85.5-127T80\
--480q0-83 31.5-1\
-56T197-763q54-54\
- 127-85.5T480-88\
-0q83 0 156 31.5T\
-763-763q54 54 85\
-.5 127T880-480q0\
- 83-31.5 156T763\
--197q-54 54-127 \
-85.5T480-80Zm-40\
--82v-78q-33 0-56\
-.5-23.5T360-320v\
--40L168-552q-3 1\
-8-5.5 36t-2.5 36\
-q0 121 79.5 212T\
-440-162Zm276-102\
-q20-22 36-47.5t2\
-6.5-53q10.5-27.5\
- 16-56.5t5.5-59q\
-0-98-54.5-179T60\
-0-776v16q0 33-23\
-.5 56.5T520-680h\
--80v80q0 17-11.5\
- 28.5T400-560h-8\
-0v80h240q17 0 28\
-.5 11.5T600-440v\
-120h40q26 0 47 1\
-5.5t29 40.5Z\x22/><\
-/svg>\
-\x00\x00\x01\x8c\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-480-280v-60h100v\
--100h60v160H480Z\
-M320-520v-160h16\
-0v60H380v100h-60\
-ZM280-40q-33 0-5\
-6.5-23.5T200-120\
-v-720q0-33 23.5-\
-56.5T280-920h400\
-q33 0 56.5 23.5T\
-760-840v720q0 33\
--23.5 56.5T680-4\
-0H280Zm0-120v40h\
-400v-40H280Zm0-8\
-0h400v-480H280v4\
-80Zm0-560h400v-4\
-0H280v40Zm0 0v-4\
-0 40Zm0 640v40-4\
-0Z\x22/></svg>\
-\x00\x00\x01\x11\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-200-120q-33 0-56\
-.5-23.5T120-200v\
--560q0-33 23.5-5\
-6.5T200-840h280v\
-80H200v560h280v8\
-0H200Zm440-160-5\
-5-58 102-102H360\
-v-80h327L585-622\
-l55-58 200 200-2\
-00 200Z\x22/></svg>\
-\
-\x00\x00\x01>\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-460-200h40v-74l1\
-40-140v-186H320v\
-186l140 140v74Zm\
--80 80v-120L240-\
-380v-220q0-33 23\
-.5-56.5T320-680h\
-40l-40 40v-200h8\
-0v160h160v-160h8\
-0v200l-40-40h40q\
-33 0 56.5 23.5T7\
-20-600v220L580-2\
-40v120H380Zm100-\
-280Z\x22/></svg>\
-\x00\x00\x01\x8c\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-784-120 532-372q\
--30 24-69 38t-83\
- 14q-109 0-184.5\
--75.5T120-580q0-\
-109 75.5-184.5T3\
-80-840q109 0 184\
-.5 75.5T640-580q\
-0 44-14 83t-38 6\
-9l252 252-56 56Z\
-M380-400q75 0 12\
-7.5-52.5T560-580\
-q0-75-52.5-127.5\
-T380-760q-75 0-1\
-27.5 52.5T200-58\
-0q0 75 52.5 127.\
-5T380-400ZM280-5\
-40v-80h200v80H28\
-0Z\x22/></svg>\
-\x00\x00\x01\x0b\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-440-120v-264L254\
--197l-57-57 187-\
-186H120v-80h264L\
-197-706l57-57 18\
-6 187v-264h80v26\
-4l186-187 57 57-\
-187 186h264v80H5\
-76l187 186-57 57\
--186-187v264h-80\
-Z\x22/></svg>\
-\x00\x00\x01}\
-<\
-svg xmlns=\x22http:\
-//www.w3.org/200\
-0/svg\x22 height=\x222\
-4\x22 viewBox=\x220 -9\
-60 960 960\x22 widt\
-h=\x2224\x22><path fil\
-l=\x22#686868\x22 d=\x22M\
-212-239q-43-48-6\
-7.5-110T120-480q\
-0-150 105-255t25\
-5-105v-80l200 15\
-0-200 150v-80q-9\
-1 0-155.5 64.5T2\
-60-480q0 46 17.5\
- 86t47.5 70l-113\
- 85ZM480-40 280-\
-190l200-150v80q9\
-1 0 155.5-64.5T7\
-00-480q0-46-17.5\
--86T635-636l113-\
-85q43 48 67.5 11\
-0T840-480q0 150-\
-105 255T480-120v\
-80Z\x22/></svg>\
-"
+from PySide6.QtCore import QResource
 
-qt_resource_name = b"\
-\x00\x05\
-\x00o\xa6S\
-\x00i\
-\x00c\x00o\x00n\x00s\
-\x00\x0b\
-\x06FO\xa7\
-\x00h\
-\x00i\x00s\x00t\x00o\x00r\x00y\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x04\xb2UG\
-\x00u\
-\x00n\x00d\x00o\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x01\x0bC\x87\
-\x00r\
-\x00e\x00s\x00i\x00z\x00e\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x08zW\xa7\
-\x00d\
-\x00r\x00a\x00g\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x0c\x98\xb7\xc7\
-\x00p\
-\x00a\x00u\x00s\x00e\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x0b\x07W\xa7\
-\x00e\
-\x00d\x00i\x00t\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x0b\x88B\x07\
-\x00r\
-\x00e\x00p\x00e\x00a\x00t\x00.\x00s\x00v\x00g\
-\x00\x13\
-\x0b\x9a\xb4'\
-\x00e\
-\x00v\x00e\x00n\x00t\x00_\x00a\x00v\x00a\x00i\x00l\x00a\x00b\x00l\x00e\x00.\x00s\
-\x00v\x00g\
-\x00\x0c\
-\x0f\x8f\x03\xe7\
-\x00s\
-\x00e\x00c\x00u\x00r\x00i\x00t\x00y\x00.\x00s\x00v\x00g\
-\x00\x0d\
-\x07d\x0f\xa7\
-\x00b\
-\x00a\x00c\x00k\x00s\x00p\x00a\x00c\x00e\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x04\xd2T\xc7\
-\x00i\
-\x00n\x00f\x00o\x00.\x00s\x00v\x00g\
-\x00\x0d\
-\x0c\xd5A\xe7\
-\x00e\
-\x00m\x00e\x00r\x00g\x00e\x00n\x00c\x00y\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x0cHU\xa7\
-\x00t\
-\x00u\x00n\x00e\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x05\x9e\x8e\xa7\
-\x00c\
-\x00l\x00o\x00c\x00k\x00.\x00s\x00v\x00g\
-\x00\x0f\
-\x05\xdd\x7f'\
-\x00h\
-\x00o\x00m\x00e\x00_\x00f\x00i\x00l\x00l\x00e\x00d\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x09s\xed\xc7\
-\x00w\
-\x00e\x00b\x00c\x00a\x00m\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x06|W\x87\
-\x00c\
-\x00o\x00p\x00y\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x05\xa8W\x87\
-\x00c\
-\x00o\x00d\x00e\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x09\x88\xc7\xa7\
-\x00l\
-\x00a\x00n\x00g\x00u\x00a\x00g\x00e\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x03\xc5\xac\xc7\
-\x00t\
-\x00i\x00m\x00e\x00r\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x08\x9eU\x87\
-\x00t\
-\x00a\x00s\x00k\x00.\x00s\x00v\x00g\
-\x00\x10\
-\x0e\x19\xe1'\
-\x00c\
-\x00h\x00e\x00c\x00k\x00_\x00c\x00i\x00r\x00c\x00l\x00e\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x0a-\x0e'\
-\x00s\
-\x00t\x00a\x00c\x00k\x00s\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x06\x96\x22G\
-\x00m\
-\x00e\x00m\x00o\x00r\x00y\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x00\xa7T\xa7\
-\x00l\
-\x00i\x00s\x00t\x00.\x00s\x00v\x00g\
-\x00\x0b\
-\x00\xb5Hg\
-\x00w\
-\x00a\x00r\x00n\x00i\x00n\x00g\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x05\x9e\x88\xa7\
-\x00b\
-\x00l\x00o\x00c\x00k\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x0bcU\x87\
-\x00s\
-\x00t\x00o\x00p\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x09cW\x87\
-\x00c\
-\x00r\x00o\x00p\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x07\x9e\xaf\x87\
-\x00s\
-\x00t\x00a\x00c\x00k\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x0bi\x9aG\
-\x00w\
-\x00i\x00n\x00d\x00o\x00w\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x0c/Wg\
-\x00f\
-\x00u\x00l\x00l\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x0a\xc2\xa3'\
-\x00v\
-\x00i\x00d\x00e\x00o\x00.\x00s\x00v\x00g\
-\x00\x07\
-\x0a\xc7Z\x07\
-\x00c\
-\x00u\x00t\x00.\x00s\x00v\x00g\
-\x00\x0e\
-\x09\x8a\x8a\x07\
-\x00p\
-\x00l\x00a\x00y\x00_\x00p\x00a\x00u\x00s\x00e\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x0bl\x84\x07\
-\x00p\
-\x00h\x00o\x00t\x00o\x00s\x00.\x00s\x00v\x00g\
-\x00\x13\
-\x08\xb28G\
-\x00s\
-\x00e\x00t\x00t\x00i\x00n\x00g\x00s\x00_\x00f\x00i\x00l\x00l\x00e\x00d\x00.\x00s\
-\x00v\x00g\
-\x00\x08\
-\x0e\x87W\xe7\
-\x00c\
-\x00h\x00a\x00t\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x04\xb8\xd2\x07\
-\x00o\
-\x00p\x00e\x00n\x00_\x00t\x00a\x00b\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x0b\xdf,\xc7\
-\x00s\
-\x00e\x00t\x00t\x00i\x00n\x00g\x00s\x00.\x00s\x00v\x00g\
-\x00\x0d\
-\x09\xd2]G\
-\x00e\
-\x00q\x00u\x00a\x00l\x00i\x00z\x00e\x00r\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x0b\xab\xa1'\
-\x00w\
-\x00i\x00d\x00t\x00h\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x07\xd7\x8d\xc7\
-\x00d\
-\x00r\x00a\x00f\x00t\x00.\x00s\x00v\x00g\
-\x00\x0b\
-\x0a=\x8f\xc7\
-\x00u\
-\x00p\x00d\x00a\x00t\x00e\x00r\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x0a\x8c\xacg\
-\x00t\
-\x00o\x00d\x00a\x00y\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x06\x98\x8e\xa7\
-\x00c\
-\x00l\x00o\x00s\x00e\x00.\x00s\x00v\x00g\
-\x00\x07\
-\x07\x01Z'\
-\x00p\
-\x00i\x00n\x00.\x00s\x00v\x00g\
-\x00\x0e\
-\x0f\x8e\xefg\
-\x00a\
-\x00d\x00d\x00_\x00f\x00o\x00l\x00d\x00e\x00r\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x07\xb5\x02G\
-\x00c\
-\x00a\x00l\x00e\x00n\x00d\x00a\x00r\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x05xB\xa7\
-\x00r\
-\x00e\x00l\x00o\x00a\x00d\x00.\x00s\x00v\x00g\
-\x00\x07\
-\x07\xa7Z\x07\
-\x00a\
-\x00d\x00d\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x0f\x98\xa0g\
-\x00v\
-\x00o\x00i\x00c\x00e\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x0a\xa8\xb7\xc7\
-\x00p\
-\x00a\x00s\x00t\x00e\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x07\xd8\xba\xa7\
-\x00i\
-\x00m\x00a\x00g\x00e\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x0b\x9e\x89\x07\
-\x00c\
-\x00h\x00e\x00c\x00k\x00.\x00s\x00v\x00g\
-\x00\x0b\
-\x05.\xa8\x07\
-\x00m\
-\x00i\x00c\x00_\x00o\x00f\x00f\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x0a-\x1b\xc7\
-\x00c\
-\x00i\x00r\x00c\x00l\x00e\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x09g\xa8g\
-\x00r\
-\x00o\x00b\x00o\x00t\x00.\x00s\x00v\x00g\
-\x00\x10\
-\x07\xdb\xc4'\
-\x00p\
-\x00l\x00a\x00y\x00l\x00i\x00s\x00t\x00_\x00a\x00d\x00d\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x08\x1a\x90\xa7\
-\x00d\
-\x00o\x00w\x00n\x00l\x00o\x00a\x00d\x00.\x00s\x00v\x00g\
-\x00\x0d\
-\x03p\x1f\x07\
-\x00c\
-\x00h\x00e\x00c\x00k\x00l\x00i\x00s\x00t\x00.\x00s\x00v\x00g\
-\x00\x0b\
-\x00\x97+\xe7\
-\x00h\
-\x00e\x00a\x00r\x00i\x00n\x00g\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x0a\xcawG\
-\x00r\
-\x00o\x00u\x00t\x00e\x00r\x00.\x00s\x00v\x00g\
-\x00\x10\
-\x0dR\xb8\xe7\
-\x00p\
-\x00a\x00u\x00s\x00e\x00_\x00c\x00i\x00r\x00c\x00l\x00e\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x07\x17\x8d\xa7\
-\x00s\
-\x00c\x00h\x00e\x00d\x00u\x00l\x00e\x00.\x00s\x00v\x00g\
-\x00\x07\
-\x03\x83Z'\
-\x00m\
-\x00a\x00p\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x0c\xa8TG\
-\x00m\
-\x00u\x00t\x00e\x00.\x00s\x00v\x00g\
-\x00\x0b\
-\x05\x03\x96\xa7\
-\x00z\
-\x00o\x00o\x00m\x00_\x00i\x00n\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x08\xc8U\xe7\
-\x00s\
-\x00a\x00v\x00e\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x05x\xd4\xa7\
-\x00u\
-\x00p\x00l\x00o\x00a\x00d\x00.\x00s\x00v\x00g\
-\x00\x11\
-\x0b\x09@\x07\
-\x00f\
-\x00o\x00l\x00d\x00e\x00r\x00_\x00f\x00i\x00l\x00l\x00e\x00d\x00.\x00s\x00v\x00g\
-\
-\x00\x0b\
-\x0c\xd7\x8d\xa7\
-\x00s\
-\x00h\x00e\x00d\x00u\x00l\x00e\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x09e\x83\xe7\
-\x00e\
-\x00r\x00r\x00o\x00r\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x02\x8cT'\
-\x00p\
-\x00l\x00a\x00y\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x05\x9eT\xa7\
-\x00l\
-\x00o\x00c\x00k\x00.\x00s\x00v\x00g\
-\x00\x0f\
-\x0d\x0b\xf1G\
-\x00f\
-\x00a\x00s\x00t\x00_\x00r\x00e\x00w\x00i\x00n\x00d\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x03\x81\xafG\
-\x00t\
-\x00e\x00x\x00t\x00f\x00i\x00l\x00e\x00.\x00s\x00v\x00g\
-\x00\x06\
-\x06\xa5Z\xc7\
-\x00d\
-\x00b\x00.\x00s\x00v\x00g\
-\x00\x0b\
-\x0bM_G\
-\x00p\
-\x00a\x00l\x00e\x00t\x00t\x00e\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x02\x87B'\
-\x00r\
-\x00e\x00p\x00l\x00a\x00y\x00.\x00s\x00v\x00g\
-\x00\x07\
-\x01\xccZ'\
-\x00k\
-\x00e\x00y\x00.\x00s\x00v\x00g\
-\x00\x0e\
-\x02\xda@\xe7\
-\x00w\
-\x00e\x00b\x00c\x00a\x00m\x00_\x00o\x00f\x00f\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x0c\xad\x02\x87\
-\x00d\
-\x00e\x00l\x00e\x00t\x00e\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x0b\x85\x8e\x87\
-\x00c\
-\x00l\x00e\x00a\x00r\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x0c;\xf6\xa7\
-\x00v\
-\x00o\x00l\x00u\x00m\x00e\x00.\x00s\x00v\x00g\
-\x00\x10\
-\x0dY\x96g\
-\x00c\
-\x00l\x00o\x00s\x00e\x00_\x00c\x00i\x00r\x00c\x00l\x00e\x00.\x00s\x00v\x00g\
-\x00\x0f\
-\x01H\x1f'\
-\x00a\
-\x00t\x00t\x00a\x00c\x00h\x00m\x00e\x00n\x00t\x00s\x00.\x00s\x00v\x00g\
-\x00\x0f\
-\x0c`7g\
-\x00a\
-\x00d\x00d\x00_\x00l\x00i\x00b\x00r\x00a\x00r\x00y\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x07\x89\xd5G\
-\x00c\
-\x00o\x00m\x00p\x00u\x00t\x00e\x00r\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x07vW\xc7\
-\x00a\
-\x00p\x00p\x00s\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x08\x88\xa9\x07\
-\x00s\
-\x00h\x00a\x00r\x00e\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x0f\xcaUG\
-\x00v\
-\x00i\x00e\x00w\x00.\x00s\x00v\x00g\
-\x00\x0b\
-\x08]\x89g\
-\x00f\
-\x00o\x00r\x00w\x00a\x00r\x00d\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x0d9\xf7\xe7\
-\x00f\
-\x00a\x00v\x00o\x00r\x00i\x00t\x00e\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x0cXT\xa7\
-\x00m\
-\x00e\x00n\x00u\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x068W'\
-\x00h\
-\x00o\x00m\x00e\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x0c\xf7U\x87\
-\x00t\
-\x00e\x00x\x00t\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x08J\xc4\x07\
-\x00e\
-\x00x\x00p\x00a\x00n\x00d\x00.\x00s\x00v\x00g\
-\x00\x0e\
-\x0f\x18~\x87\
-\x00a\
-\x00t\x00t\x00a\x00c\x00h\x00m\x00e\x00n\x00t\x00.\x00s\x00v\x00g\
-\x00\x07\
-\x03\xf6Z'\
-\x00m\
-\x00i\x00c\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x00W\xb5\xe7\
-\x00p\
-\x00r\x00i\x00n\x00t\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x05\xa2\x9e\xa7\
-\x00b\
-\x00o\x00o\x00k\x00m\x00a\x00r\x00k\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x08\xf7W\x07\
-\x00g\
-\x00r\x00i\x00d\x00.\x00s\x00v\x00g\
-\x00\x07\
-\x07\x86Z\x07\
-\x00a\
-\x00b\x00c\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x0b\xb2U\xc7\
-\x00r\
-\x00e\x00d\x00o\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x06\xbe\xa8g\
-\x00k\
-\x00e\x00y\x00b\x00o\x00a\x00r\x00d\x00.\x00s\x00v\x00g\
-\x00\x07\
-\x0azZ'\
-\x00t\
-\x00a\x00g\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x06\x8eU\x07\
-\x00w\
-\x00o\x00r\x00k\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x0c3W\x07\
-\x00h\
-\x00e\x00l\x00p\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x0a\xc8\xf6\x87\
-\x00f\
-\x00o\x00l\x00d\x00e\x00r\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x07\xc7\xbag\
-\x00i\
-\x00n\x00p\x00u\x00t\x00.\x00s\x00v\x00g\
-\x00\x0b\
-\x06i\xd1\x87\
-\x00s\
-\x00e\x00n\x00s\x00o\x00r\x00s\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x08\xab\xd7\x87\
-\x00u\
-\x00p\x00d\x00a\x00t\x00e\x00.\x00s\x00v\x00g\
-\x00\x10\
-\x0c&\xab\xc7\
-\x00f\
-\x00a\x00s\x00t\x00_\x00f\x00o\x00r\x00w\x00a\x00r\x00d\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x06HW\xa7\
-\x00d\
-\x00o\x00n\x00e\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x07\x9eW\xc7\
-\x00b\
-\x00a\x00c\x00k\x00.\x00s\x00v\x00g\
-\x00\x13\
-\x06\xfeZ\x07\
-\x00m\
-\x00o\x00r\x00e\x00_\x00h\x00o\x00r\x00i\x00z\x00o\x00n\x00t\x00a\x00l\x00.\x00s\
-\x00v\x00g\
-\x00\x09\
-\x00'\x89G\
-\x00b\
-\x00u\x00i\x00l\x00d\x00.\x00s\x00v\x00g\
-\x00\x0e\
-\x0fo\x02'\
-\x00a\
-\x00d\x00d\x00_\x00c\x00i\x00r\x00c\x00l\x00e\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x0c\x9b\x89\xe7\
-\x00b\
-\x00r\x00u\x00s\x00h\x00.\x00s\x00v\x00g\
-\x00\x0e\
-\x03\xe6t\xa7\
-\x00f\
-\x00u\x00l\x00l\x00s\x00c\x00r\x00e\x00e\x00n\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x06\x97U\x87\
-\x00s\
-\x00o\x00r\x00t\x00.\x00s\x00v\x00g\
-\x00\x0f\
-\x06\xefq\x07\
-\x00s\
-\x00t\x00o\x00p\x00_\x00c\x00i\x00r\x00c\x00l\x00e\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x0a\x85U\x87\
-\x00s\
-\x00t\x00a\x00r\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x0c\x91j\xa7\
-\x00c\
-\x00a\x00m\x00e\x00r\x00a\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x08\x90\x8a\x87\
-\x00a\
-\x00l\x00a\x00r\x00m\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x08\x94m\xc7\
-\x00s\
-\x00e\x00a\x00r\x00c\x00h\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x0b&r\xc7\
-\x00t\
-\x00e\x00r\x00m\x00i\x00n\x00a\x00l\x00.\x00s\x00v\x00g\
-\x00\x11\
-\x0cB&\x07\
-\x00p\
-\x00u\x00b\x00l\x00i\x00c\x00_\x00f\x00i\x00l\x00l\x00e\x00d\x00.\x00s\x00v\x00g\
-\
-\x00\x0e\
-\x0ap\xcf\x87\
-\x00s\
-\x00c\x00r\x00e\x00e\x00n\x00s\x00h\x00o\x00t\x00.\x00s\x00v\x00g\
-\x00\x0a\
-\x06\xc91\x07\
-\x00l\
-\x00o\x00g\x00o\x00u\x00t\x00.\x00s\x00v\x00g\
-\x00\x09\
-\x0d\xc5\xb4\x07\
-\x00p\
-\x00o\x00w\x00e\x00r\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x06\xeb\x9c'\
-\x00z\
-\x00o\x00o\x00m\x00_\x00o\x00u\x00t\x00.\x00s\x00v\x00g\
-\x00\x0c\
-\x0d\x8b\x03\xe7\
-\x00a\
-\x00s\x00t\x00e\x00r\x00i\x00s\x00k\x00.\x00s\x00v\x00g\
-\x00\x08\
-\x00FU\xa7\
-\x00s\
-\x00y\x00n\x00c\x00.\x00s\x00v\x00g\
-"
+# Icons are compiled to binary resource file: data/icons.rcc (see: resources.sh)
+# The file is memory-mapped by Qt on registration, so icons data is read only when used.
 
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x87\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x0cF\x00\x00\x00\x00\x00\x01\x00\x00\xb52\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x0e,\x00\x00\x00\x00\x00\x01\x00\x00\xcf*\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x0a\x8c\x00\x00\x00\x00\x00\x01\x00\x00\x9a\xe0\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x06l\x00\x00\x00\x00\x00\x01\x00\x00[(\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x02\x98\x00\x00\x00\x00\x00\x01\x00\x00#\xde\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x02\xae\x00\x00\x00\x00\x00\x01\x00\x00%\xcd\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x00B\x00\x00\x00\x00\x00\x01\x00\x00\x02\xda\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x09\x16\x00\x00\x00\x00\x00\x01\x00\x00\x86\xa6\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x08n\x00\x00\x00\x00\x00\x01\x00\x00}\xbf\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x08T\x00\x00\x00\x00\x00\x01\x00\x00|+\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x07\xb8\x00\x00\x00\x00\x00\x01\x00\x00q\x04\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x08\x82\x00\x00\x00\x00\x00\x01\x00\x00\x7f\xe0\
-\x00\x00\x01\x8d\xf2\xd5$j\
-\x00\x00\x06L\x00\x00\x00\x00\x00\x01\x00\x00Z\x1b\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x08\x08\x00\x00\x00\x00\x00\x01\x00\x00t\xb3\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x06\xe6\x00\x00\x00\x00\x00\x01\x00\x00dT\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x02\x10\x00\x00\x00\x00\x00\x01\x00\x00\x1b\xf1\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x0c\x98\x00\x00\x00\x00\x00\x01\x00\x00\xba\xbf\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x0ax\x00\x00\x00\x00\x00\x01\x00\x00\x99\x1d\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x00,\x00\x00\x00\x00\x00\x01\x00\x00\x01\xbc\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x04\x00\x00\x00\x00\x00\x00\x01\x00\x007\xbd\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x01$\x00\x00\x00\x00\x00\x01\x00\x00\x0d\x22\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x07\x10\x00\x00\x00\x00\x00\x01\x00\x00g\xcf\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x05\xba\x00\x00\x00\x00\x00\x01\x00\x00R\x1d\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x05,\x00\x00\x00\x00\x00\x01\x00\x00I\x8a\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x07B\x00\x00\x00\x00\x00\x01\x00\x00j\xfd\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x07\xce\x00\x00\x00\x00\x00\x01\x00\x00q\xc2\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x02\xca\x00\x00\x00\x00\x00\x01\x00\x00'\x07\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x01p\x00\x00\x00\x00\x00\x01\x00\x00\x12f\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x0a\xa4\x00\x00\x00\x00\x00\x01\x00\x00\x9c\xc2\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x01\xdc\x00\x00\x00\x00\x00\x01\x00\x00\x17=\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x01\x88\x00\x00\x00\x00\x00\x01\x00\x00\x14\x05\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x0a\x10\x00\x00\x00\x00\x00\x01\x00\x00\x94\xf7\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x0b\xee\x00\x00\x00\x00\x00\x01\x00\x00\xb2\x18\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x0b\x92\x00\x00\x00\x00\x00\x01\x00\x00\xac\xc5\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x01\xc6\x00\x00\x00\x00\x00\x01\x00\x00\x15\xe9\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x0b4\x00\x00\x00\x00\x00\x01\x00\x00\xa6\x1b\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x02~\x00\x00\x00\x00\x00\x01\x00\x00\x22+\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x0c\xba\x00\x00\x00\x00\x00\x01\x00\x00\xbb\xbc\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x04\xc0\x00\x00\x00\x00\x00\x01\x00\x00A\xec\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x08&\x00\x00\x00\x00\x00\x01\x00\x00v\x00\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x0b\x02\x00\x00\x00\x00\x00\x01\x00\x00\xa2\xd1\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x0d\xbe\x00\x00\x00\x00\x00\x01\x00\x00\xca4\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x0d\xf0\x00\x00\x00\x00\x00\x01\x00\x00\xcc\x8b\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x0c\xd0\x00\x00\x00\x00\x00\x01\x00\x00\xbc}\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x0c\x1a\x00\x00\x00\x00\x00\x01\x00\x00\xb3\x87\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x04\xd8\x00\x00\x00\x00\x00\x01\x00\x00B\xca\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x06\xc8\x00\x00\x00\x00\x00\x01\x00\x00b{\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x01\x04\x00\x00\x00\x00\x00\x01\x00\x00\x0b\x93\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x09|\x00\x01\x00\x00\x00\x01\x00\x00\x8b\x09\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x0a\xd8\x00\x00\x00\x00\x00\x01\x00\x00\x9f\x94\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x09^\x00\x00\x00\x00\x00\x01\x00\x00\x89\xdb\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x0c\x04\x00\x00\x00\x00\x00\x01\x00\x00\xb2\xca\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x03\x0e\x00\x00\x00\x00\x00\x01\x00\x00*\xaf\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x05F\x00\x00\x00\x00\x00\x01\x00\x00J\xd7\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x05\x0e\x00\x00\x00\x00\x00\x01\x00\x00E\xe7\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x0bz\x00\x00\x00\x00\x00\x01\x00\x00\xabp\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x04t\x00\x00\x00\x00\x00\x01\x00\x00=\xfc\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x05\x8a\x00\x00\x00\x00\x00\x01\x00\x00P$\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x06\x08\x00\x00\x00\x00\x00\x01\x00\x00X\x0b\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x06.\x00\x00\x00\x00\x00\x01\x00\x00Y\x05\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x0a<\x00\x00\x00\x00\x00\x01\x00\x00\x96\xba\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x09\xc0\x00\x00\x00\x00\x00\x01\x00\x00\x91|\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x00\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x04o\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x09\x92\x00\x00\x00\x00\x00\x01\x00\x00\x8c6\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x0d$\x00\x00\x00\x00\x00\x01\x00\x00\xc1L\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x0d<\x00\x00\x00\x00\x00\x01\x00\x00\xc3~\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x02(\x00\x00\x00\x00\x00\x01\x00\x00\x1d\xd4\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x0b\xae\x00\x00\x00\x00\x00\x01\x00\x00\xaf]\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x03\xbe\x00\x00\x00\x00\x00\x01\x00\x004\x8a\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x07,\x00\x00\x00\x00\x00\x01\x00\x00iy\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x0a\xc2\x00\x00\x00\x00\x00\x01\x00\x00\x9d\xc5\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x02\xf8\x00\x00\x00\x00\x00\x01\x00\x00)\xa3\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x07\xa0\x00\x00\x00\x00\x00\x01\x00\x00n\xeb\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x05\xf0\x00\x00\x00\x00\x00\x01\x00\x00U\xa0\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x01\xac\x00\x00\x00\x00\x00\x01\x00\x00\x14\xb9\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x01\xf2\x00\x00\x00\x00\x00\x01\x00\x00\x18!\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x03\x82\x00\x00\x00\x00\x00\x01\x00\x002D\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x04<\x00\x00\x00\x00\x00\x01\x00\x00;\xec\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x02d\x00\x00\x00\x00\x00\x01\x00\x00 \xf5\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x05\xd6\x00\x00\x00\x00\x00\x01\x00\x00T\x06\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x04\x8c\x00\x00\x00\x00\x00\x01\x00\x00?\x1b\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x0d\x9c\x00\x00\x00\x00\x00\x01\x00\x00\xc8\xa4\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x0b \x00\x00\x00\x00\x00\x01\x00\x00\xa4\xda\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x0c\xf4\x00\x00\x00\x00\x00\x01\x00\x00\xbe1\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x04\xa8\x00\x00\x00\x00\x00\x01\x00\x00@\xa7\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x05r\x00\x00\x00\x00\x00\x01\x00\x00Nq\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x03V\x00\x00\x00\x00\x00\x01\x00\x00.O\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x03n\x00\x00\x00\x00\x00\x01\x00\x00/\xa6\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x0b`\x00\x00\x00\x00\x00\x01\x00\x00\xaaC\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x06\x88\x00\x00\x00\x00\x00\x01\x00\x00]\x86\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x00\x8a\x00\x00\x00\x00\x00\x01\x00\x00\x06\xb4\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x07\x5c\x00\x00\x00\x00\x00\x01\x00\x00l\x15\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x0dV\x00\x00\x00\x00\x00\x01\x00\x00\xc4\xf6\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x088\x00\x00\x00\x00\x00\x01\x00\x00x\xd9\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x02\xe2\x00\x00\x00\x00\x00\x01\x00\x00(\xe3\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x03&\x00\x00\x00\x00\x00\x01\x00\x00,5\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x03\xa4\x00\x00\x00\x00\x00\x01\x00\x003\x0d\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x08\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x82n\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x00\xa0\x00\x00\x00\x00\x00\x01\x00\x00\x07\xfd\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x00\xba\x00\x00\x00\x00\x00\x01\x00\x00\x09\x05\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x05\xa2\x00\x00\x00\x00\x00\x01\x00\x00Qk\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x04\x5c\x00\x00\x00\x00\x00\x01\x00\x00<\xb3\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x0a\xec\x00\x00\x00\x00\x00\x01\x00\x00\xa1\xb2\
-\x00\x00\x01\x8d\x5c(\xc7\x04\
-\x00\x00\x04\x1e\x00\x00\x00\x00\x00\x01\x00\x008\xe9\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x0b\xc8\x00\x00\x00\x00\x00\x01\x00\x00\xb1\x1d\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x03@\x00\x00\x00\x00\x00\x01\x00\x00-\x89\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x0bJ\x00\x00\x00\x00\x00\x01\x00\x00\xa7\x8c\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x08\xd6\x00\x00\x00\x00\x00\x01\x00\x00\x831\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x0dt\x00\x00\x00\x00\x00\x01\x00\x00\xc6J\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x01Z\x00\x00\x00\x00\x00\x01\x00\x00\x11.\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x09\xfa\x00\x00\x00\x00\x00\x01\x00\x00\x946\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x09:\x00\x00\x00\x00\x00\x01\x00\x00\x88P\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x0d\x0a\x00\x00\x00\x00\x00\x01\x00\x00\xbfX\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x00r\x00\x00\x00\x00\x00\x01\x00\x00\x05\xb6\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x0c\x80\x00\x00\x00\x00\x00\x01\x00\x00\xb9\x14\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x06\xfa\x00\x00\x00\x00\x00\x01\x00\x00e\xe0\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x08\xa4\x00\x00\x00\x00\x00\x01\x00\x00\x81[\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x01:\x00\x00\x00\x00\x00\x01\x00\x00\x0f9\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x07\x84\x00\x00\x00\x00\x00\x01\x00\x00m\x12\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x0a&\x00\x00\x00\x00\x00\x01\x00\x00\x95\xea\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x07\xe4\x00\x00\x00\x00\x00\x01\x00\x00s\xb5\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x09\xdc\x00\x00\x00\x00\x00\x01\x00\x00\x92:\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x06\xa2\x00\x00\x00\x00\x00\x01\x00\x00`\xb1\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x08\xf0\x00\x00\x00\x00\x00\x01\x00\x00\x84\xab\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x0e\x0e\x00\x00\x00\x00\x00\x01\x00\x00\xce\x1b\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x0d\xd8\x00\x00\x00\x00\x00\x01\x00\x00\xcbI\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x02>\x00\x00\x00\x00\x00\x01\x00\x00\x1f&\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x03\xea\x00\x00\x00\x00\x00\x01\x00\x006i\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x0aV\x00\x00\x00\x00\x00\x01\x00\x00\x97l\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x0c^\x00\x00\x00\x00\x00\x01\x00\x00\xb7A\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x04\xec\x00\x00\x00\x00\x00\x01\x00\x00D\x87\
-\x00\x00\x01\x8d[e\x92\xcd\
-\x00\x00\x00\xe6\x00\x00\x00\x00\x00\x01\x00\x00\x0a}\
-\x00\x00\x01\x8d[e\x92\xd1\
-\x00\x00\x05Z\x00\x00\x00\x00\x00\x01\x00\x00K\x8d\
-\x00\x00\x01\x8d[e\x92\xd5\
-\x00\x00\x09\xaa\x00\x00\x00\x00\x00\x01\x00\x00\x8fR\
-\x00\x00\x01\x8d[e\x92\xd5\
-"
 
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+def get_path() -> str:
+    """
+    Return path to compiled resources file
+
+    :return: path to icons.rcc
+    """
+    path = os.path.abspath(os.path.dirname(__file__))
+    if __file__.endswith('.pyc'):  # if compiled with pyinstaller
+        path = os.path.dirname(path)
+    return os.path.join(path, 'data', 'icons.rcc')
+
+
+def qInitResources() -> bool:
+    """
+    Register icons resources
+
+    :return: True if registered
+    """
+    return QResource.registerResource(get_path())
+
+
+def qCleanupResources() -> bool:
+    """
+    Unregister icons resources
+
+    :return: True if unregistered
+    """
+    return QResource.unregisterResource(get_path())
 
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
 
 qInitResources()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.15 10:00:00                  #
+# Updated Date: 2024.03.20 10:00:00                  #
 # ================================================== #
 
 import copy
@@ -58,6 +58,8 @@ class CtxItem:
         self.index_meta = {}  # llama-index metadata ctx used
         self.doc_ids = []  # document ids
         self.prev_ctx = None  # previous context (reply output)
+        self.sub_reply = False  # reply collected by parallel commands executor
+        self.sub_extra = []  # extra data from commands executed in parallel
 
     def clear_reply(self):
         """Clear current reply output"""
@@ -6,18 +6,22 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.02.24 00:00:00                  #
+# Updated Date: 2024.03.20 14:00:00                  #
 # ================================================== #
 
+import os
 import sys
 import argparse
+import time
 from logging import ERROR, WARNING, INFO, DEBUG
 
+from PySide6.QtCore import QObject, QEvent, QTimer
 from PySide6.QtGui import QScreen
 from PySide6.QtWidgets import QApplication
 
 from pygpt_net.core.debug import Debug
 from pygpt_net.core.platforms import Platforms
+from pygpt_net.core.profiler import Profiler
 from pygpt_net.ui.main import MainWindow
 from pygpt_net.plugin.base import BasePlugin
 from pygpt_net.provider.llms.base import BaseLLM
@@ -34,6 +38,11 @@ class Launcher:
         self.app = None
         self.window = None
         self.debug = False
+        self.profile = False
+        self.profile_path = None
+        self.profile_exit = False
+        self.paint_watcher = None
+        self.init_end = None
 
     def setup(self) -> dict:
         """
@@ -48,8 +57,29 @@ class Launcher:
             required=False,
             help="debug mode (0=disabled, 1=info, 2=debug)",
         )
+        parser.add_argument(
+            "--profile-startup",
+            required=False,
+            nargs="?",
+            const="",
+            metavar="PATH",
+            help="profile startup and dump Chrome trace JSON file (default: startup_profile.json in user dir)",
+        )
+        parser.add_argument(
+            "--profile-exit",
+            required=False,
+            action="store_true",
+            help="exit after first window paint (use with --profile-startup for benchmarks)",
+        )
         args = vars(parser.parse_args())
 
+        # startup profiler
+        if args.get("profile_startup") is not None:
+            self.profile = True
+            self.profile_path = args["profile_startup"]
+            self.profile_exit = args.get("profile_exit", False)
+            Profiler.enable()
+
         # set log level [ERROR|WARNING|INFO|DEBUG]
         if "debug" in args and args["debug"] == "1":
             print("** Debug mode enabled (1=INFO)")
@@ -66,10 +96,15 @@ class Launcher:
 
     def init(self):
         """Initialize app"""
-        args = self.setup()
-        Platforms.prepare()  # setup platform specific options
-        self.app = QApplication(sys.argv)
-        self.window = MainWindow(self.app, args=args)
+        Profiler.mark("app.imports")
+        with Profiler.span("launcher.setup"):
+            args = self.setup()
+            Platforms.prepare()  # setup platform specific options
+        with Profiler.span("qt.application"):
+            self.app = QApplication(sys.argv)
+        with Profiler.span("window.init"):
+            self.window = MainWindow(self.app, args=args)
+        self.init_end = time.perf_counter()
 
     def add_plugin(self, plugin: BasePlugin):
         """
@@ -178,15 +213,65 @@ class Launcher:
 
     def run(self):
         """Run app"""
+        if self.init_end is not None:
+            Profiler.add("launcher.register", self.init_end, time.perf_counter())
+        if self.profile:
+            self.paint_watcher = PaintWatcher(self.handle_first_paint)
+            self.window.installEventFilter(self.paint_watcher)
+
         self.window.setup()
         geometry = self.window.screen().availableGeometry()
         pos = QScreen.availableGeometry(QApplication.primaryScreen()).topLeft()
         margin = 100
         self.window.resize(geometry.width() - margin, geometry.height() - margin)
-        self.window.show()
-        self.window.move(pos)
-        self.window.post_setup()
-        self.app.setWindowIcon(self.window.ui.get_app_icon())
-        self.window.ui.tray.setup(self.app)
-        self.window.controller.after_setup()
+        with Profiler.span("window.show"):
+            self.window.show()
+            self.window.move(pos)
+        with Profiler.span("window.post_setup"):
+            self.window.post_setup()
+            self.app.setWindowIcon(self.window.ui.get_app_icon())
+            self.window.ui.tray.setup(self.app)
+        with Profiler.span("controller.after_setup"):
+            self.window.controller.after_setup()
+        if not self.profile:
+            Profiler.finish()  # stop recording spans
         sys.exit(self.app.exec())
+
+    def handle_first_paint(self):
+        """Handle first window paint (startup profiler)"""
+        self.window.removeEventFilter(self.paint_watcher)
+        Profiler.mark("window.first_paint")
+        Profiler.finish()
+        path = self.profile_path
+        if not path:
+            path = os.path.join(self.window.core.config.path, "startup_profile.json")
+        Profiler.dump(path)
+        print(Profiler.summary())
+        print("Startup profile saved to: {}".format(path))
+        if self.profile_exit:
+            QTimer.singleShot(0, self.app.quit)
+
+
+class PaintWatcher(QObject):
+    def __init__(self, callback: callable):
+        """
+        Event filter calling callback on first paint event
+
+        :param callback: callback to call
+        """
+        super().__init__()
+        self.callback = callback
+        self.painted = False
+
+    def eventFilter(self, source, event) -> bool:
+        """
+        Event filter
+
+        :param source: source object
+        :param event: event
+        :return: False to pass event further
+        """
+        if event.type() == QEvent.Paint and not self.painted:
+            self.painted = True
+            QTimer.singleShot(0, self.callback)  # after paint is finished
+        return False
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.21 16:00:00                  #
+# ================================================== #
+
+from sqlalchemy import text
+
+from .base import BaseMigration
+
+
+class Version20240321140000(BaseMigration):
+    def __init__(self, window=None):
+        super(Version20240321140000, self).__init__(window)
+        self.window = window
+
+    def up(self, conn):
+        conn.execute(text("""
+        ALTER TABLE idx_file ADD COLUMN size INTEGER;
+        """))
+        conn.execute(text("""
+        ALTER TABLE idx_file ADD COLUMN mtime INTEGER;
+        """))
+        conn.execute(text("""
+        ALTER TABLE idx_file ADD COLUMN hash TEXT;
+        """))
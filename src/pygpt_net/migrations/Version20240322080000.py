@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.22 08:00:00                  #
+# ================================================== #
+
+from sqlalchemy import text
+
+from .base import BaseMigration
+
+
+class Version20240322080000(BaseMigration):
+    def __init__(self, window=None):
+        super(Version20240322080000, self).__init__(window)
+        self.window = window
+
+    def up(self, conn):
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS idx_ctx_store_idx_meta ON idx_ctx (store, idx, meta_id);
+        """))
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS ctx_item_meta_id ON ctx_item (meta_id);
+        """))
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.03 22:00:00                  #
+# Updated Date: 2024.03.22 08:00:00                  #
 # ================================================== #
 
 from .Version20231227152900 import Version20231227152900  # 2.0.59
@@ -17,6 +17,8 @@ from .Version20240107060000 import Version20240107060000  # 2.0.88
 from .Version20240222160000 import Version20240222160000  # 2.0.162
 from .Version20240223050000 import Version20240223050000  # 2.0.163
 from .Version20240303190000 import Version20240303190000  # 2.1.8
+from .Version20240321140000 import Version20240321140000  # 2.1.38
+from .Version20240322080000 import Version20240322080000  # 2.1.38
 
 
 class Migrations:
@@ -39,4 +41,6 @@ class Migrations:
             Version20240222160000(),  # 2.0.162
             Version20240223050000(),  # 2.0.163
             Version20240303190000(),  # 2.1.8
+            Version20240321140000(),  # 2.1.38
+            Version20240322080000(),  # 2.1.38
         ]
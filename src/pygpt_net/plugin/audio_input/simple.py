@@ -6,10 +6,9 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.15 10:00:00                  #
+# Updated Date: 2024.03.20 12:00:00                  #
 # ================================================== #
 
-import pyaudio
 import wave
 import os
 
@@ -49,6 +48,7 @@ class Simple:
 
     def start_recording(self):
         """Start recording"""
+        import pyaudio
         self.frames = []  # clear audio frames
 
         def callback(in_data, frame_count, time_info, status):
@@ -85,6 +85,7 @@ class Simple:
 
     def stop_recording(self):
         """Stop recording"""
+        import pyaudio
         self.is_recording = False
         self.switch_btn_start()
         path = os.path.join(self.plugin.window.core.config.path, self.plugin.input_file)
@@ -6,12 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.19 06:00:00                  #
+# Updated Date: 2024.03.20 12:00:00                  #
 # ================================================== #
 
 import os.path
 import time
-import speech_recognition as sr
 import audioop
 
 from PySide6.QtCore import Slot, Signal
@@ -87,6 +86,7 @@ class Worker(BaseWorker):
 
     def handle_advanced(self):
         """Handle mic advanced mode."""
+        import speech_recognition as sr
         try:
             if not self.plugin.listening:
                 return
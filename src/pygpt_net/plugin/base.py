@@ -6,12 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.18 03:00:00                  #
+# Updated Date: 2024.03.20 10:00:00                  #
 # ================================================== #
 
 import copy
 
-from PySide6.QtCore import QObject, Signal, QRunnable, Slot
+from PySide6.QtCore import QObject, Signal, QRunnable, Slot, QThread
 from typing_extensions import deprecated
 
 from pygpt_net.core.dispatcher import Event
@@ -241,6 +241,10 @@ class BasePlugin:
         """
         self.window.core.debug.log(err)
         msg = self.window.core.debug.parse_alert(err)
+        if QThread.currentThread() != self.window.thread():
+            # called from parallel commands executor thread, dialogs are not thread-safe
+            self.window.statusChanged.emit("{}: {}".format(self.name, str(err)))
+            return
         self.window.ui.dialogs.alert("{}: {}".format(self.name, msg))
 
     def debug(self, data: any):
@@ -293,7 +297,9 @@ class BasePlugin:
         :param extra_data: extra data
         """
         # handle post-finishing operations
-        if isinstance(extra_data, dict):
+        if ctx is not None and ctx.sub_reply:
+            ctx.sub_extra.append(extra_data)  # post-update deferred to parallel executor
+        elif isinstance(extra_data, dict):
             if "post_update" in extra_data and isinstance(extra_data["post_update"], list):
                 if "file_explorer" in extra_data["post_update"]:
                     # update file explorer view
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.12 06:00:00                  #
+# Updated Date: 2024.03.22 20:00:00                  #
 # ================================================== #
 
 import json
@@ -99,6 +99,16 @@ class Plugin(BasePlugin):
             description="User agent to use when making requests, default: Mozilla/5.0",
             tooltip="User agent to use when making requests",
         )
+        self.add_option(
+            "cache_ttl",
+            type="int",
+            value=0,
+            label="Cache TTL",
+            description="Lifetime of cached GET responses in seconds, overrides HTTP cache headers "
+                        "(0 = use Cache-Control/Expires headers, -1 = disable cache)",
+            min=-1,
+            max=None,
+        )
 
     def setup(self) -> dict:
         """
@@ -267,26 +277,14 @@ class Plugin(BasePlugin):
         }
         self.log(str(log_data))
 
-        # prepare request
-        req = Request(
-            url=url,
+        # cached, revalidated with conditional GET
+        return self.window.core.fetch.get(
+            url,
             headers=headers,
+            timeout=self.get_option_value('timeout'),
+            verify=not self.get_option_value('disable_ssl'),
+            ttl=self.get_option_value('cache_ttl'),
         )
-        if self.get_option_value('disable_ssl'):
-            context = ssl.create_default_context()
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
-            data = urlopen(
-                req,
-                context=context,
-                timeout=self.get_option_value('timeout'),
-            ).read()
-        else:
-            data = urlopen(
-                req,
-                timeout=self.get_option_value('timeout'),
-            ).read()
-        return data
 
     def call_post(self, url: str, data: dict, extra_headers: dict = None) -> bytes:
         """
@@ -6,12 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.18 03:00:00                  #
+# Updated Date: 2024.03.20 12:00:00                  #
 # ================================================== #
 
 import os.path
 import subprocess
-import docker
 
 from pygpt_net.item.ctx import CtxItem
 
@@ -92,12 +91,13 @@ class Runner:
         """
         return self.plugin.get_option_value('sandbox_docker')
 
-    def get_docker(self) -> docker.client.DockerClient:
+    def get_docker(self):
         """
         Get docker client
 
         :return: docker client instance
         """
+        import docker
         return docker.from_env()
 
     def get_docker_image(self) -> str:
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.16 12:00:00                  #
+# Updated Date: 2024.03.22 18:00:00                  #
 # ================================================== #
 
 import json
@@ -71,6 +71,14 @@ class Plugin(BasePlugin):
             min=0,
             max=None,
         )
+        self.add_option(
+            "summary_reduce",
+            type="bool",
+            value=False,
+            label="Summarize partial summaries",
+            description="If enabled, summaries of content chunks are summarized again in a final call "
+                        "(one combined summary instead of joined chunk summaries)",
+        )
         self.add_option(
             "ctx_items_limit",
             type="int",
@@ -594,37 +602,29 @@ class Plugin(BasePlugin):
             sys_prompt: str = None
     ) -> str:
         """
-        Get summarized text from chunks, TODO: create external method for chunk summarization
+        Get summarized text from chunks (chunks are summarized concurrently)
 
         :param chunks: chunks of text
         :param sys_prompt: system prompt
         :return: summarized text
         """
-        summary = ""
-
-        # get custom prompt if set
         max_tokens = int(self.get_option_value("summary_max_tokens"))
 
         # get model
         model = self.window.core.models.from_defaults()
-        tmp_model = self.get_option_value("summary_model")
+        tmp_model = self.get_option_value("model_summarize")
         if self.window.core.models.has(tmp_model):
             model = self.window.core.models.get(tmp_model)
 
-        # summarize per chunk
-        for chunk in chunks:
-            try:
-                response = self.window.core.bridge.quick_call(
-                    prompt=chunk,
-                    system_prompt=sys_prompt,
-                    max_tokens=max_tokens,
-                    model=model,
-                )
-                if response is not None and response != "":
-                    summary += response
-            except Exception as e:
-                self.error(e)
-        return summary
+        return self.window.core.summarizer.summarize(
+            chunks,
+            system_prompt=sys_prompt,
+            model=model,
+            max_tokens=max_tokens,
+            reduce=bool(self.get_option_value("summary_reduce")),
+            callback=lambda done, total, response: self.log("Summarized chunk {} of {}".format(done, total)),
+            error_callback=self.error,
+        )
 
     def log(self, msg: str):
         """
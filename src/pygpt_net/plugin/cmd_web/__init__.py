@@ -6,11 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.12 21:00:00                  #
+# Updated Date: 2024.03.22 22:00:00                  #
 # ================================================== #
 
-import ssl
-from urllib.request import Request, urlopen
+import threading
 
 from pygpt_net.plugin.base import BasePlugin
 from pygpt_net.provider.web.base import BaseProvider
@@ -70,6 +69,23 @@ class Plugin(BasePlugin):
             min=0,
             max=None,
         )
+        self.add_option(
+            "max_html_size",
+            type="int",
+            value=1000000,
+            label="Max HTML size",
+            description="Max bytes of page HTML to parse, applied before decoding (0 = unlimited)",
+            min=0,
+            max=None,
+        )
+        self.add_option(
+            "extract_main",
+            type="bool",
+            value=True,
+            label="Extract main content",
+            description="If enabled, only the main content of the page is extracted, navigation, headers, "
+                        "footers, sidebars and other boilerplate are skipped",
+        )
         self.add_option(
             "chunk_size",
             type="int",
@@ -103,6 +119,35 @@ class Plugin(BasePlugin):
             description="User agent to use when making requests, default: Mozilla/5.0",
             tooltip="User agent to use when making requests",
         )
+        self.add_option(
+            "cache_ttl",
+            type="int",
+            value=0,
+            label="Cache TTL",
+            description="Lifetime of cached pages in seconds, overrides HTTP cache headers "
+                        "(0 = use Cache-Control/Expires headers, -1 = disable cache)",
+            min=-1,
+            max=None,
+        )
+        self.add_option(
+            "prefetch",
+            type="int",
+            value=3,
+            label="Concurrent page fetches",
+            description="Number of search result pages fetched concurrently, the first usable page is used "
+                        "(1 = sequential)",
+            min=1,
+            max=None,
+        )
+        self.add_option(
+            "prefetch_grace",
+            type="float",
+            value=0.5,
+            label="Prefetch grace time",
+            description="Seconds to wait for higher ranked pages when a lower ranked page arrives first",
+            min=0,
+            max=None,
+        )
         self.add_option(
             "max_result_length",
             type="int",
@@ -121,6 +166,14 @@ class Plugin(BasePlugin):
             min=0,
             max=None,
         )
+        self.add_option(
+            "summary_reduce",
+            type="bool",
+            value=False,
+            label="Summarize partial summaries",
+            description="If enabled, summaries of page chunks are summarized again in a final call "
+                        "(one combined summary instead of joined chunk summaries)",
+        )
         self.add_option(
             "model_tmp_query",
             type="combo",
@@ -582,12 +635,18 @@ class Plugin(BasePlugin):
             self.reply(response, ctx)
             return
 
-    def get_url(self, url: str, extra_headers: dict = None) -> bytes:
+    def get_url(
+            self,
+            url: str,
+            extra_headers: dict = None,
+            stop: threading.Event = None
+    ) -> bytes:
         """
         Get URL content
 
         :param url: URL
         :param extra_headers: extra headers
+        :param stop: event set to abort download (empty content is returned)
         :return: response data (bytes)
         """
         headers = {
@@ -596,25 +655,15 @@ class Plugin(BasePlugin):
         if extra_headers is not None:
             headers.update(extra_headers)
 
-        req = Request(
-            url=url,
+        # cached, revalidated with conditional GET
+        return self.window.core.fetch.get(
+            url,
             headers=headers,
+            timeout=self.get_option_value('timeout'),
+            verify=not self.get_option_value('disable_ssl'),
+            ttl=self.get_option_value('cache_ttl'),
+            stop=stop,
         )
-        if self.get_option_value('disable_ssl'):
-            context = ssl.create_default_context()
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
-            data = urlopen(
-                req,
-                context=context,
-                timeout=self.get_option_value('timeout'),
-            ).read()
-        else:
-            data = urlopen(
-                req,
-                timeout=self.get_option_value('timeout'),
-            ).read()
-        return data
 
     def log(self, msg: str):
         """
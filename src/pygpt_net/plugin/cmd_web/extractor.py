@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.22 22:00:00                  #
+# ================================================== #
+
+import re
+
+
+class Extractor:
+    # removed with content
+    SKIP_TAGS = ["script", "style", "noscript", "template", "svg", "canvas", "iframe", "object", "embed", "head"]
+    # removed with content if main content extraction is enabled
+    BOILERPLATE_TAGS = ["nav", "aside", "footer", "header", "form", "button", "select"]
+    # text separated by space
+    BLOCK_TAGS = [
+        "address", "article", "blockquote", "br", "dd", "div", "dl", "dt", "figcaption", "h1", "h2", "h3",
+        "h4", "h5", "h6", "hr", "li", "main", "ol", "p", "pre", "section", "table", "td", "th", "tr", "ul",
+    ]
+    # containers for main content
+    MAIN_TAGS = ["article", "main"]
+    # class, id or role of boilerplate containers
+    NEGATIVE = re.compile(
+        r"\b(nav|navbar|navigation|menu|footer|sidebar|breadcrumbs?|cookies?|banner|share|social|comments?|"
+        r"advert|ads|promo|related|popup|modal|newsletter|subscribe|signup)\b",
+        re.IGNORECASE,
+    )
+    # class, id or role of content containers (never removed)
+    POSITIVE = re.compile(r"\b(article|body|content|entry|main|post|story|text)\b", re.IGNORECASE)
+    CHARSET = re.compile(rb"<meta[^>]+charset=[\"']?([\w-]+)", re.IGNORECASE)
+    MIN_PARAGRAPH = 25  # min paragraph length (characters) scored as content
+    MIN_MAIN = 250  # min main content length (characters), whole body is used if shorter
+
+    def __init__(self):
+        """HTML to text extraction (boilerplate removal, main content detection)"""
+        self.lxml = None  # None = not checked yet
+
+    def has_lxml(self) -> bool:
+        """
+        Check if lxml is installed
+
+        :return: True if installed
+        """
+        if self.lxml is None:
+            try:
+                import lxml.html
+                self.lxml = True
+            except ImportError:
+                self.lxml = False
+        return self.lxml
+
+    def extract(self, data: bytes, max_size: int = 0, main: bool = True) -> str:
+        """
+        Extract readable text from HTML
+
+        :param data: HTML data
+        :param max_size: max bytes of HTML to parse, applied before decode (0 = unlimited)
+        :param main: extract main content only, skip navigation, headers, footers, etc.
+        :return: text content (whitespace collapsed)
+        """
+        if not data:
+            return ""
+        if 0 < max_size < len(data):
+            data = data[:max_size]
+        if not self.has_lxml():
+            return self.extract_simple(data)
+
+        import lxml.etree
+        import lxml.html
+        try:
+            root = lxml.html.document_fromstring(self.decode(data))
+        except (lxml.etree.ParserError, ValueError):
+            return ""  # empty or not HTML
+        self.clean(root, main)
+        body = root.find("body")
+        if body is None:
+            body = root
+        return self.to_text(self.find_main(body) if main else body)
+
+    def decode(self, data: bytes) -> str or bytes:
+        """
+        Decode HTML as UTF-8, unless other charset is declared (decoded by parser)
+
+        :param data: HTML data
+        :return: decoded HTML or data if declared charset is not UTF-8
+        """
+        match = self.CHARSET.search(data[:4096])
+        if match and match.group(1).lower() not in [b"utf-8", b"utf8"]:
+            return data
+        html = data.decode("utf-8", errors="ignore")  # truncated multibyte char is dropped
+        if html.lstrip().startswith("<?xml"):
+            html = html[html.find("?>") + 2:]  # encoding declaration is not allowed in str
+        return html
+
+    def extract_simple(self, data: bytes) -> str:
+        """
+        Extract text with BeautifulSoup (fallback if lxml is not installed)
+
+        :param data: HTML data
+        :return: text content (whitespace collapsed)
+        """
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(data.decode("utf-8", errors="ignore"), "html.parser")
+        for element in soup.find_all(self.SKIP_TAGS):
+            element.decompose()
+        return " ".join(soup.get_text(" ").split())
+
+    def clean(self, root, main: bool = True):
+        """
+        Remove scripts, styles, comments and boilerplate (in place)
+
+        :param root: root element
+        :param main: remove boilerplate elements
+        """
+        import lxml.etree
+        tags = self.SKIP_TAGS + self.BOILERPLATE_TAGS if main else self.SKIP_TAGS
+        for element in list(root.iter(lxml.etree.Comment, lxml.etree.ProcessingInstruction, *tags)):
+            if element.tag == "header" and self.in_main(element):
+                continue  # article header with title
+            if element.tag == "form" and self.is_content(element):
+                continue  # whole page wrapped in form
+            self.drop(element)
+        if not main:
+            return
+        for element in list(root.iter("div", "section", "ul", "ol", "table", "span", "p")):
+            attrs = " ".join([element.get("class", ""), element.get("id", ""), element.get("role", "")])
+            if self.NEGATIVE.search(attrs) and not self.POSITIVE.search(attrs) and not self.is_content(element):
+                self.drop(element)
+
+    def is_content(self, element) -> bool:
+        """
+        Check if element contains content (e.g. wrapper with misleading class)
+
+        :param element: element
+        :return: True if contains <article>, <main> or long text with few links
+        """
+        if next(element.iter(*self.MAIN_TAGS), None) is not None:
+            return True
+        return len(element.text_content().strip()) >= self.MIN_MAIN and self.get_link_density(element) < 0.5
+
+    def in_main(self, element) -> bool:
+        """
+        Check if element is inside main content container
+
+        :param element: element
+        :return: True if inside <article> or <main>
+        """
+        return next(element.iterancestors(*self.MAIN_TAGS), None) is not None
+
+    def drop(self, element):
+        """
+        Remove element with its content (tail text is kept)
+
+        :param element: element
+        """
+        if element.getparent() is not None:
+            element.drop_tree()
+
+    def find_main(self, body):
+        """
+        Find main content: longest <article> or <main>, or the container with most paragraph text
+
+        :param body: body element
+        :return: main content element (body if not found)
+        """
+        candidates = list(body.iter(*self.MAIN_TAGS)) + body.xpath('.//*[@role="main"]')
+        if candidates:
+            best = max(candidates, key=lambda element: len(element.text_content()))
+            if len(best.text_content().strip()) >= self.MIN_MAIN:
+                return best
+
+        scores = {}
+        for p in body.iter("p", "pre", "blockquote"):
+            length = len(p.text_content().strip())
+            parent = p.getparent()
+            if length < self.MIN_PARAGRAPH or parent is None:
+                continue
+            scores[parent] = scores.get(parent, 0) + length
+            grandparent = parent.getparent()
+            if grandparent is not None:
+                scores[grandparent] = scores.get(grandparent, 0) + length / 2  # nested wrappers
+        if not scores:
+            return body
+        best = max(scores, key=lambda element: scores[element] * (1 - self.get_link_density(element)))
+        if len(best.text_content().strip()) < self.MIN_MAIN:
+            return body
+        return best
+
+    def get_link_density(self, element) -> float:
+        """
+        Get ratio of link text to all text
+
+        :param element: element
+        :return: link density (0-1)
+        """
+        length = len(element.text_content())
+        if length == 0:
+            return 1.0
+        links = sum(len(a.text_content()) for a in element.iter("a"))
+        return min(links / length, 1.0)
+
+    def to_text(self, element) -> str:
+        """
+        Get text with block elements separated
+
+        :param element: element
+        :return: text (whitespace collapsed)
+        """
+        for block in element.iter(*self.BLOCK_TAGS):
+            block.text = " " + (block.text or "")
+            block.tail = " " + (block.tail or "")
+        return " ".join(element.text_content().split())
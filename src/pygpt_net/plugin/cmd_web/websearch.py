@@ -6,11 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.02.20 19:00:00                  #
+# Updated Date: 2024.03.22 22:00:00                  #
 # ================================================== #
 
-import re
-from bs4 import BeautifulSoup
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .extractor import Extractor
 
 
 class WebSearch:
@@ -22,6 +25,7 @@ class WebSearch:
         """
         self.plugin = plugin
         self.signals = None
+        self.extractor = Extractor()
 
     def search(
             self,
@@ -60,31 +64,25 @@ class WebSearch:
             self.log("Error in web search: " + str(e))
         return urls
 
-    def query_url(self, url: str) -> str:
+    def query_url(self, url: str, stop: threading.Event = None) -> str:
         """
         Query a URL and return the text content
 
         :param url: URL to query
+        :param stop: event set to abort download
         :return: text content
         """
         self.debug(
             "Plugin: cmd_web:query_url: crawling URL: {}".format(url)
         )
-        text = ''
-        html = ''
         try:
-            data = self.plugin.get_url(url)
-            try:
-                html = data.decode("utf-8")  # try to decode
-            except Exception as e:
-                pass
-
-            if html:
-                soup = BeautifulSoup(html, "html.parser")
-                for element in soup.find_all('html'):
-                    text += element.text
-                text = text.replace("\n", " ").replace("\t", " ")
-                text = re.sub(r'\s+', ' ', text)
+            data = self.plugin.get_url(url, stop=stop)
+            if data:
+                text = self.extractor.extract(
+                    data,
+                    max_size=int(self.plugin.get_option_value("max_html_size") or 0),
+                    main=bool(self.plugin.get_option_value("extract_main")),
+                )
                 self.debug(
                     "Plugin: cmd_web:query_url: received text: {}".format(text)
                 )
@@ -96,6 +94,71 @@ class WebSearch:
             )
             self.log("Error in query_web: " + str(e))
 
+    def fetch_pages(self, urls: list):
+        """
+        Fetch pages concurrently and yield usable pages in order of preference
+
+        Pending downloads are cancelled when the generator is closed.
+
+        :param urls: list of URLs (ranked)
+        :return: generator of (URL, text content)
+        """
+        num = max(int(self.plugin.get_option_value("prefetch") or 1), 1)
+        grace = float(self.plugin.get_option_value("prefetch_grace") or 0)
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=num)
+        futures = {}  # rank -> future
+        next_rank = 0
+        try:
+            while True:
+                while next_rank < len(urls) and len(futures) < num:
+                    self.log("Web attempt: " + str(next_rank + 1) + " of " + str(len(urls)))
+                    self.log("URL: " + urls[next_rank])
+                    futures[next_rank] = executor.submit(self.query_url, urls[next_rank], stop)
+                    next_rank += 1
+                if not futures:
+                    return
+                rank = self.select_page(futures, grace)
+                if rank is not None:
+                    yield urls[rank], futures.pop(rank).result()
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def select_page(self, futures: dict, grace: float) -> int or None:
+        """
+        Wait for the first usable page
+
+        Page is taken as soon as it arrives if all higher ranked pages failed, otherwise
+        higher ranked pages still downloading are awaited up to the grace time.
+
+        :param futures: dict with rank -> future (pages with empty content are removed)
+        :param grace: grace time (seconds)
+        :return: rank of usable page or None if some pages failed (window can be refilled)
+        """
+        deadline = None
+        while futures:
+            ranks = sorted(futures)
+            failed = [r for r in ranks if futures[r].done() and not futures[r].result()]
+            if failed:
+                for r in failed:
+                    del futures[r]
+                return None
+            arrived = [r for r in ranks if futures[r].done()]
+            running = [futures[r] for r in ranks if not futures[r].done()]
+            if not arrived:
+                wait(running, return_when=FIRST_COMPLETED)
+                continue
+            if arrived[0] == ranks[0]:
+                return arrived[0]  # best ranked page
+            if deadline is None:
+                deadline = time.time() + grace
+            timeout = deadline - time.time()
+            if timeout <= 0:
+                return arrived[0]
+            wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+        return None
+
     def to_chunks(
             self,
             text: str,
@@ -126,7 +189,6 @@ class WebSearch:
         :param summarize_prompt: custom summarize prompt
         :return: summarized text
         """
-        summary = ""
         sys_prompt = "Summarize text in English in a maximum of 3 paragraphs, trying to find the most important " \
                      "content that can help answer the following question: {query}".format(query=query)
 
@@ -157,27 +219,28 @@ class WebSearch:
         if self.plugin.window.core.models.has(tmp_model):
             model = self.plugin.window.core.models.get(tmp_model)
 
-        # summarize per chunk
-        for chunk in chunks:
-            # print("Chunk: " + chunk)
+        def progress(done: int, total: int, response: str):
+            self.log("Summarized chunk {} of {}".format(done, total))
             self.debug(
-                "Plugin: cmd_web:get_summary (chunk, max_tokens): {}, {}".format(chunk, max_tokens)
+                "Plugin: cmd_web:get_summary (chunk summary): {}".format(response)
             )
-            try:
-                response = self.plugin.window.core.bridge.quick_call(
-                    prompt=chunk,
-                    system_prompt=sys_prompt,
-                    max_tokens=max_tokens,
-                    model=model,
-                )
-                if response is not None and response != "":
-                    summary += response
-            except Exception as e:
-                self.error(e)
-                self.debug(
-                    "Plugin: cmd_web:get_summary: error: {}".format(e)
-                )
-        return summary
+
+        def error(e: Exception):
+            self.error(e)
+            self.debug(
+                "Plugin: cmd_web:get_summary: error: {}".format(e)
+            )
+
+        # summarize chunks concurrently
+        return self.plugin.window.core.summarizer.summarize(
+            chunks,
+            system_prompt=sys_prompt,
+            model=model,
+            max_tokens=max_tokens,
+            reduce=bool(self.plugin.get_option_value("summary_reduce")),
+            callback=progress,
+            error_callback=error,
+        )
 
     def make_query(
             self,
@@ -203,9 +266,8 @@ class WebSearch:
 
         total_found = len(urls)
         result = ""
-        i = 1
         current = 1
-        url = ""
+        pages = []
         for url in urls:
             if url is None or url == "":
                 continue
@@ -214,35 +276,34 @@ class WebSearch:
             if current != page_no:
                 current += 1
                 continue
+            pages.append(url)
 
-            self.log("Web attempt: " + str(i) + " of " + str(len(urls)))
-            self.log("URL: " + url)
-            content = self.query_url(url)
-            if content is None or content == "":
-                i += 1
-                continue
-
-            self.log("Content found (chars: {}). Please wait...".format(len(content)))
-            if 0 < max_per_page < len(content):
-                content = content[:max_per_page]
+        url = ""
+        fetched = self.fetch_pages(pages)
+        try:
+            for url, content in fetched:
+                self.log("Content found (chars: {}). Please wait...".format(len(content)))
+                if 0 < max_per_page < len(content):
+                    content = content[:max_per_page]
 
-            chunks = self.to_chunks(content, chunk_size)  # it returns list of chunks
-            self.debug(
-                "Plugin: cmd_web: URL: {}".format(url)
-            )
-            result = self.get_summary(
-                chunks,
-                str(query),
-                summarize_prompt,
-            )
-            # if result then stop
-            if result is not None and result != "":
-                self.log("Summary generated (chars: {})".format(len(result)))
-
-                # index webpage if auto-index is enabled
-                self.index_url(url)
-                break
-            i += 1
+                chunks = self.to_chunks(content, chunk_size)  # it returns list of chunks
+                self.debug(
+                    "Plugin: cmd_web: URL: {}".format(url)
+                )
+                result = self.get_summary(
+                    chunks,
+                    str(query),
+                    summarize_prompt,
+                )
+                # if result then stop
+                if result is not None and result != "":
+                    self.log("Summary generated (chars: {})".format(len(result)))
+
+                    # index webpage if auto-index is enabled
+                    self.index_url(url)
+                    break
+        finally:
+            fetched.close()  # cancel remaining fetches
 
         self.debug(
             "Plugin: cmd_web: summary: {}".format(result)
@@ -6,15 +6,18 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.13 15:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from pygpt_net.plugin.base import BasePlugin
 from pygpt_net.core.dispatcher import Event
 from pygpt_net.item.ctx import CtxItem
 
+from .cache import QueryCache
 from .worker import Worker
 
 
@@ -33,6 +36,7 @@ class Plugin(BasePlugin):
         self.order = 100
         self.use_locale = True
         self.mode = None  # current mode
+        self.cache = QueryCache()  # ask first results
         self.init_options()
 
     def init_options(self):
@@ -117,6 +121,35 @@ class Plugin(BasePlugin):
             min=0,
             max=None,
         )
+        self.add_option(
+            "cache_ttl",
+            type="int",
+            value=300,
+            label="Cache TTL",
+            description="Time (in seconds) to reuse response for the same question asked again when asking "
+                        "Llama-index first, cache is cleared when index is modified, 0 = disabled",
+            min=0,
+            max=None,
+        )
+        self.add_option(
+            "max_workers",
+            type="int",
+            value=4,
+            label="Max concurrent queries",
+            description="Max number of indexes queried at once when more than one index is used",
+            min=1,
+            max=None,
+        )
+        self.add_option(
+            "timeout",
+            type="int",
+            value=60,
+            label="Query timeout",
+            description="Max time (in seconds) to wait for all indexes, responses from indexes not queried "
+                        "in time are skipped, 0 = no limit",
+            min=0,
+            max=None,
+        )
         self.add_option(
             "append_meta",
             type="bool",
@@ -276,15 +309,33 @@ class Plugin(BasePlugin):
         if not self.get_option_value("ask_llama_first") or self.window.controller.agent.enabled():
             return prompt
 
-        question = ctx.input
-        if self.get_option_value("prepare_question"):
-            question = self.prepare_question(ctx)
-            if question == "":
-                return prompt
-
-        self.log("Querying Llama-index for: " + question)
-
-        response, doc_ids, metas = self.query(question)
+        ttl = self.get_option_value("cache_ttl")
+        result = None
+        if ttl:
+            scope, revision = self.get_cache_scope()
+            result = self.cache.get(scope, revision, ctx.input, ttl)
+            self.log("Query cache {}: {} (hit rate: {:.0%}, hits: {}, misses: {})".format(
+                "hit" if result is not None else "miss",
+                ctx.input,
+                self.cache.get_hit_rate(),
+                self.cache.hits,
+                self.cache.misses,
+            ))
+
+        if result is None:
+            question = ctx.input
+            if self.get_option_value("prepare_question"):
+                question = self.prepare_question(ctx)
+                if question == "":
+                    return prompt
+
+            self.log("Querying Llama-index for: " + question)
+
+            result = self.query(question)
+            if ttl and result[0]:
+                self.cache.set(scope, revision, ctx.input, result)
+
+        response, doc_ids, metas = result
         if response is None or len(response) == 0:
             self.log("No additional context. Aborting.")
             return prompt
@@ -294,6 +345,23 @@ class Plugin(BasePlugin):
         prompt += "\nADDITIONAL CONTEXT: " + response
         return prompt
 
+    def get_cache_scope(self) -> (tuple, tuple):
+        """
+        Get query cache scope and current revisions of queried indexes
+
+        :return: scope, revision
+        """
+        indexes = [index.strip() for index in self.get_option_value("idx").split(",")]
+        scope = (
+            self.window.core.idx.get_current_store(),
+            tuple(indexes),
+            self.get_option_value("model_query"),
+            self.get_option_value("prepare_question"),
+            self.get_option_value("model_prepare_question"),
+        )
+        revision = tuple(self.window.core.idx.storage.get_revision(index) for index in indexes)
+        return scope, revision
+
     def query(self, question: str) -> (str, list, list):
         """
         Query Llama-index
@@ -311,7 +379,7 @@ class Plugin(BasePlugin):
                 model = self.window.core.models.get(model_query)
 
         # get indexes
-        indexes = idx.split(",")
+        indexes = [index.strip() for index in idx.split(",")]
 
         # max length of question for Llama-index
         max_len = self.get_option_value("max_question_chars")
@@ -319,42 +387,84 @@ class Plugin(BasePlugin):
             if len(question) > max_len:
                 question = question[:max_len]
 
-        # query index(es)
+        # query index(es), concurrently if more than one
+        context = self.window.core.idx.llm.get_service_context(model=model)  # shared by all indexes
         if len(indexes) > 1:
-            responses = []
-            for index in indexes:
-                ctx = CtxItem()  # tmp ctx
-                ctx.input = question
-                self.window.core.idx.chat.query(
-                    ctx=ctx,
-                    idx=index.strip(),
-                    model=model,
-                    stream=False,
-                )
-                if ctx.index_meta:
-                    doc_ids.append(ctx.index_meta)
-                    metas.append(ctx.index_meta)
-                    self.append_meta_to_response(ctx)
-                self.log("Using additional context: " + str(ctx.output))
-                responses.append(ctx.output)
-
-            return "\n---\n".join(responses), doc_ids, metas
+            ctxs = self.query_concurrent(indexes, question, model, context)
         else:
-            ctx = CtxItem()  # tmp ctx
-            ctx.input = question
-            self.window.core.idx.chat.query(
-                ctx=ctx,
-                idx=idx,
-                model=model,
-                stream=False,
-            )
+            ctxs = [self.query_index(indexes[0], question, model, context)]
+
+        responses = []
+        for ctx in ctxs:
+            if ctx is None:  # timeout
+                continue
             if ctx.index_meta:
                 doc_ids.append(ctx.index_meta)
                 metas.append(ctx.index_meta)
                 self.append_meta_to_response(ctx)
             self.log("Using additional context: " + str(ctx.output))
+            responses.append(ctx.output)
+
+        if len(indexes) == 1:
+            return responses[0], doc_ids, metas  # llama doc_ids, meta
+        return "\n---\n".join(responses), doc_ids, metas
 
-            return ctx.output, doc_ids, metas  # tmp ctx, llama doc_ids, meta
+    def query_index(self, idx: str, question: str, model, context=None) -> CtxItem:
+        """
+        Query single index
+
+        :param idx: index name
+        :param question: question
+        :param model: model item
+        :param context: service context
+        :return: tmp ctx with response
+        """
+        start = time.perf_counter()
+        ctx = CtxItem()  # tmp ctx
+        ctx.input = question
+        self.window.core.idx.chat.query(
+            ctx=ctx,
+            idx=idx,
+            model=model,
+            stream=False,
+            service_context=context,
+        )
+        self.log("Index {} queried in {:.2f} s".format(idx, time.perf_counter() - start))
+        return ctx
+
+    def query_concurrent(self, indexes: list, question: str, model, context=None) -> list:
+        """
+        Query indexes concurrently (bounded pool, overall timeout)
+
+        :param indexes: index names
+        :param question: question
+        :param model: model item
+        :param context: service context
+        :return: list of tmp ctx in order of indexes, None for indexes failed or not queried before timeout
+        """
+        max_workers = self.get_option_value("max_workers")
+        if not max_workers or max_workers < 1:
+            max_workers = 1
+        timeout = self.get_option_value("timeout") or None  # 0 = no limit
+        executor = ThreadPoolExecutor(max_workers=min(len(indexes), int(max_workers)))
+        try:
+            futures = [executor.submit(self.query_index, idx, question, model, context) for idx in indexes]
+            wait(futures, timeout=timeout)
+            ctxs = []
+            for idx, future in zip(indexes, futures):
+                if not future.done():
+                    self.log("Index {} not queried in {} s, skipping.".format(idx, timeout))
+                    ctxs.append(None)
+                    continue
+                try:
+                    ctxs.append(future.result())
+                except Exception as e:
+                    self.error(e)
+                    self.log("Index {} query failed, skipping.".format(idx))
+                    ctxs.append(None)  # results from other indexes are still merged
+            return ctxs
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)  # do not wait for timed out queries
 
     def append_meta_to_response(self, ctx: CtxItem):
         """
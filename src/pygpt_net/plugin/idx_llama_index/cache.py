@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.22 02:00:00                  #
+# ================================================== #
+
+import re
+import time
+from collections import OrderedDict
+
+
+class QueryCache:
+    def __init__(self, max_items: int = 100):
+        """
+        Cache of Llama-index query results
+
+        :param max_items: max number of cached results (least recently used are removed first)
+        """
+        self.max_items = max_items
+        self.items = OrderedDict()  # key -> (time, result)
+        self.hits = 0
+        self.misses = 0
+
+    def normalize(self, question: str) -> str:
+        """
+        Normalize question (case, whitespace and punctuation are ignored)
+
+        :param question: question
+        :return: normalized question
+        """
+        question = re.sub(r"[^\w\s]", " ", question.lower(), flags=re.UNICODE)
+        return " ".join(question.split())
+
+    def get_key(self, scope: tuple, revision: tuple, question: str) -> tuple:
+        """
+        Build cache key
+
+        :param scope: query scope (vector store, indexes, model, etc.)
+        :param revision: revisions of queried indexes
+        :param question: question
+        :return: cache key
+        """
+        return scope, revision, self.normalize(question)
+
+    def get(self, scope: tuple, revision: tuple, question: str, ttl: int):
+        """
+        Get cached result
+
+        :param scope: query scope (vector store, indexes, model, etc.)
+        :param revision: revisions of queried indexes
+        :param question: question
+        :param ttl: max age in seconds
+        :return: cached result or None
+        """
+        key = self.get_key(scope, revision, question)
+        item = self.items.get(key)
+        if item is not None and time.time() - item[0] <= ttl:
+            self.items.move_to_end(key)
+            self.hits += 1
+            return item[1]
+        if item is not None:
+            del self.items[key]  # expired
+        self.misses += 1
+        return None
+
+    def set(self, scope: tuple, revision: tuple, question: str, result):
+        """
+        Store result in cache
+
+        :param scope: query scope (vector store, indexes, model, etc.)
+        :param revision: revisions of queried indexes
+        :param question: question
+        :param result: query result
+        """
+        # results for previous revisions of the same indexes will never be used again
+        for key in [key for key in self.items if key[0] == scope and key[1] != revision]:
+            del self.items[key]
+        key = self.get_key(scope, revision, question)
+        self.items[key] = (time.time(), result)
+        self.items.move_to_end(key)
+        while len(self.items) > self.max_items:
+            self.items.popitem(last=False)
+
+    def get_hit_rate(self) -> float:
+        """
+        Get cache hit rate
+
+        :return: hit rate (0-1)
+        """
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    def clear(self):
+        """Clear cache"""
+        self.items.clear()
+        self.hits = 0
+        self.misses = 0
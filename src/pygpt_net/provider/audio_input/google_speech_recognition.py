@@ -6,10 +6,9 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.02.27 04:00:00                  #
+# Updated Date: 2024.03.20 12:00:00                  #
 # ================================================== #
 
-import speech_recognition as sr
 
 from .base import BaseProvider
 from pygpt_net.utils import parse_args
@@ -67,6 +66,7 @@ class GoogleSpeechRecognition(BaseProvider):
         if additional_args:
             args.update(additional_args)
 
+        import speech_recognition as sr
         r = sr.Recognizer()
         file = sr.AudioFile(path)
         with file as source:
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.19 01:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
 import copy
@@ -1269,6 +1269,61 @@ class Patch:
                     data["audio.transcribe.convert_video"] = True
                 updated = True
 
+            # < 2.1.38
+            if old < parse_version("2.1.38"):
+                print("Migrating config from < 2.1.38...")
+                if 'cmd.parallel' not in data:
+                    data["cmd.parallel"] = False
+                if 'cmd.parallel.workers' not in data:
+                    data["cmd.parallel.workers"] = 4
+                if 'llama.idx.embeddings.batch' not in data:
+                    data["llama.idx.embeddings.batch"] = 100
+                if 'llama.idx.embeddings.cache.size' not in data:
+                    data["llama.idx.embeddings.cache.size"] = 256
+                if 'llama.idx.embeddings.limit.tpm' not in data:
+                    data["llama.idx.embeddings.limit.tpm"] = 0
+                if 'llama.idx.hybrid' not in data:
+                    data["llama.idx.hybrid"] = False
+                if 'llama.idx.hybrid.top_k' not in data:
+                    data["llama.idx.hybrid.top_k"] = 4
+                if 'llama.idx.hybrid.weight.bm25' not in data:
+                    data["llama.idx.hybrid.weight.bm25"] = 0.6
+                if 'llama.idx.hybrid.weight.vector' not in data:
+                    data["llama.idx.hybrid.weight.vector"] = 0.4
+                if 'llama.idx.incremental' not in data:
+                    data["llama.idx.incremental"] = True
+                if 'llama.idx.jobs.checkpoint' not in data:
+                    data["llama.idx.jobs.checkpoint"] = 20
+                if 'llama.idx.jobs.resume' not in data:
+                    data["llama.idx.jobs.resume"] = True
+                if 'llama.idx.pipeline.queue' not in data:
+                    data["llama.idx.pipeline.queue"] = 64
+                if 'llama.idx.pipeline.workers' not in data:
+                    data["llama.idx.pipeline.workers"] = 0
+                if 'llama.idx.storage.cache.size' not in data:
+                    data["llama.idx.storage.cache.size"] = 512
+                if 'llama.idx.tmp.cache.size' not in data:
+                    data["llama.idx.tmp.cache.size"] = 128
+                if 'llama.idx.tmp.cache.ttl' not in data:
+                    data["llama.idx.tmp.cache.ttl"] = 600
+                if 'llama.idx.watch' not in data:
+                    data["llama.idx.watch"] = False
+                if 'llama.idx.watch.debounce' not in data:
+                    data["llama.idx.watch.debounce"] = 2
+                if 'llama.idx.watch.index' not in data:
+                    data["llama.idx.watch.index"] = "base"
+                if 'llama.idx.watch.interval' not in data:
+                    data["llama.idx.watch.interval"] = 5
+                if 'llama.idx.watch.paths' not in data:
+                    data["llama.idx.watch.paths"] = ""
+                if 'max_concurrent_requests' not in data:
+                    data["max_concurrent_requests"] = 4
+                if 'web.cache' not in data:
+                    data["web.cache"] = True
+                if 'web.cache.max_size' not in data:
+                    data["web.cache.max_size"] = 100
+                updated = True
+
         # update file
         migrated = False
         if updated:
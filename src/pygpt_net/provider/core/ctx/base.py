@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.09 21:00:00                  #
+# Updated Date: 2024.03.22 08:00:00                  #
 # ================================================== #
 
 from packaging.version import Version
@@ -77,6 +77,12 @@ class BaseProvider:
     def set_meta_indexed_by_id(self, id: int, ts: int) -> bool:
         pass
 
+    def get_meta_by_ids(self, ids: list) -> dict:
+        pass
+
+    def set_meta_indexed_bulk(self, store_id: str, idx: str, items: list, ts: int) -> bool:
+        pass
+
     def update_meta_indexes_by_id(self, id: int, meta: CtxMeta) -> bool:
         pass
 
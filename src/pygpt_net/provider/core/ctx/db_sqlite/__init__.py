@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.09 21:00:00                  #
+# Updated Date: 2024.03.22 08:00:00                  #
 # ================================================== #
 
 import time
@@ -238,6 +238,27 @@ class DbSqliteProvider(BaseProvider):
         """
         return self.storage.set_meta_indexed_by_id(id, ts)
 
+    def get_meta_by_ids(self, ids: list) -> dict:
+        """
+        Return dict with CtxMeta objects, indexed by ID
+
+        :param ids: ctx meta IDs
+        :return: dict of CtxMeta
+        """
+        return self.storage.get_meta_by_ids(ids)
+
+    def set_meta_indexed_bulk(self, store_id: str, idx: str, items: list, ts: int) -> bool:
+        """
+        Set metas indexed (indexed timestamp, indexes data and index db) in one transaction
+
+        :param store_id: store ID
+        :param idx: index name
+        :param items: list of tuples (CtxMeta, last document ID)
+        :param ts: timestamp
+        :return: True if set
+        """
+        return self.storage.set_meta_indexed_bulk(store_id, idx, items, ts)
+
     def update_meta_indexes_by_id(self, id: int, meta: CtxMeta) -> bool:
         """
         Update meta indexes by ID
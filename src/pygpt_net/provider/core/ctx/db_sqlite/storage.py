@@ -6,14 +6,15 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.09 21:00:00                  #
+# Updated Date: 2024.03.22 08:00:00                  #
 # ================================================== #
 
 from datetime import datetime
 import re
 import time
+import uuid
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from pygpt_net.item.ctx import CtxMeta, CtxItem
 from .utils import \
@@ -394,6 +395,121 @@ class Storage:
             conn.execute(stmt)
             return True
 
+    def get_meta_by_ids(self, ids: list) -> dict:
+        """
+        Return dict with CtxMeta objects, indexed by ID
+
+        :param ids: ctx meta IDs
+        :return: dict of CtxMeta
+        """
+        items = {}
+        if not ids:
+            return items
+        stmt = text("""
+            SELECT * FROM ctx_meta WHERE id IN :ids
+        """).bindparams(bindparam("ids", value=list(ids), expanding=True))
+        db = self.window.core.db.get_db()
+        with db.connect() as conn:
+            result = conn.execute(stmt)
+            for row in result:
+                meta = CtxMeta()
+                unpack_meta(meta, row._asdict())
+                items[meta.id] = meta
+        return items
+
+    def set_meta_indexed_bulk(self, store_id: str, idx: str, items: list, ts: int) -> bool:
+        """
+        Update indexed ctx metas and index data (idx_ctx) in one transaction
+
+        :param store_id: store ID
+        :param idx: index name
+        :param items: list of tuples (CtxMeta with updated indexes, last document ID)
+        :param ts: indexed timestamp
+        :return: True if updated
+        """
+        if not items:
+            return False
+        db = self.window.core.db.get_db()
+        with db.begin() as conn:
+            stmt = text("""
+                SELECT meta_id FROM idx_ctx
+                WHERE store = :store_id
+                AND idx = :idx
+                AND meta_id IN :ids
+            """).bindparams(
+                bindparam("ids", value=[meta.id for meta, doc_id in items], expanding=True),
+                store_id=store_id,
+                idx=idx,
+            )
+            existing = set(row[0] for row in conn.execute(stmt))
+            updates = [item for item in items if item[0].id in existing]
+            inserts = [item for item in items if item[0].id not in existing]
+            if updates:
+                conn.execute(text("""
+                    UPDATE idx_ctx
+                    SET
+                        updated_ts = :updated_ts,
+                        doc_id = :doc_id
+                    WHERE store = :store_id
+                    AND idx = :idx
+                    AND meta_id = :meta_id
+                """), [
+                    {
+                        "updated_ts": ts,
+                        "doc_id": doc_id,
+                        "store_id": store_id,
+                        "idx": idx,
+                        "meta_id": meta.id,
+                    } for meta, doc_id in updates
+                ])
+            if inserts:
+                conn.execute(text("""
+                    INSERT INTO idx_ctx
+                    (
+                        uuid,
+                        meta_id,
+                        doc_id,
+                        created_ts,
+                        updated_ts,
+                        store,
+                        idx
+                    )
+                    VALUES
+                    (
+                        :uuid,
+                        :meta_id,
+                        :doc_id,
+                        :created_ts,
+                        :updated_ts,
+                        :store,
+                        :idx
+                    )
+                """), [
+                    {
+                        "uuid": str(uuid.uuid4()),
+                        "meta_id": meta.id,
+                        "doc_id": doc_id,
+                        "created_ts": ts,
+                        "updated_ts": ts,
+                        "store": store_id,
+                        "idx": idx,
+                    } for meta, doc_id in inserts
+                ])
+            conn.execute(text("""
+                UPDATE ctx_meta
+                SET
+                    indexed_ts = :indexed_ts,
+                    indexes_json = :indexes_json
+                WHERE id = :id
+            """), [
+                {
+                    "indexed_ts": ts,
+                    "indexes_json": pack_item_value(meta.indexes),
+                    "id": meta.id,
+                } for meta, doc_id in items
+            ])
+        return True
+
     def update_meta_indexes_by_id(self, id: int, meta: CtxMeta) -> bool:
         """
         Update ctx meta indexed timestamp
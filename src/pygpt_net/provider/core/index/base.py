@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.06 02:00:00                  #
+# Updated Date: 2024.03.22 08:00:00                  #
 # ================================================== #
 
 from packaging.version import Version
@@ -41,7 +41,7 @@ class BaseProvider:
     def append_external(self, store_id: str, idx: str, data: dict) -> int:
         pass
 
-    def update_file(self, id: int, doc_id: str, ts: int) -> bool:
+    def update_file(self, id: int, doc_id: str, ts: int, stat: dict = None) -> bool:
         pass
 
     def update_ctx_meta(self, id: int, doc_id: str) -> bool:
@@ -62,6 +62,9 @@ class BaseProvider:
     def get_meta_doc_id(self, store_id: str, idx: str, meta_id: int) -> str:
         pass
 
+    def get_meta_doc_ids(self, store_id: str, idx: str) -> dict:
+        pass
+
     def get_file_doc_id(self, store_id: str, idx: str, file_id: str) -> str:
         pass
 
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.06 02:00:00                  #
+# Updated Date: 2024.03.22 08:00:00                  #
 # ================================================== #
 
 from packaging.version import Version
@@ -130,6 +130,16 @@ class DbSqliteProvider(BaseProvider):
         """
         return self.storage.get_meta_doc_id(store_id, idx, meta_id)
 
+    def get_meta_doc_ids(self, store_id: str, idx: str) -> dict:
+        """
+        Get indexed document ids of all ctx metas
+
+        :param store_id: store id
+        :param idx: index name
+        :return: dict: meta id -> document id
+        """
+        return self.storage.get_meta_doc_ids(store_id, idx)
+
     def get_file_doc_id(self, store_id: str, idx: str, file_id: str) -> str:
         """
         Get indexed document id by file id
@@ -153,15 +163,16 @@ class DbSqliteProvider(BaseProvider):
         """
         return self.storage.get_external_doc_id(store_id, idx, content, type)
 
-    def update_file(self, id: int, doc_id: str, ts: int) -> bool:
+    def update_file(self, id: int, doc_id: str, ts: int, stat: dict = None) -> bool:
         """
         Update indexed timestamp of indexed file
 
         :param: id: db record ID
         :param: doc_id: document ID
         :param: ts: timestamp
+        :param: stat: file manifest (size, mtime, hash)
         """
-        return self.storage.update_file(id, doc_id, ts)
+        return self.storage.update_file(id, doc_id, ts, stat)
 
     def update_ctx_meta(self, meta_id: int, doc_id: str) -> bool:
         """
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.06 02:00:00                  #
+# Updated Date: 2024.03.22 08:00:00                  #
 # ================================================== #
 
 import uuid
@@ -85,7 +85,10 @@ class Storage:
                 name,
                 path,
                 store,
-                idx
+                idx,
+                size,
+                mtime,
+                hash
             )
             VALUES 
             (
@@ -96,7 +99,10 @@ class Storage:
                 :name,
                 :path,
                 :store,
-                :idx
+                :idx,
+                :size,
+                :mtime,
+                :hash
             )
         """).bindparams(
             uuid=str(uuid.uuid4()),
@@ -107,6 +113,9 @@ class Storage:
             path=data['path'],
             store=store_id,
             idx=idx,
+            size=data.get('size'),
+            mtime=data.get('mtime'),
+            hash=data.get('hash'),
         )
         with db.begin() as conn:
             result = conn.execute(stmt)
@@ -322,6 +331,32 @@ class Storage:
             data = row._asdict()
             return data['doc_id']
 
+    def get_meta_doc_ids(self, store_id: str, idx: str) -> dict:
+        """
+        Get indexed document ids of all ctx metas
+
+        :param store_id: store id
+        :param idx: index name
+        :return: dict: meta id -> document id
+        """
+        db = self.window.core.db.get_db()
+        stmt = text("""
+            SELECT meta_id, doc_id
+            FROM idx_ctx
+            WHERE store = :store_id
+            AND idx = :idx
+        """).bindparams(
+            store_id=store_id,
+            idx=idx,
+        )
+        items = {}
+        with db.connect() as conn:
+            result = conn.execute(stmt)
+            for row in result:
+                data = row._asdict()
+                items[data['meta_id']] = data['doc_id']
+        return items
+
     def get_file_doc_id(self, store_id: str, idx: str, file_id: str) -> str:
         """
         Get indexed document id by file id
@@ -379,25 +414,34 @@ class Storage:
             data = row._asdict()
             return data['doc_id']
 
-    def update_file(self, id: int, doc_id: str, ts: int) -> bool:
+    def update_file(self, id: int, doc_id: str, ts: int, stat: dict = None) -> bool:
         """
         Update timestamp of file in index
 
         :param id: db record ID
         :param doc_id: document ID
         :param ts: timestamp
+        :param stat: file manifest (size, mtime, hash)
         """
+        if stat is None:
+            stat = {}
         db = self.window.core.db.get_db()
         stmt = text("""
             UPDATE idx_file
             SET 
             updated_ts = :updated_ts,
-            doc_id = :doc_id
+            doc_id = :doc_id,
+            size = COALESCE(:size, size),
+            mtime = COALESCE(:mtime, mtime),
+            hash = COALESCE(:hash, hash)
             WHERE id = :id
         """).bindparams(
             id=id,
             doc_id=doc_id,
             updated_ts=ts,
+            size=stat.get('size'),
+            mtime=stat.get('mtime'),
+            hash=stat.get('hash'),
         )
         with db.begin() as conn:
             conn.execute(stmt)
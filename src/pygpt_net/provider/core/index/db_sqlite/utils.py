@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.06 02:00:00                  #
+# Updated Date: 2024.03.21 16:00:00                  #
 # ================================================== #
 
 from pygpt_net.utils import unpack_var
@@ -26,4 +26,7 @@ def unpack_file_item(row: dict) -> (str, dict):
     data["name"] = row['name']
     data["path"] = row['path']
     data["indexed_ts"] = unpack_var(row['updated_ts'], 'int')
+    data["size"] = row.get('size')  # manifest, empty if indexed before manifest was added
+    data["mtime"] = row.get('mtime')
+    data["hash"] = row.get('hash')
     return idx, data
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.17 13:00:00                  #
+# Updated Date: 2024.03.22 18:00:00                  #
 # ================================================== #
 
 from pygpt_net.item.ctx import CtxItem
@@ -40,12 +40,12 @@ class Summarizer:
             if self.window.core.models.has(tmp_model):
                 model = self.window.core.models.get(tmp_model)
 
-        # quick call OpenAI API
-        response = self.window.core.bridge.quick_call(
-            prompt=text,
+        # quick call OpenAI API (shared summarizer, under RPM limit)
+        response = self.window.core.summarizer.summarize(
+            [text],
             system_prompt=system_prompt,
-            max_tokens=500,
             model=model,
+            max_tokens=500,
         )
-        if response is not None:
+        if response:
             return response
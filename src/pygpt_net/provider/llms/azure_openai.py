@@ -6,16 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.13 15:00:00                  #
+# Updated Date: 2024.03.20 12:00:00                  #
 # ================================================== #
 
-from langchain_openai import AzureOpenAI
-from langchain_openai import AzureChatOpenAI
-
 from llama_index.core.llms.llm import BaseLLM as LlamaBaseLLM
 from llama_index.core.base.embeddings.base import BaseEmbedding
-from llama_index.llms.azure_openai import AzureOpenAI as LlamaAzureOpenAI
-from llama_index.embeddings.azure_openai import AzureOpenAIEmbedding
 
 from pygpt_net.provider.llms.base import BaseLLM
 from pygpt_net.item.model import ModelItem
@@ -36,6 +31,7 @@ class AzureOpenAILLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from langchain_openai import AzureOpenAI
         args = self.parse_args(model.langchain)
         return AzureOpenAI(**args)
 
@@ -48,6 +44,7 @@ class AzureOpenAILLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from langchain_openai import AzureChatOpenAI
         args = self.parse_args(model.langchain)
         return AzureChatOpenAI(**args)
 
@@ -60,6 +57,7 @@ class AzureOpenAILLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from llama_index.llms.azure_openai import AzureOpenAI as LlamaAzureOpenAI
         args = self.parse_args(model.llama_index)
         return LlamaAzureOpenAI(**args)
 
@@ -71,6 +69,7 @@ class AzureOpenAILLM(BaseLLM):
         :param config: config keyword arguments list
         :return: Embedding provider instance
         """
+        from llama_index.embeddings.azure_openai import AzureOpenAIEmbedding
         args = {}
         if config is not None:
             args = self.parse_args({
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.22 12:00:00                  #
+# ================================================== #
+
+from llama_index.core.base.embeddings.base import BaseEmbedding
+
+from pygpt_net.provider.llms.base import BaseLLM
+
+
+class LocalLLM(BaseLLM):
+    def __init__(self, *args, **kwargs):
+        super(LocalLLM, self).__init__(*args, **kwargs)
+        self.id = "local"
+        self.type = ["embeddings"]
+
+    def get_embeddings_model(self, window, config: list = None) -> BaseEmbedding:
+        """
+        Return provider instance for embeddings (offline hashing vectorizer)
+
+        :param window: window instance
+        :param config: config keyword arguments list
+        :return: Embedding provider instance
+        """
+        from pygpt_net.core.idx.embeddings import HashingEmbedding
+        args = {}
+        if config is not None:
+            args = self.parse_args({
+                "args": config,
+            })
+        # skip arguments of other providers (model name, etc.)
+        args = {k: v for k, v in args.items() if k in ["dim", "ngrams"]}
+        return HashingEmbedding(**args)
@@ -6,12 +6,9 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.14 11:00:00                  #
+# Updated Date: 2024.03.20 12:00:00                  #
 # ================================================== #
 
-from langchain_community.chat_models import ChatOllama
-
-
 from pygpt_net.provider.llms.base import BaseLLM
 from pygpt_net.item.model import ModelItem
 
@@ -42,5 +39,6 @@ class OllamaLLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from langchain_community.chat_models import ChatOllama
         args = self.parse_args(model.langchain)
         return ChatOllama(args)
@@ -6,16 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.13 15:00:00                  #
+# Updated Date: 2024.03.20 12:00:00                  #
 # ================================================== #
 
-from langchain_openai import OpenAI
-from langchain_openai import ChatOpenAI
-
 from llama_index.core.llms.llm import BaseLLM as LlamaBaseLLM
 from llama_index.core.base.embeddings.base import BaseEmbedding
-from llama_index.llms.openai import OpenAI as LlamaOpenAI
-from llama_index.embeddings.openai import OpenAIEmbedding
 
 from pygpt_net.provider.llms.base import BaseLLM
 from pygpt_net.item.model import ModelItem
@@ -36,6 +31,7 @@ class OpenAILLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from langchain_openai import OpenAI
         args = self.parse_args(model.langchain)
         return OpenAI(**args)
 
@@ -48,6 +44,7 @@ class OpenAILLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from langchain_openai import ChatOpenAI
         args = self.parse_args(model.langchain)
         return ChatOpenAI(**args)
 
@@ -60,6 +57,7 @@ class OpenAILLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from llama_index.llms.openai import OpenAI as LlamaOpenAI
         args = self.parse_args(model.llama_index)
         return LlamaOpenAI(**args)
 
@@ -71,6 +69,7 @@ class OpenAILLM(BaseLLM):
         :param config: config keyword arguments list
         :return: Embedding provider instance
         """
+        from llama_index.embeddings.openai import OpenAIEmbedding
         args = {}
         if config is not None:
             args = self.parse_args({
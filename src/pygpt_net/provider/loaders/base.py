@@ -6,9 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.01 02:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
+import importlib.util
+
 from llama_index.core.readers.base import BaseReader
 
 
@@ -20,10 +22,12 @@ class BaseLoader:
         self.extensions = []
         self.type = ["file"]  # list of types: file, web
         self.instructions = []  # list of instructions for 'web_index' command for how to handle this type
+        self.requires = []  # list of modules required by reader (checked before web loader registration)
         self.args = {}  # custom keyword arguments
         self.init_args = {}  # initial keyword arguments
         self.allow_compiled = True  # allow in compiled and Snap versions
         # This is required due to some readers may require Python environment to install additional packages
+        self.allow_subprocess = True  # allow parsing in indexing pipeline subprocess (reader must not use window)
 
     def attach_window(self, window):
         """
@@ -74,6 +78,20 @@ class BaseLoader:
             return args.get("url")
         return ""
 
+    def is_available(self) -> bool:
+        """
+        Check if modules required by reader are installed (without importing them)
+
+        :return: True if all required modules are installed
+        """
+        for module in self.requires:
+            try:
+                if importlib.util.find_spec(module) is None:
+                    return False
+            except (ImportError, ValueError):
+                return False  # parent package not installed
+        return True
+
     def get(self) -> BaseReader:
         """
         Get reader instance
@@ -81,3 +99,35 @@ class BaseLoader:
         :return: Data reader instance
         """
         pass
+
+
+class LazyReader:
+    def __init__(self, loader: BaseLoader, args: dict):
+        """
+        Lazy reader wrapper, reader instance is created on first use
+
+        :param loader: data loader instance
+        :param args: reader keyword arguments
+        """
+        self.loader = loader
+        self.args = args
+        self.reader = None
+
+    def get(self) -> BaseReader:
+        """
+        Get (and create if not exists) reader instance
+
+        :return: Data reader instance
+        """
+        if self.reader is None:
+            self.loader.set_args(self.args)
+            self.reader = self.loader.get()
+        return self.reader
+
+    def load_data(self, *args, **kwargs):
+        """
+        Load data using wrapped reader
+
+        :return: list of documents
+        """
+        return self.get().load_data(*args, **kwargs)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.01 02:00:00                  #
+# Updated Date: 2024.03.21 10:00:00                  #
 # ================================================== #
 
 from llama_index.core.readers.base import BaseReader
@@ -22,6 +22,7 @@ class Loader(BaseLoader):
         self.name = "Image (vision)"
         self.extensions = ["jpg", "jpeg", "png", "gif", "bmp", "tiff", "webp"]
         self.type = ["file"]
+        self.allow_subprocess = False  # uses window instance
         self.init_args = {
             "use_local": False,  # use local model instead of API
             "keep_image": False,
@@ -1,7 +1,7 @@
 """Read Webpages"""
 
 
-from typing import List
+from typing import Callable, List, Optional
 
 from llama_index.core.readers.base import BaseReader
 from llama_index.core.schema import Document
@@ -10,6 +10,12 @@ from llama_index.core.schema import Document
 class WebPage(BaseReader):
     """Webpage base reader."""
 
+    def __init__(self, fetch: Optional[Callable[[str], bytes]] = None):
+        """
+        :param fetch: function returning URL content (e.g. cached fetch), requests are used if not set
+        """
+        self.fetch = fetch
+
     def load_data(self, **kwargs) -> List[Document]:
         """
         Read URL and return documents.
@@ -20,4 +26,10 @@ class WebPage(BaseReader):
         from llama_index.readers.web import BeautifulSoupWebReader
 
         url = kwargs.get("url")
-        return BeautifulSoupWebReader().load_data([url])
+        if self.fetch is None:
+            return BeautifulSoupWebReader().load_data([url])
+
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(self.fetch(url), "html.parser")
+        return [Document(text=soup.getText(), id_=url, extra_info={"URL": url})]
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.12 06:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
 import json
@@ -23,6 +23,7 @@ class Loader(BaseLoader):
         self.id = "google_calendar"
         self.name = "Google Calendar"
         self.type = ["web"]
+        self.requires = ["google_auth_oauthlib", "google.auth", "googleapiclient"]  # required modules
         self.instructions = [
             {
                 "google_calendar": {
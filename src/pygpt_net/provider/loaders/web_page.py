@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.12 06:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
 from llama_index.core.readers.base import BaseReader
@@ -21,6 +21,7 @@ class Loader(BaseLoader):
         self.id = "webpage"
         self.name = "Webpages"
         self.type = ["web"]
+        self.requires = ["bs4"]  # required modules
         self.instructions = [
             {
                 "webpage": {
@@ -40,7 +41,10 @@ class Loader(BaseLoader):
 
         :return: Data reader instance
         """
-        return WebPage()
+        fetch = None
+        if self.window is not None:
+            fetch = self.window.core.fetch.get  # cached
+        return WebPage(fetch=fetch)
 
     def prepare_args(self, **kwargs) -> dict:
         """
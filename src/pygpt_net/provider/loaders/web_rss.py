@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.12 06:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
 from llama_index.core.readers.base import BaseReader
@@ -21,6 +21,7 @@ class Loader(BaseLoader):
         self.id = "rss"
         self.name = "RSS"
         self.type = ["web"]
+        self.requires = ["feedparser", "html2text"]  # required modules
         self.instructions = [
             {
                 "rss": {
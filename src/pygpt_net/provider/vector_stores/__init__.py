@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.08 23:00:00                  #
+# Updated Date: 2024.03.22 06:00:00                  #
 # ================================================== #
 
 import hashlib
@@ -27,6 +27,7 @@ class Storage:
         self.window = window
         self.storages = {}
         self.indexes = {}
+        self.revisions = {}  # index name -> revision, incremented on every change
         self.tmp_storage = TempProvider(window=window)
 
     def get_storage(self) -> BaseStore or None:
@@ -68,6 +69,23 @@ class Storage:
         """
         return list(self.storages.keys())
 
+    def get_revision(self, id: str) -> int:
+        """
+        Get index revision (number of changes since app start)
+
+        :param id: index name
+        :return: revision
+        """
+        return self.revisions.get(id, 0)
+
+    def update_revision(self, id: str):
+        """
+        Increment index revision (index modified)
+
+        :param id: index name
+        """
+        self.revisions[id] = self.revisions.get(id, 0) + 1
+
     def exists(self, id: str = None) -> bool:
         """
         Check if index exists
@@ -121,6 +139,18 @@ class Storage:
             id=id,
             index=index,
         )
+        self.update_revision(id)
+
+    def flush(self, id: str = None):
+        """
+        Persist not stored changes
+
+        :param id: index name or None to flush all indexes
+        """
+        storage = self.get_storage()
+        if storage is None:
+            return
+        storage.flush(id)
 
     def remove(self, id: str) -> bool:
         """
@@ -132,6 +162,8 @@ class Storage:
         storage = self.get_storage()
         if storage is None:
             raise Exception('Storage engine not found!')
+        self.window.core.idx.lexical.remove(id)
+        self.update_revision(id)
         return storage.remove(id)
 
     def truncate(self, id: str) -> bool:
@@ -144,6 +176,8 @@ class Storage:
         storage = self.get_storage()
         if storage is None:
             raise Exception('Storage engine not found!')
+        self.window.core.idx.lexical.remove(id)
+        self.update_revision(id)
         return storage.truncate(id)
 
     def remove_document(self, id: str, doc_id: str) -> bool:
@@ -157,11 +191,22 @@ class Storage:
         storage = self.get_storage()
         if storage is None:
             raise Exception('Storage engine not found!')
+        self.window.core.idx.lexical.delete(id, doc_id)
+        self.update_revision(id)
         return storage.remove_document(
             id=id,
             doc_id=doc_id,
         )
 
+    def get_tmp_id(self, identifier: str) -> str:
+        """
+        Get tmp index ID
+
+        :param identifier: identifier
+        :return: tmp index ID
+        """
+        return hashlib.md5(identifier.encode()).hexdigest()  # convert path to md5 hash
+
     def get_tmp(self, identifier: str, service_context=None) -> (str, BaseIndex):
         """
         Get tmp index instance
@@ -170,8 +215,7 @@ class Storage:
         :param service_context: service context
         :return: index instance
         """
-        # convert path to md5 hash
-        id = hashlib.md5(identifier.encode()).hexdigest()
+        id = self.get_tmp_id(identifier)
         storage = self.get_tmp_storage()
         if storage is None:
             raise Exception('Storage engine not found!')
@@ -195,6 +239,30 @@ class Storage:
             index=index,
         )
 
+    def has_tmp(self, identifier: str) -> bool:
+        """
+        Check if reusable tmp index is already built
+
+        :param identifier: identifier
+        :return: True if exists
+        """
+        storage = self.get_tmp_storage()
+        if storage is None:
+            raise Exception('Storage engine not found!')
+        return storage.is_cached(self.get_tmp_id(identifier))
+
+    def keep_tmp(self, id: str, scope: str):
+        """
+        Keep tmp index for reuse (cleaned after TTL or when memory limit is exceeded)
+
+        :param id: index name
+        :param scope: index scope (e.g. file path), previous versions with the same scope are cleaned
+        """
+        storage = self.get_tmp_storage()
+        if storage is None:
+            raise Exception('Storage engine not found!')
+        storage.keep(id, scope)
+
     def count_tmp(self) -> int:
         """
         Count temp indices
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.11 01:00:00                  #
+# Updated Date: 2024.03.21 20:00:00                  #
 # ================================================== #
 
 import os
@@ -109,6 +109,14 @@ class BaseStore:
         """
         pass
 
+    def flush(self, id: str = None):
+        """
+        Persist not stored changes (if provider defers persisting)
+
+        :param id: index name or None to flush all indexes
+        """
+        pass
+
     def remove(self, id: str) -> bool:
         """
         Clear index
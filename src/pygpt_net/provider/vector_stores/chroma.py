@@ -6,17 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.11 01:00:00                  #
+# Updated Date: 2024.03.20 12:00:00                  #
 # ================================================== #
 
 import os.path
-import chromadb
-from chromadb.config import Settings
 
 from llama_index.core.indices.base import BaseIndex
 from llama_index.core.indices.service_context import ServiceContext
 from llama_index.core import StorageContext
-from llama_index.vector_stores.chroma import ChromaVectorStore
 
 from .base import BaseStore
 
@@ -42,6 +39,8 @@ class ChromaProvider(BaseStore):
         :param id: index name
         :return: database instance
         """
+        import chromadb
+        from chromadb.config import Settings
         path = self.get_path(id)
         return chromadb.PersistentClient(
             path=path, 
@@ -72,6 +71,7 @@ class ChromaProvider(BaseStore):
         :param service_context: Service context
         :return: index instance
         """
+        from llama_index.vector_stores.chroma import ChromaVectorStore
         if not self.exists(id):
             self.create(id)
         path = self.get_path(id)
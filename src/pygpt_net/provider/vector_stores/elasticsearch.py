@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.11 01:00:00                  #
+# Updated Date: 2024.03.20 12:00:00                  #
 # ================================================== #
 
 import datetime
@@ -15,7 +15,7 @@ import os.path
 from llama_index.core.indices.base import BaseIndex
 from llama_index.core.indices.service_context import ServiceContext
 from llama_index.core import StorageContext
-from llama_index.vector_stores.elasticsearch import ElasticsearchStore
+from llama_index.core.vector_stores.types import BasePydanticVectorStore
 
 from pygpt_net.utils import parse_args
 from .base import BaseStore
@@ -46,7 +46,7 @@ class ElasticsearchProvider(BaseStore):
             os.makedirs(path)
             self.store(id)
 
-    def get_es_client(self, id: str) -> ElasticsearchStore:
+    def get_es_client(self, id: str) -> BasePydanticVectorStore:
         """
         Get Elasticsearch client
 
@@ -62,6 +62,7 @@ class ElasticsearchProvider(BaseStore):
         if "index_name" in additional_args:
             del defaults["index_name"]
 
+        from llama_index.vector_stores.elasticsearch import ElasticsearchStore
         return ElasticsearchStore(
             **defaults,
             **additional_args
@@ -0,0 +1,656 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.22 14:00:00                  #
+# ================================================== #
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, List, Optional
+
+import numpy as np
+
+from llama_index.core import VectorStoreIndex
+from llama_index.core.bridge.pydantic import PrivateAttr
+from llama_index.core.indices.base import BaseIndex
+from llama_index.core.indices.service_context import ServiceContext
+from llama_index.core.schema import BaseNode
+from llama_index.core.vector_stores.types import (
+    BasePydanticVectorStore,
+    FilterCondition,
+    FilterOperator,
+    MetadataFilters,
+    VectorStoreQuery,
+    VectorStoreQueryMode,
+    VectorStoreQueryResult,
+)
+from llama_index.core.vector_stores.utils import metadata_dict_to_node, node_to_metadata_dict
+
+from pygpt_net.utils import parse_args
+from .base import BaseStore
+
+MATRIX_FILE = "vectors.bin"
+MATRIX_TMP_FILE = "vectors.tmp"
+SCALES_FILE = "scales.bin"
+EXACT_FILE = "exact.bin"
+SIDECAR_FILE = "nodes.db"
+
+SQL_OPERATORS = {
+    FilterOperator.EQ: "=",
+    FilterOperator.NE: "!=",
+    FilterOperator.GT: ">",
+    FilterOperator.LT: "<",
+    FilterOperator.GTE: ">=",
+    FilterOperator.LTE: "<=",
+}
+
+
+class NumpyVectorStore(BasePydanticVectorStore):
+    """
+    Vector store with embeddings in memory-mapped matrix (float32, float16 or int8
+    with per-row scale) and nodes with metadata in SQLite sidecar
+
+    Quantized matrix is scanned for approximate top candidates, candidates are re-ranked
+    with exact float32 vectors kept on disk (memory-mapped, only candidate rows are read).
+    """
+    stores_text: bool = True
+    flat_metadata: bool = False
+    path: str
+    dtype: str = "float32"
+    compact_ratio: float = 0.25  # compact matrix on persist if deleted rows exceed this ratio
+    rerank: int = 4  # candidates re-ranked with exact vectors = top_k * rerank (quantized matrix only)
+    chunk_size: int = 65536  # rows scored at once
+
+    _db: sqlite3.Connection = PrivateAttr()
+    _lock: Any = PrivateAttr()
+    _matrix: Any = PrivateAttr(default=None)
+    _scales: Any = PrivateAttr(default=None)  # int8 only, per-row dequantization scale
+    _exact: Any = PrivateAttr(default=None)  # float32 vectors for re-ranking
+    _has_exact: bool = PrivateAttr(default=False)
+    _capacity: int = PrivateAttr(default=0)
+    _count: int = PrivateAttr(default=0)
+    _dim: Optional[int] = PrivateAttr(default=None)
+    _deleted: Any = PrivateAttr(default=None)  # tombstones mask
+
+    def __init__(self, path: str, dtype: str = "float32", **kwargs: Any):
+        """
+        Open or create store
+
+        :param path: store directory
+        :param dtype: matrix type: float32, float16 or int8 (used only for new store)
+        """
+        super().__init__(path=path, dtype=str(np.dtype(dtype)), **kwargs)
+        if self.dtype not in ["float32", "float16", "int8"]:
+            raise ValueError("Unsupported dtype: {}, use float32, float16 or int8".format(self.dtype))
+        self._lock = threading.RLock()
+        self._db = self.connect()
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS nodes (
+                row INTEGER PRIMARY KEY,
+                node_id TEXT NOT NULL,
+                ref_doc_id TEXT,
+                metadata TEXT NOT NULL,
+                deleted INTEGER NOT NULL DEFAULT 0
+            )""")
+        self._db.execute("CREATE INDEX IF NOT EXISTS nodes_ref_doc_id ON nodes (ref_doc_id)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS nodes_node_id ON nodes (node_id)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT)")
+        self._db.commit()
+        self.load()
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "NumpyVectorStore"
+
+    @property
+    def client(self) -> None:
+        """Get client"""
+        return None
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Open sidecar database
+
+        :return: database connection
+        """
+        os.makedirs(self.path, exist_ok=True)
+        return sqlite3.connect(os.path.join(self.path, SIDECAR_FILE), check_same_thread=False)
+
+    def get_info(self, key: str) -> Optional[str]:
+        row = self._db.execute("SELECT value FROM info WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_info(self, key: str, value):
+        self._db.execute("INSERT OR REPLACE INTO info (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def load(self):
+        """Load store state: dimensions, rows count and tombstones"""
+        self.recover()
+
+        if self.get_info("dtype"):
+            self.dtype = self.get_info("dtype")
+        dim = self.get_info("dim")
+        self._dim = int(dim) if dim else None
+        if self._dim is None:
+            self._has_exact = self.dtype != "float32" and self.rerank > 0  # new store
+        else:
+            self._has_exact = self.get_info("exact") == "1"
+        self._count = int(self.get_info("count") or 0)
+        self._deleted = np.zeros(self._count, dtype=bool)
+        rows = [row for (row,) in self._db.execute("SELECT row FROM nodes WHERE deleted = 1")]
+        if rows:
+            self._deleted[rows] = True
+        if self._dim is not None:
+            self.open_matrix()
+
+    def recover(self):
+        """Finish or discard compaction interrupted before matrix files were replaced"""
+        pending = self.get_info("pending") == MATRIX_TMP_FILE
+        for file in [MATRIX_FILE, SCALES_FILE, EXACT_FILE]:
+            tmp_path = os.path.join(self.path, self.get_tmp_file(file))
+            if os.path.exists(tmp_path):
+                if pending:
+                    self.replace_array(file)  # sidecar already compacted
+                else:
+                    os.remove(tmp_path)  # compaction not committed
+        self.set_info("pending", "")
+        self._db.commit()
+
+    def get_tmp_file(self, file: str) -> str:
+        """
+        Get temporary file name used in compaction
+
+        :param file: array file name
+        :return: temporary file name
+        """
+        return os.path.splitext(file)[0] + ".tmp"
+
+    def get_arrays(self) -> dict:
+        """
+        Get arrays stored in files
+
+        :return: dict: attribute -> (file name, dtype, columns)
+        """
+        arrays = {
+            "_matrix": (MATRIX_FILE, self.dtype, self._dim),
+        }
+        if self.dtype == "int8":
+            arrays["_scales"] = (SCALES_FILE, "float32", 1)
+        if self._has_exact:
+            arrays["_exact"] = (EXACT_FILE, "float32", self._dim)
+        return arrays
+
+    def open_matrix(self, capacity: int = 0):
+        """
+        Map matrix files to memory, grow files if needed
+
+        :param capacity: min number of rows
+        """
+        self._capacity = None
+        for name, (file, dtype, cols) in self.get_arrays().items():
+            array = self.open_array(file, dtype, cols, capacity)
+            setattr(self, name, array)
+            rows = len(array) if array is not None else 0
+            self._capacity = rows if self._capacity is None else min(self._capacity, rows)
+
+    def open_array(self, file: str, dtype: str, cols: int, capacity: int = 0) -> Optional[np.ndarray]:
+        """
+        Map array file to memory, grow file if needed
+
+        :param file: file name
+        :param dtype: array type
+        :param cols: number of columns
+        :param capacity: min number of rows
+        :return: memory-mapped array or None if empty
+        """
+        path = os.path.join(self.path, file)
+        row_size = cols * np.dtype(dtype).itemsize
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if capacity * row_size > size:
+            with open(path, "ab") as f:
+                f.truncate(capacity * row_size)  # sparse file
+            size = capacity * row_size
+        rows = size // row_size
+        if rows == 0:
+            return None
+        return np.memmap(path, dtype=dtype, mode="r+", shape=(rows, cols))
+
+    def flush(self):
+        """Flush memory-mapped arrays"""
+        for name in self.get_arrays():
+            array = getattr(self, name)
+            if array is not None:
+                array.flush()
+
+    def reserve(self, rows: int):
+        """
+        Grow matrix to fit rows (append-only, capacity doubled)
+
+        :param rows: required number of rows
+        """
+        if rows <= self._capacity:
+            return
+        self.flush()
+        self.open_matrix(max(rows, self._capacity * 2, 1024))
+
+    def add(self, nodes: List[BaseNode], **add_kwargs: Any) -> List[str]:
+        """
+        Append nodes to store
+
+        :param nodes: nodes with embeddings
+        :return: list of node ids
+        """
+        if not nodes:
+            return []
+        embeddings = np.asarray([node.get_embedding() for node in nodes], dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        embeddings /= norms  # normalized, cosine similarity = dot product
+
+        with self._lock:
+            if self._dim is None:
+                self._dim = embeddings.shape[1]
+                self.set_info("dim", self._dim)
+                self.set_info("dtype", self.dtype)
+                self.set_info("exact", int(self._has_exact))
+            elif embeddings.shape[1] != self._dim:
+                raise ValueError("Embedding dimensions mismatch: {} != {}".format(embeddings.shape[1], self._dim))
+
+            start = self._count
+            end = start + len(nodes)
+            self.reserve(end)
+            if self.dtype == "int8":
+                self._matrix[start:end], self._scales[start:end, 0] = self.quantize(embeddings)
+            else:
+                self._matrix[start:end] = embeddings.astype(self.dtype)
+            if self._has_exact:
+                self._exact[start:end] = embeddings
+
+            # replace previous versions of nodes
+            ids = [node.node_id for node in nodes]
+            self.mark_deleted("node_id", ids)
+
+            rows = []
+            for i, node in enumerate(nodes):
+                metadata = node_to_metadata_dict(node, remove_text=False, flat_metadata=self.flat_metadata)
+                rows.append((start + i, node.node_id, node.ref_doc_id, json.dumps(metadata)))
+            self._db.executemany(
+                "INSERT INTO nodes (row, node_id, ref_doc_id, metadata) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._count = end
+            self._deleted = np.concatenate([self._deleted, np.zeros(len(nodes), dtype=bool)])
+            self.set_info("count", self._count)
+            self._db.commit()
+        return ids
+
+    def quantize(self, embeddings: np.ndarray) -> (np.ndarray, np.ndarray):
+        """
+        Quantize vectors to int8 with symmetric per-row scale
+
+        :param embeddings: float32 vectors
+        :return: int8 vectors, scales
+        """
+        scales = np.abs(embeddings).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        values = np.rint(embeddings / scales[:, None]).astype(np.int8)
+        return values, scales.astype(np.float32)
+
+    def score(self, rows, q: np.ndarray) -> np.ndarray:
+        """
+        Get approximate similarity scores of rows
+
+        :param rows: slice or array of rows
+        :param q: normalized query vector
+        :return: scores
+        """
+        scores = np.dot(self._matrix[rows].astype(np.float32), q)
+        if self.dtype == "int8":
+            scores *= self._scales[rows, 0]
+        return scores.astype(np.float32)
+
+    def mark_deleted(self, column: str, values: list):
+        """
+        Mark rows as deleted (tombstones)
+
+        :param column: column name (node_id or ref_doc_id)
+        :param values: column values
+        """
+        for i in range(0, len(values), 500):  # SQLite variables limit
+            chunk = values[i:i + 500]
+            where = "{} IN ({}) AND deleted = 0".format(column, ",".join("?" * len(chunk)))
+            rows = [row for (row,) in self._db.execute("SELECT row FROM nodes WHERE " + where, chunk)]
+            if rows:
+                self._db.execute("UPDATE nodes SET deleted = 1 WHERE " + where, chunk)
+                self._deleted[rows] = True
+
+    def delete(self, ref_doc_id: str, **delete_kwargs: Any) -> None:
+        """
+        Delete nodes of document
+
+        :param ref_doc_id: document id
+        """
+        with self._lock:
+            self.mark_deleted("ref_doc_id", [ref_doc_id])
+            self._db.commit()
+
+    def build_filter(self, filters: MetadataFilters) -> (str, list):
+        """
+        Build SQL condition from metadata filters
+
+        :param filters: metadata filters
+        :return: SQL condition, params
+        """
+        clauses = []
+        params = []
+        for item in filters.filters:
+            if isinstance(item, MetadataFilters):
+                sql, sub_params = self.build_filter(item)
+                clauses.append("(" + sql + ")")
+                params.extend(sub_params)
+                continue
+            field = "json_extract(metadata, ?)"
+            params.append('$."{}"'.format(item.key.replace('"', '\\"')))
+            operator = getattr(item, "operator", FilterOperator.EQ)
+            if operator in SQL_OPERATORS:
+                clauses.append("{} {} ?".format(field, SQL_OPERATORS[operator]))
+                params.append(item.value)
+            elif operator in [FilterOperator.IN, FilterOperator.NIN]:
+                values = item.value if isinstance(item.value, list) else [item.value]
+                clauses.append("{} {} ({})".format(
+                    field,
+                    "IN" if operator == FilterOperator.IN else "NOT IN",
+                    ",".join("?" * len(values)),
+                ))
+                params.extend(values)
+            elif operator == FilterOperator.TEXT_MATCH:
+                clauses.append("{} LIKE ?".format(field))
+                params.append("%" + str(item.value) + "%")
+            else:
+                raise ValueError("Unsupported filter operator: {}".format(operator))
+        condition = " OR " if filters.condition == FilterCondition.OR else " AND "
+        return condition.join(clauses) or "1", params
+
+    def get_candidates(self, query: VectorStoreQuery) -> Optional[np.ndarray]:
+        """
+        Get rows matching metadata filters, node and document ids (pre-filtering)
+
+        :param query: query
+        :return: array of rows or None if not filtered
+        """
+        if query.filters is None and not query.node_ids and not query.doc_ids:
+            return None
+        where = ["deleted = 0"]
+        params = []
+        if query.filters is not None:
+            sql, filter_params = self.build_filter(query.filters)
+            where.append("(" + sql + ")")
+            params.extend(filter_params)
+        for column, values in [("ref_doc_id", query.doc_ids), ("node_id", query.node_ids)]:
+            if values:
+                where.append("{} IN ({})".format(column, ",".join("?" * len(values))))
+                params.extend(values)
+        sql = "SELECT row FROM nodes WHERE " + " AND ".join(where) + " ORDER BY row"
+        return np.asarray([row for (row,) in self._db.execute(sql, params)], dtype=np.int64)
+
+    def query(self, query: VectorStoreQuery, **kwargs: Any) -> VectorStoreQueryResult:
+        """
+        Get top-k most similar nodes (cosine similarity)
+
+        :param query: query
+        :return: query result
+        """
+        if query.mode != VectorStoreQueryMode.DEFAULT:
+            raise ValueError("Invalid query mode: {}".format(query.mode))
+        with self._lock:
+            if self._dim is None or self._count == 0 or query.query_embedding is None:
+                return VectorStoreQueryResult(nodes=[], similarities=[], ids=[])
+            q = np.asarray(query.query_embedding, dtype=np.float32)
+            norm = np.linalg.norm(q)
+            if norm > 0:
+                q = q / norm
+            k = max(1, query.similarity_top_k)
+            top_k = k
+            if self._has_exact:
+                top_k = k * max(1, self.rerank)  # approximate candidates
+            candidates = self.get_candidates(query)
+            total = self._count if candidates is None else len(candidates)
+
+            best_scores = np.empty(0, dtype=np.float32)
+            best_rows = np.empty(0, dtype=np.int64)
+            for start in range(0, total, self.chunk_size):
+                end = min(start + self.chunk_size, total)
+                if candidates is None:
+                    rows = np.arange(start, end)
+                    scores = self.score(slice(start, end), q)
+                    scores[self._deleted[start:end]] = -np.inf
+                else:
+                    rows = candidates[start:end]
+                    scores = self.score(rows, q)
+                if len(scores) > top_k:
+                    top = np.argpartition(-scores, top_k - 1)[:top_k]
+                    scores = scores[top]
+                    rows = rows[top]
+                best_scores = np.concatenate([best_scores, scores])
+                best_rows = np.concatenate([best_rows, rows])
+                if len(best_scores) > top_k:
+                    top = np.argpartition(-best_scores, top_k - 1)[:top_k]
+                    best_scores = best_scores[top]
+                    best_rows = best_rows[top]
+
+            found = np.isfinite(best_scores)
+            best_scores = best_scores[found]
+            best_rows = best_rows[found]
+            if self._has_exact and len(best_rows) > 0:
+                best_rows = np.sort(best_rows)  # sequential reads
+                best_scores = np.dot(self._exact[best_rows], q).astype(np.float32)
+            order = np.argsort(-best_scores)[:k]
+            best_scores = best_scores[order]
+            best_rows = best_rows[order]
+
+            data = {}
+            rows = [int(row) for row in best_rows]
+            if rows:
+                sql = "SELECT row, node_id, metadata FROM nodes WHERE row IN ({})".format(",".join("?" * len(rows)))
+                for row, node_id, metadata in self._db.execute(sql, rows):
+                    data[row] = (node_id, metadata)
+
+        nodes = []
+        ids = []
+        similarities = []
+        for row, score in zip(rows, best_scores):
+            if row not in data:
+                continue
+            node_id, metadata = data[row]
+            nodes.append(metadata_dict_to_node(json.loads(metadata)))
+            ids.append(node_id)
+            similarities.append(float(score))
+        return VectorStoreQueryResult(nodes=nodes, similarities=similarities, ids=ids)
+
+    def count(self) -> int:
+        """
+        Count not deleted rows
+
+        :return: number of rows
+        """
+        return int(self._count - np.count_nonzero(self._deleted))
+
+    def compact(self):
+        """Remove deleted rows from matrix and sidecar"""
+        with self._lock:
+            if self._dim is None or not self._deleted.any():
+                return
+            live = np.flatnonzero(~self._deleted)
+            self.write_matrix(live)
+
+            # rows are renumbered in ascending order, new row is never greater than old
+            self._db.execute("DELETE FROM nodes WHERE deleted = 1")
+            self._db.executemany(
+                "UPDATE nodes SET row = ? WHERE row = ?",
+                [(new, int(old)) for new, old in enumerate(live) if new != old],
+            )
+            self.set_info("count", len(live))
+            self.set_info("pending", MATRIX_TMP_FILE)
+            self._db.commit()
+
+            for name in self.get_arrays():
+                setattr(self, name, None)
+            self.replace_matrix()
+            self.set_info("pending", "")
+            self._db.commit()
+            self._count = len(live)
+            self._deleted = np.zeros(self._count, dtype=bool)
+            self.open_matrix()
+
+    def write_matrix(self, rows: np.ndarray):
+        """
+        Write selected rows to temporary matrix files
+
+        :param rows: rows to copy (ascending)
+        """
+        for name, (file, dtype, cols) in self.get_arrays().items():
+            self.write_array(file, getattr(self, name), rows)
+
+    def write_array(self, file: str, array: np.ndarray, rows: np.ndarray):
+        """
+        Write selected rows of array to temporary file
+
+        :param file: array file name
+        :param array: source array
+        :param rows: rows to copy (ascending)
+        """
+        tmp = np.memmap(
+            os.path.join(self.path, self.get_tmp_file(file)),
+            dtype=array.dtype,
+            mode="w+",
+            shape=(max(len(rows), 1024), array.shape[1]),
+        )
+        for start in range(0, len(rows), self.chunk_size):
+            chunk = rows[start:start + self.chunk_size]
+            tmp[start:start + len(chunk)] = array[chunk]
+        tmp.flush()
+        del tmp
+
+    def replace_matrix(self):
+        """Replace matrix files with temporary matrix files"""
+        for file, dtype, cols in self.get_arrays().values():
+            self.replace_array(file)
+
+    def replace_array(self, file: str):
+        """
+        Replace array file with temporary file
+
+        :param file: array file name
+        """
+        tmp_path = os.path.join(self.path, self.get_tmp_file(file))
+        if os.path.exists(tmp_path):  # may be already replaced before interruption
+            os.replace(tmp_path, os.path.join(self.path, file))
+
+    def persist(self, persist_path: str = None, fs: Any = None) -> None:
+        """
+        Flush matrix and sidecar, compact if too many deleted rows
+
+        :param persist_path: not used, store is persisted in own directory
+        :param fs: not used
+        """
+        with self._lock:
+            self.flush()
+            self._db.commit()
+            if self._count > 0 and np.count_nonzero(self._deleted) / self._count > self.compact_ratio:
+                self.compact()
+
+    def close(self):
+        """Close store"""
+        with self._lock:
+            self.flush()
+            for name in self.get_arrays():
+                setattr(self, name, None)
+            self._db.close()
+
+
+class NumpyProvider(BaseStore):
+    def __init__(self, *args, **kwargs):
+        super(NumpyProvider, self).__init__(*args, **kwargs)
+        """
+        Local memory-mapped vector store provider (NumPy)
+
+        :param args: args
+        :param kwargs: kwargs
+        """
+        self.window = kwargs.get('window', None)
+        self.id = "NumpyVectorStore"
+        self.prefix = "numpy_"  # prefix for index directory
+        self.indexes = {}
+        self.stores = {}  # opened stores
+
+    def get_store(self, id: str) -> NumpyVectorStore:
+        """
+        Get opened vector store
+
+        :param id: index name
+        :return: vector store instance
+        """
+        if id not in self.stores:
+            args = parse_args(
+                self.window.core.config.get('llama.idx.storage.args', []),
+            )
+            self.stores[id] = NumpyVectorStore(
+                path=self.get_path(id),
+                **args
+            )
+        return self.stores[id]
+
+    def create(self, id: str):
+        """
+        Create empty index
+
+        :param id: index name
+        """
+        self.get_store(id)
+
+    def get(self, id: str, service_context: ServiceContext = None) -> BaseIndex:
+        """
+        Get index
+
+        :param id: index name
+        :param service_context: service context
+        :return: index instance
+        """
+        if not self.exists(id):
+            self.create(id)
+        vector_store = self.get_store(id)
+        self.indexes[id] = VectorStoreIndex.from_vector_store(
+            vector_store,
+            service_context=service_context,
+        )
+        return self.indexes[id]
+
+    def store(self, id: str, index: BaseIndex = None):
+        """
+        Store index
+
+        :param id: index name
+        :param index: index instance
+        """
+        self.get_store(id).persist()
+        if index is not None:
+            self.indexes[id] = index
+
+    def remove(self, id: str) -> bool:
+        """
+        Clear index
+
+        :param id: index name
+        :return: True if success
+        """
+        if id in self.stores:
+            self.stores[id].close()
+            del self.stores[id]
+        return super(NumpyProvider, self).remove(id)
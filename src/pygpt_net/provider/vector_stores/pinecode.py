@@ -6,18 +6,16 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.11 01:00:00                  #
+# Updated Date: 2024.03.20 12:00:00                  #
 # ================================================== #
 
 import datetime
 import os.path
 
-from pinecone import Pinecone, ServerlessSpec
-
 from llama_index.core import StorageContext
 from llama_index.core.indices.base import BaseIndex
 from llama_index.core.indices.service_context import ServiceContext
-from llama_index.vector_stores.pinecone import PineconeVectorStore
+from llama_index.core.vector_stores.types import BasePydanticVectorStore
 
 from pygpt_net.utils import parse_args
 from .base import BaseStore
@@ -55,6 +53,7 @@ class PinecodeProvider(BaseStore):
         for key in kwargs_additional:
             if key in allowed_additional:
                 spec_kwargs[key] = kwargs_additional[key]
+        from pinecone import ServerlessSpec
         spec = ServerlessSpec(**spec_kwargs)
 
         # base idx create kwargs
@@ -87,7 +86,7 @@ class PinecodeProvider(BaseStore):
             os.makedirs(path)
             self.store(id)
 
-    def get_client(self) -> Pinecone:
+    def get_client(self):
         """
         Get Pinecone client
 
@@ -101,9 +100,10 @@ class PinecodeProvider(BaseStore):
         )
         if "api_key" in kwargs_additional:
             base_kwargs["api_key"] = kwargs_additional["api_key"]
+        from pinecone import Pinecone
         return Pinecone(**base_kwargs)  # api_key argument is required
 
-    def get_store(self, id: str) -> PineconeVectorStore:
+    def get_store(self, id: str) -> BasePydanticVectorStore:
         """
         Get Pinecone store
 
@@ -118,6 +118,7 @@ class PinecodeProvider(BaseStore):
         if "index_name" in kwargs:
             name = kwargs["index_name"]
         pinecone_index = pc.Index(name)  # use base index name or custom name
+        from llama_index.vector_stores.pinecone import PineconeVectorStore
         return PineconeVectorStore(
             pinecone_index=pinecone_index,
         )
@@ -6,13 +6,17 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.11 01:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
 import os.path
+import threading
+
+from collections import OrderedDict
 
 from llama_index.core import StorageContext, load_index_from_storage
 from llama_index.core.indices.base import BaseIndex
+from llama_index.core.indices.registry import INDEX_STRUCT_TYPE_TO_INDEX_CLASS
 from llama_index.core.indices.service_context import ServiceContext
 
 from .base import BaseStore
@@ -31,6 +35,38 @@ class SimpleProvider(BaseStore):
         self.id = "SimpleVectorStore"
         self.prefix = ""  # prefix for index directory
         self.indexes = {}
+        self.cache = OrderedDict()  # resident indexes data (LRU): id -> {storage, struct, size, mtime, dirty}
+        self.lock = threading.RLock()
+
+    def get_cache_size(self) -> int:
+        """
+        Get max size of resident indexes
+
+        :return: max size in bytes, 0 if cache is disabled
+        """
+        size = None
+        if self.window is not None:
+            size = self.window.core.config.get('llama.idx.storage.cache.size')
+        if size is None:
+            return 0
+        return max(0, int(size)) * 1024 * 1024
+
+    def get_disk_info(self, id: str) -> (int, float):
+        """
+        Get size and last modification time of persisted index files
+
+        :param id: index name
+        :return: size in bytes, last modified time
+        """
+        size = 0
+        mtime = 0
+        path = self.get_path(id)
+        if os.path.isdir(path):
+            for file in os.listdir(path):
+                stat = os.stat(os.path.join(path, file))
+                size += stat.st_size
+                mtime = max(mtime, stat.st_mtime)
+        return size, mtime
 
     def create(self, id: str):
         """
@@ -56,27 +92,157 @@ class SimpleProvider(BaseStore):
         """
         if not self.exists(id):
             self.create(id)
-        path = self.get_path(id)
-        storage_context = StorageContext.from_defaults(
-            persist_dir=path,
-        )
-        self.indexes[id] = load_index_from_storage(
-            storage_context,
-            service_context=service_context,
-        )
+        with self.lock:
+            item = self.get_resident(id)
+            if item is not None:
+                # reuse resident storage and index struct, only service context is changed
+                index_cls = INDEX_STRUCT_TYPE_TO_INDEX_CLASS[item["struct"].get_type()]
+                self.indexes[id] = index_cls(
+                    index_struct=item["struct"],
+                    storage_context=item["storage"],
+                    service_context=service_context,
+                )
+            else:
+                storage_context = StorageContext.from_defaults(
+                    persist_dir=self.get_path(id),
+                )
+                self.indexes[id] = load_index_from_storage(
+                    storage_context,
+                    service_context=service_context,
+                )
+                self.cache_put(id, self.indexes[id])
         return self.indexes[id]
 
-    def store(self, id: str, index: BaseIndex = None):
+    def get_resident(self, id: str) -> dict or None:
+        """
+        Get resident index data if not modified on disk
+
+        :param id: index name
+        :return: dict with storage context and index struct or None if not loaded
+        """
+        if self.get_cache_size() <= 0:
+            self.flush()  # cache disabled, persist not stored changes before unloading
+            self.cache.clear()
+            return None
+        if id not in self.cache:
+            return None
+        item = self.cache[id]
+        if not item["dirty"] and self.get_disk_info(id)[1] != item["mtime"]:
+            del self.cache[id]  # modified on disk
+            return None
+        self.cache.move_to_end(id)
+        return item
+
+    def cache_put(self, id: str, index: BaseIndex, dirty: bool = False):
         """
-        Store index
+        Keep index data resident and evict least recently used if max size exceeded
 
         :param id: index name
         :param index: index instance
+        :param dirty: True if not persisted changes
         """
-        if index is None:
-            index = self.indexes[id]
-        path = self.get_path(id)
-        index.storage_context.persist(
-            persist_dir=path,
+        if self.get_cache_size() <= 0:
+            return
+        size, mtime = self.get_disk_info(id)
+        self.cache[id] = {
+            "storage": index.storage_context,
+            "struct": index.index_struct,
+            "size": size,  # persisted size as memory usage estimate
+            "mtime": mtime,
+            "dirty": dirty,
+        }
+        self.cache.move_to_end(id)
+        self.evict(keep=id)
+
+    def evict(self, keep: str = None):
+        """
+        Remove least recently used indexes from memory if max size exceeded
+
+        :param keep: index name to keep (currently used)
+        """
+        max_size = self.get_cache_size()
+        total = sum(item["size"] for item in self.cache.values())
+        for id in list(self.cache.keys()):
+            if total <= max_size:
+                break
+            if id == keep:
+                continue
+            item = self.cache.pop(id)
+            if item["dirty"]:
+                self.persist(id, item["storage"])
+            total -= item["size"]
+
+    def persist(self, id: str, storage_context: StorageContext):
+        """
+        Persist storage context to disk
+
+        :param id: index name
+        :param storage_context: storage context
+        """
+        storage_context.persist(
+            persist_dir=self.get_path(id),
         )
-        self.indexes[id] = index
+
+    def store(self, id: str, index: BaseIndex = None):
+        """
+        Store index (always persisted, inserts are made directly on index and are not tracked as dirty)
+
+        :param id: index name
+        :param index: index instance
+        """
+        with self.lock:
+            if index is None:
+                index = self.indexes[id]
+            self.persist(id, index.storage_context)
+            self.indexes[id] = index
+            self.cache_put(id, index)
+
+    def flush(self, id: str = None):
+        """
+        Persist not stored changes
+
+        :param id: index name or None to flush all indexes
+        """
+        with self.lock:
+            for key in list(self.cache.keys()):
+                if id is not None and key != id:
+                    continue
+                item = self.cache[key]
+                if item["dirty"]:
+                    self.persist(key, item["storage"])
+                    item["size"], item["mtime"] = self.get_disk_info(key)
+                    item["dirty"] = False
+
+    def remove(self, id: str) -> bool:
+        """
+        Clear index
+
+        :param id: index name
+        :return: True if success
+        """
+        with self.lock:
+            self.cache.pop(id, None)
+            return super(SimpleProvider, self).remove(id)
+
+    def remove_document(self, id: str, doc_id: str) -> bool:
+        """
+        Remove document from index (resident), changes are persisted on next store or flush
+
+        :param id: index name
+        :param doc_id: document ID
+        :return: True if success
+        """
+        with self.lock:
+            if self.get_resident(id) is not None and self.indexes.get(id) is not None:
+                index = self.indexes[id]  # shares storage and index struct with resident data
+            else:
+                index = self.get(id)
+            index.delete_ref_doc(doc_id)
+            if id not in self.cache:
+                self.store(
+                    id=id,
+                    index=index,
+                )  # cache disabled, persist now
+            else:
+                self.cache[id]["dirty"] = True
+        return True
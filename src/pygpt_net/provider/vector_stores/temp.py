@@ -6,10 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.11 01:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
 import os.path
+import threading
+import time
+
+from collections import OrderedDict
 
 from llama_index.core import StorageContext, load_index_from_storage
 from llama_index.core.indices.base import BaseIndex
@@ -32,6 +36,8 @@ class TempProvider(BaseStore):
         self.prefix = ""  # prefix for index directory
         self.indexes = {}
         self.persist = False
+        self.cache = OrderedDict()  # reusable indexes (LRU): id -> {scope, time (built), size}
+        self.lock = threading.RLock()
 
     def count(self) -> int:
         """
@@ -41,6 +47,110 @@ class TempProvider(BaseStore):
         """
         return len(self.indexes)
 
+    def get_cache_ttl(self) -> int:
+        """
+        Get time to keep reusable indexes
+
+        :return: TTL in seconds, 0 if cache is disabled
+        """
+        ttl = None
+        if self.window is not None:
+            ttl = self.window.core.config.get('llama.idx.tmp.cache.ttl')
+        if ttl is None:
+            return 0
+        return max(0, int(ttl))
+
+    def get_cache_size(self) -> int:
+        """
+        Get max size of reusable indexes
+
+        :return: max size in bytes
+        """
+        size = None
+        if self.window is not None:
+            size = self.window.core.config.get('llama.idx.tmp.cache.size')
+        if size is None:
+            return 0
+        return max(0, int(size)) * 1024 * 1024
+
+    def get_index_size(self, index: BaseIndex) -> int:
+        """
+        Estimate memory used by index (texts and embeddings)
+
+        :param index: index instance
+        :return: size in bytes
+        """
+        size = 0
+        for node in index.docstore.docs.values():
+            size += len(node.get_content())
+        data = getattr(index.vector_store, "_data", None)  # SimpleVectorStore data
+        embeddings = getattr(data, "embedding_dict", {})
+        for embedding in embeddings.values():
+            size += len(embedding) * 32  # list of Python floats
+        return size
+
+    def is_cached(self, id: str) -> bool:
+        """
+        Check if reusable index is kept in memory and not expired
+
+        :param id: index name
+        :return: True if index can be reused
+        """
+        with self.lock:
+            self.expire()
+            return id in self.cache and self.exists(id)
+
+    def keep(self, id: str, scope: str, index: BaseIndex = None):
+        """
+        Keep index in memory for reuse instead of cleaning it
+
+        :param id: index name
+        :param scope: index scope, older indexes with the same scope (e.g. previous version of file) are removed
+        :param index: index instance
+        """
+        if self.get_cache_ttl() <= 0:
+            self.clean(id)
+            return
+        with self.lock:
+            if index is not None:
+                self.store(id, index)
+            for key in [key for key, item in self.cache.items() if item["scope"] == scope and key != id]:
+                self.clean(key)
+            if id in self.cache and index is None:
+                self.cache.move_to_end(id)  # reused, expires at the same time as when built
+                return
+            self.cache[id] = {
+                "scope": scope,
+                "time": time.time(),  # build time, not refreshed on reuse
+                "size": self.get_index_size(self.indexes[id]),
+            }
+            self.cache.move_to_end(id)
+            self.expire()
+            self.evict(keep=id)
+
+    def expire(self):
+        """Remove indexes built earlier than TTL ago"""
+        ttl = self.get_cache_ttl()
+        now = time.time()
+        for id in [id for id, item in self.cache.items() if now - item["time"] > ttl]:
+            self.clean(id)
+
+    def evict(self, keep: str = None):
+        """
+        Remove least recently used indexes if max size exceeded
+
+        :param keep: index name to keep (currently used)
+        """
+        max_size = self.get_cache_size()
+        total = sum(item["size"] for item in self.cache.values())
+        for id in list(self.cache.keys()):
+            if total <= max_size:
+                break
+            if id == keep:
+                continue
+            total -= self.cache[id]["size"]
+            self.clean(id)
+
     def get_path(self, id: str) -> str:
         """
         Get database path
@@ -148,6 +258,8 @@ class TempProvider(BaseStore):
 
         :param id: index name
         """
+        with self.lock:
+            self.cache.pop(id, None)
         if not self.persist:
             if id in self.indexes:
                 del self.indexes[id]
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.02.24 00:00:00                  #
+# Updated Date: 2024.03.21 20:00:00                  #
 # ================================================== #
 
 from PySide6.QtCore import QTimer, Signal, Slot, QThreadPool, QEvent, Qt
@@ -15,6 +15,7 @@ from qt_material import QtStyleTools
 
 from pygpt_net.container import Container
 from pygpt_net.controller import Controller
+from pygpt_net.core.profiler import Profiler
 from pygpt_net.ui import UI
 from pygpt_net.utils import get_app_meta
 
@@ -56,22 +57,26 @@ class MainWindow(QMainWindow, QtStyleTools):
         self.meta = get_app_meta()
 
         # setup service container
-        self.core = Container(self)
-        self.core.init()
-        self.core.patch()  # patch version if needed
+        with Profiler.span("core.init"):
+            self.core = Container(self)
+            self.core.init()
+        with Profiler.span("core.patch"):
+            self.core.patch()  # patch version if needed
 
         # setup thread pool
         self.threadpool = QThreadPool()
 
         # setup controllers
-        self.controller = Controller(self)
+        with Profiler.span("controller.init"):
+            self.controller = Controller(self)
 
-        # init, load settings options, etc.
-        self.controller.init()
+            # init, load settings options, etc.
+            self.controller.init()
 
         # setup UI
-        self.ui = UI(self)
-        self.ui.init()
+        with Profiler.span("ui.init"):
+            self.ui = UI(self)
+            self.ui.init()
 
         # setup signals
         self.statusChanged.connect(self.update_status)
@@ -135,9 +140,12 @@ class MainWindow(QMainWindow, QtStyleTools):
 
     def setup(self):
         """Setup app"""
-        self.controller.setup()
-        self.controller.plugins.setup()
-        self.controller.post_setup()
+        with Profiler.span("controller.setup"):
+            self.controller.setup()
+        with Profiler.span("plugins.setup"):
+            self.controller.plugins.setup()
+        with Profiler.span("controller.post_setup"):
+            self.controller.post_setup()
 
     def post_setup(self):
         """Called after setup"""
@@ -162,6 +170,7 @@ class MainWindow(QMainWindow, QtStyleTools):
     def post_update(self):
         """Called on post-update (slow)"""
         self.controller.debug.on_update()
+        self.controller.idx.watcher.on_update()
         self.controller.plugins.on_post_update()
 
     @Slot(str)
@@ -207,6 +216,10 @@ class MainWindow(QMainWindow, QtStyleTools):
         self.controller.painter.save_all()
         print("Saving layout state...")
         self.controller.layout.save()
+        print("Stopping watcher...")
+        self.controller.idx.watcher.stop()
+        print("Saving indexes...")
+        self.core.idx.storage.flush()
         print("Stopping timers...")
         self.timer.stop()
         self.post_timer.stop()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.31 18:00:00                  #
+# Updated Date: 2024.03.22 10:00:00                  #
 # ================================================== #
 
 from PySide6.QtGui import QAction, QIcon
@@ -72,6 +72,21 @@ class IndexList(BaseList):
             lambda: self.action_truncate(event)
         )
 
+        actions['job_pause'] = QAction(QIcon(":/icons/close.svg"), trans('idx.job.pause'), self)
+        actions['job_pause'].triggered.connect(
+            lambda: self.action_job_pause(event)
+        )
+
+        actions['job_resume'] = QAction(QIcon(":/icons/search.svg"), trans('idx.job.resume'), self)
+        actions['job_resume'].triggered.connect(
+            lambda: self.action_job_resume(event)
+        )
+
+        actions['job_cancel'] = QAction(QIcon(":/icons/delete.svg"), trans('idx.job.cancel'), self)
+        actions['job_cancel'].triggered.connect(
+            lambda: self.action_job_cancel(event)
+        )
+
         menu = QMenu(self)
         menu.addAction(actions['edit'])
         menu.addAction(actions['idx_db_all'])
@@ -84,6 +99,17 @@ class IndexList(BaseList):
         idx = item.row()
         if idx >= 0:
             self.window.controller.idx.select(item.row())
+
+            # running or paused indexing jobs
+            name = self.window.core.idx.get_by_idx(idx)
+            statuses = [job["status"] for job in self.window.core.idx.jobs.get_by_idx(name)]
+            if statuses:
+                menu.addSeparator()
+                if "running" in statuses:
+                    menu.addAction(actions['job_pause'])
+                if "paused" in statuses:
+                    menu.addAction(actions['job_resume'])
+                menu.addAction(actions['job_cancel'])
             menu.exec_(event.globalPos())
 
     def action_idx_db_all(self, event):
@@ -119,6 +145,39 @@ class IndexList(BaseList):
         if idx >= 0:
             self.window.controller.idx.idx_files_all_by_idx(idx)
 
+    def action_job_pause(self, event):
+        """
+        Pause indexing job action handler
+
+        :param event: mouse event
+        """
+        item = self.indexAt(event.pos())
+        idx = item.row()
+        if idx >= 0:
+            self.window.controller.idx.pause_jobs_by_idx(idx)
+
+    def action_job_resume(self, event):
+        """
+        Resume indexing job action handler
+
+        :param event: mouse event
+        """
+        item = self.indexAt(event.pos())
+        idx = item.row()
+        if idx >= 0:
+            self.window.controller.idx.resume_jobs_by_idx(idx)
+
+    def action_job_cancel(self, event):
+        """
+        Cancel indexing job action handler
+
+        :param event: mouse event
+        """
+        item = self.indexAt(event.pos())
+        idx = item.row()
+        if idx >= 0:
+            self.window.controller.idx.cancel_jobs_by_idx(idx)
+
     def action_edit(self, event):
         """
         Edit action handler
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.21 18:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+
+from tests.mocks import mock_window
+from pygpt_net.controller.idx.watcher import Watcher
+
+
+def test_setup(mock_window):
+    """Test start watcher if enabled"""
+    watcher = Watcher(mock_window)
+    watcher.setup()
+    mock_window.core.idx.watcher.start.assert_not_called()
+    mock_window.core.config.set('llama.idx.watch', True)
+    watcher.setup()
+    mock_window.core.idx.watcher.start.assert_called_once()
+
+
+def test_on_update(mock_window):
+    """Test send changed paths to indexer"""
+    mock_window.core.config.set('llama.idx.watch.index', 'test')
+    mock_window.core.idx.watcher.is_running = MagicMock(return_value=True)
+    mock_window.core.idx.watcher.get_batch = MagicMock(return_value=["/fake/file.txt"])
+    watcher = Watcher(mock_window)
+    watcher.on_update()
+    mock_window.controller.idx.indexer.index_paths.assert_called_once_with(
+        ["/fake/file.txt"],
+        "test",
+        silent=True,
+    )
+    watcher.on_update()  # previous batch in progress
+    assert mock_window.controller.idx.indexer.index_paths.call_count == 1
+    watcher.on_finished()
+    watcher.on_update()
+    assert mock_window.controller.idx.indexer.index_paths.call_count == 2
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.27 19:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
 from unittest.mock import MagicMock
@@ -184,4 +184,42 @@ def test_handle_finished_file(mock_window):
     idx.handle_finished_file("base", files, [], True)
     idx.update_idx_status.assert_called_once_with("base")
     mock_window.core.idx.append.assert_called_once_with("base", files)
-    mock_window.controller.idx.after_index.assert_called_once_with("base")
\ No newline at end of file
+    mock_window.controller.idx.after_index.assert_called_once_with("base")
+
+def test_index_all_files_incremental(mock_window):
+    """Test index all files confirm without scanning changes in UI thread"""
+    idx = Indexer(mock_window)
+    mock_window.core.idx.indexing.is_incremental = MagicMock(return_value=True)
+    mock_window.core.idx.indexing.get_changes = MagicMock()
+    mock_window.ui.dialogs.confirm = MagicMock()
+    idx.index_all_files("base")
+    msg = mock_window.ui.dialogs.confirm.call_args.kwargs["msg"]
+    assert "only new and modified files will be indexed" in msg
+    mock_window.core.idx.indexing.get_changes.assert_not_called()  # scanned by worker
+
+
+def test_handle_finished_job(mock_window):
+    """Test handle finished file job (files are appended at checkpoints)"""
+    mock_window.update_status = MagicMock()
+    idx = Indexer(mock_window)
+    idx.update_idx_status = MagicMock()
+    mock_window.core.idx.append = MagicMock()
+    mock_window.controller.idx.after_index = MagicMock()
+    job = {
+        "type": "file",
+        "status": "finished",
+        "result": 1,
+    }
+    idx.handle_finished_job("base", job, [], True)
+    idx.update_idx_status.assert_called_once_with("base")
+    mock_window.core.idx.append.assert_not_called()
+
+
+def test_resume_jobs(mock_window):
+    """Test resume interrupted jobs on start"""
+    idx = Indexer(mock_window)
+    idx.start_job = MagicMock()
+    mock_window.core.config.data['llama.idx.jobs.resume'] = True
+    mock_window.core.idx.jobs.get_unfinished = MagicMock(return_value=[{"id": "job1", "idx": "base"}])
+    idx.resume_jobs()
+    idx.start_job.assert_called_once_with("job1", "base", True)
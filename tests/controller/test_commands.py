@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.15 10:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
 import os
@@ -73,3 +73,93 @@ def test_handle_finished(mock_window):
     event.ctx = ctx
     command.handle_finished(event)
     mock_window.ui.status.assert_called_once_with('')
+
+
+def test_dispatch_parallel(mock_window):
+    """Test dispatch parallel"""
+    command = Command(mock_window)
+    event = Event(Event.CMD_EXECUTE, {'commands': []})
+    command.dispatch_parallel(event)
+    mock_window.threadpool.start.assert_called_once()
+
+
+def test_worker_parallel(mock_window):
+    """Test parallel worker"""
+    command = Command(mock_window)
+    cmds = [
+        {"cmd": "read_file", "params": {"path": "a.txt"}},
+        {"cmd": "read_file", "params": {"path": "b.txt"}},
+    ]
+    mock_window.core.command.group_independent = MagicMock(return_value=[
+        [(0, cmds[0])],
+        [(1, cmds[1])],
+    ])
+    mock_window.core.config.data['cmd.parallel.workers'] = 2
+    mock_window.core.plugins.get_ids = MagicMock(return_value=['test'])
+    mock_window.controller.plugins.is_enabled = MagicMock(return_value=True)
+
+    def apply(id, event):
+        event.ctx.results.append({"request": event.data['commands'][0], "result": "OK"})
+        event.ctx.reply = True
+
+    mock_window.core.dispatcher.apply = apply
+    ctx = CtxItem()
+    event = Event(Event.CMD_EXECUTE, {'commands': cmds})
+    event.ctx = ctx
+    finished_signal = MagicMock()
+    command.worker_parallel(event, mock_window, finished_signal)
+    finished_signal.emit.assert_called_once_with(event)
+    assert [sub_ctx.cmds for sub_ctx in event.data['sub_ctx']] == [[cmds[0]], [cmds[1]]]
+    assert ctx.results == []  # merged in main thread
+
+
+def test_worker_parallel_error(mock_window):
+    """Test parallel worker emits finished with stop on error"""
+    command = Command(mock_window)
+    cmds = [{"cmd": "read_file", "params": {"path": "a.txt"}}]
+    mock_window.core.command.group_independent = MagicMock(return_value=[[(0, cmds[0])]])
+    mock_window.core.config.data['cmd.parallel.workers'] = 2
+    command.run_group = MagicMock(side_effect=Exception("error"))
+    event = Event(Event.CMD_EXECUTE, {'commands': cmds})
+    event.ctx = CtxItem()
+    finished_signal = MagicMock()
+    command.worker_parallel(event, mock_window, finished_signal)
+    finished_signal.emit.assert_called_once_with(event)
+    assert event.stop is True
+    assert event.data['sub_ctx'] == []
+    mock_window.core.debug.log.assert_called_once()
+
+
+def test_handle_finished_parallel(mock_window):
+    """Test handle_finished_parallel"""
+    command = Command(mock_window)
+    ctx = CtxItem()
+    sub_ctx1 = command.prepare_sub_ctx(ctx, {"cmd": "test1"})
+    sub_ctx1.results.append({"result": "1"})
+    sub_ctx1.reply = True
+    sub_ctx1.sub_extra.append({"post_update": ["file_explorer"]})
+    sub_ctx2 = command.prepare_sub_ctx(ctx, {"cmd": "test2"})
+    sub_ctx2.results.append({"result": "2"})
+    sub_ctx2.urls.append("https://example.com")
+    sub_ctx2.reply = True
+    event = Event(Event.CMD_EXECUTE, {'commands': [], 'sub_ctx': [sub_ctx1, sub_ctx2]})
+    event.ctx = ctx
+    command.handle_finished_parallel(event)
+    assert ctx.results == [{"result": "1"}, {"result": "2"}]
+    assert ctx.urls == ["https://example.com"]
+    assert ctx.reply is True
+    mock_window.controller.files.update_explorer.assert_called_once()
+    mock_window.core.dispatcher.reply.assert_called_once_with(ctx)
+
+
+def test_handle_finished_parallel_stopped(mock_window):
+    """Test handle_finished_parallel when stopped"""
+    command = Command(mock_window)
+    ctx = CtxItem()
+    event = Event(Event.CMD_EXECUTE, {'commands': [], 'sub_ctx': []})
+    event.ctx = ctx
+    event.stop = True
+    command.handle_finished_parallel(event)
+    mock_window.core.dispatcher.reply.assert_not_called()
+    mock_window.controller.chat.common.unlock_input.assert_called_once()
+    mock_window.stateChanged.emit.assert_called_once_with(mock_window.STATE_IDLE)
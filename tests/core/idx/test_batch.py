@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.22 00:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+from llama_index.core import Document, VectorStoreIndex
+from llama_index.core.embeddings import MockEmbedding
+from llama_index.core.node_parser import SentenceSplitter
+
+from tests.mocks import mock_window
+from pygpt_net.core.idx import Indexing
+from pygpt_net.core.idx.batch import Batch
+
+
+class FakeEmbedding(MockEmbedding):
+    """Embeddings provider counting batch API requests"""
+    calls: int = 0
+    error: str = None
+
+    def _get_text_embeddings(self, texts):
+        self.calls += 1
+        if self.error is not None:
+            raise Exception(self.error)
+        return super()._get_text_embeddings(texts)
+
+
+def create_index() -> VectorStoreIndex:
+    return VectorStoreIndex.from_documents(
+        [],
+        embed_model=FakeEmbedding(embed_dim=8),
+        transformations=[SentenceSplitter(tokenizer=str.split)],
+    )
+
+
+def test_is_enabled(mock_window):
+    """Test batching enabled only for vector store index"""
+    batch = Batch(mock_window, MagicMock())
+    mock_window.core.config.set("llama.idx.embeddings.batch", 0)
+    assert batch.is_enabled(create_index()) is False
+    mock_window.core.config.set("llama.idx.embeddings.batch", 10)
+    assert batch.is_enabled(create_index()) is True
+    assert batch.is_enabled(MagicMock()) is False
+
+
+def test_add_and_flush(mock_window):
+    """Test nodes from many documents are embedded and inserted in batches"""
+    mock_window.core.config.set("llama.idx.embeddings.batch", 3)
+    indexing = MagicMock()
+    batch = Batch(mock_window, indexing)
+    index = create_index()
+    index.insert_nodes = MagicMock(wraps=index.insert_nodes)
+    for i in range(5):
+        batch.add(index, Document(text="document {}".format(i), id_="doc{}".format(i)))
+
+    assert index.insert_nodes.call_count == 1  # flushed when 3 nodes collected
+    assert len(batch.nodes) == 2
+    assert batch.flush() == ["doc3", "doc4"]
+    assert index.insert_nodes.call_count == 2
+    assert index._embed_model.calls == 2
+    assert indexing.apply_rate_limit.call_count == 2  # rate limit per batch
+    assert len(index.index_struct.nodes_dict) == 5
+    assert set(index.ref_doc_info.keys()) == {"doc0", "doc1", "doc2", "doc3", "doc4"}
+    assert index.docstore.get_document_hash("doc0") is not None
+    assert batch.stats["requests"] == 2
+    assert index._embed_model.embed_batch_size == 10  # restored
+
+
+def test_flush_error(mock_window):
+    """Test failed batch"""
+    mock_window.core.config.set("llama.idx.embeddings.batch", 10)
+    batch = Batch(mock_window, MagicMock())
+    index = create_index()
+    index._embed_model.error = "API error"
+    batch.add(index, Document(text="document", id_="doc1"))
+    assert batch.flush() == []
+    errors, failed = batch.get_errors()
+    assert errors == ["API error"]
+    assert failed == ["doc1"]
+    assert batch.get_errors() == ([], [])
+
+
+def test_index_document_batched(mock_window):
+    """Test index document with batching"""
+    mock_window.core.config.set("llama.idx.embeddings.batch", 10)
+    mock_window.core.config.set("llama.idx.embeddings.limit.rpm", 0)
+    idx = Indexing(mock_window)
+    index = create_index()
+    index.insert = MagicMock()
+    indexed = {"file1.txt": "doc1", "file2.txt": "doc2"}
+    idx.index_document(index, Document(text="document", id_="doc1"))
+    idx.index_document(index, Document(text="document", id_="doc2"))
+    index.insert.assert_not_called()
+    assert idx.flush_documents(indexed) == []
+    assert len(index.index_struct.nodes_dict) == 2
+
+    idx.index_document(index, Document(text="document", id_="doc3"))
+    idx.batch.flush = MagicMock()  # simulate failed batch
+    idx.batch.failed = ["doc1"]
+    idx.batch.errors = ["API error"]
+    assert idx.flush_documents(indexed) == ["API error"]
+    assert indexed == {"file2.txt": "doc2"}
+
+
+def test_flush_lexical(mock_window):
+    """Test inserted nodes are added to lexical index of named index only"""
+    mock_window.core.config.set("llama.idx.embeddings.batch", 10)
+    batch = Batch(mock_window, MagicMock())
+    index = create_index()
+    batch.add(index, Document(text="document", id_="doc1"), "base")
+    batch.add(index, Document(text="document", id_="doc2"), "other")  # flush to previous index
+    mock_window.core.idx.lexical.add.assert_called_once()
+    assert mock_window.core.idx.lexical.add.call_args[0][0] == "base"
+    assert mock_window.core.idx.lexical.add.call_args[0][1][0].ref_doc_id == "doc1"
+    batch.flush()
+    assert mock_window.core.idx.lexical.add.call_args[0][0] == "other"
+
+    mock_window.core.idx.lexical.add.reset_mock()
+    batch.add(index, Document(text="document", id_="doc3"))  # temporary index
+    batch.flush()
+    mock_window.core.idx.lexical.add.assert_not_called()
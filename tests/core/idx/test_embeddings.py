@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.22 12:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock, patch
+from llama_index.core.embeddings import MockEmbedding
+
+from tests.mocks import mock_window
+from pygpt_net.core.idx.embeddings import EmbeddingsCache, CachedEmbedding, HashingEmbedding
+
+
+class FakeEmbedding(MockEmbedding):
+    """Embeddings provider counting embedded texts"""
+    texts: list = []
+
+    def _get_text_embeddings(self, texts):
+        self.texts.extend(texts)
+        return [[float(len(text))] * self.embed_dim for text in texts]
+
+
+def create_cache(mock_window, size: int = 10) -> EmbeddingsCache:
+    mock_window.core.config.set("llama.idx.embeddings.cache.size", size)
+    cache = EmbeddingsCache(mock_window)
+    cache.get_path = MagicMock(return_value=":memory:")
+    return cache
+
+
+def test_wrap(mock_window):
+    """Test wrap embeddings model"""
+    cache = create_cache(mock_window, 0)
+    embed_model = FakeEmbedding(embed_dim=4)
+    assert cache.wrap(embed_model, "openai") is embed_model  # disabled
+    mock_window.core.config.set("llama.idx.embeddings.cache.size", 10)
+    wrapped = cache.wrap(embed_model, "openai")
+    assert isinstance(wrapped, CachedEmbedding)
+    assert wrapped.get_model() is embed_model
+    assert wrapped.model_name == embed_model.model_name
+
+
+def test_get_text_embeddings(mock_window):
+    """Test only not cached texts are embedded"""
+    cache = create_cache(mock_window)
+    embed_model = FakeEmbedding(embed_dim=4, texts=[])
+    wrapped = cache.wrap(embed_model, "openai")
+    with patch("os.makedirs"):
+        assert wrapped.get_text_embedding_batch(["a", "bb"]) == [[1.0] * 4, [2.0] * 4]
+        assert wrapped.get_text_embedding_batch(["bb", "ccc", "ccc"]) == [[2.0] * 4, [3.0] * 4, [3.0] * 4]
+    assert embed_model.texts == ["a", "bb", "ccc"]
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["size"] == 3 * 4 * 4
+
+
+def test_key(mock_window):
+    """Test key depends on provider, model and text"""
+    cache = EmbeddingsCache(mock_window)
+    key = cache.get_key("openai", "model", "text")
+    assert key == cache.get_key("openai", "model", "text")
+    assert key != cache.get_key("openai", "model2", "text")
+    assert key != cache.get_key("ollama", "model", "text")
+    assert key != cache.get_key("openai", "model", "text2")
+
+
+def test_evict(mock_window):
+    """Test least recently used embeddings are removed"""
+    cache = create_cache(mock_window, 1)
+    vector = [0.0] * 65536  # 256 KB
+    with patch("os.makedirs"), patch("time.time") as mock_time:
+        for i in range(4):
+            mock_time.return_value = i
+            cache.set_many({"key" + str(i): vector})
+        mock_time.return_value = 10
+        assert list(cache.get_many(["key0"]).keys()) == ["key0"]  # mark as used
+        cache.set_many({"key4": vector})  # exceeds 1 MB
+        assert cache.stats["evicted"] == 2
+        assert cache.size == 3 * 65536 * 4
+        assert sorted(cache.get_many(["key0", "key1", "key2", "key3", "key4"]).keys()) == ["key0", "key3", "key4"]
+
+
+def test_hashing_embedding():
+    """Test local hashing embeddings: deterministic, normalized, similar for shared terms"""
+    model = HashingEmbedding(dim=256)
+    a, b, c = model.get_text_embedding_batch([
+        "Function get_file_reader loads files",
+        "get file reader",
+        "Audio output plugin",
+    ])
+    assert len(a) == 256
+    assert abs(sum(v * v for v in a) - 1.0) < 1e-5
+    assert HashingEmbedding(dim=256).get_query_embedding("get file reader") == b  # stable across instances
+    sim_b = sum(x * y for x, y in zip(a, b))
+    sim_c = sum(x * y for x, y in zip(a, c))
+    assert sim_b > 0.5
+    assert sim_b > sim_c
+    assert model.get_text_embedding("") == [0.0] * 256
+
+
+def test_wrap_hashing(mock_window):
+    """Test local embeddings are not cached"""
+    cache = create_cache(mock_window)
+    model = HashingEmbedding()
+    assert cache.wrap(model, "local") is model
@@ -6,15 +6,19 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.03 22:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+from llama_index.core import VectorStoreIndex
+from llama_index.core.embeddings import MockEmbedding
+from llama_index.core.node_parser import SentenceSplitter
 
 from pygpt_net.item.ctx import CtxItem
 from pygpt_net.item.model import ModelItem
 from tests.mocks import mock_window
 from pygpt_net.core.idx import Chat
+from pygpt_net.provider.vector_stores import Storage
 
 
 def test_call(mock_window):
@@ -139,3 +143,95 @@ def test_get_custom_prompt(mock_window):
     chat = Chat(mock_window)
     custom = chat.get_custom_prompt("test")
     assert custom is not None
+
+
+def test_get_query_engine_hybrid(mock_window):
+    """Test query and chat engines use hybrid retriever if enabled"""
+    index = MagicMock()
+    chat = Chat(mock_window)
+    chat.get_query_engine(index, "base", streaming=False)
+    index.as_query_engine.assert_called_once_with(streaming=False)
+    chat.get_chat_engine(index, "base", system_prompt="test")
+    index.as_chat_engine.assert_called_once_with(chat_mode="context", system_prompt="test")
+
+    mock_window.core.config.set("llama.idx.hybrid", True)
+    retriever = MagicMock()
+    mock_window.core.idx.lexical.get_retriever = MagicMock(return_value=retriever)
+    with patch("pygpt_net.core.idx.chat.RetrieverQueryEngine.from_args") as from_args, \
+            patch("pygpt_net.core.idx.chat.ContextChatEngine.from_defaults") as from_defaults:
+        chat.get_query_engine(index, "base", streaming=True)
+        chat.get_chat_engine(index, "base", system_prompt="test")
+    mock_window.core.idx.lexical.get_retriever.assert_called_with(index, "base")
+    from_args.assert_called_once_with(retriever, service_context=index.service_context, streaming=True)
+    from_defaults.assert_called_once_with(
+        retriever=retriever,
+        service_context=index.service_context,
+        system_prompt="test",
+    )
+
+
+def test_query_file_reuse(mock_window):
+    """Test temporary index is reused until file is modified"""
+    mock_window.core.config.data["llama.idx.tmp.cache.ttl"] = 600
+    mock_window.core.config.data["llama.idx.tmp.cache.size"] = 128
+    mock_window.core.idx.indexing.index_files = MagicMock(return_value=(["file.txt"], []))
+    storage = Storage(mock_window)
+    storage.tmp_storage.index_from_empty = MagicMock(
+        side_effect=lambda: VectorStoreIndex(
+            [],
+            embed_model=MockEmbedding(embed_dim=8),
+            transformations=[SentenceSplitter(tokenizer=str.split)],
+        )
+    )
+    chat = Chat(mock_window, storage)
+    chat.query_tmp = MagicMock(return_value="response")
+    model = ModelItem()
+    model.id = "gpt-4"
+    with patch.object(chat, "get_file_version", return_value=[1.0, 100]):
+        assert chat.query_file(CtxItem(), "file.txt", "query 1", model) == "response"
+        assert chat.query_file(CtxItem(), "file.txt", "query 2", model) == "response"
+    assert mock_window.core.idx.indexing.index_files.call_count == 1
+    assert storage.count_tmp() == 1
+
+    with patch.object(chat, "get_file_version", return_value=[2.0, 120]):  # modified
+        chat.query_file(CtxItem(), "file.txt", "query 3", model)
+    assert mock_window.core.idx.indexing.index_files.call_count == 2
+    assert storage.count_tmp() == 1  # previous version removed
+
+    mock_window.core.config.data["llama.idx.tmp.cache.ttl"] = 0  # disabled
+    with patch.object(chat, "get_file_version", return_value=[3.0, 120]):
+        chat.query_file(CtxItem(), "file.txt", "query 3", model)
+        chat.query_file(CtxItem(), "file.txt", "query 5", model)
+    assert mock_window.core.idx.indexing.index_files.call_count == 4
+    assert storage.count_tmp() == 0
+
+
+def test_query_web_reuse(mock_window):
+    """Test temporary web index is reused until TTL from build without any request"""
+    mock_window.core.config.data["llama.idx.tmp.cache.ttl"] = 600
+    mock_window.core.config.data["llama.idx.tmp.cache.size"] = 128
+    mock_window.core.idx.indexing.index_urls = MagicMock(return_value=(1, []))
+    storage = Storage(mock_window)
+    storage.tmp_storage.index_from_empty = MagicMock(
+        side_effect=lambda: VectorStoreIndex(
+            [],
+            embed_model=MockEmbedding(embed_dim=8),
+            transformations=[SentenceSplitter(tokenizer=str.split)],
+        )
+    )
+    chat = Chat(mock_window, storage)
+    chat.query_tmp = MagicMock(return_value="response")
+    model = ModelItem()
+    model.id = "gpt-4"
+    with patch("requests.Session.request") as request:
+        assert chat.query_web(CtxItem(), "webpage", "https://example.com", {}, "query 1", model) == "response"
+        assert chat.query_web(CtxItem(), "webpage", "https://example.com", {}, "query 2", model) == "response"
+    request.assert_not_called()
+    mock_window.core.fetch.get.assert_not_called()
+    assert mock_window.core.idx.indexing.index_urls.call_count == 1
+    assert storage.count_tmp() == 1
+
+    storage.tmp_storage.cache[list(storage.tmp_storage.cache.keys())[0]]["time"] -= 601  # expired
+    chat.query_web(CtxItem(), "webpage", "https://example.com", {}, "query 3", model)
+    assert mock_window.core.idx.indexing.index_urls.call_count == 2  # rebuilt
+    assert storage.count_tmp() == 1
@@ -6,12 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.02.27 04:00:00                  #
+# Updated Date: 2024.03.21 16:00:00                  #
 # ================================================== #
 
 import os
 import platform
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from packaging.version import Version
 
@@ -363,6 +363,52 @@ def test_append(mock_window):
     assert idx.items["test_store"]["base"].items["file.txt"]["id"] == "61f210f3-5635-49b8-95f4-ebc998d53c2f"
 
 
+def test_append_manifest(mock_window):
+    """
+    Test append with file manifest
+    """
+    idx = Idx(mock_window)
+    mock_window.core.config.set("llama.idx.storage", "test_store")
+    idx.items = {
+        "test_store": {
+            "base": IndexItem(),
+        }
+    }
+    idx.files.get_stat = MagicMock(return_value={"size": 10, "mtime": 100, "hash": "abc"})
+    idx.files.provider = MagicMock()
+    idx.files.provider.append_file = MagicMock(return_value=1)
+    idx.append(idx="base", files={
+        "file.txt": "test_id"
+    })
+    data = idx.files.provider.append_file.call_args.kwargs["data"]
+    assert data["size"] == 10
+    assert data["mtime"] == 100
+    assert data["hash"] == "abc"
+    assert idx.items["test_store"]["base"].items["file.txt"]["hash"] == "abc"
+
+
+def test_files_compare(mock_window):
+    """
+    Test compare file with manifest
+    """
+    files = Files(mock_window, MagicMock())
+    files.get_hash = MagicMock(return_value="abc")
+    item = {"size": 10, "mtime": 100, "hash": "abc"}
+    stat = MagicMock()
+    stat.st_size = 10
+    stat.st_mtime_ns = 100
+    with patch("os.stat", return_value=stat):
+        assert files.compare("file.txt", item) == "unchanged"
+        files.get_hash.assert_not_called()  # not hashed if size and mtime not changed
+        stat.st_mtime_ns = 200
+        assert files.compare("file.txt", item) == "touched"
+        files.get_hash.return_value = "def"
+        assert files.compare("file.txt", item) == "modified"
+        stat.st_size = 20
+        assert files.compare("file.txt", item) == "modified"
+        assert files.compare("file.txt", {"size": None, "mtime": None}) == "modified"
+
+
 def test_clear(mock_window):
     """
     Test clear
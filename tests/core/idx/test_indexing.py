@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.13 01:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
 import os
@@ -16,6 +16,7 @@ from llama_index.core import Document
 
 from tests.mocks import mock_window
 from pygpt_net.core.idx import Indexing
+from pygpt_net.provider.loaders.base import BaseLoader, LazyReader
 
 
 def test_get_online_loader(mock_window):
@@ -32,6 +33,86 @@ def test_get_online_loader(mock_window):
     assert idx.get_online_loader("pdf") == loader
 
 
+def test_register_loader_lazy(mock_window):
+    """Test register loader without reader initialization"""
+    idx = Indexing(mock_window)
+    idx.get_loader_arguments = MagicMock(return_value={"foo": "bar"})
+    mock_window.core.config.is_compiled = MagicMock(return_value=False)
+    mock_window.core.platforms.is_snap = MagicMock(return_value=False)
+    loader = BaseLoader()
+    loader.id = "test"
+    loader.extensions = ["pdf", "txt"]
+    loader.type = ["file", "web"]
+    reader = MagicMock()
+    loader.get = MagicMock(return_value=reader)
+    idx.register_loader(loader)
+    loader.get.assert_not_called()
+    assert isinstance(idx.loaders["file"]["pdf"], LazyReader)
+    assert idx.loaders["file"]["pdf"] is idx.loaders["file"]["txt"]
+    assert isinstance(idx.loaders["web"]["test"], LazyReader)
+
+    idx.loaders["file"]["pdf"].load_data(file="file.pdf")
+    idx.loaders["file"]["txt"].load_data(file="file.txt")
+    loader.get.assert_called_once()  # reader created once, on first use
+    assert loader.args == {"foo": "bar"}
+    assert reader.load_data.call_count == 2
+
+
+def test_get_file_reader_import_error(mock_window):
+    """Test get file reader if reader dependencies are missing"""
+    idx = Indexing(mock_window)
+    loader = BaseLoader()
+    loader.id = "test"
+    loader.get = MagicMock(side_effect=ImportError("missing"))
+    reader = LazyReader(loader, {})
+    idx.loaders["file"]["pdf"] = reader
+    idx.loaders["file"]["docx"] = reader
+    assert idx.get_file_reader("pdf") is None
+    assert "pdf" not in idx.loaders["file"]
+    assert "docx" not in idx.loaders["file"]
+    assert idx.get_file_reader("xyz") is None
+
+
+def test_register_loader_missing_dependencies(mock_window):
+    """Test web loader with missing dependencies is not registered and its commands are not advertised"""
+    idx = Indexing(mock_window)
+    idx.get_loader_arguments = MagicMock(return_value={})
+    mock_window.core.config.is_compiled = MagicMock(return_value=False)
+    mock_window.core.platforms.is_snap = MagicMock(return_value=False)
+    loader = BaseLoader()
+    loader.id = "test"
+    loader.type = ["web"]
+    loader.instructions = [{"test_cmd": {"description": "test"}}]
+    loader.requires = ["json"]
+    idx.register_loader(loader)
+    assert "test" in idx.loaders["web"]
+    assert "test_cmd" in idx.get_external_instructions()
+
+    loader.requires = ["json", "pygpt_missing_module"]
+    idx.register_loader(loader)  # reload
+    assert "test" not in idx.loaders["web"]
+    assert "test_cmd" not in idx.get_external_instructions()
+
+    loader.requires = ["pygpt_missing_package.module"]
+    assert loader.is_available() is False
+
+
+def test_get_web_reader_import_error(mock_window):
+    """Test get web reader if reader dependencies are missing"""
+    idx = Indexing(mock_window)
+    loader = BaseLoader()
+    loader.id = "test"
+    loader.instructions = [{"test_cmd": {"description": "test"}}]
+    loader.get = MagicMock(side_effect=ImportError("missing"))
+    idx.data_providers["test"] = loader
+    idx.loaders["web"]["test"] = LazyReader(loader, {})
+    idx.external_instructions["test_cmd"] = {"description": "test"}
+    assert idx.get_web_reader("test") is None
+    assert "test" not in idx.loaders["web"]
+    assert "test_cmd" not in idx.get_external_instructions()
+    assert idx.get_web_reader("xyz") is None
+
+
 def test_get_documents(mock_window):
     """Test get documents"""
     idx = Indexing(mock_window)
@@ -168,11 +249,180 @@ def test_index_db_by_meta_id(mock_window):
 def test_index_db_from_updated_ts(mock_window):
     """Test index db from updated ts"""
     idx = Indexing(mock_window)
-    idx.index_db_by_meta_id = MagicMock(return_value=(1, []))
-    idx.get_db_meta_ids_from_ts = MagicMock(return_value=[123])
     doc = Document()
-    idx.index_documents = MagicMock()
+    doc.metadata = {"ctx_id": 123}
+    idx.get_db_data_from_ts = MagicMock(return_value=[doc])
+    idx.index_document = MagicMock()
+    idx.flush_documents = MagicMock(return_value=[])
     index = MagicMock()
     indexed, errors = idx.index_db_from_updated_ts("base", index, 123)
     assert indexed == 1
     assert errors == []
+    idx.get_db_data_from_ts.assert_called_once_with(123)
+
+
+def test_index_db_documents_bulk(mock_window):
+    """Test ctx metas are updated once per batch"""
+    mock_window.core.config.data["llama.idx.embeddings.batch"] = 2
+    idx = Indexing(mock_window)
+    docs = []
+    for i, meta_id in enumerate([1, 1, 2, 2, 2]):
+        doc = Document(text="text {}".format(i), id_="doc{}".format(i), metadata={"ctx_id": meta_id})
+        docs.append(doc)
+
+    def flush(indexed: dict) -> list:
+        indexed.pop("doc3", None)  # failed
+        return []
+
+    idx.index_document = MagicMock()
+    idx.flush_documents = MagicMock(side_effect=flush)
+    indexed, errors = idx.index_db_documents("base", MagicMock(), docs)
+    assert indexed == 4
+    calls = mock_window.core.ctx.idx.set_meta_as_indexed_bulk.call_args_list
+    assert [call[0][1] for call in calls] == [
+        {1: ["doc0", "doc1"]},
+        {2: ["doc2"]},  # doc3 not inserted
+        {2: ["doc4"]},
+    ]
+
+
+def test_apply_tokens_limit(mock_window):
+    """Test TPM limit"""
+    idx = Indexing(mock_window)
+    mock_window.core.config.set("llama.idx.embeddings.limit.tpm", 100)
+    mock_window.core.tokens.from_str = MagicMock(return_value=30)
+    with patch("time.time", return_value=1000.0), patch("time.sleep") as mock_sleep:
+        idx.apply_tokens_limit(["a", "b"])  # 60 tokens
+        mock_sleep.assert_not_called()
+        idx.apply_tokens_limit(["c", "d"])  # 120 tokens > 100, wait for first call to expire
+        mock_sleep.assert_called_once_with(60.0)
+    assert len(idx.tokens_calls) == 2
+
+
+def test_index_files_recursive_file_id(mock_window):
+    """Test file id of files in subdirectories"""
+    index = MagicMock()
+    idx = Indexing(mock_window)
+    idx.get_documents = MagicMock(return_value=[])
+    idx.remove_old_file = MagicMock()
+    mock_window.core.idx.files.get_id = MagicMock(side_effect=lambda path: "id:" + path)
+    with patch('os.path.isdir', return_value=True), \
+            patch('os.walk', return_value=[('/fake', [], ['file1.txt'])]):
+        idx.index_files_recursive("base", index, "/fake")
+    idx.remove_old_file.assert_called_once_with("base", "id:" + os.path.join('/fake', 'file1.txt'))
+
+
+def test_get_changes(mock_window):
+    """Test compare directory with indexed files manifest"""
+    idx = Indexing(mock_window)
+    fake_path = os.path.normpath('/fake/directory')
+    items = {
+        "modified.txt": {"id": "doc1", "path": os.path.join(fake_path, 'modified.txt')},
+        "unchanged.txt": {"id": "doc2", "path": os.path.join(fake_path, 'unchanged.txt')},
+        "removed.txt": {"id": "doc3", "path": os.path.join(fake_path, 'removed.txt')},
+        "other.txt": {"id": "doc4", "path": os.path.normpath('/other/other.txt')},
+    }
+    mock_window.core.idx.get_idx_data = MagicMock(return_value={"base": items})
+    mock_window.core.idx.files.get_id = MagicMock(side_effect=lambda path: os.path.basename(path))
+    mock_window.core.idx.files.compare = MagicMock(
+        side_effect=lambda path, item: "modified" if path.endswith("modified.txt") else "unchanged"
+    )
+    fake_files = ['new.txt', 'modified.txt', 'unchanged.txt']
+    with patch('os.listdir', return_value=fake_files), \
+            patch('os.path.isfile', return_value=True), \
+            patch('os.path.exists', side_effect=lambda path: not path.endswith("removed.txt")):
+        changes = idx.get_changes("base", fake_path)
+
+    assert changes["new"] == [os.path.join(fake_path, 'new.txt')]
+    assert changes["modified"] == [os.path.join(fake_path, 'modified.txt')]
+    assert changes["unchanged"] == [os.path.join(fake_path, 'unchanged.txt')]
+    assert list(changes["removed"].keys()) == ["removed.txt"]
+    assert idx.get_changes_summary(changes) == {"new": 1, "modified": 1, "removed": 1, "unchanged": 1}
+
+
+def test_index_files_incremental(mock_window):
+    """Test index only new and modified files"""
+    mock_window.core.config.set("llama.idx.incremental", True)
+    index = MagicMock()
+    idx = Indexing(mock_window)
+    doc = Document()
+    doc.id_ = "test_id"
+    idx.get_documents = MagicMock(return_value=[doc])
+    idx.remove_old_file = MagicMock()
+    fake_path = '/fake/directory'
+    changes = {
+        "new": [os.path.join(fake_path, 'file1.txt')],
+        "modified": [os.path.join(fake_path, 'file2.txt')],
+        "touched": [],
+        "unchanged": [os.path.join(fake_path, 'file3.txt')],
+        "removed": {},
+    }
+    idx.get_changes = MagicMock(return_value=changes)
+    idx.apply_changes = MagicMock()
+    with patch('os.path.isdir', return_value=True), \
+            patch('os.listdir', return_value=['file1.txt', 'file2.txt', 'file3.txt']), \
+            patch('os.path.isfile', return_value=True):
+        indexed, errors = idx.index_files("base", index, fake_path)
+    assert indexed == {
+        os.path.join(fake_path, 'file1.txt'): 'test_id',
+        os.path.join(fake_path, 'file2.txt'): 'test_id',
+    }
+    idx.apply_changes.assert_called_once_with("base", index, changes)
+
+
+def test_apply_changes(mock_window):
+    """Test remove deleted files and update touched files manifest"""
+    index = MagicMock()
+    idx = Indexing(mock_window)
+    items = {
+        "removed.txt": {"id": "doc1", "path": "/fake/removed.txt"},
+        "touched.txt": {"id": "doc2", "db_id": 2, "path": "/fake/touched.txt", "indexed_ts": 123},
+    }
+    mock_window.core.idx.get_current_store = MagicMock(return_value="SimpleVectorStore")
+    mock_window.core.idx.get_idx_data = MagicMock(return_value={"base": items})
+    mock_window.core.idx.files.get_id = MagicMock(side_effect=lambda path: os.path.basename(path))
+    mock_window.core.idx.files.get_stat = MagicMock(return_value={"size": 1, "mtime": 2, "hash": "abc"})
+    changes = {
+        "new": [],
+        "modified": [],
+        "touched": ["/fake/touched.txt"],
+        "unchanged": [],
+        "removed": {"removed.txt": items["removed.txt"]},
+    }
+    idx.apply_changes("base", index, changes)
+    index.delete_ref_doc.assert_called_once_with("doc1", delete_from_docstore=True)
+    mock_window.core.idx.files.remove.assert_called_once_with("SimpleVectorStore", "base", "doc1")
+    mock_window.core.idx.storage.store.assert_called_once_with(id="base", index=index)
+    mock_window.core.idx.files.update.assert_called_once_with(
+        id=2,
+        doc_id="doc2",
+        ts=123,
+        stat={"size": 1, "mtime": 2, "hash": "abc"},
+    )
+    assert list(items.keys()) == ["touched.txt"]
+    assert items["touched.txt"]["hash"] == "abc"
+
+
+def test_index_paths(mock_window):
+    """Test index changed paths"""
+    index = MagicMock()
+    idx = Indexing(mock_window)
+    items = {
+        "modified.txt": {"id": "doc1", "path": "/fake/modified.txt"},
+        "removed.txt": {"id": "doc2", "path": "/fake/removed.txt"},
+        "dir_file.txt": {"id": "doc3", "path": "/fake/dir/dir_file.txt"},
+    }
+    mock_window.core.idx.get_idx_data = MagicMock(return_value={"base": items})
+    mock_window.core.idx.files.get_id = MagicMock(side_effect=lambda path: os.path.basename(path))
+    mock_window.core.idx.files.compare = MagicMock(return_value="modified")
+    idx.apply_changes = MagicMock()
+    idx.index_files_list = MagicMock(return_value=({}, []))
+    paths = ["/fake/new.txt", "/fake/modified.txt", "/fake/removed.txt", "/fake/dir"]
+    with patch('os.path.isdir', return_value=False), \
+            patch('os.path.isfile', side_effect=lambda path: path in ["/fake/new.txt", "/fake/modified.txt"]):
+        idx.index_paths("base", index, paths)
+    changes = idx.apply_changes.call_args.args[2]
+    assert changes["new"] == ["/fake/new.txt"]
+    assert changes["modified"] == ["/fake/modified.txt"]
+    assert sorted(changes["removed"].keys()) == ["dir_file.txt", "removed.txt"]
+    idx.index_files_list.assert_called_once_with("base", index, ["/fake/new.txt", "/fake/modified.txt"])
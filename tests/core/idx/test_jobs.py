@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.23 10:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock, patch
+from llama_index.core import Document
+
+from tests.mocks import mock_window
+from pygpt_net.core.idx.jobs import Jobs
+
+
+def get_jobs(mock_window) -> Jobs:
+    jobs = Jobs(mock_window)
+    jobs.loaded = True
+    jobs.save = MagicMock()
+    mock_window.core.config.data["llama.idx.jobs.checkpoint"] = 2
+    mock_window.core.idx.indexing.embed_calls = 0
+    return jobs
+
+
+def test_run_files_checkpoints(mock_window):
+    """Test file job: files indexed in chunks, index stored and manifest appended at store interval"""
+    jobs = get_jobs(mock_window)
+    jobs.store_items = 4
+    indexing = mock_window.core.idx.indexing
+    indexing.pipeline.is_enabled = MagicMock(return_value=False)
+
+    def index_files_list(idx, index, files):
+        indexing.embed_calls += len(files)
+        return {f: "doc_" + f for f in files}, []
+
+    indexing.index_files_list = MagicMock(side_effect=index_files_list)
+    indexing.flush_documents = MagicMock(return_value=[])
+    job = jobs.create("file", "base", "/data")
+    jobs.get_files = MagicMock(return_value=["/data/a", "/data/b", "/data/c", "/data/d", "/data/e"])
+    progress = []
+    with patch("pygpt_net.core.idx.jobs.os.path.isdir", return_value=False), \
+            patch("pygpt_net.core.idx.jobs.os.path.getsize", return_value=10):
+        result = jobs.run(job["id"], progress.append)
+
+    assert result["status"] == Jobs.STATUS_FINISHED
+    assert result["result"] == 5
+    assert result["checkpoint"] is None
+    assert result["stats"]["done"] == 5
+    assert result["stats"]["bytes"] == 50
+    assert result["stats"]["embed_calls"] == 5
+    assert indexing.index_files_list.call_count == 3
+    assert mock_window.core.idx.storage.store.call_count == 2  # after 4 items and at the end
+    mock_window.core.idx.append.assert_any_call("base", {f: "doc_" + f for f in ["/data/a", "/data/b", "/data/c", "/data/d"]})
+    mock_window.core.idx.append.assert_called_with("base", {"/data/e": "doc_/data/e"})
+    assert [p["metrics"]["done"] for p in progress] == [2, 4, 5]
+    assert set(progress[0].keys()) == {"id", "type", "idx", "status", "result", "metrics"}  # no job data
+    assert jobs.save.call_count == 4  # created, 2 stores and removed, not at every chunk
+    assert jobs.get(job["id"]) is None  # finished jobs are removed
+
+
+def test_run_files_pipeline(mock_window):
+    """Test file job: pipeline is run once for all files, paused from consumer callback"""
+    jobs = get_jobs(mock_window)
+    indexing = mock_window.core.idx.indexing
+    indexing.pipeline.is_enabled = MagicMock(return_value=True)
+    indexing.flush_documents = MagicMock(return_value=[])
+    files = ["/data/a", "/data/b", "/data/c", "/data/d", "/data/e"]
+    job = jobs.create("file", "base", "/data")
+    jobs.get_files = MagicMock(return_value=files)
+
+    def run(idx, index, path, files, callback):
+        indexed = {}
+        for file in files:
+            indexed[file] = "doc_" + file
+            if not callback(file, indexed[file]):
+                break
+        return indexed, []
+
+    indexing.pipeline.run = MagicMock(side_effect=run)
+
+    def on_progress(progress):
+        jobs.pause(job["id"])
+
+    with patch("pygpt_net.core.idx.jobs.os.path.isdir", return_value=True), \
+            patch("pygpt_net.core.idx.jobs.os.path.getsize", return_value=10):
+        result = jobs.run(job["id"], on_progress)
+
+    assert result["status"] == Jobs.STATUS_PAUSED
+    assert indexing.pipeline.run.call_count == 1
+    assert indexing.pipeline.run.call_args.kwargs["files"] == files
+    assert result["result"] == 2
+    assert result["stats"]["done"] == 2
+    mock_window.core.idx.storage.store.assert_called_once()  # stored when paused
+    mock_window.core.idx.append.assert_called_once_with("base", {"/data/a": "doc_/data/a", "/data/b": "doc_/data/b"})
+
+
+def test_run_files_resume_new_file(mock_window):
+    """Test resumed file job indexes new file sorted before stored files and skips files stored by job"""
+    jobs = get_jobs(mock_window)
+    indexing = mock_window.core.idx.indexing
+    indexing.is_incremental = MagicMock(return_value=False)
+    indexing.pipeline.is_enabled = MagicMock(return_value=False)
+    indexing.flush_documents = MagicMock(return_value=[])
+    mock_window.core.config.data["llama.idx.recursive"] = False
+    indexing.index_files_list = MagicMock(side_effect=lambda idx, index, files: ({f: f for f in files}, []))
+    job = jobs.create("file", "base", "/data")
+    job["status"] = Jobs.STATUS_PAUSED
+    mock_window.core.idx.get_idx_data = MagicMock(return_value={"base": {
+        "1": {"path": "/data/b", "indexed_ts": job["created_ts"]},
+        "2": {"path": "/data/c", "indexed_ts": job["created_ts"] + 1},
+        "3": {"path": "/data/d", "indexed_ts": job["created_ts"] - 1},  # indexed before job, modified
+    }})
+    with patch("pygpt_net.core.idx.jobs.os.path.isdir", return_value=True), \
+            patch("pygpt_net.core.idx.jobs.os.path.isfile", return_value=True), \
+            patch("pygpt_net.core.idx.jobs.os.listdir", return_value=["d", "c", "a", "b"]), \
+            patch("pygpt_net.core.idx.jobs.os.path.getsize", return_value=10):
+        result = jobs.run(job["id"])
+
+    assert result["status"] == Jobs.STATUS_FINISHED
+    assert result["result"] == 2
+    indexing.index_files_list.assert_called_once_with("base", mock_window.core.idx.storage.get.return_value,
+                                                      ["/data/a", "/data/d"])
+
+
+def test_run_pause_and_resume(mock_window):
+    """Test job paused after first chunk is resumed from checkpoint"""
+    jobs = get_jobs(mock_window)
+    documents = [
+        Document(text="a", metadata={"ctx_id": 1, "item_id": 1}),
+        Document(text="b", metadata={"ctx_id": 1, "item_id": 2}),
+        Document(text="c", metadata={"ctx_id": 2, "item_id": 3}),
+    ]
+    indexing = mock_window.core.idx.indexing
+    indexing.get_db_data_from_ts = MagicMock(return_value=documents)
+    indexing.index_db_documents = MagicMock(side_effect=lambda idx, index, docs: (len(docs), []))
+    job = jobs.create("db_current", "base", 123)
+
+    progress = []
+
+    def callback(data):
+        progress.append(data)
+        jobs.pause(job["id"])
+
+    result = jobs.run(job["id"], callback)
+    assert result["status"] == Jobs.STATUS_PAUSED
+    assert result["checkpoint"] == [1, 2]
+    assert result["result"] == 2
+    assert len(progress) == 1
+    assert progress[0]["metrics"]["done"] == 2
+    assert jobs.get(job["id"]) is not None  # paused job is kept
+
+    result = jobs.run(job["id"])
+    assert result["status"] == Jobs.STATUS_FINISHED
+    assert result["result"] == 3
+    assert result["stats"]["total"] == 3
+    indexing.index_db_documents.assert_called_with("base", mock_window.core.idx.storage.get.return_value, [documents[2]])
+    indexing.remove_old_meta_ids.assert_not_called()  # from timestamp, old documents are kept
+
+
+def test_cancel(mock_window):
+    """Test cancel job"""
+    jobs = get_jobs(mock_window)
+    running = jobs.create("file", "base", "/data")
+    paused = jobs.create("file", "base", "/data")
+    jobs.pause(paused["id"])
+    assert jobs.cancel(running["id"])
+    assert jobs.is_stopped(running)
+    assert jobs.get(running["id"]) is not None  # removed by worker at next checkpoint
+    assert jobs.cancel(paused["id"])
+    assert jobs.get(paused["id"]) is None
+    assert jobs.get_unfinished() == []
+
+
+def test_get_metrics(mock_window):
+    """Test progress metrics"""
+    jobs = get_jobs(mock_window)
+    job = jobs.create("file", "base", "/data")
+    job["stats"].update({"total": 100, "done": 20, "bytes": 2048, "embed_calls": 5, "time": 10.0})
+    metrics = jobs.get_metrics(job)
+    assert metrics["rate"] == 2.0
+    assert metrics["eta"] == 40.0
+    assert metrics["embed_calls"] == 5
+    assert jobs.format_eta(metrics["eta"]) == "0:00:40"
+    assert jobs.format_size(metrics["bytes"]) == "2.0 KB"
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.23 10:00:00                  #
+# ================================================== #
+
+import os
+import sqlite3
+
+import pytest
+
+from unittest.mock import MagicMock, patch
+from llama_index.core import VectorStoreIndex
+from llama_index.core.embeddings import MockEmbedding
+from llama_index.core.node_parser import SentenceSplitter
+from llama_index.core.schema import NodeRelationship, NodeWithScore, QueryBundle, RelatedNodeInfo, TextNode
+
+from tests.mocks import mock_window
+from pygpt_net.core.idx.lexical import Lexical, tokenize
+from pygpt_net.core.idx.retriever import HybridRetriever
+
+
+os_functions = {name: getattr(os, name) for name in ["listdir", "makedirs", "mkdir", "scandir"]}
+
+
+@pytest.fixture
+def real_os(monkeypatch):
+    for name, func in os_functions.items():
+        monkeypatch.setattr(os, name, func)  # not mocked by other tests
+
+
+def create_node(id: str, doc_id: str, text: str) -> TextNode:
+    node = TextNode(text=text, id_=id)
+    node.relationships[NodeRelationship.SOURCE] = RelatedNodeInfo(node_id=doc_id)
+    return node
+
+
+def create_nodes() -> list:
+    return [
+        create_node("n1", "doc1", "Function get_file_reader() returns reader for extension."),
+        create_node("n2", "doc1", "If loading fails, error E4021 is raised."),
+        create_node("n3", "doc2", "The reader is selected by file extension and loaded lazily."),
+    ]
+
+
+def create_index() -> VectorStoreIndex:
+    return VectorStoreIndex(
+        create_nodes(),
+        embed_model=MockEmbedding(embed_dim=8),
+        transformations=[SentenceSplitter(tokenizer=str.split)],
+    )
+
+
+def test_tokenize():
+    """Test identifiers are kept whole and split into parts"""
+    assert tokenize("Call get_file_reader now") == ["call", "get_file_reader", "get", "file", "reader", "now"]
+    assert tokenize("loadIndexData E4021") == ["loadindexdata", "load", "index", "data", "e4021", "e", "4021"]
+
+
+def test_search():
+    """Test BM25 search by exact identifiers"""
+    lexical = Lexical()
+    db = lexical.connect("")
+    lexical.insert(db, create_nodes())
+    assert lexical.count(db) == 3
+
+    nodes = lexical.search(db, "get_file_reader", 2)
+    assert nodes[0].node.node_id == "n1"
+    assert nodes[0].node.text == "Function get_file_reader() returns reader for extension."
+    assert nodes[0].node.ref_doc_id == "doc1"
+
+    nodes = lexical.search(db, 'what is error "E4021"?', 2)
+    assert nodes[0].node.node_id == "n2"
+    assert nodes[0].score > nodes[1].score
+    assert lexical.search(db, "?!", 2) == []
+
+    lexical.insert(db, [create_node("n2", "doc1", "Replaced node")])  # replace by node ID
+    assert lexical.count(db) == 3
+    assert lexical.search(db, "E4021", 2) == []
+
+
+def test_add_delete(mock_window):
+    """Test lexical index updated on insert and delete"""
+    lexical = Lexical(mock_window)
+    db = lexical.connect("")
+    lexical.get_db = MagicMock(return_value=db)
+    lexical.add("base", create_nodes())  # disabled
+    assert lexical.count(db) == 0
+
+    mock_window.core.config.set("llama.idx.hybrid", True)
+    lexical.add("base", create_nodes())
+    assert lexical.count(db) == 3
+    with patch("os.path.exists", return_value=True):
+        lexical.delete("base", "doc1")
+    assert lexical.count(db) == 1
+    assert lexical.search(db, "reader", 5)[0].node.node_id == "n3"
+
+
+def test_sync(mock_window):
+    """Test lexical index built from docstore of existing index"""
+    lexical = Lexical(mock_window)
+    db = lexical.connect("")
+    lexical.get_db = MagicMock(return_value=db)
+    index = create_index()
+    lexical.sync("base", index)
+    assert lexical.count(db) == 3
+    lexical.insert(db, [create_node("n4", "doc3", "text")])
+    lexical.sync("base", index)  # count differs, rebuilt
+    assert lexical.count(db) == 3
+    assert lexical.search(db, "text", 2) == []
+
+
+def test_sync_added_disabled(mock_window):
+    """Test nodes added to non-empty index while hybrid retrieval was disabled are synced"""
+    lexical = Lexical(mock_window)
+    db = lexical.connect("")
+    lexical.get_db = MagicMock(return_value=db)
+    index = create_index()
+    lexical.sync("base", index)
+    index.insert_nodes([create_node("n4", "doc3", "Added while disabled")])
+    lexical.add("base", [create_node("n4", "doc3", "Added while disabled")])  # disabled, not added
+    assert lexical.count(db) == 3
+
+    lexical.sync("base", index)
+    assert lexical.count(db) == 4
+    assert lexical.search(db, "disabled", 2)[0].node.node_id == "n4"
+
+    mock_window.core.idx.log.reset_mock()
+    lexical.sync("base", index)  # count matches, not rebuilt
+    mock_window.core.idx.log.assert_not_called()
+
+
+def test_count_stored(real_os, tmp_path):
+    """Test nodes count is stored in database, not counted on every sync"""
+    path = str(tmp_path / "base.db")
+    db = sqlite3.connect(path)  # database created before nodes count was stored
+    db.execute("CREATE VIRTUAL TABLE nodes USING fts5(terms, node_id UNINDEXED, ref_doc_id UNINDEXED, node UNINDEXED)")
+    db.executemany("INSERT INTO nodes VALUES (?, ?, 'doc1', '{}')", [("a", "n1"), ("b", "n2")])
+    db.commit()
+    db.close()
+
+    lexical = Lexical()
+    db = lexical.connect(path)
+    assert lexical.count(db) == 2
+    db.execute("INSERT INTO nodes VALUES ('c', 'n3', 'doc1', '{}')")  # not inserted by lexical index
+    assert lexical.count(db) == 2
+    lexical.insert(db, [create_node("n2", "doc1", "replaced"), create_node("n4", "doc2", "new")])
+    assert lexical.count(db) == 3
+    db.close()
+
+    db = lexical.connect(path)
+    assert lexical.count(db) == 3  # not recounted
+    db.close()
+
+
+def test_get_retriever(mock_window):
+    """Test hybrid retriever on temporary index"""
+    mock_window.core.config.set("llama.idx.hybrid.top_k", 1)
+    lexical = Lexical(mock_window)
+    index = create_index()
+    retriever = lexical.get_retriever(index)
+    assert retriever.top_k == 1
+    assert retriever.retrievers[0][1] == 0.4
+    assert retriever.retrievers[1][1] == 0.6
+    nodes = retriever.retrieve("E4021")
+    assert len(nodes) == 1
+    assert nodes[0].node.node_id == "n2"  # vector scores are equal (mock embeddings)
+
+
+def test_fuse():
+    """Test weighted fusion of normalized scores"""
+    nodes = create_nodes()
+    vector = MagicMock()
+    vector.retrieve.return_value = [NodeWithScore(node=nodes[0], score=0.9), NodeWithScore(node=nodes[2], score=0.5)]
+    bm25 = MagicMock()
+    bm25.retrieve.return_value = [NodeWithScore(node=nodes[1], score=12.0), NodeWithScore(node=nodes[2], score=4.0)]
+
+    retriever = HybridRetriever([(vector, 0.4), (bm25, 0.6)], top_k=3)
+    result = retriever.retrieve(QueryBundle("query"))
+    assert [n.node.node_id for n in result] == ["n2", "n1", "n3"]
+    assert [round(n.score, 2) for n in result] == [0.6, 0.4, 0.0]
+
+    retriever = HybridRetriever([(vector, 1.0), (bm25, 0.0)], top_k=2)
+    result = retriever.retrieve(QueryBundle("query"))
+    assert [n.node.node_id for n in result] == ["n1", "n3"]
+    bm25.retrieve.assert_called_once()  # not called if weight is 0
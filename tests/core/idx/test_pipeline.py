@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.23 10:00:00                  #
+# ================================================== #
+
+import os
+import threading
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+from llama_index.core import Document
+
+from tests.mocks import mock_window
+from pygpt_net.core.idx import Indexing
+from pygpt_net.core.idx.pipeline import Pipeline, parse_file
+from pygpt_net.provider.loaders.base import BaseLoader, LazyReader
+
+
+class SyncExecutor:
+    """Process pool replacement, executes tasks in current process"""
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, *args, **kwargs):
+        pass
+
+
+def make_doc(id):
+    doc = Document()
+    doc.id_ = id
+    return doc
+
+
+def test_is_enabled(mock_window):
+    """Test enabled by number of workers"""
+    pipeline = Pipeline(mock_window, MagicMock())
+    mock_window.core.config.set("llama.idx.pipeline.workers", 0)
+    assert pipeline.is_enabled() is False
+    mock_window.core.config.set("llama.idx.pipeline.workers", 2)
+    assert pipeline.is_enabled() is True
+    assert pipeline.get_workers() == 2
+    mock_window.core.config.set("llama.idx.pipeline.queue", 0)
+    assert pipeline.get_queue_size() == 64
+
+
+def test_parse_file_default():
+    """Test parse file with default reader"""
+    docs = [make_doc("test_id")]
+    with patch("pygpt_net.core.idx.pipeline.SimpleDirectoryReader") as mock_reader:
+        mock_reader.return_value.load_data.return_value = docs
+        assert parse_file("file.txt") == docs
+        mock_reader.assert_called_once_with(input_files=["file.txt"])
+
+
+def test_run(mock_window):
+    """Test run pipeline on directory"""
+    mock_window.core.config.set("llama.idx.pipeline.workers", 2)
+    mock_window.core.config.set("llama.idx.pipeline.queue", 1)
+    indexing = MagicMock()
+    indexing.is_excluded = MagicMock(side_effect=lambda ext: ext == "exe")
+    indexing.get_file_reader = MagicMock(return_value=None)  # default reader
+    pipeline = Pipeline(mock_window, indexing)
+    fake_path = '/fake/directory'
+    fake_files = ['file1.txt', 'file2.txt', 'file3.exe']
+    with patch('os.listdir') as mock_listdir, \
+            patch('os.path.isfile') as mock_isfile, \
+            patch("pygpt_net.core.idx.pipeline.ProcessPoolExecutor", SyncExecutor), \
+            patch("pygpt_net.core.idx.pipeline.SimpleDirectoryReader") as mock_reader:
+        mock_listdir.return_value = fake_files
+        mock_isfile.return_value = True
+        mock_reader.return_value.load_data.side_effect = lambda: [make_doc("test_id")]
+        indexed, errors = pipeline.run("base", MagicMock(), fake_path)
+
+    assert indexed == {
+        os.path.join(fake_path, 'file1.txt'): 'test_id',
+        os.path.join(fake_path, 'file2.txt'): 'test_id',
+    }
+    assert errors == []
+    assert indexing.index_document.call_count == 2
+    assert indexing.remove_old_file.call_count == 2
+    summary = pipeline.get_summary()
+    assert summary["scan"]["files"] == 3
+    assert summary["parse"]["files"] == 2
+    assert summary["insert"]["docs"] == 2
+
+
+def test_run_callback_stop(mock_window):
+    """Test pipeline stopped by consumer callback"""
+    mock_window.core.config.set("llama.idx.pipeline.workers", 2)
+    indexing = MagicMock()
+    indexing.is_excluded = MagicMock(return_value=False)
+    indexing.get_file_reader = MagicMock(return_value=None)  # default reader
+    indexing.flush_documents = MagicMock(return_value=[])
+    pipeline = Pipeline(mock_window, indexing)
+    fake_path = '/fake/directory'
+    calls = []
+
+    def callback(file, doc_id):
+        calls.append((file, doc_id))
+        return False  # stop
+
+    with patch("pygpt_net.core.idx.pipeline.ProcessPoolExecutor", SyncExecutor), \
+            patch("pygpt_net.core.idx.pipeline.SimpleDirectoryReader") as mock_reader:
+        mock_reader.return_value.load_data.side_effect = lambda: [make_doc("test_id")]
+        files = [os.path.join(fake_path, f) for f in ['file1.txt', 'file2.txt', 'file3.txt']]
+        indexed, errors = pipeline.run("base", MagicMock(), fake_path, files=files, callback=callback)
+
+    assert calls == [(files[0], "test_id")]
+    assert indexed == {files[0]: "test_id"}
+    assert indexing.index_document.call_count == 1
+
+
+def test_run_local_reader(mock_window):
+    """Test run pipeline with reader not allowed in subprocess"""
+    mock_window.core.config.set("llama.idx.pipeline.workers", 2)
+    loader = BaseLoader()
+    loader.allow_subprocess = False
+    indexing = MagicMock()
+    indexing.is_excluded = MagicMock(return_value=False)
+    indexing.get_file_reader = MagicMock(return_value=LazyReader(loader, {}))
+    threads = []
+    results = [[make_doc("test_id")], Exception("parse error")]
+
+    def get_documents(file):
+        threads.append(threading.current_thread())
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    indexing.get_documents = MagicMock(side_effect=get_documents)
+    pipeline = Pipeline(mock_window, indexing)
+    fake_path = '/fake/directory'
+    with patch('os.listdir') as mock_listdir, \
+            patch('os.path.isfile') as mock_isfile, \
+            patch("pygpt_net.core.idx.pipeline.ProcessPoolExecutor") as mock_pool:
+        mock_listdir.return_value = ['file1.jpg', 'file2.jpg']
+        mock_isfile.return_value = True
+        indexed, errors = pipeline.run("base", MagicMock(), fake_path, is_tmp=True)
+
+    mock_pool.assert_not_called()
+    assert indexed == {os.path.join(fake_path, 'file1.jpg'): 'test_id'}
+    assert errors == ["parse error"]
+    indexing.remove_old_file.assert_not_called()
+    assert threads == [threading.current_thread()] * 2  # parsed in consumer (indexing) thread
+
+
+def test_index_files_pipeline(mock_window):
+    """Test index directory using pipeline"""
+    mock_window.core.config.set("llama.idx.pipeline.workers", 2)
+    mock_window.core.config.set("llama.idx.recursive", True)
+    idx = Indexing(mock_window)
+    idx.pipeline.run = MagicMock(return_value=({}, []))
+    index = MagicMock()
+    with patch('os.path.isdir') as mock_isdir:
+        mock_isdir.return_value = True
+        assert idx.index_files("base", index, "/fake/directory") == ({}, [])
+    idx.pipeline.run.assert_called_once_with(
+        idx="base",
+        index=index,
+        path="/fake/directory",
+        is_tmp=False,
+        recursive=True,
+        files=None,
+    )
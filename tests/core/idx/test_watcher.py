@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.21 18:00:00                  #
+# ================================================== #
+
+import os
+from unittest.mock import MagicMock, patch
+
+from tests.mocks import mock_window
+from pygpt_net.core.idx.watcher import (
+    Watcher,
+    InotifyBackend,
+    PollingBackend,
+    EVENT_HEADER,
+    IN_CLOSE_WRITE,
+    IN_CREATE,
+    IN_DELETE,
+    IN_ISDIR,
+    IN_Q_OVERFLOW,
+)
+
+
+class FakeBackend:
+    """Events backend with fake clock, one tick per read"""
+    def __init__(self, watcher, events):
+        self.watcher = watcher
+        self.events = list(events)
+        self.clock = 0
+
+    def read(self, timeout):
+        self.clock += 1
+        if not self.events:
+            self.watcher.stop_event.set()
+            return set()
+        return self.events.pop(0)
+
+
+def pack_event(wd: int, mask: int, name: str = "") -> bytes:
+    name_bytes = name.encode()
+    if name_bytes:
+        name_bytes += b"\0" * (16 - len(name_bytes) % 16)
+    return EVENT_HEADER.pack(wd, mask, 0, len(name_bytes)) + name_bytes
+
+
+def test_inotify_read():
+    """Test parse inotify events"""
+    backend = InotifyBackend.__new__(InotifyBackend)
+    backend.paths = ["/fake"]
+    backend.recursive = True
+    backend.fd = 10
+    backend.watches = {1: "/fake"}
+    backend.add = MagicMock()
+    data = pack_event(1, IN_CLOSE_WRITE, "file1.txt") \
+        + pack_event(1, IN_DELETE, "file2.txt") \
+        + pack_event(1, IN_CREATE | IN_ISDIR, "dir") \
+        + pack_event(2, IN_CLOSE_WRITE, "unknown.txt")  # not watched
+    with patch("select.select", return_value=([10], [], [])), \
+            patch("os.read", return_value=data):
+        changed = backend.read(timeout=0.1)
+    assert changed == {
+        os.path.join("/fake", "file1.txt"),
+        os.path.join("/fake", "file2.txt"),
+        os.path.join("/fake", "dir"),
+    }
+    backend.add.assert_called_once_with(os.path.join("/fake", "dir"))  # watch new subdirectory
+
+    with patch("select.select", return_value=([10], [], [])), \
+            patch("os.read", return_value=pack_event(-1, IN_Q_OVERFLOW)):
+        assert backend.read(timeout=0.1) == {"/fake"}  # rescan on overflow
+
+
+def test_polling_read():
+    """Test mtime polling"""
+    backend = PollingBackend(["/fake"], recursive=False, interval=0)
+    backend.scan = MagicMock(side_effect=[
+        {"/fake/file1.txt": (1, 4), "/fake/file2.txt": (1, 4)},
+        {"/fake/file1.txt": (2, 8), "/fake/file3.txt": (1, 4)},
+        {"/fake/file1.txt": (2, 8), "/fake/file3.txt": (1, 4)},
+    ])
+    assert backend.read(timeout=0) == set()  # initial scan
+    assert backend.read(timeout=0) == {"/fake/file1.txt", "/fake/file2.txt", "/fake/file3.txt"}
+    assert backend.read(timeout=0) == set()
+
+
+def test_run_debounce(mock_window):
+    """Test bursts of changes are put to queue as batches"""
+    watcher = Watcher(mock_window)
+    backend = FakeBackend(watcher, [
+        {"/fake/a.txt"},
+        {"/fake/b.txt", "/fake/a.txt"},
+        set(),
+        set(),  # 2 ticks without changes
+        {"/fake/c.txt"},
+        set(),
+        set(),
+    ])
+    with patch("time.monotonic", side_effect=lambda: backend.clock):
+        watcher.run(backend, debounce=2)
+    assert watcher.queue.get_nowait() == ["/fake/a.txt", "/fake/b.txt"]
+    assert watcher.queue.get_nowait() == ["/fake/c.txt"]
+
+
+def test_get_batch(mock_window):
+    """Test merge queued batches"""
+    watcher = Watcher(mock_window)
+    watcher.queue.put(["/fake/b.txt", "/fake/a.txt"])
+    watcher.queue.put(["/fake/a.txt", "/fake/c.txt"])
+    assert watcher.get_batch() == ["/fake/a.txt", "/fake/b.txt", "/fake/c.txt"]
+    assert watcher.get_batch() == []
+
+
+def test_get_paths(mock_window):
+    """Test watched directories"""
+    watcher = Watcher(mock_window)
+    mock_window.core.config.get_user_dir = MagicMock(return_value="/data")
+    with patch("os.path.isdir", side_effect=lambda path: path != os.path.normpath("/not_exists")):
+        assert watcher.get_paths() == [os.path.normpath("/data")]  # data dir if not configured
+        mock_window.core.config.set("llama.idx.watch.paths", "/dir1, /not_exists")
+        assert watcher.get_paths() == [os.path.normpath("/dir1")]
+
+
+def test_start_stop(mock_window):
+    """Test start and stop watcher thread"""
+    watcher = Watcher(mock_window)
+    watcher.get_paths = MagicMock(return_value=["/fake"])
+    backend = MagicMock()
+    backend.read = MagicMock(return_value=set())
+    watcher.create_backend = MagicMock(return_value=backend)
+    assert watcher.start() is True
+    assert watcher.is_running() is True
+    watcher.stop()
+    assert watcher.is_running() is False
+    backend.close.assert_called_once()
@@ -6,11 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.31 20:00:00                  #
+# Updated Date: 2024.03.22 18:00:00                  #
 # ================================================== #
 
 import os
-from unittest.mock import MagicMock
+import threading
+from unittest.mock import MagicMock, patch
 
 from pygpt_net.item.ctx import CtxItem
 from tests.mocks import mock_window
@@ -121,3 +122,18 @@ def test_quick_call(mock_window):
     ctx = CtxItem()
     bridge.quick_call(ctx=ctx, prompt="test", mode="chat", model=None)
     mock_window.core.gpt.quick_call.assert_called_once()
+
+
+def test_apply_rate_limit_concurrent(mock_window):
+    """Test concurrent calls get consecutive RPM slots"""
+    mock_window.core.config.data["max_requests_limit"] = 60
+    bridge = Bridge(mock_window)
+    sleeps = []
+    with patch("pygpt_net.core.bridge.time.sleep", side_effect=sleeps.append):
+        threads = [threading.Thread(target=bridge.apply_rate_limit) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert len(sleeps) == 2  # first call is not delayed
+    assert sorted(round(s) for s in sleeps) == [1, 2]
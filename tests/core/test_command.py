@@ -10,6 +10,7 @@
 # ================================================== #
 
 import json
+import os
 from unittest.mock import MagicMock
 
 from tests.mocks import mock_window_conf, mock_window
@@ -72,4 +73,59 @@ def test_extract_cmd_white_spaces():
     cmd = Command()
     cmd1 = '   ' \
            '{"cmd": "command1", "params": {"arg1": "some arg"}}   '
-    assert cmd.extract_cmd(cmd1) == json.loads(cmd1.strip())
\ No newline at end of file
+    assert cmd.extract_cmd(cmd1) == json.loads(cmd1.strip())
+
+def test_get_resources():
+    """
+    Test get resources
+    """
+    window = MagicMock()
+    window.core.config.get_user_dir = MagicMock(return_value='/data')
+    cmd = Command(window=window)
+    item = {"cmd": "read_file", "params": {"path": ["a.txt", "/tmp/b.txt"]}}
+    assert cmd.get_resources(item) == [
+        os.path.normcase(os.path.normpath('/data/a.txt')),
+        os.path.normcase(os.path.normpath('/tmp/b.txt')),
+    ]
+    item = {"cmd": "web_url_open", "params": {"url": "https://example.com/"}}
+    assert cmd.get_resources(item) == ["https://example.com"]
+    item = {"cmd": "web_search", "params": {"query": "test"}}
+    assert cmd.get_resources(item) == []
+
+
+def test_is_conflict():
+    """
+    Test is conflict
+    """
+    cmd = Command()
+    assert cmd.is_conflict("/data/a.txt", "/data/a.txt") is True
+    assert cmd.is_conflict("/data", "/data/a.txt") is True
+    assert cmd.is_conflict("/data/a.txt", "/data/b.txt") is False
+    assert cmd.is_conflict("/data/a", "/data/ab") is False
+    assert cmd.is_conflict("https://a.com", "https://a.com") is True
+    assert cmd.is_conflict("https://a.com", "https://a.com/page") is False
+
+
+def test_group_independent():
+    """
+    Test group independent commands
+    """
+    window = MagicMock()
+    window.core.config.get_user_dir = MagicMock(return_value='/data')
+    plugin = MagicMock()
+    plugin.allowed_cmds = ["sys_exec"]
+    window.core.plugins.get_ids = MagicMock(return_value=['cmd_code_interpreter'])
+    window.core.plugins.get = MagicMock(return_value=plugin)
+    window.controller.plugins.is_enabled = MagicMock(return_value=True)
+    cmd = Command(window=window)
+    cmds = [
+        {"cmd": "read_file", "params": {"path": "a.txt"}},
+        {"cmd": "read_file", "params": {"path": "b.txt"}},
+        {"cmd": "save_file", "params": {"path": "a.txt", "data": "test"}},
+        {"cmd": "sys_exec", "params": {"command": "ls"}},
+        {"cmd": "sys_exec", "params": {"command": "pwd"}},
+        {"cmd": "rmdir", "params": {"path": "/tmp/x"}},
+        {"cmd": "read_file", "params": {"path": "/tmp/x/c.txt"}},
+    ]
+    groups = cmd.group_independent(cmds)
+    assert [[idx for idx, item in group] for group in groups] == [[0, 2], [1], [3, 4], [5, 6]]
@@ -15,6 +15,7 @@ from unittest.mock import MagicMock, patch
 
 from tests.mocks import mock_window
 from pygpt_net.core.dispatcher import Dispatcher, Event
+from pygpt_net.item.ctx import CtxItem
 
 
 def test_dispatch(mock_window):
@@ -49,6 +50,7 @@ def test_reply(mock_window):
     ctx.output = None
     ctx.extra_ctx = None
     ctx.prev_ctx = None
+    ctx.sub_reply = False
 
     prev_ctx = MagicMock()
     dispatcher.window.core.ctx.as_previous = MagicMock(return_value=prev_ctx)
@@ -63,3 +65,41 @@ def test_reply(mock_window):
         internal=False,
         prev_ctx=prev_ctx,
     )
+
+
+def test_reply_sub_ctx(mock_window):
+    """Test reply from command executed in parallel (collected only)"""
+    dispatcher = Dispatcher(mock_window)
+    ctx = CtxItem()
+    ctx.reply = True
+    ctx.sub_reply = True
+    dispatcher.window.controller.chat.input.send = MagicMock()
+    dispatcher.reply(ctx)
+    dispatcher.window.controller.chat.input.send.assert_not_called()
+
+
+def test_parallel_allowed(mock_window):
+    """Test parallel allowed"""
+    dispatcher = Dispatcher(mock_window)
+    ctx = CtxItem()
+    mock_window.core.config.data['mode'] = 'chat'
+    mock_window.core.config.data['cmd.parallel'] = True
+    assert dispatcher.parallel_allowed(ctx) is True
+    mock_window.core.config.data['mode'] = 'agent'
+    assert dispatcher.parallel_allowed(ctx) is False
+    mock_window.core.config.data['mode'] = 'chat'
+    mock_window.core.config.data['cmd.parallel'] = False
+    assert dispatcher.parallel_allowed(ctx) is False
+    mock_window.core.config.data['cmd.parallel'] = True
+    ctx.internal = True
+    assert dispatcher.parallel_allowed(ctx) is False
+
+
+def test_async_allowed_sub_ctx(mock_window):
+    """Test async not allowed in parallel executor thread"""
+    dispatcher = Dispatcher(mock_window)
+    ctx = CtxItem()
+    mock_window.core.config.data['mode'] = 'chat'
+    assert dispatcher.async_allowed(ctx) is True
+    ctx.sub_reply = True
+    assert dispatcher.async_allowed(ctx) is False
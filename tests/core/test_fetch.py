@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.23 10:00:00                  #
+# ================================================== #
+
+import os
+import tempfile
+from unittest.mock import MagicMock
+
+import pytest
+
+from tests.mocks import mock_window, stub_server
+from pygpt_net.core.fetch import Fetch
+
+os_functions = {name: getattr(os, name) for name in ["makedirs", "remove", "replace", "stat", "utime"]}
+
+
+def get_page(request) -> tuple:
+    status = 200
+    headers = {}
+    body = b"content of " + request.path.encode("utf-8")
+    if request.path.startswith("/etag"):
+        headers = {"ETag": '"v1"', "Cache-Control": "no-cache"}
+        if request.headers.get("If-None-Match") == '"v1"':
+            status = 304
+            body = b""
+    elif request.path.startswith("/max_age"):
+        headers = {"Cache-Control": "max-age=60"}
+    elif request.path.startswith("/no_store"):
+        headers = {"Cache-Control": "no-store", "ETag": '"v1"'}
+    elif request.path.startswith("/big"):
+        headers = {"Cache-Control": "max-age=60"}
+        body = b"x" * 600 * 1024
+    return status, headers, body
+
+
+@pytest.fixture
+def server(stub_server):
+    stub_server.routes = {"/": get_page}
+    return stub_server.url
+
+
+@pytest.fixture
+def requests_log(stub_server):
+    return stub_server.requests  # (path, status)
+
+
+@pytest.fixture(autouse=True)
+def real_os(monkeypatch):
+    for name, func in os_functions.items():
+        monkeypatch.setattr(os, name, func)  # not mocked by other tests
+
+
+@pytest.fixture
+def cache_dir():
+    with tempfile.TemporaryDirectory() as path:
+        yield path
+
+
+def list_files(path: str) -> list:
+    with os.scandir(path) as entries:
+        return [entry.name for entry in entries]
+
+
+def get_fetch(mock_window, path: str) -> Fetch:
+    fetch = Fetch(mock_window)
+    fetch.get_cache_dir = MagicMock(return_value=path)
+    return fetch
+
+
+def test_get_fresh(mock_window, server, requests_log, cache_dir):
+    """Test response with max-age is served from cache"""
+    fetch = get_fetch(mock_window, cache_dir)
+    assert fetch.get(server + "/max_age") == b"content of /max_age"
+    assert fetch.get(server + "/max_age") == b"content of /max_age"
+    assert requests_log == [("/max_age", 200)]
+
+    # request headers are part of the key
+    fetch.get(server + "/max_age", headers={"Authorization": "key"})
+    assert len(requests_log) == 2
+
+
+def test_get_revalidate(mock_window, server, requests_log, cache_dir):
+    """Test stale response is revalidated with conditional GET"""
+    fetch = get_fetch(mock_window, cache_dir)
+    assert fetch.get(server + "/etag") == b"content of /etag"
+    assert fetch.get(server + "/etag") == b"content of /etag"
+    assert requests_log == [("/etag", 200), ("/etag", 304)]
+
+    # TTL override
+    assert fetch.get(server + "/etag", ttl=60) == b"content of /etag"
+    assert len(requests_log) == 2
+
+
+def test_get_no_store(mock_window, server, requests_log, cache_dir):
+    """Test no-store responses and disabled cache"""
+    fetch = get_fetch(mock_window, cache_dir)
+    fetch.get(server + "/no_store")
+    fetch.get(server + "/no_store", ttl=60)
+    assert len(requests_log) == 2
+    assert list_files(cache_dir) == []
+
+    fetch.get(server + "/max_age", ttl=-1)
+    mock_window.core.config.data["web.cache"] = False
+    fetch.get(server + "/max_age")
+    assert len(requests_log) == 4
+    assert list_files(cache_dir) == []
+
+
+def test_evict(mock_window, server, requests_log, cache_dir):
+    """Test least recently used entries removed when cache exceeds max size"""
+    mock_window.core.config.data["web.cache.max_size"] = 1  # MB
+    fetch = get_fetch(mock_window, cache_dir)
+    fetch.get(server + "/big?1")
+    fetch.get(server + "/big?2")  # 1.2 MB > 1 MB
+    assert fetch.get_size() == 600 * 1024
+    fetch.get(server + "/big?2")  # still cached
+    fetch.get(server + "/big?1")  # evicted
+    assert [path for path, status in requests_log] == ["/big?1", "/big?2", "/big?1"]
+    assert len(list_files(cache_dir)) == 2  # body and metadata
+
+
+def test_get_stale_on_error(mock_window, server, cache_dir):
+    """Test stale content returned if revalidation failed"""
+    fetch = get_fetch(mock_window, cache_dir)
+    fetch.get(server + "/etag")
+    fetch.download = MagicMock(side_effect=ConnectionError("offline"))
+    assert fetch.get(server + "/etag") == b"content of /etag"
+    with pytest.raises(ConnectionError):
+        fetch.get(server + "/max_age")
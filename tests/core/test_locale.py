@@ -6,39 +6,118 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.03 19:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
 import os
-from unittest.mock import MagicMock, patch
+import tempfile
+from unittest.mock import MagicMock, patch, mock_open
+
+import pytest
 
 from tests.mocks import mock_window
 from pygpt_net.core.locale import Locale
 
+os_functions = {name: getattr(os, name) for name in ["makedirs", "mkdir", "replace"]}
+
+
+def list_files(path: str) -> set:
+    with os.scandir(path) as entries:
+        return {entry.name for entry in entries}
+
+
+@pytest.fixture
+def config():
+    """Config mock with user path in temporary directory, nothing may be written outside of it"""
+    cwd = os.getcwd()
+    before = list_files(cwd)
+    with tempfile.TemporaryDirectory() as path:
+        config = MagicMock()
+        config.get_user_path = MagicMock(return_value=path)
+        yield config
+    assert list_files(cwd) == before
+
 
-def test_reload(mock_window):
+def test_reload(mock_window, config):
     """Test reload"""
-    config = MagicMock()
     locale = Locale(domain=None, config=config)
     locale.load = MagicMock()
     locale.reload()
     locale.load.assert_called_once()
 
 
-def load(mock_window):
+def test_reload_clear_domains(mock_window, config):
+    """Test reload clears loaded domains"""
+    locale = Locale(domain=None, config=config)
+    locale.data = {'locale': {'a': 'b'}, 'plugin.test': {'c': 'd'}}
+    locale.load = MagicMock()
+    locale.reload()
+    assert locale.data == {}  # plugin domains are loaded again on first use
+    locale.data = {'locale': {'a': 'b'}, 'plugin.test': {'c': 'd'}}
+    locale.reload('plugin.test')
+    assert locale.data == {'locale': {'a': 'b'}}
+
+
+def test_from_cache(mock_window, config):
+    """Test load translations from compiled cache"""
+    locale = Locale(domain=None, config=config)
+    locale.cache = {}
+    locale.load_cache = MagicMock(return_value={})
+    locale.save_cache = MagicMock()
+    locale.get_stamp = MagicMock(side_effect=[[1, 10], None, [1, 10], None, [2, 10], None])
+    locale.from_file = MagicMock(return_value={'test': 'translated'})
+
+    # not cached, parse and save
+    assert locale.from_cache('locale', 'en') == {'test': 'translated'}
+    locale.from_file.assert_called_once()
+    locale.save_cache.assert_called_once_with('en')
+    cached = locale.load_cache.return_value
+    assert cached['locale']['stamp'] == [[1, 10], None]
+
+    # cached, source not changed
+    assert locale.from_cache('locale', 'en') == {'test': 'translated'}
+    locale.from_file.assert_called_once()
+
+    # source changed, rebuild
+    locale.from_file = MagicMock(return_value={'test': 'changed'})
+    assert locale.from_cache('locale', 'en') == {'test': 'changed'}
+    locale.from_file.assert_called_once()
+    assert cached['locale']['stamp'] == [[2, 10], None]
+
+
+def test_load_cache_invalid(mock_window, config):
+    """Test load invalid cache file"""
+    locale = Locale(domain=None, config=config)
+    locale.cache = {}
+    locale.get_cache_path = MagicMock(return_value='locale.en.marshal')
+    with patch('os.path.exists', return_value=True), \
+            patch('builtins.open', mock_open(read_data=b'invalid')):
+        assert locale.load_cache('en') == {}
+    assert locale.cache['en'] == {}
+
+
+def load(mock_window, config):
     """Test load"""
-    config = MagicMock()
     locale = Locale(domain=None, config=config)
     locale.load = MagicMock()
     locale.load('en')
     locale.load.assert_called_once()
 
 
-def test_get(mock_window):
+def test_get(mock_window, config):
     """Test get"""
-    config = MagicMock()
     locale = Locale(domain=None, config=config)
     locale.data = {'locale': {'test': 'translated'}}
     locale.load = MagicMock()
     assert locale.get('test') == 'translated'
     locale.load.assert_not_called()  # already have data
+
+
+def test_save_cache(mock_window, config, monkeypatch):
+    """Test compiled cache is saved in user directory"""
+    for name, func in os_functions.items():
+        monkeypatch.setattr(os, name, func)  # not mocked by other tests
+    locale = Locale(domain=None, config=config)
+    path = os.path.join(config.get_user_path(), 'cache')
+    assert locale.get_cache_path('en') == os.path.join(path, 'locale.en.marshal')
+    assert list_files(path) == {'locale.en.marshal'}
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.20 14:00:00                  #
+# ================================================== #
+
+import os
+from unittest.mock import patch, mock_open
+
+from pygpt_net.core.profiler import Profiler
+
+
+def test_span():
+    """Test span"""
+    Profiler.reset()
+    with Profiler.span("test.span"):
+        pass
+    assert len(Profiler.spans) == 1
+    assert Profiler.spans[0]["name"] == "test.span"
+    assert Profiler.spans[0]["end"] >= Profiler.spans[0]["start"]
+
+
+def test_finish():
+    """Test finish (stop recording)"""
+    Profiler.reset()
+    Profiler.mark("test.mark")
+    Profiler.finish()
+    with Profiler.span("test.span"):
+        pass
+    assert [s["name"] for s in Profiler.spans] == ["test.mark"]
+    Profiler.reset()
+
+
+def test_to_trace():
+    """Test Chrome trace format"""
+    Profiler.reset()
+    start = Profiler.start_time
+    Profiler.add("test.span", start + 0.5, start + 0.75)
+    trace = Profiler.to_trace()
+    event = trace["traceEvents"][0]
+    assert event["name"] == "test.span"
+    assert event["ph"] == "X"
+    assert event["ts"] == 500000.0
+    assert event["dur"] == 250000.0
+    assert event["pid"] == os.getpid()
+    Profiler.reset()
+
+
+def test_dump():
+    """Test dump and summary"""
+    Profiler.reset()
+    with Profiler.span("test.span"):
+        pass
+    with patch("builtins.open", mock_open()) as mock_file, \
+            patch("json.dump") as mock_dump:
+        Profiler.dump("trace.json")
+        mock_file.assert_called_once_with("trace.json", 'w', encoding="utf-8")
+        data = mock_dump.call_args[0][0]
+    assert data["traceEvents"][0]["name"] == "test.span"
+    assert "test.span" in Profiler.summary()
+    Profiler.reset()
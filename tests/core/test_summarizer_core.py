@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.22 18:00:00                  #
+# ================================================== #
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from tests.mocks import mock_window
+from pygpt_net.core.summarizer import Summarizer
+
+
+def quick_call(prompt: str, **kwargs) -> str:
+    time.sleep(0.2)
+    return "[" + prompt + "]"
+
+
+def test_to_chunks(mock_window):
+    """Test split text into chunks"""
+    summarizer = Summarizer(mock_window)
+    assert summarizer.to_chunks("abcde", 2) == ["ab", "cd", "e"]
+    assert summarizer.to_chunks("", 2) == []
+
+
+def test_summarize_concurrent(mock_window):
+    """Test chunks summarized concurrently, partial summaries joined in order"""
+    mock_window.core.config.data["max_concurrent_requests"] = 4
+    mock_window.core.bridge.quick_call = MagicMock(side_effect=quick_call)
+    summarizer = Summarizer(mock_window)
+    progress = []
+    start = time.time()
+    summary = summarizer.summarize(
+        ["a", "b", "c", "d"],
+        system_prompt="prompt",
+        model=None,
+        max_tokens=100,
+        callback=lambda done, total, response: progress.append((done, total)),
+    )
+    assert time.time() - start < 0.6  # sequential calls would take 0.8s
+    assert summary == "[a][b][c][d]"
+    assert progress[-1] == (4, 4)
+    assert mock_window.core.bridge.apply_rate_limit.call_count == 4
+    mock_window.core.bridge.quick_call.assert_any_call(
+        prompt="a",
+        system_prompt="prompt",
+        max_tokens=100,
+        model=None,
+    )
+
+
+def test_summarize_reduce(mock_window):
+    """Test partial summaries summarized in final call"""
+    mock_window.core.bridge.quick_call = MagicMock(side_effect=quick_call)
+    summarizer = Summarizer(mock_window)
+    assert summarizer.summarize(["a", "b"], "prompt", None, 100, reduce=True) == "[[a]\n\n[b]]"
+    assert summarizer.summarize(["a"], "prompt", None, 100, reduce=True) == "[a]"  # nothing to reduce
+
+
+def test_summarize_errors(mock_window):
+    """Test failed chunks are reported and skipped"""
+    def call(prompt: str, **kwargs) -> str:
+        if prompt == "b":
+            raise ValueError("API error")
+        return prompt.upper()
+
+    mock_window.core.bridge.quick_call = MagicMock(side_effect=call)
+    summarizer = Summarizer(mock_window)
+    errors = []
+    assert summarizer.summarize(["a", "b", "c"], "prompt", None, 100, error_callback=errors.append) == "AC"
+    assert len(errors) == 1
+    with pytest.raises(ValueError):
+        summarizer.summarize(["a", "b", "c"], "prompt", None, 100)
@@ -6,9 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.29 17:00:00                  #
+# Updated Date: 2024.03.23 10:00:00                  #
 # ================================================== #
 
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 from unittest.mock import MagicMock
 from PySide6.QtWidgets import QMainWindow
@@ -52,3 +55,48 @@ def mock_window_conf():
     window.core.config.get_lang = MagicMock(return_value='en')
     window.core.debug = MagicMock()
     return window
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Local HTTP stub server handler, responses are returned by server routes"""
+    def do_GET(self):
+        status, headers, body = self.server.route(self)
+        self.server.requests.append((self.path, status))
+        try:
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client aborted
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.url = "http://127.0.0.1:{}".format(self.server_address[1])
+        self.routes = {}  # path prefix -> callable(request) returning (status, headers, body)
+        self.requests = []  # (path, status)
+
+    def route(self, request) -> tuple:
+        for prefix, handler in self.routes.items():
+            if request.path.startswith(prefix):
+                return handler(request)
+        return 404, {}, b""
+
+
+@pytest.fixture
+def stub_server():
+    server = StubServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.22 22:00:00                  #
+# ================================================== #
+
+from pygpt_net.plugin.cmd_web.extractor import Extractor
+
+ARTICLE = "Article paragraph with enough text to be scored as content. " * 5
+PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Page title</title><style>body {{ color: red; }}</style></head>
+<body>
+<header><a href="/">Home</a><nav><a href="/a">Menu A</a><a href="/b">Menu B</a></nav></header>
+<div class="layout">
+<div class="sidebar"><a href="/c">Sidebar link</a></div>
+<div id="main-column">
+<h1>Headline</h1>
+<p>{article}</p>
+<p>Second <b>bold</b> paragraph of the article with some more words in it.</p>
+<script>var tracking = "script text";</script>
+<!-- comment text -->
+<div class="share-buttons social">Share on social</div>
+</div>
+<ul class="related"><li><a href="/d">Related article</a></li></ul>
+</div>
+<footer>Copyright footer</footer>
+</body>
+</html>""".format(article=ARTICLE)
+
+
+def test_extract_main():
+    """Test main content is extracted without boilerplate"""
+    text = Extractor().extract(PAGE.encode("utf-8"))
+    assert text.startswith("Headline Article paragraph")
+    assert text.endswith("Second bold paragraph of the article with some more words in it.")
+    for boilerplate in ["Page title", "color", "Home", "Menu A", "Sidebar link", "script text",
+                        "comment text", "Share on social", "Related article", "Copyright footer"]:
+        assert boilerplate not in text
+
+
+def test_extract_all():
+    """Test whole body is extracted without scripts and styles if main content extraction is disabled"""
+    text = Extractor().extract(PAGE.encode("utf-8"), main=False)
+    assert "Menu A" in text
+    assert "Copyright footer" in text
+    assert "Headline" in text
+    assert "script text" not in text
+    assert "comment text" not in text
+    assert "color" not in text
+
+
+def test_extract_article():
+    """Test <article> is preferred as main content"""
+    html = "<html><body><div><p>{}</p></div><article><p>{}</p></article></body></html>".format(
+        "Other text in a long paragraph outside of the article element. " * 2,
+        ARTICLE,
+    )
+    assert Extractor().extract(html.encode("utf-8")) == ARTICLE.strip()
+
+
+def test_extract_short_page():
+    """Test whole body is used if no main content found"""
+    assert Extractor().extract(b"<html><body><div>fast page</div></body></html>") == "fast page"
+    assert Extractor().extract(b"") == ""
+    assert Extractor().extract(b"   ") == ""
+
+
+def test_extract_max_size():
+    """Test HTML is truncated before decoding (partial multibyte character dropped)"""
+    html = "<html><body><p>zażółć gęślą jaźń</p></body></html>".encode("utf-8")
+    end = html.index("ó".encode("utf-8")) + 1  # half of character
+    assert Extractor().extract(html, max_size=end) == "zaż"
+
+
+def test_extract_charset():
+    """Test declared charset is used for decoding"""
+    html = '<html><head><meta charset="iso-8859-2"></head><body><p>zażółć</p></body></html>'
+    assert Extractor().extract(html.encode("iso-8859-2")) == "zażółć"
+
+
+def test_extract_simple():
+    """Test fallback extraction without lxml"""
+    extractor = Extractor()
+    extractor.lxml = False
+    text = extractor.extract(PAGE.encode("utf-8"))
+    assert "Headline" in text
+    assert "script text" not in text
+    assert "color" not in text
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.23 10:00:00                  #
+# ================================================== #
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from tests.mocks import mock_window, stub_server
+from pygpt_net.core.fetch import Fetch
+from pygpt_net.plugin.cmd_web import Plugin
+
+PAGES = {
+    "/fast": (0.0, 200, "<html><body>fast page</body></html>"),
+    "/slow": (0.5, 200, "<html><body>slow page</body></html>"),
+    "/very_slow": (3.0, 200, "<html><body>very slow page</body></html>"),
+    "/empty": (0.0, 200, ""),
+    "/error": (0.0, 500, "<html><body>error</body></html>"),
+}
+
+
+def get_page(request) -> tuple:
+    delay, status, body = PAGES[request.path]
+    time.sleep(delay)
+    return status, {"Content-Type": "text/html"}, body.encode("utf-8")
+
+
+@pytest.fixture
+def server(stub_server):
+    stub_server.routes = {path: get_page for path in PAGES}
+    return stub_server.url
+
+
+def get_plugin(mock_window, prefetch: int = 3, grace: float = 1.0) -> Plugin:
+    mock_window.core.fetch = Fetch(mock_window)
+    mock_window.core.config.data["web.cache"] = False
+    plugin = Plugin(window=mock_window)
+    plugin.init_options()
+    plugin.setup()
+    plugin.options["prefetch"]["value"] = prefetch
+    plugin.options["prefetch_grace"]["value"] = grace
+    plugin.options["disable_ssl"]["value"] = False
+    return plugin
+
+
+def test_fetch_pages_rank_preference(mock_window, server):
+    """Test higher ranked page is awaited within grace time"""
+    plugin = get_plugin(mock_window, grace=2.0)
+    pages = plugin.websearch.fetch_pages([server + "/slow", server + "/fast"])
+    url, content = next(pages)
+    pages.close()
+    assert url == server + "/slow"
+    assert content == "slow page"
+
+
+def test_fetch_pages_grace_elapsed(mock_window, server):
+    """Test first arrived page is taken when grace time elapsed"""
+    plugin = get_plugin(mock_window, grace=0.1)
+    start = time.time()
+    pages = plugin.websearch.fetch_pages([server + "/very_slow", server + "/fast"])
+    url, content = next(pages)
+    pages.close()
+    assert url == server + "/fast"
+    assert content == "fast page"
+    assert time.time() - start < 2.0  # not blocked by very slow page
+
+
+def test_fetch_pages_failed_skipped(mock_window, server):
+    """Test failed and empty pages are skipped, window is refilled"""
+    plugin = get_plugin(mock_window, prefetch=2)
+    urls = [server + "/error", server + "/empty", server + "/slow", server + "/fast"]
+    result = list(plugin.websearch.fetch_pages(urls))
+    assert result == [(server + "/slow", "slow page"), (server + "/fast", "fast page")]
+
+
+def test_make_query_parallel(mock_window, server):
+    """Test web search takes the first usable page and summarizes it only"""
+    plugin = get_plugin(mock_window, grace=0.1)
+    websearch = plugin.websearch
+    websearch.get_urls = MagicMock(return_value=[server + "/very_slow", server + "/error", server + "/fast"])
+    websearch.get_summary = MagicMock(return_value="summary")
+    websearch.index_url = MagicMock()
+    start = time.time()
+    result, total, current, url = websearch.make_query("query")
+    assert time.time() - start < 2.0  # sequential fetch would wait for very slow page
+    assert result == "summary"
+    assert total == 3
+    assert url == server + "/fast"
+    websearch.get_summary.assert_called_once_with(["fast page"], "query", "")
+
+
+def test_query_url_stopped(mock_window, server):
+    """Test download is aborted when stop event is set"""
+    plugin = get_plugin(mock_window)
+    stop = threading.Event()
+    stop.set()
+    assert plugin.get_url(server + "/fast", stop=stop) == b""
+    assert plugin.get_url(server + "/fast") == b"<html><body>fast page</body></html>"
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.23 10:00:00                  #
+# ================================================== #
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from pygpt_net.item.ctx import CtxItem
+from tests.mocks import mock_window
+from pygpt_net.plugin.idx_llama_index import Plugin
+from pygpt_net.plugin.idx_llama_index.cache import QueryCache
+
+
+def create_plugin(mock_window) -> (Plugin, dict):
+    plugin = Plugin(window=mock_window)
+    plugin.init_options()
+    plugin.options["ask_llama_first"]["value"] = True
+    plugin.options["idx"]["value"] = "base, files"
+    mock_window.controller.agent.enabled = MagicMock(return_value=False)
+    mock_window.core.idx.get_current_store = MagicMock(return_value="SimpleVectorStore")
+    revisions = {"base": 0, "files": 0}
+    mock_window.core.idx.storage.get_revision = MagicMock(side_effect=lambda id: revisions[id])
+    plugin.query = MagicMock(return_value=("answer", ["doc_id"], ["meta"]))
+    return plugin, revisions
+
+
+def test_options(mock_window):
+    """Test options"""
+    plugin = Plugin(window=mock_window)
+    plugin.init_options()
+    options = plugin.setup()
+    assert "idx" in options
+    assert "ask_llama_first" in options
+    assert "cache_ttl" in options
+
+
+def test_on_post_prompt_cache(mock_window):
+    """Test ask first results are reused for the same question"""
+    plugin, revisions = create_plugin(mock_window)
+    ctx = CtxItem()
+    ctx.input = "What is PyGPT?"
+    assert plugin.on_post_prompt("prompt", ctx) == "prompt\nADDITIONAL CONTEXT: answer"
+
+    ctx = CtxItem()
+    ctx.input = "  what is   pygpt "  # near-identical
+    assert plugin.on_post_prompt("prompt", ctx) == "prompt\nADDITIONAL CONTEXT: answer"
+    assert ctx.doc_ids == ["doc_id"]
+    assert plugin.query.call_count == 1
+    assert plugin.cache.hits == 1
+    assert plugin.cache.misses == 1
+
+    revisions["files"] += 1  # index modified
+    plugin.on_post_prompt("prompt", ctx)
+    assert plugin.query.call_count == 2
+    assert len(plugin.cache.items) == 1  # previous revision removed
+
+
+def test_on_post_prompt_cache_prepare(mock_window):
+    """Test question preparation is skipped on cache hit"""
+    plugin, revisions = create_plugin(mock_window)
+    plugin.options["prepare_question"]["value"] = True
+    plugin.prepare_question = MagicMock(return_value="pygpt")
+    ctx = CtxItem()
+    ctx.input = "What is PyGPT?"
+    plugin.on_post_prompt("prompt", ctx)
+    plugin.on_post_prompt("prompt", ctx)
+    plugin.query.assert_called_once_with("pygpt")
+    plugin.prepare_question.assert_called_once()
+
+
+def test_on_post_prompt_cache_disabled(mock_window):
+    """Test cache disabled"""
+    plugin, revisions = create_plugin(mock_window)
+    plugin.options["cache_ttl"]["value"] = 0
+    ctx = CtxItem()
+    ctx.input = "What is PyGPT?"
+    plugin.on_post_prompt("prompt", ctx)
+    plugin.on_post_prompt("prompt", ctx)
+    assert plugin.query.call_count == 2
+    assert len(plugin.cache.items) == 0
+
+
+def test_cache_ttl():
+    """Test expired and evicted results"""
+    cache = QueryCache(max_items=2)
+    with patch("time.time", return_value=100.0):
+        cache.set(("base",), (0,), "q1", "r1")
+        cache.set(("base",), (0,), "q2", "r2")
+    with patch("time.time", return_value=150.0):
+        assert cache.get(("base",), (0,), "Q1!", 60) == "r1"
+        cache.set(("base",), (0,), "q3", "r3")  # q2 is least recently used
+    assert cache.get(("base",), (0,), "q2", 60) is None
+    with patch("time.time", return_value=200.0):
+        assert cache.get(("base",), (0,), "q1", 60) is None  # expired
+        assert cache.get(("base",), (0,), "q3", 60) == "r3"
+    assert cache.get_hit_rate() == 0.5
+
+
+def test_query_concurrent(mock_window):
+    """Test indexes are queried concurrently and merged in configured order"""
+    plugin = Plugin(window=mock_window)
+    plugin.init_options()
+    plugin.options["idx"]["value"] = "base, files, ctx"
+    delays = {"base": 0.3, "files": 0.1, "ctx": 0.2}
+
+    def query(**kwargs):
+        time.sleep(delays[kwargs["idx"]])
+        kwargs["ctx"].set_output("response " + kwargs["idx"], "")
+        return True
+
+    mock_window.core.idx.chat.query = MagicMock(side_effect=query)
+    start = time.perf_counter()
+    response, doc_ids, metas = plugin.query("question")
+    assert time.perf_counter() - start < 0.55
+    assert response == "response base\n---\nresponse files\n---\nresponse ctx"
+    assert mock_window.core.idx.chat.query.call_count == 3
+
+
+def test_query_error(mock_window):
+    """Test failed index query is skipped and other responses are merged"""
+    plugin = Plugin(window=mock_window)
+    plugin.init_options()
+    plugin.options["idx"]["value"] = "base,files,ctx"
+    plugin.error = MagicMock()
+
+    def query(**kwargs):
+        if kwargs["idx"] == "files":
+            raise ValueError("query error")
+        kwargs["ctx"].set_output("response " + kwargs["idx"], "")
+        return True
+
+    mock_window.core.idx.chat.query = MagicMock(side_effect=query)
+    response, doc_ids, metas = plugin.query("question")
+    assert response == "response base\n---\nresponse ctx"
+    plugin.error.assert_called_once()
+
+
+def test_query_timeout(mock_window):
+    """Test indexes not queried before timeout are skipped"""
+    plugin = Plugin(window=mock_window)
+    plugin.init_options()
+    plugin.options["idx"]["value"] = "base,files"
+    plugin.options["timeout"]["value"] = 0.2
+    release = threading.Event()
+
+    def query(**kwargs):
+        if kwargs["idx"] == "base":
+            release.wait(5)
+        kwargs["ctx"].set_output("response " + kwargs["idx"], "")
+        return True
+
+    mock_window.core.idx.chat.query = MagicMock(side_effect=query)
+    response, doc_ids, metas = plugin.query("question")
+    release.set()
+    assert response == "response files"
@@ -6,12 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.03 22:00:00                  #
+# Updated Date: 2024.03.22 08:00:00                  #
 # ================================================== #
 
 from unittest.mock import MagicMock, patch, mock_open, Mock
+from sqlalchemy import create_engine, text
 
 from pygpt_net.item.ctx import CtxItem, CtxMeta
+from pygpt_net.migrations import Migrations
 from tests.mocks import mock_window
 from pygpt_net.provider.core.ctx.db_sqlite.storage import Storage
 from pygpt_net.provider.core.ctx.db_sqlite.utils import *
@@ -390,3 +392,33 @@ def test_unpack_item_value():
     assert unpack_item_value('1') == 1
     assert unpack_item_value('[1, 2, 3]') == [1, 2, 3]
     assert unpack_item_value('{"a": 1, "b": 2}') == {'a': 1, 'b': 2}
+
+
+def test_set_meta_indexed_bulk(mock_window):
+    """Test bulk update of indexed metas"""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        for migration in Migrations.get_versions():
+            migration.up(conn)
+        for id in [1, 2, 3]:
+            conn.execute(text(
+                "INSERT INTO ctx_meta (id, created_ts, updated_ts, is_initialized, is_deleted, is_important, "
+                "is_archived) VALUES ({}, 1, 1, 0, 0, 0, 0)".format(id)
+            ))
+        conn.execute(text("INSERT INTO idx_ctx (doc_id, meta_id, store, idx) VALUES ('old', 1, 'Simple', 'base')"))
+        conn.execute(text("INSERT INTO idx_ctx (doc_id, meta_id, store, idx) VALUES ('other', 1, 'Simple', 'other')"))
+    mock_window.core.db.get_db = MagicMock(return_value=engine)
+    storage = Storage(mock_window)
+
+    metas = storage.get_meta_by_ids([1, 2])
+    assert sorted(metas.keys()) == [1, 2]
+    metas[1].indexes = {"Simple": {"base": {"doc1": 100}}}
+    metas[2].indexes = {"Simple": {"base": {"doc2": 100}}}
+    assert storage.set_meta_indexed_bulk("Simple", "base", [(metas[1], "doc1"), (metas[2], "doc2")], 100)
+
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT meta_id, doc_id, idx FROM idx_ctx ORDER BY meta_id, idx")).fetchall()
+        assert [tuple(row) for row in rows] == [(1, "doc1", "base"), (1, "other", "other"), (2, "doc2", "base")]
+        rows = conn.execute(text("SELECT id, indexed_ts FROM ctx_meta ORDER BY id")).fetchall()
+        assert [tuple(row) for row in rows] == [(1, 100), (2, 100), (3, 0)]
+    assert storage.get_meta_by_ids([2])[2].indexes == {"Simple": {"base": {"doc2": 100}}}
@@ -6,12 +6,13 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.26 18:00:00                  #
+# Updated Date: 2024.03.22 18:00:00                  #
 # ================================================== #
 
 from unittest.mock import MagicMock
 
 from tests.mocks import mock_window_conf
+from pygpt_net.core.summarizer import Summarizer as CoreSummarizer
 from pygpt_net.provider.gpt.summarizer import Summarizer
 from pygpt_net.item.ctx import CtxItem
 
@@ -34,6 +35,7 @@ def test_summary_ctx(mock_window_conf):
     Test prepare ctx name
     """
     summarizer = Summarizer(mock_window_conf)
+    summarizer.window.core.summarizer = CoreSummarizer(mock_window_conf)
     summarizer.window.core.bridge.quick_call = MagicMock(return_value='test_response')
     summarizer.window.core.config.get.side_effect = mock_get
     summarizer.window.core.models.get_num_ctx = MagicMock(return_value=2048)
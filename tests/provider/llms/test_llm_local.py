@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.22 12:00:00                  #
+# ================================================== #
+
+from tests.mocks import mock_window
+from pygpt_net.core.idx.embeddings import HashingEmbedding
+from pygpt_net.provider.llms.local import LocalLLM as Wrapper
+
+
+def test_get_embeddings_model(mock_window):
+    wrapper = Wrapper()
+    config = [
+        {"name": "model", "value": "text-embedding-3-small", "type": "str"},  # other provider arg
+        {"name": "dim", "value": 128, "type": "int"},
+    ]
+    model = wrapper.get_embeddings_model(mock_window, config)
+    assert isinstance(model, HashingEmbedding)
+    assert model.dim == 128
+    assert len(model.get_text_embedding("offline test")) == 128
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.23 10:00:00                  #
+# ================================================== #
+
+import os
+import sqlite3
+
+import numpy as np
+import pytest
+
+from unittest.mock import MagicMock, patch
+from llama_index.core import Document, PromptHelper, ServiceContext
+from llama_index.core.embeddings import MockEmbedding
+from llama_index.core.node_parser import SentenceSplitter
+from llama_index.core.schema import NodeRelationship, RelatedNodeInfo, TextNode
+from llama_index.core.vector_stores.types import (
+    FilterCondition,
+    FilterOperator,
+    MetadataFilter,
+    MetadataFilters,
+    VectorStoreQuery,
+)
+
+from tests.mocks import mock_window
+from pygpt_net.provider.vector_stores.numpy_mmap import NumpyProvider, NumpyVectorStore
+
+
+class Matrix(np.ndarray):
+    """Matrix kept in memory instead of memory-mapped file"""
+    def flush(self):
+        pass
+
+
+class MemoryVectorStore(NumpyVectorStore):
+    """Store with sidecar and matrix kept in memory"""
+    def connect(self) -> sqlite3.Connection:
+        return sqlite3.connect("file:{}?mode=memory&cache=shared".format(self.path), uri=True)
+
+    def recover(self):
+        pass
+
+    def open_array(self, file: str, dtype: str, cols: int, capacity: int = 0):
+        key = self.path + "/" + file
+        array = files.get(key)
+        if array is None or capacity > len(array):
+            grown = np.zeros((capacity, cols), dtype=dtype).view(Matrix)
+            if array is not None:
+                grown[:len(array)] = array
+            array = files[key] = grown
+        return array
+
+    def write_array(self, file: str, array: np.ndarray, rows: np.ndarray):
+        files[self.path + "/" + self.get_tmp_file(file)] = array[rows].copy()
+
+    def replace_array(self, file: str):
+        files[self.path + "/" + file] = files.pop(self.path + "/" + self.get_tmp_file(file))
+
+
+files = {}  # path -> array
+
+
+@pytest.fixture
+def db():
+    """Keep shared in-memory sidecar alive between connections"""
+    files.clear()
+    conn = sqlite3.connect("file:test_numpy?mode=memory&cache=shared", uri=True)
+    yield "test_numpy"
+    conn.close()
+
+
+def create_node(id: str, doc_id: str, embedding: list, **metadata) -> TextNode:
+    node = TextNode(text="text " + id, id_=id, embedding=embedding, metadata=metadata)
+    node.relationships[NodeRelationship.SOURCE] = RelatedNodeInfo(node_id=doc_id)
+    return node
+
+
+def create_nodes() -> list:
+    return [
+        create_node("n1", "doc1", [1.0, 0.0, 0.0], type="a", page=1),
+        create_node("n2", "doc1", [0.8, 0.2, 0.0], type="b", page=2),
+        create_node("n3", "doc2", [0.0, 1.0, 0.0], type="a", page=3),
+        create_node("n4", "doc3", [0.0, 0.0, 5.0], type="b", page=4),
+    ]
+
+
+def test_query(db):
+    """Test top-k by cosine similarity"""
+    store = MemoryVectorStore(path=db)
+    store.add(create_nodes())
+    result = store.query(VectorStoreQuery(query_embedding=[2.0, 0.0, 0.0], similarity_top_k=2))
+    assert result.ids == ["n1", "n2"]
+    assert abs(result.similarities[0] - 1.0) < 1e-6
+    assert result.nodes[0].text == "text n1"
+    assert result.nodes[0].ref_doc_id == "doc1"
+    assert result.nodes[1].metadata == {"type": "b", "page": 2}
+
+    result = store.query(VectorStoreQuery(query_embedding=[0.0, 0.0, 1.0], similarity_top_k=10))
+    assert result.ids[0] == "n4"  # normalized
+    assert len(result.ids) == 4
+    store.close()
+
+
+def test_query_filters(db):
+    """Test metadata pre-filtering"""
+    store = MemoryVectorStore(path=db)
+    store.add(create_nodes())
+    filters = MetadataFilters(filters=[MetadataFilter(key="type", value="a")])
+    result = store.query(VectorStoreQuery(query_embedding=[1.0, 0.0, 0.0], similarity_top_k=2, filters=filters))
+    assert result.ids == ["n1", "n3"]
+
+    filters = MetadataFilters(
+        filters=[
+            MetadataFilter(key="page", value=4, operator=FilterOperator.GTE),
+            MetadataFilter(key="page", value=2),
+        ],
+        condition=FilterCondition.OR,
+    )
+    result = store.query(VectorStoreQuery(query_embedding=[1.0, 0.0, 0.0], similarity_top_k=5, filters=filters))
+    assert result.ids == ["n2", "n4"]
+
+    result = store.query(VectorStoreQuery(query_embedding=[1.0, 0.0, 0.0], similarity_top_k=5, node_ids=["n3"]))
+    assert result.ids == ["n3"]
+    store.close()
+
+
+def test_delete_compact(db):
+    """Test tombstones, compaction and reopening of store"""
+    store = MemoryVectorStore(path=db, dtype="float16")
+    store.add(create_nodes())
+    store.delete("doc1")
+    assert store.count() == 2
+    result = store.query(VectorStoreQuery(query_embedding=[1.0, 0.0, 0.0], similarity_top_k=5))
+    assert "n1" not in result.ids
+    assert "n2" not in result.ids
+
+    store.persist()  # deleted ratio 0.5 > 0.25
+    assert store._count == 2
+    assert not store._deleted.any()
+    result = store.query(VectorStoreQuery(query_embedding=[0.0, 0.0, 1.0], similarity_top_k=1))
+    assert result.ids == ["n4"]
+
+    store.add([create_node("n3", "doc2", [0.0, 0.0, 1.0])])  # replace node
+    assert store.count() == 2
+    store.close()
+
+    store = MemoryVectorStore(path=db)
+    assert store.dtype == "float16"
+    assert store.count() == 2
+    assert store._count == 3  # replaced node is tombstoned until next compaction
+    result = store.query(VectorStoreQuery(query_embedding=[0.0, 0.0, 1.0], similarity_top_k=2))
+    assert sorted(result.ids) == ["n3", "n4"]
+    store.close()
+
+
+def test_query_int8(db):
+    """Test int8 matrix with per-row scales, with and without exact re-ranking"""
+    rnd = np.random.default_rng(1)
+    vectors = rnd.normal(size=(200, 16)).astype(np.float32)
+    nodes = [create_node("n" + str(i), "doc", v.tolist()) for i, v in enumerate(vectors)]
+    q = rnd.normal(size=16).astype(np.float32)
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    exact = np.dot(normalized, q / np.linalg.norm(q))
+    expected = ["n" + str(i) for i in np.argsort(-exact)[:5]]
+
+    store = MemoryVectorStore(path=db + "_approx", dtype="int8", rerank=0)
+    store.add(nodes)
+    assert store._matrix.dtype == np.int8
+    assert store._exact is None
+    result = store.query(VectorStoreQuery(query_embedding=q.tolist(), similarity_top_k=5))
+    assert len(set(result.ids) & set(expected)) >= 4  # approximate
+    assert abs(result.similarities[0] - exact.max()) < 0.02
+    store.close()
+
+    store = MemoryVectorStore(path=db, dtype="int8", rerank=8)
+    store.add(nodes)
+    assert store._exact is not None
+    result = store.query(VectorStoreQuery(query_embedding=q.tolist(), similarity_top_k=5))
+    assert result.ids == expected  # exact order after re-ranking
+    assert abs(result.similarities[0] - exact.max()) < 1e-5
+
+    store.delete("doc")
+    store.add(nodes[:10])
+    store.persist()  # compaction of matrix, scales and exact vectors
+    assert store._count == 10
+    result = store.query(VectorStoreQuery(query_embedding=vectors[3].tolist(), similarity_top_k=1))
+    assert result.ids == ["n3"]
+    store.close()
+
+    store = MemoryVectorStore(path=db, rerank=2)
+    assert store.dtype == "int8"
+    assert store._has_exact
+    result = store.query(VectorStoreQuery(query_embedding=vectors[7].tolist(), similarity_top_k=1))
+    assert result.ids == ["n7"]
+    store.close()
+
+
+def test_provider(mock_window, db):
+    """Test index with memory-mapped vector store"""
+    context = ServiceContext.from_defaults(
+        embed_model=MockEmbedding(embed_dim=8),
+        llm=None,
+        prompt_helper=PromptHelper(tokenizer=str.split),
+        node_parser=SentenceSplitter(tokenizer=str.split),
+    )
+    provider = NumpyProvider(window=mock_window)
+    provider.exists = MagicMock(return_value=True)
+    provider.stores["base"] = MemoryVectorStore(path=db)
+    index = provider.get("base", service_context=context)
+    index.insert(Document(text="document", id_="doc1"))
+    provider.store("base", index)
+    assert provider.get_store("base").count() == 1
+
+    index = provider.get("base", service_context=context)
+    nodes = index.as_retriever(similarity_top_k=1).retrieve("document")
+    assert nodes[0].node.ref_doc_id == "doc1"
+
+    index.delete_ref_doc("doc1")
+    assert provider.get_store("base").count() == 0
+    provider.stores["base"].close()
+
+
+os_functions = {name: getattr(os, name) for name in ["listdir", "makedirs", "mkdir", "remove", "replace", "scandir"]}
+os_path_functions = {name: getattr(os.path, name) for name in ["exists", "getsize", "isdir", "isfile"]}
+
+
+@pytest.fixture
+def real_os(monkeypatch):
+    for name, func in os_functions.items():
+        monkeypatch.setattr(os, name, func)  # not mocked by other tests
+    for name, func in os_path_functions.items():
+        monkeypatch.setattr(os.path, name, func)
+
+
+def create_vectors(n: int, dim: int = 8, seed: int = 1) -> list:
+    rnd = np.random.default_rng(seed)
+    vectors = rnd.normal(size=(n, dim)).astype(np.float32)
+    return [create_node("n" + str(i), "doc" + str(i % 3), v.tolist()) for i, v in enumerate(vectors)]
+
+
+def test_file_grow(real_os, tmp_path):
+    """Test memory-mapped matrix file grows and is reopened"""
+    path = str(tmp_path / "store")
+    nodes = create_vectors(1500)
+    store = NumpyVectorStore(path=path)
+    store.add(nodes[:10])
+    assert store._capacity == 1024
+    assert os.path.getsize(os.path.join(path, "vectors.bin")) == 1024 * 8 * 4
+    store.add(nodes[10:])
+    assert store._capacity == 2048  # doubled
+    assert os.path.getsize(os.path.join(path, "vectors.bin")) == 2048 * 8 * 4
+    store.persist()
+    store.close()
+
+    store = NumpyVectorStore(path=path)
+    assert store.count() == 1500
+    for i in [0, 777, 1499]:
+        result = store.query(VectorStoreQuery(query_embedding=nodes[i].embedding, similarity_top_k=1))
+        assert result.ids == ["n" + str(i)]
+    store.close()
+
+
+def test_file_compact(real_os, tmp_path):
+    """Test compaction replaces matrix files and remaps rows"""
+    path = str(tmp_path / "store")
+    nodes = create_vectors(30)
+    store = NumpyVectorStore(path=path, dtype="int8", rerank=4)
+    store.add(nodes)
+    store.delete("doc0")
+    store.persist()  # deleted ratio 1/3 > 0.25
+    assert store._count == 20
+    assert sorted(os.listdir(path)) == ["exact.bin", "nodes.db", "scales.bin", "vectors.bin"]
+    store.close()
+
+    store = NumpyVectorStore(path=path)
+    assert store.count() == 20
+    rows = dict(store._db.execute("SELECT node_id, row FROM nodes"))
+    assert sorted(rows.values()) == list(range(20))
+    for i in [1, 2, 29]:
+        result = store.query(VectorStoreQuery(query_embedding=nodes[i].embedding, similarity_top_k=1))
+        assert result.ids == ["n" + str(i)]
+    result = store.query(VectorStoreQuery(query_embedding=nodes[3].embedding, similarity_top_k=20))
+    assert "n3" not in result.ids  # deleted
+    store.close()
+
+
+def test_file_recover_pending(real_os, tmp_path):
+    """Test compaction interrupted after sidecar commit is finished on reopen"""
+    path = str(tmp_path / "store")
+    nodes = create_vectors(30)
+    store = NumpyVectorStore(path=path, dtype="int8", rerank=4)
+    store.add(nodes)
+    store.delete("doc1")
+    with patch.object(NumpyVectorStore, "replace_matrix", side_effect=OSError("interrupted")):
+        with pytest.raises(OSError):
+            store.persist()
+    assert store.get_info("pending") == "vectors.tmp"
+    assert os.path.exists(os.path.join(path, "vectors.tmp"))
+    store._db.close()  # app killed
+
+    store = NumpyVectorStore(path=path)
+    assert store.get_info("pending") == ""
+    assert sorted(os.listdir(path)) == ["exact.bin", "nodes.db", "scales.bin", "vectors.bin"]
+    assert store.count() == 20
+    assert store._count == 20
+    for i in [0, 2, 29]:
+        result = store.query(VectorStoreQuery(query_embedding=nodes[i].embedding, similarity_top_k=1))
+        assert result.ids == ["n" + str(i)]  # rows remapped to compacted matrix
+    result = store.query(VectorStoreQuery(query_embedding=nodes[1].embedding, similarity_top_k=20))
+    assert "n1" not in result.ids
+    store.close()
+
+
+def test_file_recover_not_committed(real_os, tmp_path):
+    """Test compaction interrupted before sidecar commit is discarded on reopen"""
+    path = str(tmp_path / "store")
+    nodes = create_vectors(30)
+    store = NumpyVectorStore(path=path)
+    store.add(nodes)
+    store.delete("doc1")
+    store.write_matrix(np.flatnonzero(~store._deleted))  # interrupted after temporary files are written
+    store.flush()
+    store._db.close()
+
+    store = NumpyVectorStore(path=path)
+    assert not os.path.exists(os.path.join(path, "vectors.tmp"))
+    assert store._count == 30  # not compacted, tombstones kept
+    assert store.count() == 20
+    result = store.query(VectorStoreQuery(query_embedding=nodes[5].embedding, similarity_top_k=1))
+    assert result.ids == ["n5"]
+    store.close()
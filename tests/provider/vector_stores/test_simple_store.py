@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.23 10:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock, patch
+from llama_index.core import Document, PromptHelper, ServiceContext, VectorStoreIndex
+from llama_index.core.embeddings import MockEmbedding
+from llama_index.core.node_parser import SentenceSplitter
+
+from tests.mocks import mock_window
+from pygpt_net.provider.vector_stores.simple import SimpleProvider
+
+
+def create_index(*docs) -> VectorStoreIndex:
+    return VectorStoreIndex.from_documents(
+        list(docs),
+        embed_model=MockEmbedding(embed_dim=8),
+        transformations=[SentenceSplitter(tokenizer=str.split)],
+    )
+
+
+def create_context() -> ServiceContext:
+    return ServiceContext.from_defaults(
+        embed_model=MockEmbedding(embed_dim=8),
+        llm=None,
+        prompt_helper=PromptHelper(tokenizer=str.split),
+        node_parser=SentenceSplitter(tokenizer=str.split),
+    )
+
+
+def create_store(mock_window, size: int = 1) -> SimpleProvider:
+    mock_window.core.config.set('llama.idx.storage.cache.size', size)
+    store = SimpleProvider(window=mock_window)
+    store.exists = MagicMock(return_value=True)
+    store.persist = MagicMock()
+    store.get_disk_info = MagicMock(return_value=(100, 1.0))
+    return store
+
+
+def test_get_resident(mock_window):
+    """Test index is loaded from disk only once"""
+    store = create_store(mock_window)
+    index = create_index(Document(text="document", id_="doc1"))
+    with patch('pygpt_net.provider.vector_stores.simple.StorageContext.from_defaults') as from_defaults, \
+            patch('pygpt_net.provider.vector_stores.simple.load_index_from_storage', return_value=index):
+        index1 = store.get("base", service_context=create_context())
+        index2 = store.get("base", service_context=create_context())
+    assert from_defaults.call_count == 1
+    assert index1 is index
+    assert index2 is not index  # new instance with current service context
+    assert index2.index_struct is index.index_struct
+    assert index2.storage_context is index.storage_context
+    assert set(index2.ref_doc_info.keys()) == {"doc1"}
+
+
+def test_get_disabled(mock_window):
+    """Test index is loaded from disk on every get if cache is disabled"""
+    store = create_store(mock_window, 0)
+    index = create_index()
+    with patch('pygpt_net.provider.vector_stores.simple.StorageContext.from_defaults') as from_defaults, \
+            patch('pygpt_net.provider.vector_stores.simple.load_index_from_storage', return_value=index):
+        store.get("base", service_context=create_context())
+        store.get("base", service_context=create_context())
+    assert from_defaults.call_count == 2
+    assert len(store.cache) == 0
+
+
+def test_get_modified_on_disk(mock_window):
+    """Test index is reloaded if modified on disk"""
+    store = create_store(mock_window)
+    store.store("base", create_index())
+    store.get_disk_info.return_value = (100, 2.0)
+    index = create_index()
+    with patch('pygpt_net.provider.vector_stores.simple.StorageContext.from_defaults') as from_defaults, \
+            patch('pygpt_net.provider.vector_stores.simple.load_index_from_storage', return_value=index):
+        store.get("base")
+    assert from_defaults.call_count == 1
+
+
+def test_remove_document(mock_window):
+    """Test removed document is persisted on flush"""
+    store = create_store(mock_window)
+    index = create_index(Document(text="document 1", id_="doc1"), Document(text="document 2", id_="doc2"))
+    store.store("base", index)
+    assert store.persist.call_count == 1
+    store.remove_document("base", "doc1")
+    assert store.persist.call_count == 1  # not persisted yet
+    assert store.cache["base"]["dirty"] is True
+    assert set(index.ref_doc_info.keys()) == {"doc2"}  # shared with resident index
+    store.flush()
+    assert store.persist.call_count == 2
+    assert store.cache["base"]["dirty"] is False
+    store.flush()
+    assert store.persist.call_count == 2
+
+
+def test_remove_document_cache_disabled(mock_window):
+    """Test removed document is persisted if cache is disabled before flush"""
+    store = create_store(mock_window)
+    index = create_index(Document(text="document 1", id_="doc1"), Document(text="document 2", id_="doc2"))
+    store.store("base", index)
+    store.remove_document("base", "doc1")
+    assert store.persist.call_count == 1  # not persisted yet
+    mock_window.core.config.set('llama.idx.storage.cache.size', 0)
+    assert store.get_resident("base") is None
+    assert store.persist.call_count == 2
+    store.persist.assert_called_with("base", index.storage_context)
+    assert len(store.cache) == 0
+
+
+def test_evict(mock_window):
+    """Test least recently used indexes are unloaded"""
+    store = create_store(mock_window)  # 1 MB
+    store.get_disk_info.return_value = (400 * 1024, 1.0)
+    store.store("idx1", create_index())
+    store.store("idx2", create_index())
+    store.remove_document("idx1", "unknown")  # dirty and recently used
+    store.store("idx3", create_index())
+    assert list(store.cache.keys()) == ["idx1", "idx3"]
+    store.store("idx4", create_index())
+    assert list(store.cache.keys()) == ["idx3", "idx4"]
+    store.persist.assert_any_call("idx1", store.indexes["idx1"].storage_context)  # persisted on evict
+
+
+def test_remove(mock_window):
+    """Test remove index from memory"""
+    store = create_store(mock_window)
+    store.store("base", create_index())
+    with patch('os.path.exists', return_value=False):
+        assert store.remove("base") is True
+    assert "base" not in store.cache
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.22 02:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+
+from tests.mocks import mock_window
+from pygpt_net.provider.vector_stores import Storage
+
+
+def test_revision(mock_window):
+    """Test index revision is incremented on every change"""
+    storage = Storage(window=mock_window)
+    storage.get_storage = MagicMock()
+    assert storage.get_revision("base") == 0
+    storage.store("base", MagicMock())
+    storage.remove_document("base", "doc_id")
+    assert storage.get_revision("base") == 2
+    storage.truncate("base")
+    storage.remove("base")
+    assert storage.get_revision("base") == 4
+    assert storage.get_revision("files") == 0
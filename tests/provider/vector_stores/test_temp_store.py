@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.23 10:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock, patch
+
+from tests.mocks import mock_window
+from pygpt_net.provider.vector_stores.temp import TempProvider
+
+
+def create_store(mock_window) -> TempProvider:
+    mock_window.core.config.data["llama.idx.tmp.cache.ttl"] = 60
+    mock_window.core.config.data["llama.idx.tmp.cache.size"] = 1  # MB
+    store = TempProvider(window=mock_window)
+    store.index_from_empty = MagicMock(side_effect=lambda: MagicMock())
+    store.get_index_size = MagicMock(return_value=400 * 1024)
+    return store
+
+
+def test_keep_expire(mock_window):
+    """Test kept index is reused until TTL from build"""
+    store = create_store(mock_window)
+    with patch("time.time", return_value=100.0):
+        store.get("a")
+        store.keep("a", "file_a")
+        assert store.is_cached("a")
+    with patch("time.time", return_value=150.0):
+        assert store.is_cached("a")
+        store.keep("a", "file_a")  # reused, expiry not extended
+    with patch("time.time", return_value=170.0):
+        assert not store.is_cached("a")
+    assert store.count() == 0
+
+
+def test_keep_evict(mock_window):
+    """Test previous versions and least recently used indexes are removed"""
+    store = create_store(mock_window)
+    for id, scope in [("a1", "file_a"), ("a2", "file_a"), ("b", "file_b")]:
+        store.get(id)
+        store.keep(id, scope)
+    assert list(store.cache.keys()) == ["a2", "b"]  # a1 replaced by a2
+
+    store.get("c")
+    store.keep("c", "file_c")  # 3 x 400 KB > 1 MB
+    assert list(store.cache.keys()) == ["b", "c"]
+    assert sorted(store.indexes.keys()) == ["b", "c"]
+
+    mock_window.core.config.data["llama.idx.tmp.cache.ttl"] = 0  # disabled
+    store.get("d")
+    store.keep("d", "file_d")
+    assert "d" not in store.indexes
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2024.03.20 16:00:00                  #
+# ================================================== #
+
+import os
+
+from PySide6.QtCore import QFile
+
+import pygpt_net.icons_rc
+
+
+def test_get_path():
+    """Test compiled resources path"""
+    path = pygpt_net.icons_rc.get_path()
+    assert path.endswith(os.path.join('data', 'icons.rcc'))
+    assert os.path.exists(path)
+
+
+def test_registered():
+    """Test icons are available from registered resources"""
+    assert QFile(":/icons/add.svg").exists()
+    assert QFile(":/icons/settings_filled.svg").exists()
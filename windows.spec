@@ -21,6 +21,7 @@ a = Analysis(
         ('src\\pygpt_net\\data\\config\\settings.json', 'data\\config'),
         ('src\\pygpt_net\\data\\config\\settings_section.json', 'data\\config'),
         ('src\\pygpt_net\\data\\icons\\chat\\*', 'data\\icons\\chat'),
+        ('src\\pygpt_net\\data\\icons.rcc', 'data'),
         ('src\\pygpt_net\\data\\locale\\*', 'data\\locale'),
         ('src\\pygpt_net\\data\\css\\*', 'data\\css'),
         ('src\\pygpt_net\\data\\fonts\\Lato\\*', 'data\\fonts\\Lato'),